@@ -93,6 +93,25 @@ class ScannerConfig(BaseModel):
     MIN_WALLETS_TO_MONITOR: int = Field(
         default=5, description="Minimum wallets needed for reliable operation"
     )
+
+    # Delta rescoring (async scanner): only wallets whose data changed are rescored
+    DELTA_SCAN_ENABLED: bool = Field(
+        default=os.getenv("LEADERBOARD_DELTA_SCAN", "false").lower() == "true",
+        description="Run the leaderboard scanner as an asyncio task with delta rescoring",
+    )
+    DELTA_RESCORE_CONCURRENCY: int = Field(
+        default=5, description="Wallets rescored concurrently per scan"
+    )
+    DELTA_RESCORE_RATE_PER_SECOND: float = Field(
+        default=2.0, description="Wallet performance fetches per second during rescoring"
+    )
+    SCORE_TABLE_FILE: str = Field(
+        default="data/leaderboard/wallet_scores.json",
+        description="Persisted wallet score table",
+    )
+    SCORE_MAX_AGE_HOURS: float = Field(
+        default=24.0, description="Rescore unchanged wallets after this many hours"
+    )
     CONFIDENCE_SCORE_THRESHOLD: float = Field(
         default=0.8, description="Minimum confidence score to copy"
     )
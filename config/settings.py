@@ -148,6 +148,40 @@ class MonitoringConfig(BaseModel):
         ge=0.1,
         le=0.95,
     )
+    concurrent_fetch_enabled: bool = Field(
+        default=True, description="Fetch wallet transactions concurrently"
+    )
+    max_concurrent_fetches: int = Field(
+        default=20, description="Maximum in-flight wallet fetches", ge=1, le=200
+    )
+    max_concurrent_executions: int = Field(
+        default=10, description="Maximum copy trades executing at once", ge=1, le=100
+    )
+    pipeline_queue_size: int = Field(
+        default=100,
+        description="Capacity of each detect/execute pipeline queue",
+        ge=1,
+        le=10000,
+    )
+    api_rate_limit_per_second: float = Field(
+        default=5.0,
+        description="Shared Polygonscan request budget (calls per second)",
+        ge=0.1,
+        le=100.0,
+    )
+    api_burst_capacity: int = Field(
+        default=5, description="Token bucket burst capacity for API calls", ge=1
+    )
+    block_cursor_file: str = Field(
+        default="data/wallet_monitor/block_cursors.json",
+        description="Path where per-wallet block cursors are persisted",
+    )
+    reorg_rewind_blocks: int = Field(
+        default=32,
+        description="Blocks re-scanned below each wallet cursor for reorg safety",
+        ge=0,
+        le=512,
+    )
 
 
 class AlertingConfig(BaseModel):
@@ -249,6 +283,11 @@ class Settings(BaseModel):
         "trading.private_key": "PRIVATE_KEY",
         "trading.wallet_address": "WALLET_ADDRESS",
         "monitoring.min_confidence_score": "MIN_CONFIDENCE_SCORE",
+        "monitoring.concurrent_fetch_enabled": "CONCURRENT_FETCH_ENABLED",
+        "monitoring.max_concurrent_fetches": "MAX_CONCURRENT_FETCHES",
+        "monitoring.max_concurrent_executions": "MAX_CONCURRENT_EXECUTIONS",
+        "monitoring.pipeline_queue_size": "PIPELINE_QUEUE_SIZE",
+        "monitoring.api_rate_limit_per_second": "POLYGONSCAN_RATE_LIMIT",
         "endgame.enabled": "ENDGAME_ENABLED",
         "endgame.min_probability": "ENDGAME_MIN_PROBABILITY",
         "endgame.max_probability_exit": "ENDGAME_MAX_PROBABILITY_EXIT",
@@ -360,7 +399,15 @@ class Settings(BaseModel):
 
         final_key = keys[-1]
         # Convert to appropriate type based on key name
-        if final_key in ["chain_id", "gas_limit", "max_gas_price", "monitor_interval"]:
+        if final_key in [
+            "chain_id",
+            "gas_limit",
+            "max_gas_price",
+            "monitor_interval",
+            "max_concurrent_fetches",
+            "max_concurrent_executions",
+            "pipeline_queue_size",
+        ]:
             try:
                 current[final_key] = int(value)
             except ValueError:
@@ -370,6 +417,7 @@ class Settings(BaseModel):
             "max_position_size",
             "max_daily_loss",
             "min_trade_amount",
+            "api_rate_limit_per_second",
         ]:
             try:
                 current[final_key] = float(value)
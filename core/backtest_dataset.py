@@ -0,0 +1,244 @@
+"""
+Compiled Backtest Dataset
+=========================
+
+One-time compilation of a HistoricalDataManager dataset into time-sorted
+NumPy columns for the BacktestingEngine simulation loop.
+
+The raw dataset stores every price, gas, regime and trade point as a dict
+with an ISO-8601 timestamp string. Scanning those lists for each simulated
+day costs O(days x rows) plus a ``datetime.fromisoformat`` call per row per
+day. Compiling parses each timestamp once, sorts the columns by time and
+turns every per-day lookup into a binary search (O(log n)) slice.
+
+Lookup windows match the original day-stepping semantics:
+- Prices/gas/regimes: ``abs((point - target).days) <= 1``, i.e. points in
+  [target - 1 day, target + 2 days) because timedelta.days floors
+- Trades: same calendar date as the target
+
+Monte Carlo scenarios use ``with_shocks`` to get a shocked view that shares
+every column except the (small) rescaled gas column, so no scenario copies
+the dataset.
+"""
+
+import copy
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+SECONDS_PER_DAY = 86400.0
+WINDOW_START_SECONDS = -SECONDS_PER_DAY  # timedelta.days == -1 lower bound
+WINDOW_END_SECONDS = 2 * SECONDS_PER_DAY  # timedelta.days == 1 upper bound (exclusive)
+
+
+def _parse_timestamps(points: List[Dict[str, Any]]) -> np.ndarray:
+    """Parse ISO timestamps once into epoch seconds"""
+    return np.fromiter(
+        (datetime.fromisoformat(point["timestamp"]).timestamp() for point in points),
+        dtype=np.float64,
+        count=len(points),
+    )
+
+
+class _TimeSeriesColumn:
+    """Time-sorted series with one value column"""
+
+    __slots__ = ("timestamps", "values")
+
+    def __init__(self, points: List[Dict[str, Any]], value_key: str) -> None:
+        timestamps = _parse_timestamps(points)
+        # Stable sort keeps list order for equal (or already sorted) timestamps
+        order = np.argsort(timestamps, kind="stable")
+        self.timestamps = timestamps[order]
+        raw_values = [points[i][value_key] for i in order]
+        try:
+            self.values = np.asarray(raw_values, dtype=np.float64)
+        except (TypeError, ValueError):
+            self.values = np.asarray(raw_values, dtype=object)
+
+    def window(self, target_ts: float) -> Tuple[int, int]:
+        """Index range of points within the lookup window of target_ts"""
+        lo = int(
+            np.searchsorted(self.timestamps, target_ts + WINDOW_START_SECONDS, "left")
+        )
+        hi = int(
+            np.searchsorted(self.timestamps, target_ts + WINDOW_END_SECONDS, "left")
+        )
+        return lo, hi
+
+    def first_in_window(self, target_ts: float) -> Optional[Any]:
+        """Earliest value within the lookup window, if any"""
+        lo, hi = self.window(target_ts)
+        return self.values[lo] if lo < hi else None
+
+    def scaled(self, multiplier: float) -> "_TimeSeriesColumn":
+        """Column sharing these timestamps with values multiplied"""
+        column = copy.copy(self)
+        column.values = self.values * multiplier
+        return column
+
+
+class CompiledBacktestDataset:
+    """
+    Columnar, date-indexed view of a backtest dataset.
+
+    Example:
+        compiled = CompiledBacktestDataset(dataset)
+        prices = compiled.prices_near(current_date)
+        for wallet_address, trades in compiled.trades_on(current_date):
+            ...
+    """
+
+    def __init__(self, dataset: Dict[str, Any]) -> None:
+        """
+        Compile a dataset.
+
+        Args:
+            dataset: Dataset produced by HistoricalDataManager
+        """
+        market_data = dataset.get("market_data", {})
+        price_data = market_data.get("price_data", {}) or {}
+        gas_series = dataset.get("gas_data", {}).get("gas_price_series", [])
+        regime_series = dataset.get("regime_data", {}).get("regime_series", [])
+
+        # Price columns per market, in the dataset's market order
+        self.price_columns: List[_TimeSeriesColumn] = [
+            _TimeSeriesColumn(prices, "price")
+            for prices in price_data.values()
+            if prices
+        ]
+        self.gas_column = _TimeSeriesColumn(gas_series, "gas_price_gwei")
+        self.regime_column = _TimeSeriesColumn(regime_series, "regime")
+
+        self._compile_trades(dataset.get("wallet_data", {}))
+
+        # Scenario multipliers applied to derived market conditions
+        self.volatility_multiplier = 1.0
+        self.liquidity_multiplier = 1.0
+
+    def with_shocks(
+        self,
+        gas_multiplier: float = 1.0,
+        volatility_multiplier: float = 1.0,
+        liquidity_multiplier: float = 1.0,
+    ) -> "CompiledBacktestDataset":
+        """
+        Shocked view of this dataset for a Monte Carlo scenario.
+
+        The view shares the price and trade columns with this dataset; only
+        the gas column is rescaled. Neither this dataset nor the source
+        dataset dict is modified.
+
+        Args:
+            gas_multiplier: Multiplier for every gas price
+            volatility_multiplier: Multiplier for the derived volatility index
+            liquidity_multiplier: Multiplier for the liquidity score
+
+        Returns:
+            Shocked CompiledBacktestDataset
+        """
+        shocked = copy.copy(self)
+        shocked.gas_column = self.gas_column.scaled(gas_multiplier)
+        shocked.volatility_multiplier = self.volatility_multiplier * volatility_multiplier
+        shocked.liquidity_multiplier = self.liquidity_multiplier * liquidity_multiplier
+        return shocked
+
+    def _compile_trades(self, wallet_data: Dict[str, Any]) -> None:
+        """Build a (day, wallet, position) sorted trade index"""
+        self.wallet_addresses: List[str] = list(wallet_data.keys())
+        self.wallet_infos: List[Dict[str, Any]] = list(wallet_data.values())
+        self.wallet_types: List[str] = [
+            info.get("summary_stats", {}).get("wallet_type", "unknown")
+            for info in self.wallet_infos
+        ]
+
+        trades: List[Dict[str, Any]] = []
+        days: List[int] = []
+        wallet_indices: List[int] = []
+        for wallet_index, wallet_info in enumerate(self.wallet_infos):
+            for trade in wallet_info.get("trades", []):
+                timestamp = trade.get("timestamp")
+                if not timestamp:
+                    continue
+                trades.append(trade)
+                days.append(datetime.fromisoformat(timestamp).date().toordinal())
+                wallet_indices.append(wallet_index)
+
+        day_column = np.asarray(days, dtype=np.int64)
+        wallet_column = np.asarray(wallet_indices, dtype=np.int64)
+        # lexsort sorts by the last key first; it is stable, so trades keep
+        # their original order within each (day, wallet) group
+        order = np.lexsort((wallet_column, day_column))
+
+        self.trade_days = day_column[order]
+        self.trade_wallets = wallet_column[order]
+        self.trades: List[Dict[str, Any]] = [trades[i] for i in order]
+
+    def prices_near(self, target_date: datetime) -> np.ndarray:
+        """
+        Prices within the lookup window, concatenated in market order.
+
+        Args:
+            target_date: Simulated date
+
+        Returns:
+            Array of prices (empty if none)
+        """
+        target_ts = target_date.timestamp()
+        slices = []
+        for column in self.price_columns:
+            lo, hi = column.window(target_ts)
+            if lo < hi:
+                slices.append(column.values[lo:hi])
+        if not slices:
+            return np.empty(0, dtype=np.float64)
+        return np.concatenate(slices)
+
+    def gas_price_near(self, target_date: datetime) -> Optional[float]:
+        """Earliest gas price within the lookup window, if any"""
+        value = self.gas_column.first_in_window(target_date.timestamp())
+        return None if value is None else float(value)
+
+    def regime_near(self, target_date: datetime) -> Optional[str]:
+        """Earliest market regime within the lookup window, if any"""
+        return self.regime_column.first_in_window(target_date.timestamp())
+
+    def trades_on(
+        self, target_date: datetime
+    ) -> List[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Trades on the target's calendar date, grouped by wallet.
+
+        Args:
+            target_date: Simulated date
+
+        Returns:
+            List of (wallet_index, trades) in dataset wallet order
+        """
+        day = target_date.date().toordinal()
+        lo = int(np.searchsorted(self.trade_days, day, "left"))
+        hi = int(np.searchsorted(self.trade_days, day, "right"))
+        if lo == hi:
+            return []
+
+        wallets = self.trade_wallets[lo:hi]
+        # Group boundaries where the wallet index changes
+        boundaries = np.flatnonzero(np.diff(wallets)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [hi - lo]))
+        return [
+            (int(wallets[start]), self.trades[lo + start : lo + end])
+            for start, end in zip(starts, ends)
+        ]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Row counts per compiled column"""
+        return {
+            "markets": len(self.price_columns),
+            "price_points": sum(len(c.timestamps) for c in self.price_columns),
+            "gas_points": len(self.gas_column.timestamps),
+            "regime_points": len(self.regime_column.timestamps),
+            "wallets": len(self.wallet_addresses),
+            "trades": len(self.trades),
+        }
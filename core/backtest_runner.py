@@ -0,0 +1,374 @@
+"""
+Backtest Batch Runner
+=====================
+
+Runs batches of independent backtests over one dataset, either serially on
+the event loop or fanned out across a process pool.
+
+Each backtest is CPU-bound, so parameter searches (grid points, GA
+populations, walk-forward windows, validation folds) are submitted as
+batches. In process mode the dataset and its compiled columns are shipped
+to each worker once through the pool initializer rather than with every
+task.
+
+Determinism: every request is run with NumPy's global RNG seeded from a
+stable hash of the request (strategy config, date range, capital) and the
+runner's base seed. Serial and process modes therefore produce identical
+results, and a request's result does not depend on its position in a batch.
+In serial mode the caller's RNG state is restored after each run.
+
+Monte Carlo scenarios are submitted in chunks through ``iter_scenarios``.
+Each scenario runs against a shocked view of the compiled dataset, and
+workers return per-scenario summaries rather than full results.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+
+from core.backtest_dataset import CompiledBacktestDataset
+from core.monte_carlo import ScenarioSpec, summarize_scenario_result
+
+if TYPE_CHECKING:
+    from core.backtesting_engine import BacktestingEngine
+
+logger = logging.getLogger(__name__)
+
+# (strategy_config, start_date, end_date, capital)
+BacktestRequest = Tuple[Dict[str, Any], datetime, datetime, float]
+
+DEFAULT_BASE_SEED = 42
+SEED_MODULUS = 2**32  # np.random.seed accepts [0, 2**32)
+
+# Per-worker state installed once by _init_worker
+_worker_engine: Optional["BacktestingEngine"] = None
+_worker_dataset: Optional[Dict[str, Any]] = None
+_worker_compiled: Optional[CompiledBacktestDataset] = None
+
+
+def request_seed(request: BacktestRequest, base_seed: int) -> int:
+    """
+    Derive a stable RNG seed for a backtest request.
+
+    Python's hash() is salted per process, so the seed is derived from a
+    SHA-256 digest of the request instead.
+
+    Args:
+        request: Backtest request tuple
+        base_seed: Runner base seed
+
+    Returns:
+        Seed in [0, 2**32)
+    """
+    strategy_config, start_date, end_date, capital = request
+    payload = json.dumps(
+        [
+            base_seed,
+            strategy_config,
+            start_date.isoformat(),
+            end_date.isoformat(),
+            capital,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.sha256(payload.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % SEED_MODULUS
+
+
+def _init_worker(
+    engine_cls: Type["BacktestingEngine"],
+    simulation_params: Dict[str, Any],
+    dataset: Dict[str, Any],
+    compiled_dataset: CompiledBacktestDataset,
+) -> None:
+    """Install the engine and dataset in a freshly started worker"""
+    global _worker_engine, _worker_dataset, _worker_compiled
+    logging.getLogger("core.backtesting_engine").setLevel(logging.WARNING)
+    _worker_engine = engine_cls(None)
+    _worker_engine.simulation_params = simulation_params
+    _worker_dataset = dataset
+    _worker_compiled = compiled_dataset
+
+
+def _run_backtest_in_worker(request: BacktestRequest, seed: int) -> Dict[str, Any]:
+    """Run one seeded backtest inside a pool worker"""
+    strategy_config, start_date, end_date, capital = request
+    np.random.seed(seed)
+    return asyncio.run(
+        _worker_engine.run_backtest(
+            strategy_config,
+            _worker_dataset,
+            start_date,
+            end_date,
+            capital,
+            compiled_dataset=_worker_compiled,
+        )
+    )
+
+
+async def _simulate_scenarios(
+    engine: "BacktestingEngine",
+    dataset: Dict[str, Any],
+    compiled_dataset: CompiledBacktestDataset,
+    request: BacktestRequest,
+    scenarios: List[ScenarioSpec],
+    summarize: bool = True,
+) -> List[Dict[str, Any]]:
+    """Run scenarios one after another against shocked dataset views"""
+    strategy_config, start_date, end_date, capital = request
+    results = []
+    for scenario_id, shocks, seed in scenarios:
+        np.random.seed(seed)
+        result = await engine.run_backtest(
+            strategy_config,
+            dataset,
+            start_date,
+            end_date,
+            capital,
+            compiled_dataset=compiled_dataset.with_shocks(
+                gas_multiplier=shocks.get("gas_price_multiplier", 1.0),
+                volatility_multiplier=shocks.get("volatility_multiplier", 1.0),
+                liquidity_multiplier=shocks.get("liquidity_multiplier", 1.0),
+            ),
+        )
+        if summarize:
+            results.append(summarize_scenario_result(scenario_id, result))
+        else:
+            result["scenario_id"] = scenario_id
+            result["scenario_shocks"] = shocks
+            results.append(result)
+    return results
+
+
+def _run_scenarios_in_worker(
+    request: BacktestRequest, scenarios: List[ScenarioSpec]
+) -> List[Dict[str, Any]]:
+    """Run a chunk of Monte Carlo scenarios inside a pool worker"""
+    return asyncio.run(
+        _simulate_scenarios(
+            _worker_engine, _worker_dataset, _worker_compiled, request, scenarios
+        )
+    )
+
+
+class BacktestBatchRunner:
+    """
+    Executes batches of seeded backtests over a single dataset.
+
+    Example:
+        runner = BacktestBatchRunner(engine, dataset, max_workers=8)
+        try:
+            results = await runner.run(
+                [(config, start_date, end_date, 10000.0) for config in configs]
+            )
+        finally:
+            runner.close()
+    """
+
+    def __init__(
+        self,
+        engine: "BacktestingEngine",
+        dataset: Dict[str, Any],
+        max_workers: Optional[int] = 1,
+        base_seed: int = DEFAULT_BASE_SEED,
+        compiled_dataset: Optional[CompiledBacktestDataset] = None,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            engine: Backtesting engine (its simulation_params are copied to workers)
+            dataset: Dataset every request runs against
+            max_workers: Worker processes; 1 runs serially on the event loop,
+                None uses all CPU cores
+            base_seed: Base seed mixed into every request seed
+            compiled_dataset: Pre-compiled columns for ``dataset``
+        """
+        self.engine = engine
+        self.dataset = dataset
+        self.base_seed = base_seed
+        self.max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self.compiled_dataset = compiled_dataset or CompiledBacktestDataset(dataset)
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._serial_lock = asyncio.Lock()
+        self.backtests_run = 0
+
+    @property
+    def is_parallel(self) -> bool:
+        """Whether requests are dispatched to a process pool"""
+        return (self.max_workers or 1) > 1
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the process pool on first use"""
+        if self._executor is None:
+            # spawn avoids forking a process that has a running event loop
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    type(self.engine),
+                    self.engine.simulation_params,
+                    self.dataset,
+                    self.compiled_dataset,
+                ),
+            )
+            logger.info(
+                f"⚙️ Backtest process pool started with {self.max_workers} workers"
+            )
+        return self._executor
+
+    async def run(
+        self, requests: List[BacktestRequest], return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Run a batch of backtests.
+
+        Args:
+            requests: (strategy_config, start_date, end_date, capital) tuples
+            return_exceptions: Return a failed backtest's exception in its slot
+                instead of raising, so the rest of the batch still completes
+
+        Returns:
+            Backtest results (or exceptions) in request order
+        """
+        if not requests:
+            return []
+
+        seeds = [request_seed(request, self.base_seed) for request in requests]
+        self.backtests_run += len(requests)
+
+        if not self.is_parallel:
+            results: List[Any] = []
+            for request, seed in zip(requests, seeds):
+                try:
+                    results.append(await self._run_serial(request, seed))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+            return results
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        return list(
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor, _run_backtest_in_worker, request, seed
+                    )
+                    for request, seed in zip(requests, seeds)
+                ),
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    async def _run_serial(self, request: BacktestRequest, seed: int) -> Dict[str, Any]:
+        """Run one seeded backtest on the event loop, preserving the caller's RNG"""
+        strategy_config, start_date, end_date, capital = request
+        # The lock keeps concurrent batches from interleaving seeded RNG use
+        async with self._serial_lock:
+            rng_state = np.random.get_state()
+            np.random.seed(seed)
+            try:
+                return await self.engine.run_backtest(
+                    strategy_config,
+                    self.dataset,
+                    start_date,
+                    end_date,
+                    capital,
+                    compiled_dataset=self.compiled_dataset,
+                )
+            finally:
+                np.random.set_state(rng_state)
+
+    async def iter_scenarios(
+        self,
+        request: BacktestRequest,
+        scenarios: List[ScenarioSpec],
+        chunk_size: int = 50,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Run Monte Carlo scenarios, yielding summaries chunk by chunk.
+
+        In process mode chunks are yielded in completion order, so callers
+        should key results by ``scenario_id`` rather than position.
+
+        Args:
+            request: Base backtest request shared by every scenario
+            scenarios: (scenario_id, shocks, simulation_seed) tuples
+            chunk_size: Scenarios per worker task
+
+        Yields:
+            Lists of scenario summaries (see summarize_scenario_result)
+        """
+        chunk_size = max(1, chunk_size)
+        chunks = [
+            scenarios[i : i + chunk_size] for i in range(0, len(scenarios), chunk_size)
+        ]
+        self.backtests_run += len(scenarios)
+
+        if not self.is_parallel:
+            for chunk in chunks:
+                yield await self.run_scenarios_serial(request, chunk)
+            return
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        futures = [
+            loop.run_in_executor(executor, _run_scenarios_in_worker, request, chunk)
+            for chunk in chunks
+        ]
+        try:
+            for future in asyncio.as_completed(futures):
+                yield await future
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def run_scenarios_serial(
+        self,
+        request: BacktestRequest,
+        scenarios: List[ScenarioSpec],
+        summarize: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run scenarios on the event loop, preserving the caller's RNG.
+
+        Args:
+            request: Base backtest request shared by every scenario
+            scenarios: (scenario_id, shocks, simulation_seed) tuples
+            summarize: Return summaries instead of full backtest results
+
+        Returns:
+            Scenario summaries or full results, in scenario order
+        """
+        async with self._serial_lock:
+            rng_state = np.random.get_state()
+            try:
+                return await _simulate_scenarios(
+                    self.engine,
+                    self.dataset,
+                    self.compiled_dataset,
+                    request,
+                    scenarios,
+                    summarize=summarize,
+                )
+            finally:
+                np.random.set_state(rng_state)
+
+    def close(self) -> None:
+        """Shut down the process pool, if one was started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
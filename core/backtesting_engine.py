@@ -15,6 +15,7 @@ Features:
 - Sensitivity analysis capabilities
 """
 
+import asyncio
 import json
 import logging
 from collections import defaultdict
@@ -27,7 +28,14 @@ from scipy import stats
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import r2_score
 
+from core.backtest_dataset import CompiledBacktestDataset
+from core.backtest_runner import BacktestBatchRunner
 from core.historical_data_manager import HistoricalDataManager
+from core.monte_carlo import (
+    MonteCarloAccumulator,
+    generate_scenario_shocks,
+    scenario_specs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +89,9 @@ class BacktestingEngine:
             "volatility_shock_scenarios": 100,  # Extreme volatility scenarios
             "correlation_break_scenarios": 50,  # Correlation breakdown scenarios
             "liquidity_crisis_scenarios": 50,  # Liquidity crisis scenarios
+            "monte_carlo_workers": 1,  # Worker processes (1 = serial, None = all cores)
+            "monte_carlo_chunk_size": 50,  # Scenarios per worker task
+            "monte_carlo_seed": 42,  # Root seed for scenario shock streams
             # Performance tracking
             "performance_metrics": [
                 "total_return",
@@ -120,6 +131,7 @@ class BacktestingEngine:
         start_date: datetime,
         end_date: datetime,
         capital: float = 10000.0,
+        compiled_dataset: Optional[CompiledBacktestDataset] = None,
     ) -> Dict[str, Any]:
         """
         Run comprehensive backtest for a copy trading strategy.
@@ -130,6 +142,8 @@ class BacktestingEngine:
             start_date: Backtest start date
             end_date: Backtest end date
             capital: Starting capital
+            compiled_dataset: Pre-compiled columns for ``dataset``; pass one to
+                share the compile step across runs on an unchanged dataset
 
         Returns:
             Complete backtest results with performance metrics
@@ -153,6 +167,10 @@ class BacktestingEngine:
             # Initialize simulation state
             self._initialize_simulation_state(strategy_config, dataset, capital)
 
+            # Compile the dataset once so each simulated day is an indexed slice
+            if compiled_dataset is None:
+                compiled_dataset = CompiledBacktestDataset(dataset)
+
             # Run simulation loop
             current_date = start_date
             portfolio_value = capital
@@ -161,12 +179,12 @@ class BacktestingEngine:
             while current_date <= end_date:
                 # Get market conditions for current date
                 market_conditions = self._get_market_conditions_at_date(
-                    dataset, current_date
+                    compiled_dataset, current_date
                 )
 
                 # Get wallet activities for current date
                 wallet_activities = self._get_wallet_activities_at_date(
-                    dataset, current_date, strategy_config
+                    compiled_dataset, current_date, strategy_config
                 )
 
                 # Execute strategy decisions
@@ -242,17 +260,10 @@ class BacktestingEngine:
         }
 
     def _get_market_conditions_at_date(
-        self, dataset: Dict[str, Any], target_date: datetime
+        self, compiled_dataset: CompiledBacktestDataset, target_date: datetime
     ) -> Dict[str, Any]:
         """Get market conditions for a specific date."""
 
-        market_data = dataset.get("market_data", {})
-        gas_data = dataset.get("gas_data", {})
-        regime_data = dataset.get("regime_data", {})
-
-        # Find closest market data point
-        price_data = market_data.get("price_data", {})
-
         market_conditions = {
             "date": target_date.isoformat(),
             "volatility_index": 0.2,  # Default
@@ -262,54 +273,36 @@ class BacktestingEngine:
             "market_regime": "normal",  # Default
         }
 
-        # Extract actual market conditions from dataset
-        if price_data:
-            # Calculate volatility from recent price data
-            all_prices = []
-            for market_prices in price_data.values():
-                # Get prices around target date
-                for price_point in market_prices:
-                    price_date = datetime.fromisoformat(price_point["timestamp"])
-                    if abs((price_date - target_date).days) <= 1:  # Within 1 day
-                        all_prices.append(price_point["price"])
-
-            if len(all_prices) >= 2:
-                returns = [
-                    all_prices[i + 1] / all_prices[i] - 1
-                    for i in range(len(all_prices) - 1)
-                ]
-                if returns:
-                    market_conditions["volatility_index"] = np.std(returns) * np.sqrt(
-                        365
-                    )
+        # Calculate volatility from prices around target date (within 1 day)
+        prices = compiled_dataset.prices_near(target_date)
+        if len(prices) >= 2:
+            returns = prices[1:] / prices[:-1] - 1
+            market_conditions["volatility_index"] = np.std(returns) * np.sqrt(365)
+
+        # Monte Carlo scenario shocks (1.0 outside stress tests)
+        market_conditions["volatility_index"] *= compiled_dataset.volatility_multiplier
+        market_conditions["liquidity_score"] *= compiled_dataset.liquidity_multiplier
 
         # Get gas price
-        gas_series = gas_data.get("gas_price_series", [])
-        for gas_point in gas_series:
-            gas_date = datetime.fromisoformat(gas_point["timestamp"])
-            if abs((gas_date - target_date).days) <= 1:
-                market_conditions["gas_price_gwei"] = gas_point["gas_price_gwei"]
-                break
+        gas_price = compiled_dataset.gas_price_near(target_date)
+        if gas_price is not None:
+            market_conditions["gas_price_gwei"] = gas_price
 
         # Get market regime
-        regime_series = regime_data.get("regime_series", [])
-        for regime_point in regime_series:
-            regime_date = datetime.fromisoformat(regime_point["timestamp"])
-            if abs((regime_date - target_date).days) <= 1:
-                market_conditions["market_regime"] = regime_point["regime"]
-                break
+        regime = compiled_dataset.regime_near(target_date)
+        if regime is not None:
+            market_conditions["market_regime"] = regime
 
         return market_conditions
 
     def _get_wallet_activities_at_date(
         self,
-        dataset: Dict[str, Any],
+        compiled_dataset: CompiledBacktestDataset,
         target_date: datetime,
         strategy_config: Dict[str, Any],
     ) -> List[Dict[str, Any]]:
         """Get wallet activities for a specific date."""
 
-        wallet_data = dataset.get("wallet_data", {})
         activities = []
 
         # Extract wallet type from strategy config
@@ -317,34 +310,21 @@ class BacktestingEngine:
             "wallet_type_filter", ["market_maker", "directional_trader"]
         )
 
-        for wallet_address, wallet_info in wallet_data.items():
-            wallet_classification = wallet_info.get("summary_stats", {}).get(
-                "wallet_type", "unknown"
-            )
+        for wallet_index, date_trades in compiled_dataset.trades_on(target_date):
+            wallet_classification = compiled_dataset.wallet_types[wallet_index]
 
             # Filter by wallet type
             if wallet_classification not in wallet_type_filter:
                 continue
 
-            trades = wallet_info.get("trades", [])
-
-            # Find trades on target date
-            date_trades = []
-            for trade in trades:
-                if trade.get("timestamp"):
-                    trade_date = datetime.fromisoformat(trade["timestamp"])
-                    if trade_date.date() == target_date.date():
-                        date_trades.append(trade)
-
-            if date_trades:
-                activities.append(
-                    {
-                        "wallet_address": wallet_address,
-                        "wallet_type": wallet_classification,
-                        "trades": date_trades,
-                        "wallet_info": wallet_info,
-                    }
-                )
+            activities.append(
+                {
+                    "wallet_address": compiled_dataset.wallet_addresses[wallet_index],
+                    "wallet_type": wallet_classification,
+                    "trades": date_trades,
+                    "wallet_info": compiled_dataset.wallet_infos[wallet_index],
+                }
+            )
 
         return activities
 
@@ -1072,14 +1052,19 @@ class BacktestingEngine:
         strategy_configs: List[Dict[str, Any]],
         dataset: Dict[str, Any],
         optimization_target: str = "sharpe_ratio",
+        backtest_runner: Optional[BacktestBatchRunner] = None,
     ) -> Dict[str, Any]:
         """
         Run walk-forward optimization to find optimal strategy parameters.
 
+        Windows are evaluated concurrently through the backtest runner, so a
+        process-pool runner spreads them across CPU cores.
+
         Args:
             strategy_configs: List of strategy configurations to optimize
             dataset: Historical dataset
             optimization_target: Metric to optimize (sharpe_ratio, total_return, etc.)
+            backtest_runner: Runner for ``dataset`` (default: serial runner)
 
         Returns:
             Optimization results with optimal parameters
@@ -1113,6 +1098,10 @@ class BacktestingEngine:
 
             current_train_start = start_date
 
+            # All windows slice the same dataset; the runner compiles it once
+            runner = backtest_runner or BacktestBatchRunner(self, dataset)
+
+            window_tasks = []
             while current_train_start + training_window + testing_window <= end_date:
                 train_start = current_train_start
                 train_end = train_start + training_window
@@ -1120,20 +1109,25 @@ class BacktestingEngine:
                 test_end = test_start + testing_window
 
                 # Optimize parameters on training data
-                window_result = await self._optimize_window_parameters(
-                    strategy_configs,
-                    dataset,
-                    train_start,
-                    train_end,
-                    test_start,
-                    test_end,
-                    optimization_target,
+                window_tasks.append(
+                    self._optimize_window_parameters(
+                        strategy_configs,
+                        dataset,
+                        train_start,
+                        train_end,
+                        test_start,
+                        test_end,
+                        optimization_target,
+                        backtest_runner=runner,
+                    )
                 )
 
-                optimization_results["walk_forward_windows"].append(window_result)
-
                 current_train_start += step_size
 
+            optimization_results["walk_forward_windows"] = list(
+                await asyncio.gather(*window_tasks)
+            )
+
             # Analyze parameter stability across windows
             optimization_results["parameter_stability"] = (
                 self._analyze_parameter_stability(
@@ -1174,9 +1168,12 @@ class BacktestingEngine:
         test_start: datetime,
         test_end: datetime,
         optimization_target: str,
+        backtest_runner: Optional[BacktestBatchRunner] = None,
     ) -> Dict[str, Any]:
         """Optimize parameters for a specific time window."""
 
+        runner = backtest_runner or BacktestBatchRunner(self, dataset)
+
         window_result = {
             "training_period": f"{train_start.isoformat()} to {train_end.isoformat()}",
             "testing_period": f"{test_start.isoformat()} to {test_end.isoformat()}",
@@ -1190,12 +1187,10 @@ class BacktestingEngine:
         best_config = None
 
         # Grid search over parameter combinations (simplified)
-        for config in strategy_configs:
-            # Run backtest on training data
-            train_result = await self.run_backtest(
-                config, dataset, train_start, train_end, capital=10000
-            )
-
+        train_results = await runner.run(
+            [(config, train_start, train_end, 10000) for config in strategy_configs]
+        )
+        for config, train_result in zip(strategy_configs, train_results):
             if "performance_metrics" in train_result:
                 score = train_result["performance_metrics"].get(optimization_target, 0)
 
@@ -1210,8 +1205,8 @@ class BacktestingEngine:
         if best_config:
             window_result["optimal_config"] = best_config
 
-            test_result = await self.run_backtest(
-                best_config, dataset, test_start, test_end, capital=10000
+            (test_result,) = await runner.run(
+                [(best_config, test_start, test_end, 10000)]
             )
 
             if "performance_metrics" in test_result:
@@ -1356,24 +1351,32 @@ class BacktestingEngine:
         start_date: datetime,
         end_date: datetime,
         capital: float = 10000,
+        backtest_runner: Optional[BacktestBatchRunner] = None,
     ) -> Dict[str, Any]:
         """
         Run Monte Carlo stress testing with various market scenarios.
 
+        All scenario shocks are drawn up front as arrays, each scenario runs
+        against a shocked view of the compiled dataset, and only a summary of
+        each scenario is kept, so large scenario counts fit in bounded memory.
+
         Args:
             strategy_config: Strategy configuration
             dataset: Historical dataset
             start_date: Test start date
             end_date: Test end date
             capital: Starting capital
+            backtest_runner: Runner for ``dataset``; one with
+                ``monte_carlo_workers`` workers is created if omitted
 
         Returns:
             Monte Carlo stress test results
         """
 
+        total_scenarios = self.simulation_params["monte_carlo_scenarios"]
         mc_results = {
-            "total_scenarios": self.simulation_params["monte_carlo_scenarios"],
-            "scenario_results": [],
+            "total_scenarios": total_scenarios,
+            "scenario_types": {},
             "aggregate_statistics": {},
             "worst_case_scenario": {},
             "best_case_scenario": {},
@@ -1383,63 +1386,63 @@ class BacktestingEngine:
             "timestamp": datetime.now().isoformat(),
         }
 
+        owns_runner = backtest_runner is None
         try:
             logger.info(
-                f"🎲 Running Monte Carlo stress test with {mc_results['total_scenarios']} scenarios"
+                f"🎲 Running Monte Carlo stress test with {total_scenarios} scenarios"
             )
 
-            scenario_results = []
-
-            for scenario_id in range(mc_results["total_scenarios"]):
-                # Generate stochastic scenario
-                scenario_shocks = self._generate_scenario_shocks(scenario_id)
-
-                # Run backtest with scenario modifications
-                scenario_result = await self._run_scenario_backtest(
-                    strategy_config,
+            if owns_runner:
+                backtest_runner = BacktestBatchRunner(
+                    self,
                     dataset,
-                    start_date,
-                    end_date,
-                    capital,
-                    scenario_shocks,
-                    scenario_id,
+                    max_workers=self.simulation_params["monte_carlo_workers"],
                 )
 
-                scenario_results.append(scenario_result)
-
-            mc_results["scenario_results"] = scenario_results
-
-            # Calculate aggregate statistics
-            mc_results["aggregate_statistics"] = self._calculate_monte_carlo_statistics(
-                scenario_results
+            # Draw every scenario's shocks at once
+            shocks = generate_scenario_shocks(
+                total_scenarios,
+                self.simulation_params,
+                self.simulation_params["monte_carlo_seed"],
             )
+            scenario_types, type_counts = np.unique(
+                shocks["scenario_type"].astype(str), return_counts=True
+            )
+            mc_results["scenario_types"] = {
+                str(t): int(c) for t, c in zip(scenario_types, type_counts)
+            }
 
-            # Find extreme scenarios
-            returns = [s["final_capital"] / capital - 1 for s in scenario_results]
-
-            worst_idx = np.argmin(returns)
-            best_idx = np.argmax(returns)
+            request = (strategy_config, start_date, end_date, capital)
+            accumulator = MonteCarloAccumulator(total_scenarios)
+            async for summaries in backtest_runner.iter_scenarios(
+                request,
+                scenario_specs(shocks, range(total_scenarios)),
+                chunk_size=self.simulation_params["monte_carlo_chunk_size"],
+            ):
+                for summary in summaries:
+                    accumulator.add(summary)
 
-            mc_results["worst_case_scenario"] = scenario_results[worst_idx]
-            mc_results["best_case_scenario"] = scenario_results[best_idx]
+            # Calculate aggregate statistics
+            mc_results["aggregate_statistics"] = accumulator.get_statistics()
+
+            # Re-run the extreme scenarios for their full (seeded) results
+            worst_id, best_id = accumulator.extreme_scenarios()
+            if worst_id is not None:
+                worst, best = await backtest_runner.run_scenarios_serial(
+                    request,
+                    scenario_specs(shocks, [worst_id, best_id]),
+                    summarize=False,
+                )
+                mc_results["worst_case_scenario"] = worst
+                mc_results["best_case_scenario"] = best
 
             # Calculate Value at Risk
-            mc_results["var_95"] = np.percentile(returns, 5)
-            mc_results["cvar_95"] = np.mean(
-                [r for r in returns if r <= mc_results["var_95"]]
+            mc_results["var_95"], mc_results["cvar_95"] = accumulator.value_at_risk(
+                0.95
             )
 
             # Confidence intervals
-            mc_results["confidence_intervals"] = {
-                "return_95_ci": [
-                    np.percentile(returns, 2.5),
-                    np.percentile(returns, 97.5),
-                ],
-                "sharpe_95_ci": [
-                    np.percentile([s["sharpe_ratio"] for s in scenario_results], 2.5),
-                    np.percentile([s["sharpe_ratio"] for s in scenario_results], 97.5),
-                ],
-            }
+            mc_results["confidence_intervals"] = accumulator.confidence_intervals()
 
             logger.info(
                 f"✅ Monte Carlo stress test completed: VaR 95% = {mc_results['var_95']:.2%}"
@@ -1449,162 +1452,13 @@ class BacktestingEngine:
             logger.error(f"Error in Monte Carlo stress test: {e}")
             mc_results["error"] = str(e)
 
-        return mc_results
-
-    def _generate_scenario_shocks(self, scenario_id: int) -> Dict[str, Any]:
-        """Generate stochastic shocks for Monte Carlo scenario."""
-
-        # Base random seed for reproducibility
-        np.random.seed(scenario_id)
-
-        scenario_shocks = {
-            "volatility_multiplier": np.random.lognormal(
-                0, 0.3
-            ),  # Log-normal for positive values
-            "liquidity_multiplier": np.random.beta(
-                2, 2
-            ),  # Beta distribution centered on 1
-            "gas_price_multiplier": np.random.lognormal(0, 0.5),
-            "correlation_shock": np.random.normal(0, 0.2),  # Correlation changes
-            "regime_change_probability": np.random.beta(
-                1, 9
-            ),  # Low probability regime changes
-        }
-
-        # Add extreme scenarios for stress testing
-        if scenario_id < self.simulation_params["volatility_shock_scenarios"]:
-            scenario_shocks["volatility_multiplier"] = np.random.uniform(2.0, 4.0)
-            scenario_shocks["scenario_type"] = "high_volatility"
-
-        elif scenario_id < (
-            self.simulation_params["volatility_shock_scenarios"]
-            + self.simulation_params["correlation_break_scenarios"]
-        ):
-            scenario_shocks["correlation_shock"] = np.random.uniform(-0.5, 0.5)
-            scenario_shocks["scenario_type"] = "correlation_break"
-
-        elif scenario_id < (
-            self.simulation_params["volatility_shock_scenarios"]
-            + self.simulation_params["correlation_break_scenarios"]
-            + self.simulation_params["liquidity_crisis_scenarios"]
-        ):
-            scenario_shocks["liquidity_multiplier"] = np.random.uniform(0.1, 0.3)
-            scenario_shocks["scenario_type"] = "liquidity_crisis"
-
-        return scenario_shocks
-
-    async def _run_scenario_backtest(
-        self,
-        strategy_config: Dict[str, Any],
-        dataset: Dict[str, Any],
-        start_date: datetime,
-        end_date: datetime,
-        capital: float,
-        scenario_shocks: Dict[str, Any],
-        scenario_id: int,
-    ) -> Dict[str, Any]:
-        """Run backtest with scenario-specific modifications."""
-
-        # Apply scenario shocks to market conditions
-        modified_dataset = self._apply_scenario_shocks_to_dataset(
-            dataset, scenario_shocks
-        )
-
-        # Run backtest with modified data
-        result = await self.run_backtest(
-            strategy_config, modified_dataset, start_date, end_date, capital
-        )
-
-        # Add scenario information
-        result["scenario_id"] = scenario_id
-        result["scenario_shocks"] = scenario_shocks
-
-        return result
-
-    def _apply_scenario_shocks_to_dataset(
-        self, dataset: Dict[str, Any], shocks: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Apply scenario shocks to dataset."""
-
-        modified_dataset = dataset.copy()
-
-        # Modify market data
-        if "market_data" in modified_dataset:
-            market_data = modified_dataset["market_data"]
-
-            # Apply volatility shock
-            vol_multiplier = shocks.get("volatility_multiplier", 1.0)
-            if "volatility_data" in market_data:
-                for market_vol in market_data["volatility_data"].values():
-                    market_vol["annualized_volatility"] *= vol_multiplier
+        finally:
+            if owns_runner and backtest_runner is not None:
+                backtest_runner.close()
 
-            # Apply liquidity shock
-            liq_multiplier = shocks.get("liquidity_multiplier", 1.0)
-            if "price_data" in market_data:
-                for market_prices in market_data["price_data"].values():
-                    for price_point in market_prices:
-                        price_point["volume"] *= liq_multiplier
-
-        # Modify gas data
-        gas_multiplier = shocks.get("gas_price_multiplier", 1.0)
-        if (
-            "gas_data" in modified_dataset
-            and "gas_price_series" in modified_dataset["gas_data"]
-        ):
-            for gas_point in modified_dataset["gas_data"]["gas_price_series"]:
-                gas_point["gas_price_gwei"] *= gas_multiplier
-
-        return modified_dataset
-
-    def _calculate_monte_carlo_statistics(
-        self, scenario_results: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
-        """Calculate aggregate statistics from Monte Carlo results."""
-
-        if not scenario_results:
-            return {}
-
-        # Extract key metrics
-        final_capitals = [s["final_capital"] for s in scenario_results]
-        returns = [
-            (c - 10000) / 10000 for c in final_capitals
-        ]  # Assuming $10K starting capital
-        sharpe_ratios = [
-            s.get("performance_metrics", {}).get("sharpe_ratio", 0)
-            for s in scenario_results
-        ]
-        max_drawdowns = [
-            s.get("performance_metrics", {}).get("max_drawdown", 0)
-            for s in scenario_results
-        ]
-
-        statistics = {
-            "mean_return": np.mean(returns),
-            "return_std": np.std(returns),
-            "return_skewness": stats.skew(returns),
-            "return_kurtosis": stats.kurtosis(returns),
-            "mean_sharpe": np.mean(sharpe_ratios),
-            "sharpe_std": np.std(sharpe_ratios),
-            "mean_max_drawdown": np.mean(max_drawdowns),
-            "probability_profit": sum(1 for r in returns if r > 0) / len(returns),
-            "probability_loss_10pct": sum(1 for r in returns if r < -0.1)
-            / len(returns),
-            "probability_loss_20pct": sum(1 for r in returns if r < -0.2)
-            / len(returns),
-            "best_return": max(returns),
-            "worst_return": min(returns),
-            "return_percentiles": {
-                "5": np.percentile(returns, 5),
-                "25": np.percentile(returns, 25),
-                "50": np.percentile(returns, 50),
-                "75": np.percentile(returns, 75),
-                "95": np.percentile(returns, 95),
-            },
-        }
-
-        return statistics
+        return mc_results
 
-    def run_sensitivity_analysis(
+    async def run_sensitivity_analysis(
         self,
         strategy_config: Dict[str, Any],
         dataset: Dict[str, Any],
@@ -1638,9 +1492,17 @@ class BacktestingEngine:
         }
 
         try:
+            # Every run shares the same unmodified dataset; compile it once
+            compiled_dataset = CompiledBacktestDataset(dataset)
+
             # Run base case
             base_result = await self.run_backtest(
-                strategy_config, dataset, start_date, end_date, capital
+                strategy_config,
+                dataset,
+                start_date,
+                end_date,
+                capital,
+                compiled_dataset=compiled_dataset,
             )
             sensitivity_results["base_case_performance"] = base_result.get(
                 "performance_metrics", {}
@@ -1662,7 +1524,12 @@ class BacktestingEngine:
 
                     # Run backtest
                     test_result = await self.run_backtest(
-                        test_config, dataset, start_date, end_date, capital
+                        test_config,
+                        dataset,
+                        start_date,
+                        end_date,
+                        capital,
+                        compiled_dataset=compiled_dataset,
                     )
                     test_metrics = test_result.get("performance_metrics", {})
 
@@ -20,11 +20,11 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 import numpy as np
-import pandas as pd
 from scipy import stats
 from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
 
+from core.change_point import detect_change_point_candidates
 from utils.helpers import BoundedCache
 
 logger = logging.getLogger(__name__)
@@ -177,13 +177,14 @@ class BehaviorPatternTracker:
             if not metrics_over_time:
                 return evolution_analysis
 
-            # Apply change point detection to each metric
-            change_points = {}
-            for metric_name, values in metrics_over_time.items():
-                if len(values) >= 20:
-                    cps = self._detect_change_points(values, metric_name)
-                    if cps:
-                        change_points[metric_name] = cps
+            # Apply change point detection to all metrics in one batch
+            change_points = self.detect_change_points_batch(
+                {
+                    metric_name: values
+                    for metric_name, values in metrics_over_time.items()
+                    if len(values) >= 20
+                }
+            )
 
             # Analyze change point significance
             if change_points:
@@ -287,113 +288,75 @@ class BehaviorPatternTracker:
     ) -> List[Dict[str, Any]]:
         """Detect change points in a time series using statistical methods."""
 
-        try:
-            if len(values) < 10:
-                return []
-
-            values_array = np.array(values)
-
-            # Method 1: CUSUM (Cumulative Sum) for change detection
-            cusum_changes = self._cusum_change_detection(values_array)
+        return self.detect_change_points_batch({metric_name: values}).get(
+            metric_name, []
+        )
 
-            # Method 2: Variance change detection
-            variance_changes = self._variance_change_detection(values_array)
+    def detect_change_points_batch(
+        self, series: Dict[Any, List[float]]
+    ) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Detect change points in many time series at once.
 
-            # Method 3: Trend change detection
-            trend_changes = self._trend_change_detection(values_array)
+        Series of equal length are stacked into a 2-D array and run through
+        the CUSUM, variance and trend detectors in one vectorized pass, so
+        every metric of many wallets can be analyzed in a single call.
 
-            # Combine and filter change points
-            all_changes = cusum_changes + variance_changes + trend_changes
+        Args:
+            series: Values keyed by metric name (or e.g. (wallet, metric))
 
-            # Remove duplicates and sort
-            unique_changes = self._filter_change_points(all_changes, len(values))
+        Returns:
+            Change points keyed like ``series``, for series that have any
+        """
 
-            change_points = []
-            for cp in unique_changes:
-                confidence = self._calculate_change_point_confidence(cp, values_array)
+        results: Dict[Any, List[Dict[str, Any]]] = {}
 
-                if confidence > self.pattern_params["change_point_detection_threshold"]:
-                    change_points.append(
-                        {
-                            "position": cp,
-                            "confidence": confidence,
-                            "method": "combined",
-                            "metric": metric_name,
-                        }
+        try:
+            # Group by length; series shorter than 10 points are skipped
+            by_length: Dict[int, List[Any]] = defaultdict(list)
+            for key, values in series.items():
+                if len(values) >= 10:
+                    by_length[len(values)].append(key)
+
+            for keys in by_length.values():
+                batch = np.array([series[key] for key in keys], dtype=np.float64)
+                candidates = detect_change_point_candidates(batch)
+
+                for key, values_array, row_candidates in zip(keys, batch, candidates):
+                    change_points = self._score_change_points(
+                        values_array, row_candidates, key
                     )
-
-            return change_points
+                    if change_points:
+                        results[key] = change_points
 
         except Exception as e:
             logger.error(f"Error detecting change points: {e}")
-            return []
-
-    def _cusum_change_detection(self, values: np.ndarray) -> List[int]:
-        """CUSUM (Cumulative Sum Control Chart) change detection."""
 
-        try:
-            # Calculate CUSUM statistics
-            mean_val = np.mean(values)
-            cusum = np.cumsum(values - mean_val)
-
-            # Find points where CUSUM changes significantly
-            cusum_diff = np.diff(cusum)
-            threshold = np.std(cusum_diff) * 2
-
-            change_indices = np.where(np.abs(cusum_diff) > threshold)[0] + 1
+        return results
 
-            return change_indices.tolist()
-
-        except Exception:
-            return []
-
-    def _variance_change_detection(self, values: np.ndarray) -> List[int]:
-        """Detect changes in variance using rolling statistics."""
-
-        try:
-            window_size = max(5, len(values) // 5)
-            rolling_var = pd.Series(values).rolling(window=window_size).var()
-
-            # Find significant variance changes
-            var_changes = np.where(
-                np.abs(np.diff(rolling_var.values)) > np.std(rolling_var) * 1.5
-            )[0]
-
-            return var_changes.tolist()
-
-        except Exception:
-            return []
-
-    def _trend_change_detection(self, values: np.ndarray) -> List[int]:
-        """Detect trend changes in the time series."""
-
-        try:
-            # Use local linear regression to detect trend changes
-            window_size = max(10, len(values) // 4)
-
-            trend_changes = []
-            for i in range(window_size, len(values) - window_size):
-                # Fit linear trend to segments before and after point
-                before_segment = values[i - window_size : i]
-                after_segment = values[i : i + window_size]
-
-                if len(before_segment) >= 5 and len(after_segment) >= 5:
-                    before_slope = np.polyfit(
-                        range(len(before_segment)), before_segment, 1
-                    )[0]
-                    after_slope = np.polyfit(
-                        range(len(after_segment)), after_segment, 1
-                    )[0]
+    def _score_change_points(
+        self, values_array: np.ndarray, candidates: List[int], metric_name: Any
+    ) -> List[Dict[str, Any]]:
+        """Filter candidate change points and keep the confident ones."""
 
-                    slope_change = abs(after_slope - before_slope)
+        # Remove duplicates and sort
+        unique_changes = self._filter_change_points(candidates, len(values_array))
 
-                    if slope_change > np.std(values) * 0.5:  # Significant slope change
-                        trend_changes.append(i)
+        change_points = []
+        for cp in unique_changes:
+            confidence = self._calculate_change_point_confidence(cp, values_array)
 
-            return trend_changes
+            if confidence > self.pattern_params["change_point_detection_threshold"]:
+                change_points.append(
+                    {
+                        "position": cp,
+                        "confidence": confidence,
+                        "method": "combined",
+                        "metric": metric_name,
+                    }
+                )
 
-        except Exception:
-            return []
+        return change_points
 
     def _filter_change_points(
         self, change_points: List[int], series_length: int
@@ -0,0 +1,188 @@
+"""
+Per-wallet block cursors for incremental transaction polling.
+
+Each monitored wallet keeps the highest block it has been scanned through.
+The next poll only asks for blocks after that cursor (minus a small reorg
+rewind), so a steady-state cycle requests a few blocks per wallet instead of
+a shared multi-thousand-block window. Cursors are persisted to disk so a
+restart resumes where the previous session stopped.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from utils.helpers import normalize_address
+
+logger = logging.getLogger(__name__)
+
+# Cursor constants
+DEFAULT_REORG_REWIND_BLOCKS = 32  # Re-scan this many blocks for reorg safety
+DEFAULT_INITIAL_LOOKBACK_BLOCKS = 150  # First poll for a wallet (~5 minutes)
+DEFAULT_MAX_BACKFILL_BLOCKS = 1800  # Never reach back further (~1 hour)
+MAX_BLOCKS_PER_QUERY = 2000  # Upper bound for a single Polygonscan query
+
+
+class BlockCursorStore:
+    """
+    Persistent mapping of wallet address -> last fully scanned block.
+
+    Example:
+        cursors = BlockCursorStore(Path("data/wallet_monitor/block_cursors.json"))
+        start, end = cursors.get_block_range(wallet, current_block)
+        ... fetch transactions for [start, end] ...
+        cursors.advance(wallet, end)
+        cursors.save()
+    """
+
+    def __init__(
+        self,
+        cursor_file: Path,
+        reorg_rewind_blocks: int = DEFAULT_REORG_REWIND_BLOCKS,
+        initial_lookback_blocks: int = DEFAULT_INITIAL_LOOKBACK_BLOCKS,
+        max_backfill_blocks: int = DEFAULT_MAX_BACKFILL_BLOCKS,
+    ) -> None:
+        """
+        Initialize the cursor store and load persisted cursors.
+
+        Args:
+            cursor_file: JSON file used to persist cursors across restarts
+            reorg_rewind_blocks: Blocks to re-scan below the cursor on each poll
+            initial_lookback_blocks: Lookback for wallets without a cursor
+            max_backfill_blocks: Maximum distance behind the chain head to scan
+        """
+        self.cursor_file = Path(cursor_file)
+        self.reorg_rewind_blocks = max(0, reorg_rewind_blocks)
+        self.initial_lookback_blocks = max(1, initial_lookback_blocks)
+        self.max_backfill_blocks = max(1, max_backfill_blocks)
+
+        self._cursors: Dict[str, int] = {}
+        self._dirty = False
+        self._last_save = 0.0
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load cursors from disk, starting empty if the file is missing or corrupt"""
+        if not self.cursor_file.exists():
+            return
+
+        try:
+            with open(self.cursor_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._cursors = {
+                normalize_address(wallet): int(block)
+                for wallet, block in data.get("cursors", {}).items()
+            }
+            logger.info(
+                f"📍 Loaded block cursors for {len(self._cursors)} wallets "
+                f"from {self.cursor_file}"
+            )
+        except (IOError, OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not load block cursors from {self.cursor_file}: {e}")
+            self._cursors = {}
+
+    def save(self, force: bool = False) -> bool:
+        """
+        Persist cursors atomically if they changed since the last save.
+
+        Args:
+            force: Write even when nothing changed
+
+        Returns:
+            True if the file was written
+        """
+        if not self._dirty and not force:
+            return False
+
+        try:
+            self.cursor_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cursor_file.with_suffix(self.cursor_file.suffix + ".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"updated_at": time.time(), "cursors": self._cursors}, f)
+            os.replace(tmp_file, self.cursor_file)
+            self._dirty = False
+            self._last_save = time.time()
+            return True
+        except (IOError, OSError) as e:
+            logger.error(f"Failed to save block cursors to {self.cursor_file}: {e}")
+            return False
+
+    def get_cursor(self, wallet_address: str) -> Optional[int]:
+        """Get the last block a wallet was scanned through, if known"""
+        return self._cursors.get(normalize_address(wallet_address))
+
+    def get_block_range(
+        self, wallet_address: str, current_block: int
+    ) -> Tuple[int, int]:
+        """
+        Compute the block range the next poll for a wallet should request.
+
+        Args:
+            wallet_address: Wallet to poll
+            current_block: Current chain head
+
+        Returns:
+            Tuple of (start_block, end_block), both inclusive
+        """
+        cursor = self.get_cursor(wallet_address)
+        if cursor is None:
+            start_block = current_block - self.initial_lookback_blocks
+        else:
+            start_block = cursor + 1 - self.reorg_rewind_blocks
+
+        start_block = max(0, start_block, current_block - self.max_backfill_blocks)
+        start_block = min(start_block, current_block)
+        end_block = min(current_block, start_block + MAX_BLOCKS_PER_QUERY)
+        return start_block, end_block
+
+    def advance(self, wallet_address: str, scanned_through_block: int) -> None:
+        """
+        Move a wallet's cursor forward after a successful fetch.
+
+        Cursors never move backwards, so an overlapping (rewound) fetch cannot
+        regress a wallet's position.
+
+        Args:
+            wallet_address: Wallet that was fetched
+            scanned_through_block: Highest block included in the fetch
+        """
+        wallet = normalize_address(wallet_address)
+        if scanned_through_block > self._cursors.get(wallet, -1):
+            self._cursors[wallet] = scanned_through_block
+            self._dirty = True
+
+    def retain(self, wallet_addresses: Iterable[str]) -> int:
+        """
+        Drop cursors for wallets that are no longer monitored.
+
+        Args:
+            wallet_addresses: Wallets whose cursors should be kept
+
+        Returns:
+            Number of cursors removed
+        """
+        keep = {normalize_address(w) for w in wallet_addresses}
+        removed = [w for w in self._cursors if w not in keep]
+        for wallet in removed:
+            del self._cursors[wallet]
+        if removed:
+            self._dirty = True
+        return len(removed)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get cursor store statistics"""
+        return {
+            "tracked_wallets": len(self._cursors),
+            "min_cursor": min(self._cursors.values()) if self._cursors else 0,
+            "max_cursor": max(self._cursors.values()) if self._cursors else 0,
+            "reorg_rewind_blocks": self.reorg_rewind_blocks,
+            "last_save": self._last_save,
+        }
+
+    def __len__(self) -> int:
+        """Number of wallets with a cursor"""
+        return len(self._cursors)
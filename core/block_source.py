@@ -0,0 +1,191 @@
+"""
+Off-event-loop block source for Web3 fallback monitoring.
+
+web3.py's HTTP provider is synchronous: ``eth.block_number`` and
+``eth.get_block`` block the calling thread for a full RPC round trip. Called
+from a coroutine they stall the whole event loop, including trade execution.
+
+Web3BlockSource runs those calls in worker threads, fetches the blocks of a
+range concurrently, and caches each block as a ``from`` address index. A
+monitoring cycle therefore fetches every block once and hands each wallet
+its own transactions by dictionary lookup: O(blocks) RPC calls and work
+instead of O(blocks x wallets).
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.exception_handler import exception_handler
+from utils.helpers import normalize_address
+from utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Block source constants
+DEFAULT_MAX_CONCURRENT_BLOCKS = 10  # In-flight get_block calls
+DEFAULT_BLOCK_CACHE_SIZE = 256  # Indexed blocks kept between cycles
+FALLBACK_SCAN_BLOCKS = 50  # Only recent blocks are scanned in fallback mode
+
+# Transactions in one block, keyed by normalized sender address
+SenderIndex = Dict[str, List[Dict[str, Any]]]
+
+
+def _hex(value: Any) -> str:
+    """0x-prefixed hex for bytes-like values, str() otherwise"""
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    return str(value)
+
+
+class Web3BlockSource:
+    """
+    Concurrent, cached block fetching for a synchronous Web3 instance.
+
+    Example:
+        source = Web3BlockSource(web3)
+        current_block = await source.get_block_number()
+        by_wallet, failed_blocks = await source.get_transactions_by_sender(
+            start_block, current_block, wallets
+        )
+    """
+
+    def __init__(
+        self,
+        web3: Any,
+        max_concurrent_blocks: int = DEFAULT_MAX_CONCURRENT_BLOCKS,
+        cache_size: int = DEFAULT_BLOCK_CACHE_SIZE,
+    ) -> None:
+        """
+        Initialize the block source.
+
+        Args:
+            web3: Web3 instance (calls run in worker threads)
+            max_concurrent_blocks: Maximum get_block calls in flight
+            cache_size: Number of indexed blocks to keep
+        """
+        self.web3 = web3
+        self.max_concurrent_blocks = max(1, max_concurrent_blocks)
+        self.cache_size = max(1, cache_size)
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_blocks)
+        self._blocks: "OrderedDict[int, SenderIndex]" = OrderedDict()
+        # Fetches in progress, shared by concurrent callers
+        self._in_flight: SingleFlight[int, Optional[SenderIndex]] = SingleFlight()
+
+        self.stats = {"blocks_fetched": 0, "cache_hits": 0, "fetch_errors": 0}
+
+    async def is_connected(self) -> bool:
+        """Whether the provider is reachable (checked off the event loop)"""
+        if self.web3 is None:
+            return False
+        return bool(await asyncio.to_thread(self.web3.is_connected))
+
+    async def get_block_number(self) -> int:
+        """Latest block number (fetched off the event loop)"""
+        return int(await asyncio.to_thread(lambda: self.web3.eth.block_number))
+
+    async def get_transactions_by_sender(
+        self, start_block: int, end_block: int, senders: Iterable[str]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[int]]:
+        """
+        Transactions sent by any of ``senders`` in [start_block, end_block].
+
+        Args:
+            start_block: First block (inclusive)
+            end_block: Last block (inclusive)
+            senders: Sender addresses of interest
+
+        Returns:
+            (mapping of normalized sender -> transactions in block order,
+            ascending numbers of blocks that could not be fetched)
+        """
+        wanted = {normalize_address(sender) for sender in senders}
+        results: Dict[str, List[Dict[str, Any]]] = {sender: [] for sender in wanted}
+        failed_blocks: List[int] = []
+        if start_block > end_block or not wanted:
+            return results, failed_blocks
+
+        block_numbers = range(start_block, end_block + 1)
+        indexes = await asyncio.gather(*(self.get_sender_index(n) for n in block_numbers))
+        for block_number, index in zip(block_numbers, indexes):
+            if index is None:
+                failed_blocks.append(block_number)
+                continue
+            if not index:
+                continue
+            # Iterate the smaller side of the join
+            if len(index) < len(wanted):
+                for sender, transactions in index.items():
+                    if sender in wanted:
+                        results[sender].extend(transactions)
+            else:
+                for sender in wanted:
+                    transactions = index.get(sender)
+                    if transactions:
+                        results[sender].extend(transactions)
+        return results, failed_blocks
+
+    async def get_sender_index(self, block_number: int) -> Optional[SenderIndex]:
+        """
+        Sender index for one block, fetching it at most once.
+
+        Args:
+            block_number: Block to index
+
+        Returns:
+            Sender index, or None if the block could not be fetched
+        """
+        index = self._blocks.get(block_number)
+        if index is not None:
+            self._blocks.move_to_end(block_number)
+            self.stats["cache_hits"] += 1
+            return index
+
+        return await self._in_flight.run(block_number, self._fetch_and_cache)
+
+    async def _fetch_and_cache(self, block_number: int) -> Optional[SenderIndex]:
+        """Fetch one block's sender index and cache it when fetched"""
+        index = await self._fetch_sender_index(block_number)
+        if index is not None:
+            self._blocks[block_number] = index
+            while len(self._blocks) > self.cache_size:
+                self._blocks.popitem(last=False)
+        return index
+
+    async def _fetch_sender_index(self, block_number: int) -> Optional[SenderIndex]:
+        """Fetch a block off the event loop and index its transactions by sender"""
+        async with self._semaphore:
+            try:
+                block = await asyncio.to_thread(
+                    self.web3.eth.get_block, block_number, full_transactions=True
+                )
+            except Exception as e:
+                self.stats["fetch_errors"] += 1
+                exception_handler.log_exception(
+                    e,
+                    context={"block_num": block_number},
+                    component="Web3BlockSource",
+                    operation="fetch_block",
+                    include_stack_trace=False,
+                )
+                return None
+
+        self.stats["blocks_fetched"] += 1
+        timestamp = block.get("timestamp")
+        index: SenderIndex = {}
+        for tx in block.get("transactions", []):
+            sender = tx.get("from") if hasattr(tx, "get") else None
+            if not sender:
+                continue
+            tx_dict = dict(tx)
+            tx_dict["blockNumber"] = block_number
+            tx_dict["timeStamp"] = timestamp
+            tx_dict["hash"] = _hex(tx_dict.get("hash", ""))
+            index.setdefault(normalize_address(sender), []).append(tx_dict)
+        return index
+
+    def get_stats(self) -> Dict[str, int]:
+        """Fetch and cache counters"""
+        return {**self.stats, "cached_blocks": len(self._blocks)}
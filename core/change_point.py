@@ -0,0 +1,209 @@
+"""
+Vectorized Change-Point Candidate Detection
+
+BehaviorPatternTracker looks for change points in a wallet's rolling
+metrics with three detectors. The trend detector used to fit two
+``np.polyfit`` lines per position (O(n*w)) and the variance detector built
+a pandas Series per metric. This module computes the same statistics for
+every window position in O(n) from prefix sums:
+
+- Rolling OLS slopes: with x = 0..w-1 inside each window,
+  ``slope = (sum(k * y) - x_mean * sum(y)) / Sxx`` where ``sum(k * y)`` is
+  recovered from prefix sums of ``t * y`` and ``y``
+- Rolling variances from prefix sums of ``y`` and ``y**2``
+
+All functions accept one series (1-D) or a batch of equal-length series
+stacked as a 2-D array (one row per series, e.g. several metrics of many
+wallets), and process the whole batch in single array passes. Series are
+centered on their mean before summing to limit cancellation error.
+"""
+
+from typing import List, Union
+
+import numpy as np
+
+# Detector constants (as in BehaviorPatternTracker's original detectors)
+CUSUM_THRESHOLD_STDS = 2.0
+VARIANCE_CHANGE_THRESHOLD_STDS = 1.5
+TREND_CHANGE_THRESHOLD_STDS = 0.5
+MIN_VARIANCE_WINDOW = 5
+MIN_TREND_WINDOW = 10
+
+ChangePoints = Union[List[int], List[List[int]]]
+
+
+def _as_batch(values: np.ndarray) -> np.ndarray:
+    """View a series or batch of series as a 2-D float array"""
+    batch = np.asarray(values, dtype=np.float64)
+    if batch.ndim == 1:
+        return batch[np.newaxis, :]
+    if batch.ndim != 2:
+        raise ValueError(f"Expected a 1-D series or 2-D batch, got {batch.ndim}-D")
+    return batch
+
+
+def _prefix_sums(batch: np.ndarray) -> np.ndarray:
+    """Prefix sums along each row with a leading zero column"""
+    sums = np.zeros((batch.shape[0], batch.shape[1] + 1))
+    np.cumsum(batch, axis=1, out=sums[:, 1:])
+    return sums
+
+
+def _centered(batch: np.ndarray) -> np.ndarray:
+    return batch - batch.mean(axis=1, keepdims=True)
+
+
+def rolling_slopes(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    OLS slope of every length-``window`` window, as np.polyfit(range(w), y, 1)[0].
+
+    Args:
+        values: Series of length n, or (m, n) batch of series
+        window: Window length (at least 2)
+
+    Returns:
+        Slopes indexed by window start, shape (n - window + 1,) or
+        (m, n - window + 1); empty if the series is shorter than the window
+    """
+    if window < 2:
+        raise ValueError("window must be at least 2")
+    batch = _as_batch(values)
+    n = batch.shape[1]
+    count = max(0, n - window + 1)
+
+    y = _centered(batch)
+    positions = np.arange(n, dtype=np.float64)
+    sum_y = _prefix_sums(y)
+    sum_ty = _prefix_sums(y * positions)
+
+    starts = positions[:count]
+    window_y = sum_y[:, window:] - sum_y[:, :count]
+    window_ty = sum_ty[:, window:] - sum_ty[:, :count]
+    window_ky = window_ty - starts * window_y  # sum of k * y[start + k]
+
+    x_mean = (window - 1) / 2
+    s_xx = window * (window * window - 1) / 12
+    slopes = (window_ky - x_mean * window_y) / s_xx
+    return slopes[0] if np.ndim(values) == 1 else slopes
+
+
+def rolling_variances(values: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    """
+    Variance of every length-``window`` window.
+
+    Args:
+        values: Series of length n, or (m, n) batch of series
+        window: Window length (greater than ddof)
+        ddof: Delta degrees of freedom (1 = sample variance, as pandas)
+
+    Returns:
+        Variances indexed by window start, shape (n - window + 1,) or
+        (m, n - window + 1); empty if the series is shorter than the window
+    """
+    if window <= ddof:
+        raise ValueError("window must be greater than ddof")
+    batch = _as_batch(values)
+    n = batch.shape[1]
+    count = max(0, n - window + 1)
+
+    y = _centered(batch)
+    sum_y = _prefix_sums(y)
+    sum_yy = _prefix_sums(y * y)
+    window_y = sum_y[:, window:] - sum_y[:, :count]
+    window_yy = sum_yy[:, window:] - sum_yy[:, :count]
+
+    variances = np.maximum(window_yy - window_y * window_y / window, 0.0) / (window - ddof)
+    return variances[0] if np.ndim(values) == 1 else variances
+
+
+def _rows_to_lists(mask: np.ndarray, offset: int, batched: bool) -> ChangePoints:
+    """Convert a boolean (m, k) mask to per-row index lists shifted by offset"""
+    rows = [(np.flatnonzero(row) + offset).tolist() for row in mask]
+    return rows if batched else rows[0]
+
+
+def cusum_change_points(values: np.ndarray) -> ChangePoints:
+    """
+    CUSUM change candidates: steps of the mean-centered cumulative sum
+    larger than CUSUM_THRESHOLD_STDS standard deviations of the steps.
+
+    Args:
+        values: Series or (m, n) batch of series
+
+    Returns:
+        Candidate positions (a list per row for a batch)
+    """
+    batch = _as_batch(values)
+    steps = np.diff(np.cumsum(_centered(batch), axis=1), axis=1)
+    if steps.shape[1] == 0:
+        return _rows_to_lists(steps.astype(bool), 1, np.ndim(values) == 2)
+    threshold = steps.std(axis=1, keepdims=True) * CUSUM_THRESHOLD_STDS
+    return _rows_to_lists(np.abs(steps) > threshold, 1, np.ndim(values) == 2)
+
+
+def variance_change_points(values: np.ndarray) -> ChangePoints:
+    """
+    Variance change candidates: jumps in the rolling sample variance
+    (window ``max(5, n // 5)``) larger than VARIANCE_CHANGE_THRESHOLD_STDS
+    standard deviations of the rolling variance.
+
+    Positions match ``np.diff`` over a pandas rolling variance, whose first
+    ``window - 1`` entries are NaN.
+
+    Args:
+        values: Series or (m, n) batch of series
+
+    Returns:
+        Candidate positions (a list per row for a batch)
+    """
+    batch = _as_batch(values)
+    window = max(MIN_VARIANCE_WINDOW, batch.shape[1] // 5)
+    variances = rolling_variances(batch, window)
+    jumps = np.abs(np.diff(variances, axis=1))
+    if variances.shape[1] == 0:
+        return _rows_to_lists(jumps.astype(bool), 0, np.ndim(values) == 2)
+    threshold = variances.std(axis=1, keepdims=True) * VARIANCE_CHANGE_THRESHOLD_STDS
+    return _rows_to_lists(jumps > threshold, window - 1, np.ndim(values) == 2)
+
+
+def trend_change_points(values: np.ndarray) -> ChangePoints:
+    """
+    Trend change candidates: positions i where the slope of the window
+    after i (``[i, i + w)``) differs from the slope of the window before
+    (``[i - w, i)``) by more than TREND_CHANGE_THRESHOLD_STDS standard
+    deviations of the series, with ``w = max(10, n // 4)``.
+
+    Args:
+        values: Series or (m, n) batch of series
+
+    Returns:
+        Candidate positions (a list per row for a batch)
+    """
+    batch = _as_batch(values)
+    n = batch.shape[1]
+    window = max(MIN_TREND_WINDOW, n // 4)
+    if n <= 2 * window:
+        return _rows_to_lists(np.zeros((batch.shape[0], 0), dtype=bool), 0, np.ndim(values) == 2)
+
+    slopes = rolling_slopes(batch, window)
+    slope_changes = np.abs(slopes[:, window : n - window] - slopes[:, : n - 2 * window])
+    threshold = batch.std(axis=1, keepdims=True) * TREND_CHANGE_THRESHOLD_STDS
+    return _rows_to_lists(slope_changes > threshold, window, np.ndim(values) == 2)
+
+
+def detect_change_point_candidates(values: np.ndarray) -> ChangePoints:
+    """
+    Candidates from all three detectors (CUSUM, variance, trend), in that order.
+
+    Args:
+        values: Series or (m, n) batch of series
+
+    Returns:
+        Unfiltered candidate positions (a list per row for a batch); the
+        same position may appear more than once
+    """
+    batch = _as_batch(values)
+    detectors = (cusum_change_points, variance_change_points, trend_change_points)
+    per_detector = [detector(batch) for detector in detectors]
+    rows = [sum((found[row] for found in per_detector), []) for row in range(batch.shape[0])]
+    return rows if np.ndim(values) == 2 else rows[0]
@@ -19,6 +19,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from utils.alert_dispatcher import AlertPriority
 from utils.alerts import send_telegram_alert
 
 logger = logging.getLogger(__name__)
@@ -427,7 +428,9 @@ class CircuitBreaker:
                     f"**Success Rate:** {self._state.total_trades - self._state.failed_trades}/{self._state.total_trades}\n"
                     f"**Consecutive Losses:** {self._state.consecutive_losses}\n"
                     f"**Cooldown:** {self.cooldown_seconds // 60} minutes\n"
-                    f"**Recovery ETA:** {recovery_eta}"
+                    f"**Recovery ETA:** {recovery_eta}",
+                    alert_type="circuit_breaker",
+                    priority=AlertPriority.CRITICAL,
                 )
             except Exception as e:
                 logger.error(f"Error sending circuit breaker alert: {e}")
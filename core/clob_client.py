@@ -1,9 +1,10 @@
 # core/clob_client.py - FIXED FOR py-clob-client==0.34.1
-from typing import Any
+from typing import Any, Dict, Iterable, Optional
 
 from py_clob_client.client import ClobClient
 from py_clob_client.constants import POLYGON
 
+from core.market_data_cache import MarketDataCache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -31,6 +32,31 @@ class PolymarketClient:
             "✅ CLOB client initialized for wallet: %s", self.wallet_address[-6:]
         )
 
+        # Cached, non-blocking market metadata and prices
+        self.market_data = MarketDataCache(self.client)
+
+    async def get_market(self, condition_id: str) -> Optional[Dict[str, Any]]:
+        """Market metadata for a condition (cached, fetched off the event loop)"""
+        return await self.market_data.get_market(condition_id)
+
+    async def get_current_price(self, condition_id: str) -> Optional[float]:
+        """Current price of a market's first outcome token"""
+        return await self.market_data.get_current_price(condition_id)
+
+    async def get_current_prices(
+        self, condition_ids: Iterable[str]
+    ) -> Dict[str, float]:
+        """Current prices for many markets, fetched in one batch"""
+        return await self.market_data.get_current_prices(condition_ids)
+
+    async def get_condition_id(self, token_id: str) -> Optional[str]:
+        """Condition id of the market an outcome token belongs to (cached)"""
+        return await self.market_data.get_condition_id(token_id)
+
+    def invalidate_market(self, condition_id: Optional[str] = None) -> None:
+        """Drop cached data for one market, or for all markets"""
+        self.market_data.invalidate(condition_id)
+
     def get_balance(self) -> dict[str, Any]:
         """
         ✅ FIXED: Type ignore removed - proper type hint added
@@ -0,0 +1,245 @@
+"""
+Polymarket Exchange Calldata Decoder
+====================================
+
+Decodes order fills from transactions sent to the Polymarket CTF Exchange
+and NegRisk CTF Exchange. Both contracts expose the same fill functions:
+
+    fillOrder(Order order, uint256 fillAmount)
+    fillOrders(Order[] orders, uint256[] fillAmounts)
+    matchOrders(Order takerOrder, Order[] makerOrders,
+                uint256 takerFillAmount, uint256[] makerFillAmounts)
+
+    Order = (uint256 salt, address maker, address signer, address taker,
+             uint256 tokenId, uint256 makerAmount, uint256 takerAmount,
+             uint256 expiration, uint256 nonce, uint256 feeRateBps,
+             uint8 side, uint8 signatureType, bytes signature)
+
+A transaction is classified by looking its 4-byte selector up in
+``FILL_SELECTORS``, so anything that is not an order fill is rejected with
+one dictionary lookup. Fill calldata is hex-decoded once and its 32-byte
+ABI words are read from a ``memoryview`` without copying; only the fixed
+width Order fields are read, the trailing signature is skipped.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.helpers import normalize_address
+
+# Polymarket exchange contracts (CTF and NegRisk share the fill ABI)
+POLYMARKET_EXCHANGE_CONTRACTS = [
+    "0x4bFb41d5B3570DeFd03C39a9A4D8dE6Bd8B8982E",  # CTF Exchange
+    "0xC5d563A36AE78145C45a50134d48A1215220f80a",  # NegRisk CTF Exchange
+]
+
+# USDC and outcome tokens both use 6 decimals
+TOKEN_DECIMALS = 10**6
+
+WORD_SIZE = 32
+SELECTOR_SIZE = 4
+
+# Order struct field positions (in words from the start of the tuple)
+ORDER_MAKER = 1
+ORDER_SIGNER = 2
+ORDER_TOKEN_ID = 4
+ORDER_MAKER_AMOUNT = 5
+ORDER_TAKER_AMOUNT = 6
+ORDER_SIDE = 10
+ORDER_HEAD_WORDS = 13  # 12 static fields + offset of the signature bytes
+
+SIDE_NAMES = ("BUY", "SELL")  # Order.side: 0 = BUY, 1 = SELL
+
+
+@dataclass(frozen=True)
+class OrderFill:
+    """One order filled by an exchange call, in token units"""
+
+    function: str
+    maker: str
+    signer: str
+    token_id: str
+    side: str  # Side of the order's maker
+    price: Decimal  # USDC per outcome token
+    size: Decimal  # Outcome tokens filled
+    amount: Decimal  # USDC notional filled
+
+    def side_for(self, wallet_address: str) -> str:
+        """Side taken by ``wallet_address``: the order side for its maker, opposite otherwise"""
+        wallet = normalize_address(wallet_address)
+        if wallet in (self.maker, self.signer):
+            return self.side
+        return SIDE_NAMES[1 - SIDE_NAMES.index(self.side)]
+
+
+class _Calldata:
+    """Word reader over ABI-encoded arguments (the bytes after the selector)"""
+
+    __slots__ = ("view",)
+
+    def __init__(self, arguments: bytes) -> None:
+        self.view = memoryview(arguments)
+
+    def word(self, offset: int) -> int:
+        end = offset + WORD_SIZE
+        if offset < 0 or end > len(self.view):
+            raise ValueError(f"calldata too short for word at {offset}")
+        return int.from_bytes(self.view[offset:end], "big")
+
+    def address(self, offset: int) -> str:
+        if offset + WORD_SIZE > len(self.view):
+            raise ValueError(f"calldata too short for address at {offset}")
+        return "0x" + self.view[offset + 12 : offset + WORD_SIZE].hex()
+
+    def uint_array(self, offset: int) -> List[int]:
+        length = self.word(offset)
+        start = offset + WORD_SIZE
+        return [self.word(start + i * WORD_SIZE) for i in range(length)]
+
+    def order_offsets(self, offset: int) -> List[int]:
+        """Absolute offsets of the (dynamic) Order tuples in an Order[] array"""
+        length = self.word(offset)
+        start = offset + WORD_SIZE
+        return [start + self.word(start + i * WORD_SIZE) for i in range(length)]
+
+
+def _decode_order(
+    data: _Calldata, offset: int, fill_amount: int, function: str
+) -> OrderFill:
+    """Decode one Order tuple and the amount of it that was filled"""
+    if offset + ORDER_HEAD_WORDS * WORD_SIZE > len(data.view):
+        raise ValueError("calldata too short for order")
+
+    side_index = data.word(offset + ORDER_SIDE * WORD_SIZE)
+    if side_index > 1:
+        raise ValueError(f"invalid order side {side_index}")
+    maker_amount = data.word(offset + ORDER_MAKER_AMOUNT * WORD_SIZE)
+    taker_amount = data.word(offset + ORDER_TAKER_AMOUNT * WORD_SIZE)
+    if maker_amount == 0 or taker_amount == 0:
+        raise ValueError("order has a zero amount")
+
+    # fillAmount is denominated in the maker's asset: USDC for a BUY,
+    # outcome tokens for a SELL
+    if side_index == 0:
+        price = Decimal(maker_amount) / Decimal(taker_amount)
+        amount = Decimal(fill_amount) / TOKEN_DECIMALS
+        size = amount / price
+    else:
+        price = Decimal(taker_amount) / Decimal(maker_amount)
+        size = Decimal(fill_amount) / TOKEN_DECIMALS
+        amount = size * price
+
+    return OrderFill(
+        function=function,
+        maker=data.address(offset + ORDER_MAKER * WORD_SIZE),
+        signer=data.address(offset + ORDER_SIGNER * WORD_SIZE),
+        token_id=str(data.word(offset + ORDER_TOKEN_ID * WORD_SIZE)),
+        side=SIDE_NAMES[side_index],
+        price=price,
+        size=size,
+        amount=amount,
+    )
+
+
+def _decode_fill_order(data: _Calldata) -> List[OrderFill]:
+    return [_decode_order(data, data.word(0), data.word(WORD_SIZE), "fillOrder")]
+
+
+def _decode_fill_orders(data: _Calldata) -> List[OrderFill]:
+    orders = data.order_offsets(data.word(0))
+    fill_amounts = data.uint_array(data.word(WORD_SIZE))
+    if len(orders) != len(fill_amounts):
+        raise ValueError("orders and fill amounts differ in length")
+    return [
+        _decode_order(data, offset, fill_amount, "fillOrders")
+        for offset, fill_amount in zip(orders, fill_amounts)
+    ]
+
+
+def _decode_match_orders(data: _Calldata) -> List[OrderFill]:
+    taker_order = data.word(0)
+    maker_orders = data.order_offsets(data.word(WORD_SIZE))
+    taker_fill_amount = data.word(2 * WORD_SIZE)
+    maker_fill_amounts = data.uint_array(data.word(3 * WORD_SIZE))
+    if len(maker_orders) != len(maker_fill_amounts):
+        raise ValueError("maker orders and fill amounts differ in length")
+    fills = [_decode_order(data, taker_order, taker_fill_amount, "matchOrders")]
+    fills.extend(
+        _decode_order(data, offset, fill_amount, "matchOrders")
+        for offset, fill_amount in zip(maker_orders, maker_fill_amounts)
+    )
+    return fills
+
+
+# Lower-case hex selector (without 0x) -> (function name, decoder). Selectors
+# are keccak256 of the signatures above with Order written as its tuple type.
+FILL_SELECTORS: Dict[str, Tuple[str, Callable[[_Calldata], List[OrderFill]]]] = {
+    "fe729aaf": ("fillOrder", _decode_fill_order),
+    "d798eff6": ("fillOrders", _decode_fill_orders),
+    "e60f0c05": ("matchOrders", _decode_match_orders),
+}
+
+
+def fill_selector(input_data: Optional[str]) -> Optional[str]:
+    """Selector of an order-fill call, or None for any other calldata"""
+    if not input_data or len(input_data) < 2 + 2 * SELECTOR_SIZE:
+        return None
+    selector = input_data[2 : 2 + 2 * SELECTOR_SIZE].lower()
+    return selector if selector in FILL_SELECTORS else None
+
+
+def is_order_fill(input_data: Optional[str]) -> bool:
+    """Whether calldata calls one of the exchange fill functions"""
+    return fill_selector(input_data) is not None
+
+
+def decode_order_fills(input_data: Optional[str]) -> Optional[List[OrderFill]]:
+    """
+    Decode the order fills in a transaction's calldata.
+
+    Args:
+        input_data: 0x-prefixed transaction input
+
+    Returns:
+        Fills in call order (for matchOrders the taker order comes first),
+        or None if the calldata is not a well-formed order-fill call
+    """
+    selector = fill_selector(input_data)
+    if selector is None:
+        return None
+    try:
+        arguments = bytes.fromhex(input_data[2 + 2 * SELECTOR_SIZE :])
+        fills = FILL_SELECTORS[selector][1](_Calldata(arguments))
+    except (ValueError, IndexError):
+        return None
+    return fills or None
+
+
+def decode_transactions(
+    transactions: Iterable[Dict[str, str]],
+) -> Dict[str, List[OrderFill]]:
+    """
+    Decode a batch of transactions, keeping only order fills.
+
+    Args:
+        transactions: Transactions with ``hash`` and ``input`` fields
+
+    Returns:
+        Mapping of transaction hash -> decoded fills
+    """
+    decoded = {}
+    for tx in transactions:
+        fills = decode_order_fills(tx.get("input"))
+        if fills:
+            decoded[tx["hash"]] = fills
+    return decoded
+
+
+def fill_for_wallet(fills: List[OrderFill], wallet_address: str) -> OrderFill:
+    """The fill whose order ``wallet_address`` made, else the first (taker) fill"""
+    wallet = normalize_address(wallet_address)
+    for fill in fills:
+        if wallet in (fill.maker, fill.signer):
+            return fill
+    return fills[0]
@@ -331,23 +331,15 @@ class HybridPortfolioConstructor:
 
         correlations = {}
 
-        # Create return series for each wallet
-        return_series = {}
-        for wallet in wallets:
-            wallet_address = wallet["address"]
-            metrics = await self._calculate_wallet_historical_metrics(wallet_address)
-            return_series[wallet_address] = metrics["avg_return"]  # Simplified
+        # Exponentially weighted daily PnL correlations, kept current by
+        # the performance analyzer as trades settle
+        wallet_addresses = [wallet["address"] for wallet in wallets]
+        matrix = self.analyzer.correlation_engine.correlation_matrix(wallet_addresses)
 
-        # Calculate pairwise correlations (simplified)
-        wallet_addresses = list(return_series.keys())
         for i, wallet1 in enumerate(wallet_addresses):
-            for j, wallet2 in enumerate(wallet_addresses):
-                if i < j:
-                    # Simplified correlation calculation
-                    corr_key = f"{wallet1[:8]}..._{wallet2[:8]}..."
-                    correlations[corr_key] = (
-                        0.1  # Placeholder - would calculate actual correlation
-                    )
+            for j in range(i + 1, len(wallet_addresses)):
+                corr_key = f"{wallet1[:8]}..._{wallet_addresses[j][:8]}..."
+                correlations[corr_key] = float(matrix[i, j])
 
         return correlations
 
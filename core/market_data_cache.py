@@ -0,0 +1,349 @@
+"""
+Async market-metadata and price cache for the CLOB client.
+
+py-clob-client is synchronous: every ``get_market`` or price lookup blocks
+the calling thread for an HTTP round trip. MarketDataCache sits between the
+async trading code and that client:
+
+- Blocking client calls run in a bounded thread pool, never on the loop.
+- Markets are cached by condition_id with a TTL, so repeat trades into a
+  hot market skip the metadata round trip; entries can be invalidated.
+- Concurrent requests for the same uncached market share one fetch.
+- Outcome token ids resolve to their market's condition_id, from cached
+  markets or one order book lookup, so on-chain fills can be matched
+  with API trades.
+- Prices for many tokens are fetched with one batched midpoint request
+  and cached briefly, so position management costs one call per cycle.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from py_clob_client.clob_types import BookParams
+
+from utils.bounded_cache import BoundedCache
+from utils.exception_handler import exception_handler
+from utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Market data cache constants
+DEFAULT_MAX_WORKERS = 4  # Blocking CLOB calls in flight
+MARKET_CACHE_SIZE = 2000
+MARKET_TTL_SECONDS = 300  # Market metadata rarely changes
+PRICE_CACHE_SIZE = 5000
+PRICE_TTL_SECONDS = 5  # Prices go stale quickly
+PRICE_BATCH_SIZE = 100  # Tokens per midpoint request
+TOKEN_CACHE_SIZE = 20000
+TOKEN_TTL_SECONDS = 86400  # A token never moves to another market
+
+
+def market_token_ids(market: Dict[str, Any]) -> List[str]:
+    """Outcome token ids of a market, in outcome order"""
+    token_ids = []
+    for token in market.get("tokens") or []:
+        token_id = token.get("token_id") or token.get("tokenId")
+        if token_id:
+            token_ids.append(str(token_id))
+    return token_ids
+
+
+class MarketDataCache:
+    """
+    Cached, non-blocking market and price lookups over a synchronous ClobClient.
+
+    Example:
+        market_data = MarketDataCache(clob_client)
+        market = await market_data.get_market(condition_id)
+        prices = await market_data.get_current_prices(condition_ids)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        market_ttl_seconds: int = MARKET_TTL_SECONDS,
+        price_ttl_seconds: int = PRICE_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            client: Synchronous py-clob-client ClobClient
+            max_workers: Maximum concurrent blocking client calls
+            market_ttl_seconds: How long market metadata is reused
+            price_ttl_seconds: How long token prices are reused
+        """
+        self.client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="clob-client"
+        )
+        self._markets = BoundedCache(
+            max_size=MARKET_CACHE_SIZE,
+            ttl_seconds=market_ttl_seconds,
+            component_name="clob.market_cache",
+        )
+        self._prices = BoundedCache(
+            max_size=PRICE_CACHE_SIZE,
+            ttl_seconds=price_ttl_seconds,
+            component_name="clob.price_cache",
+        )
+        self._token_conditions = BoundedCache(
+            max_size=TOKEN_CACHE_SIZE,
+            ttl_seconds=TOKEN_TTL_SECONDS,
+            component_name="clob.token_condition_cache",
+        )
+        # Fetches in progress, shared by concurrent callers
+        self._in_flight: SingleFlight[str, Optional[Dict[str, Any]]] = SingleFlight()
+        self._token_lookups: SingleFlight[str, Optional[str]] = SingleFlight()
+
+        self.stats = {
+            "market_hits": 0,
+            "market_fetches": 0,
+            "coalesced_requests": 0,
+            "token_hits": 0,
+            "token_lookups": 0,
+            "price_hits": 0,
+            "price_batches": 0,
+            "errors": 0,
+        }
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking client call in the bounded executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args)
+        )
+
+    async def get_market(self, condition_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Market metadata for a condition, fetched at most once per TTL.
+
+        Args:
+            condition_id: Market condition id
+
+        Returns:
+            Market dict, or None if it could not be fetched
+        """
+        market = self._markets.get(condition_id)
+        if market is not None:
+            self.stats["market_hits"] += 1
+            return market
+
+        return await self._shared_fetch(
+            self._in_flight, condition_id, self._fetch_and_cache_market
+        )
+
+    async def _shared_fetch(
+        self,
+        in_flight: SingleFlight[str, Any],
+        key: str,
+        fetch: Callable[[str], Awaitable[Any]],
+    ) -> Any:
+        """Run ``fetch(key)`` once for all concurrent callers asking for ``key``"""
+        if key in in_flight:
+            self.stats["coalesced_requests"] += 1
+        return await in_flight.run(key, fetch)
+
+    async def _fetch_and_cache_market(
+        self, condition_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch one market and cache it when found"""
+        market = await self._fetch_market(condition_id)
+        if market:
+            self._markets.set(condition_id, market)
+            for token_id in market_token_ids(market):
+                self._token_conditions.set(token_id, condition_id)
+        return market
+
+    async def _fetch_market(self, condition_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch one market from the CLOB API"""
+        self.stats["market_fetches"] += 1
+        try:
+            market = await self._run(self.client.get_market, condition_id)
+        except Exception as e:
+            self.stats["errors"] += 1
+            exception_handler.log_exception(
+                e,
+                context={"condition_id": condition_id},
+                component="MarketDataCache",
+                operation="get_market",
+                include_stack_trace=False,
+            )
+            return None
+        return market if isinstance(market, dict) and market else None
+
+    async def get_condition_id(self, token_id: str) -> Optional[str]:
+        """
+        Condition id of the market an outcome token belongs to.
+
+        Tokens of markets already fetched resolve from the cache; others
+        cost one order book request, whose summary names the market.
+
+        Args:
+            token_id: Outcome token id
+
+        Returns:
+            Market condition id, or None if it could not be resolved
+        """
+        token_id = str(token_id)
+        condition_id = self._token_conditions.get(token_id)
+        if condition_id is not None:
+            self.stats["token_hits"] += 1
+            return condition_id
+        return await self._shared_fetch(
+            self._token_lookups, token_id, self._fetch_condition_id
+        )
+
+    async def _fetch_condition_id(self, token_id: str) -> Optional[str]:
+        """Look up a token's market through its order book"""
+        self.stats["token_lookups"] += 1
+        try:
+            book = await self._run(self.client.get_order_book, token_id)
+        except Exception as e:
+            self.stats["errors"] += 1
+            exception_handler.log_exception(
+                e,
+                context={"token_id": token_id},
+                component="MarketDataCache",
+                operation="get_condition_id",
+                include_stack_trace=False,
+            )
+            return None
+
+        if isinstance(book, dict):
+            condition_id = book.get("market")
+        else:
+            condition_id = getattr(book, "market", None)
+        if not condition_id:
+            return None
+        self._token_conditions.set(token_id, str(condition_id))
+        return str(condition_id)
+
+    def invalidate(self, condition_id: Optional[str] = None) -> None:
+        """
+        Drop cached market metadata and prices.
+
+        Args:
+            condition_id: Market to drop, or None to clear everything
+        """
+        if condition_id is None:
+            self._markets.clear()
+            self._prices.clear()
+            return
+
+        market = self._markets.get(condition_id)
+        self._markets.delete(condition_id)
+        if market:
+            for token_id in market_token_ids(market):
+                self._prices.delete(token_id)
+
+    async def get_prices(self, token_ids: Iterable[str]) -> Dict[str, float]:
+        """
+        Midpoint prices for many tokens, batching the uncached ones.
+
+        Args:
+            token_ids: Outcome token ids
+
+        Returns:
+            Mapping of token id -> price for every token that has one
+        """
+        prices: Dict[str, float] = {}
+        missing: List[str] = []
+        for token_id in dict.fromkeys(str(t) for t in token_ids):
+            price = self._prices.get(token_id)
+            if price is not None:
+                self.stats["price_hits"] += 1
+                prices[token_id] = price
+            else:
+                missing.append(token_id)
+
+        batches = [
+            missing[i : i + PRICE_BATCH_SIZE]
+            for i in range(0, len(missing), PRICE_BATCH_SIZE)
+        ]
+        for fetched in await asyncio.gather(*(self._fetch_prices(b) for b in batches)):
+            for token_id, price in fetched.items():
+                self._prices.set(token_id, price)
+                prices[token_id] = price
+        return prices
+
+    async def _fetch_prices(self, token_ids: List[str]) -> Dict[str, float]:
+        """Fetch midpoints for one batch of tokens in a single request"""
+        self.stats["price_batches"] += 1
+        try:
+            response = await self._run(
+                self.client.get_midpoints,
+                [BookParams(token_id=token_id) for token_id in token_ids],
+            )
+        except Exception as e:
+            self.stats["errors"] += 1
+            exception_handler.log_exception(
+                e,
+                context={"token_count": len(token_ids)},
+                component="MarketDataCache",
+                operation="get_prices",
+                include_stack_trace=False,
+            )
+            return {}
+
+        prices: Dict[str, float] = {}
+        if isinstance(response, dict):
+            for token_id, price in response.items():
+                try:
+                    prices[str(token_id)] = float(price)
+                except (TypeError, ValueError):
+                    continue
+        return prices
+
+    async def get_current_prices(
+        self, condition_ids: Iterable[str]
+    ) -> Dict[str, float]:
+        """
+        Current price of each market's first outcome token.
+
+        Markets come from the cache (missing ones are fetched concurrently)
+        and all prices are requested in one batch.
+
+        Args:
+            condition_ids: Market condition ids
+
+        Returns:
+            Mapping of condition id -> price for markets with a known price
+        """
+        condition_ids = list(dict.fromkeys(condition_ids))
+        markets = await asyncio.gather(*(self.get_market(c) for c in condition_ids))
+
+        first_tokens: Dict[str, str] = {}
+        for condition_id, market in zip(condition_ids, markets):
+            token_ids = market_token_ids(market) if market else []
+            if token_ids:
+                first_tokens[condition_id] = token_ids[0]
+
+        prices = await self.get_prices(first_tokens.values())
+        return {
+            condition_id: prices[token_id]
+            for condition_id, token_id in first_tokens.items()
+            if token_id in prices
+        }
+
+    async def get_current_price(self, condition_id: str) -> Optional[float]:
+        """Current price of a market's first outcome token"""
+        prices = await self.get_current_prices([condition_id])
+        return prices.get(condition_id)
+
+    def close(self) -> None:
+        """Release the executor threads"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache counters and sizes"""
+        return {
+            **self.stats,
+            "cached_markets": len(self._markets),
+            "cached_prices": len(self._prices),
+            "cached_tokens": len(self._token_conditions),
+        }
@@ -11,21 +11,30 @@ Features:
 - Model drift detection and automated retraining
 - Explainable AI for strategy transparency
 - Model monitoring and validation framework
+
+Model fits are CPU-bound, so training runs in a separate worker process and
+the event loop only awaits the result. The fitted model, scaler and label
+encoder are swapped in together with no await in between, so predictions
+never mix a new model with an old scaler or encoder.
 """
 
 import asyncio
 import json
 import logging
+import multiprocessing
 import pickle
 import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import joblib
 import numpy as np
 from sklearn.ensemble import (
+    GradientBoostingClassifier,
     GradientBoostingRegressor,
     RandomForestClassifier,
     VotingClassifier,
@@ -47,6 +56,185 @@ from sklearn.preprocessing import LabelEncoder, StandardScaler
 
 logger = logging.getLogger(__name__)
 
+# Training worker constants
+TRAINING_WORKERS = 1  # Fits run one at a time in a dedicated process
+
+
+def _build_strategy_ensemble() -> VotingClassifier:
+    """Strategy ensemble (soft voting, so it provides predict_proba)"""
+    return VotingClassifier(
+        [
+            (
+                "rf",
+                RandomForestClassifier(
+                    n_estimators=100,
+                    max_depth=10,
+                    min_samples_split=20,
+                    random_state=42,
+                ),
+            ),
+            (
+                "gb",
+                GradientBoostingClassifier(
+                    n_estimators=100,
+                    max_depth=6,
+                    learning_rate=0.1,
+                    random_state=42,
+                ),
+            ),
+            ("lr", LogisticRegression(random_state=42, max_iter=1000)),
+        ],
+        voting="soft",
+    )
+
+
+def _strategy_validation_metrics(
+    model: Any,
+    feature_scaler: StandardScaler,
+    label_encoder: LabelEncoder,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+) -> Dict[str, Any]:
+    """Validate a trained strategy model on held-out data."""
+
+    validation_metrics = {}
+
+    try:
+        # Scale validation data
+        X_val_scaled = feature_scaler.transform(X_val)
+
+        # Encode validation labels
+        y_val_encoded = label_encoder.transform(y_val)
+
+        # Predictions
+        y_pred = model.predict(X_val_scaled)
+        y_pred_proba = model.predict_proba(X_val_scaled)
+
+        # Classification metrics
+        validation_metrics["accuracy"] = accuracy_score(y_val_encoded, y_pred)
+        validation_metrics["precision"] = precision_score(
+            y_val_encoded, y_pred, average="weighted"
+        )
+        validation_metrics["recall"] = recall_score(
+            y_val_encoded, y_pred, average="weighted"
+        )
+        validation_metrics["f1_score"] = f1_score(
+            y_val_encoded, y_pred, average="weighted"
+        )
+
+        # Confusion matrix
+        cm = confusion_matrix(y_val_encoded, y_pred)
+        validation_metrics["confusion_matrix"] = cm.tolist()
+
+        # Class-specific metrics
+        class_report = classification_report(
+            y_val_encoded,
+            y_pred,
+            target_names=label_encoder.classes_,
+            output_dict=True,
+        )
+        validation_metrics["class_report"] = class_report
+
+        # Prediction confidence analysis
+        prediction_confidences = np.max(y_pred_proba, axis=1)
+        validation_metrics["avg_prediction_confidence"] = np.mean(
+            prediction_confidences
+        )
+        validation_metrics["confidence_std"] = np.std(prediction_confidences)
+        validation_metrics["high_confidence_predictions"] = np.mean(
+            prediction_confidences > 0.8
+        )
+
+    except Exception as e:
+        logger.error(f"Error validating model: {e}")
+        validation_metrics["error"] = str(e)
+
+    return validation_metrics
+
+
+def _fit_strategy_predictor(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+) -> Dict[str, Any]:
+    """
+    Fit, validate and cross-validate the strategy ensemble.
+
+    Runs in the training worker process; everything it returns is pickled
+    back to the event loop process.
+
+    Returns:
+        Fitted model, scaler and label encoder plus evaluation metrics
+    """
+    # Fit label encoder and scaler on training data only
+    label_encoder = LabelEncoder().fit(y_train)
+    y_train_encoded = label_encoder.transform(y_train)
+    feature_scaler = StandardScaler().fit(X_train)
+    X_train_scaled = feature_scaler.transform(X_train)
+
+    # Train model
+    model = _build_strategy_ensemble()
+    model.fit(X_train_scaled, y_train_encoded)
+
+    # Add model version
+    model_version = f"v_{int(time.time())}"
+    setattr(model, "_model_version", model_version)
+
+    # Calculate cross-validation score
+    cv_scores = cross_val_score(
+        model,
+        X_train_scaled,
+        y_train_encoded,
+        cv=TimeSeriesSplit(n_splits=5),
+        scoring="accuracy",
+    )
+
+    return {
+        "model": model,
+        "feature_scaler": feature_scaler,
+        "label_encoder": label_encoder,
+        "model_version": model_version,
+        "performance_metrics": _strategy_validation_metrics(
+            model, feature_scaler, label_encoder, X_val, y_val
+        ),
+        "cross_validation_score": float(cv_scores.mean()),
+    }
+
+
+def _fit_performance_predictor(X: np.ndarray, y: np.ndarray) -> Dict[str, Any]:
+    """
+    Fit and evaluate the performance regressor (runs in the training worker).
+
+    Returns:
+        Fitted model and held-out evaluation metrics
+    """
+    # Split data
+    split_idx = int(len(X) * 0.8)
+    X_train, X_test = X[:split_idx], X[split_idx:]
+    y_train, y_test = y[:split_idx], y[split_idx:]
+
+    # Scale features
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+
+    # Train gradient boosting regressor
+    model = GradientBoostingRegressor(
+        n_estimators=200, max_depth=8, learning_rate=0.1, random_state=42
+    )
+    model.fit(X_train_scaled, y_train)
+
+    # Evaluate
+    y_pred = model.predict(X_test_scaled)
+
+    return {
+        "model": model,
+        "r2_score": r2_score(y_test, y_pred),
+        "rmse": np.sqrt(mean_squared_error(y_test, y_pred)),
+        "explained_variance": explained_variance_score(y_test, y_pred),
+    }
+
 
 class MLStrategyOptimizer:
     """
@@ -59,12 +247,22 @@ class MLStrategyOptimizer:
     - Real-time feature engineering
     """
 
-    def __init__(self):
+    def __init__(self, use_process_pool: bool = True):
+        """
+        Args:
+            use_process_pool: Train in a worker process (True) or a worker
+                thread (False); either way the event loop is not blocked
+        """
         # ML Models
         self.strategy_predictor = None
         self.performance_predictor = None
         self.risk_predictor = None
 
+        # Off-loop training
+        self.use_process_pool = use_process_pool
+        self._training_executor: Optional[ProcessPoolExecutor] = None
+        self._training_in_progress: Set[str] = set()
+
         # Feature engineering
         self.feature_scaler = StandardScaler()
         self.label_encoder = LabelEncoder()
@@ -148,105 +346,129 @@ class MLStrategyOptimizer:
             Strategy prediction with confidence scores
         """
 
-        prediction_result = {
-            "recommended_strategy": None,
-            "confidence_score": 0.0,
-            "prediction_probabilities": {},
-            "feature_importance": {},
-            "prediction_timestamp": datetime.now().isoformat(),
-            "model_version": None,
-            "fallback_reason": None,
+        predictions = await self.predict_optimal_strategies(
+            {wallet_address: wallet_data}, market_conditions, available_strategies
+        )
+        return predictions[wallet_address]
+
+    async def predict_optimal_strategies(
+        self,
+        wallets: Dict[str, Dict[str, Any]],
+        market_conditions: Dict[str, Any],
+        available_strategies: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Predict optimal trading strategies for many wallets in one model call.
+
+        Features of all wallets are stacked into one matrix, which is scaled
+        and passed to the strategy model once.
+
+        Args:
+            wallets: Wallet behavior and classification data by wallet address
+            market_conditions: Current market conditions
+            available_strategies: List of available strategy options
+
+        Returns:
+            Strategy prediction with confidence scores, by wallet address
+        """
+
+        predictions = {
+            wallet_address: self._new_prediction_result() for wallet_address in wallets
         }
 
-        try:
-            # Check if models are trained and available
-            if not self._models_ready():
-                prediction_result["fallback_reason"] = "Models not trained yet"
-                return self._fallback_prediction(
-                    wallet_data, available_strategies, prediction_result
-                )
+        def fallback(wallet_address: str, reason: str) -> None:
+            predictions[wallet_address]["fallback_reason"] = reason
+            self._fallback_prediction(
+                wallets[wallet_address],
+                available_strategies,
+                predictions[wallet_address],
+            )
+
+        # Check if models are trained and available
+        if not self._models_ready():
+            for wallet_address in wallets:
+                fallback(wallet_address, "Models not trained yet")
+            return predictions
 
-            # Feature engineering
+        # Feature engineering
+        feature_names: List[str] = []
+        rows: List[List[float]] = []
+        row_wallets: List[str] = []
+        for wallet_address, wallet_data in wallets.items():
             features = await self._extract_features(
                 wallet_address, wallet_data, market_conditions
             )
-
             if not features:
-                prediction_result["fallback_reason"] = "Feature extraction failed"
-                return self._fallback_prediction(
-                    wallet_data, available_strategies, prediction_result
-                )
-
-            # Scale features
-            scaled_features = self.feature_scaler.transform([list(features.values())])
+                fallback(wallet_address, "Feature extraction failed")
+                continue
+            feature_names = list(features.keys())
+            rows.append(list(features.values()))
+            row_wallets.append(wallet_address)
 
-            # Strategy prediction
-            if self.strategy_predictor:
-                strategy_probs = self.strategy_predictor.predict_proba(scaled_features)[
-                    0
-                ]
-
-                # Map probabilities to available strategies
-                strategy_probabilities = {}
-                for i, prob in enumerate(strategy_probs):
-                    strategy_name = self.label_encoder.inverse_transform([i])[0]
-                    if strategy_name in available_strategies:
-                        strategy_probabilities[strategy_name] = prob
-
-                # Select highest probability strategy
-                if strategy_probabilities:
-                    best_strategy = max(
-                        strategy_probabilities.keys(),
-                        key=lambda x: strategy_probabilities[x],
-                    )
-                    prediction_result["recommended_strategy"] = best_strategy
-                    prediction_result["confidence_score"] = strategy_probabilities[
-                        best_strategy
-                    ]
-                    prediction_result["prediction_probabilities"] = (
-                        strategy_probabilities
-                    )
+        if not rows:
+            return predictions
 
-                    # Get feature importance if available
-                    if hasattr(self.strategy_predictor, "feature_importances_"):
-                        feature_names = list(features.keys())
-                        importance_dict = dict(
-                            zip(
-                                feature_names,
-                                self.strategy_predictor.feature_importances_,
-                            )
-                        )
-                        prediction_result["feature_importance"] = importance_dict
-
-                    prediction_result["model_version"] = getattr(
-                        self.strategy_predictor, "_model_version", "unknown"
-                    )
+        # One consistent model version for the whole batch
+        predictor = self.strategy_predictor
+        feature_scaler = self.feature_scaler
+        label_encoder = self.label_encoder
 
-                else:
-                    prediction_result["fallback_reason"] = (
-                        "No matching strategies in prediction"
-                    )
-                    return self._fallback_prediction(
-                        wallet_data, available_strategies, prediction_result
-                    )
+        try:
+            # Scale features and predict all wallets at once
+            scaled_features = feature_scaler.transform(np.array(rows))
+            all_strategy_probs = predictor.predict_proba(scaled_features)
+        except Exception as e:
+            logger.error(f"Error in strategy prediction for {len(rows)} wallets: {e}")
+            for wallet_address in row_wallets:
+                predictions[wallet_address]["error"] = str(e)
+                fallback(wallet_address, f"Prediction error: {e}")
+            return predictions
+
+        class_names = label_encoder.classes_
+        importance_dict = None
+        if hasattr(predictor, "feature_importances_"):
+            importance_dict = dict(zip(feature_names, predictor.feature_importances_))
+        model_version = getattr(predictor, "_model_version", "unknown")
+
+        for wallet_address, strategy_probs in zip(row_wallets, all_strategy_probs):
+            # Map probabilities to available strategies
+            strategy_probabilities = {
+                class_names[i]: prob
+                for i, prob in enumerate(strategy_probs)
+                if class_names[i] in available_strategies
+            }
 
-            else:
-                prediction_result["fallback_reason"] = (
-                    "Strategy predictor not available"
-                )
-                return self._fallback_prediction(
-                    wallet_data, available_strategies, prediction_result
-                )
+            if not strategy_probabilities:
+                fallback(wallet_address, "No matching strategies in prediction")
+                continue
 
-        except Exception as e:
-            logger.error(f"Error in strategy prediction for {wallet_address}: {e}")
-            prediction_result["error"] = str(e)
-            prediction_result["fallback_reason"] = f"Prediction error: {e}"
-            return self._fallback_prediction(
-                wallet_data, available_strategies, prediction_result
+            # Select highest probability strategy
+            best_strategy = max(
+                strategy_probabilities.keys(),
+                key=lambda x: strategy_probabilities[x],
             )
+            prediction_result = predictions[wallet_address]
+            prediction_result["recommended_strategy"] = best_strategy
+            prediction_result["confidence_score"] = strategy_probabilities[best_strategy]
+            prediction_result["prediction_probabilities"] = strategy_probabilities
+            if importance_dict is not None:
+                prediction_result["feature_importance"] = dict(importance_dict)
+            prediction_result["model_version"] = model_version
 
-        return prediction_result
+        return predictions
+
+    def _new_prediction_result(self) -> Dict[str, Any]:
+        """Empty prediction result for one wallet."""
+
+        return {
+            "recommended_strategy": None,
+            "confidence_score": 0.0,
+            "prediction_probabilities": {},
+            "feature_importance": {},
+            "prediction_timestamp": datetime.now().isoformat(),
+            "model_version": None,
+            "fallback_reason": None,
+        }
 
     def _models_ready(self) -> bool:
         """Check if ML models are trained and ready for prediction."""
@@ -512,64 +734,29 @@ class MLStrategyOptimizer:
             X_train, X_val = X[:split_idx], X[split_idx:]
             y_train, y_val = y[:split_idx], y[split_idx:]
 
-            # Train ensemble model
-            self.strategy_predictor = VotingClassifier(
-                [
-                    (
-                        "rf",
-                        RandomForestClassifier(
-                            n_estimators=100,
-                            max_depth=10,
-                            min_samples_split=20,
-                            random_state=42,
-                        ),
-                    ),
-                    (
-                        "gb",
-                        GradientBoostingRegressor(
-                            n_estimators=100,
-                            max_depth=6,
-                            learning_rate=0.1,
-                            random_state=42,
-                        ),
-                    ),
-                    ("lr", LogisticRegression(random_state=42, max_iter=1000)),
-                ]
-            )
-
-            # Fit label encoder
-            self.label_encoder.fit(y_train)
-
-            # Transform labels
-            y_train_encoded = self.label_encoder.transform(y_train)
-
-            # Fit scaler on training features
-            self.feature_scaler.fit(X_train)
-
-            # Scale training data
-            X_train_scaled = self.feature_scaler.transform(X_train)
-
-            # Train model
-            self.strategy_predictor.fit(X_train_scaled, y_train_encoded)
+            if "strategy_predictor" in self._training_in_progress:
+                training_results["reason"] = "Training already in progress"
+                return training_results
 
-            # Add model version
-            model_version = f"v_{int(time.time())}"
-            setattr(self.strategy_predictor, "_model_version", model_version)
-            training_results["model_version"] = model_version
+            # Fit, validate and cross-validate off the event loop
+            self._training_in_progress.add("strategy_predictor")
+            try:
+                fitted = await self._run_training_job(
+                    _fit_strategy_predictor, X_train, y_train, X_val, y_val
+                )
+            finally:
+                self._training_in_progress.discard("strategy_predictor")
 
-            # Validate model
-            validation_results = await self._validate_model(X_val, y_val)
-            training_results["performance_metrics"] = validation_results
+            # Swap the new model in atomically (no await in between)
+            self.strategy_predictor = fitted["model"]
+            self.feature_scaler = fitted["feature_scaler"]
+            self.label_encoder = fitted["label_encoder"]
 
-            # Calculate cross-validation score
-            cv_scores = cross_val_score(
-                self.strategy_predictor,
-                X_train_scaled,
-                y_train_encoded,
-                cv=TimeSeriesSplit(n_splits=5),
-                scoring="accuracy",
-            )
-            training_results["cross_validation_score"] = cv_scores.mean()
+            training_results["model_version"] = fitted["model_version"]
+            training_results["performance_metrics"] = fitted["performance_metrics"]
+            training_results["cross_validation_score"] = fitted[
+                "cross_validation_score"
+            ]
 
             training_results["training_successful"] = True
 
@@ -624,62 +811,57 @@ class MLStrategyOptimizer:
     ) -> Dict[str, Any]:
         """Validate trained model performance."""
 
-        validation_metrics = {}
-
-        try:
-            if self.strategy_predictor is None:
-                return validation_metrics
-
-            # Scale validation data
-            X_val_scaled = self.feature_scaler.transform(X_val)
-
-            # Encode validation labels
-            y_val_encoded = self.label_encoder.transform(y_val)
+        if self.strategy_predictor is None:
+            return {}
 
-            # Predictions
-            y_pred = self.strategy_predictor.predict(X_val_scaled)
-            y_pred_proba = self.strategy_predictor.predict_proba(X_val_scaled)
+        return _strategy_validation_metrics(
+            self.strategy_predictor, self.feature_scaler, self.label_encoder, X_val, y_val
+        )
 
-            # Classification metrics
-            validation_metrics["accuracy"] = accuracy_score(y_val_encoded, y_pred)
-            validation_metrics["precision"] = precision_score(
-                y_val_encoded, y_pred, average="weighted"
-            )
-            validation_metrics["recall"] = recall_score(
-                y_val_encoded, y_pred, average="weighted"
-            )
-            validation_metrics["f1_score"] = f1_score(
-                y_val_encoded, y_pred, average="weighted"
+    def _get_training_executor(self) -> ProcessPoolExecutor:
+        """Start the training process on first use"""
+        if self._training_executor is None:
+            # spawn avoids forking a process that has a running event loop
+            self._training_executor = ProcessPoolExecutor(
+                max_workers=TRAINING_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
             )
+            logger.info("⚙️ ML training process started")
+        return self._training_executor
 
-            # Confusion matrix
-            cm = confusion_matrix(y_val_encoded, y_pred)
-            validation_metrics["confusion_matrix"] = cm.tolist()
-
-            # Class-specific metrics
-            class_report = classification_report(
-                y_val_encoded,
-                y_pred,
-                target_names=self.label_encoder.classes_,
-                output_dict=True,
-            )
-            validation_metrics["class_report"] = class_report
+    async def _run_training_job(
+        self, job: Callable[..., Dict[str, Any]], *args: Any
+    ) -> Dict[str, Any]:
+        """
+        Run a CPU-bound training job without blocking the event loop.
 
-            # Prediction confidence analysis
-            prediction_confidences = np.max(y_pred_proba, axis=1)
-            validation_metrics["avg_prediction_confidence"] = np.mean(
-                prediction_confidences
-            )
-            validation_metrics["confidence_std"] = np.std(prediction_confidences)
-            validation_metrics["high_confidence_predictions"] = np.mean(
-                prediction_confidences > 0.8
-            )
+        Jobs run in the training process, or in a worker thread when the
+        process pool is disabled or cannot be started.
+        """
+        if self.use_process_pool:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(
+                    self._get_training_executor(), job, *args
+                )
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(
+                    f"ML training process unavailable ({e}), training in a thread"
+                )
+                # Reaping a broken pool blocks, so keep it off the event loop
+                executor, self._training_executor = self._training_executor, None
+                if executor is not None:
+                    await asyncio.to_thread(
+                        executor.shutdown, wait=True, cancel_futures=True
+                    )
 
-        except Exception as e:
-            logger.error(f"Error validating model: {e}")
-            validation_metrics["error"] = str(e)
+        return await asyncio.to_thread(job, *args)
 
-        return validation_metrics
+    def close(self) -> None:
+        """Shut down the training process, if one was started"""
+        if self._training_executor is not None:
+            self._training_executor.shutdown(wait=True, cancel_futures=True)
+            self._training_executor = None
 
     def _recent_model_exists(self) -> bool:
         """Check if a recent model exists."""
@@ -747,31 +929,22 @@ class MLStrategyOptimizer:
             training_results["training_samples"] = len(X)
             training_results["feature_count"] = X.shape[1]
 
-            # Split data
-            split_idx = int(len(X) * 0.8)
-            X_train, X_test = X[:split_idx], X[split_idx:]
-            y_train, y_test = y[:split_idx], y[split_idx:]
-
-            # Scale features
-            scaler = StandardScaler()
-            X_train_scaled = scaler.fit_transform(X_train)
-            X_test_scaled = scaler.transform(X_test)
-
-            # Train gradient boosting regressor
-            self.performance_predictor = GradientBoostingRegressor(
-                n_estimators=200, max_depth=8, learning_rate=0.1, random_state=42
-            )
+            if "performance_predictor" in self._training_in_progress:
+                training_results["reason"] = "Training already in progress"
+                return training_results
 
-            self.performance_predictor.fit(X_train_scaled, y_train)
+            # Fit and evaluate off the event loop
+            self._training_in_progress.add("performance_predictor")
+            try:
+                fitted = await self._run_training_job(_fit_performance_predictor, X, y)
+            finally:
+                self._training_in_progress.discard("performance_predictor")
 
-            # Evaluate
-            y_pred = self.performance_predictor.predict(X_test_scaled)
+            self.performance_predictor = fitted["model"]
 
-            training_results["r2_score"] = r2_score(y_test, y_pred)
-            training_results["rmse"] = np.sqrt(mean_squared_error(y_test, y_pred))
-            training_results["explained_variance"] = explained_variance_score(
-                y_test, y_pred
-            )
+            training_results["r2_score"] = fitted["r2_score"]
+            training_results["rmse"] = fitted["rmse"]
+            training_results["explained_variance"] = fitted["explained_variance"]
 
             training_results["training_successful"] = True
 
@@ -1094,6 +1267,7 @@ class MLStrategyOptimizer:
                 "reinforcement_learning": self.rl_agent is not None,
             },
             "training_data_size": len(self.training_data),
+            "training_in_progress": sorted(self._training_in_progress),
             "last_training": None,
             "prediction_accuracy": self.prediction_accuracy,
             "drift_status": "unknown",
@@ -0,0 +1,253 @@
+"""
+Monte Carlo Scenario Generation and Aggregation
+===============================================
+
+Vectorized building blocks for BacktestingEngine.run_monte_carlo_stress_test.
+
+- ``generate_scenario_shocks`` draws every scenario's shocks at once, one
+  array per shock, each from its own ``np.random.Generator`` stream spawned
+  from a single SeedSequence. A scenario's shocks depend only on the seed
+  and its scenario id, never on how scenarios are split across workers.
+- ``MonteCarloAccumulator`` folds scenario summaries in as they complete.
+  Only a few floats per scenario are kept (in preallocated arrays), so full
+  backtest results and trade logs are never held for the whole run.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import stats
+
+# Per-scenario inputs handed to a worker: (scenario_id, shocks, simulation_seed)
+ScenarioSpec = Tuple[int, Dict[str, Any], int]
+
+# Independent generator stream per shock component
+SHOCK_STREAMS = (
+    "volatility",
+    "liquidity",
+    "gas",
+    "correlation",
+    "regime",
+    "stress",
+    "simulation",
+)
+
+SEED_MODULUS = 2**32  # np.random.seed accepts [0, 2**32)
+
+
+def generate_scenario_shocks(
+    total_scenarios: int, simulation_params: Dict[str, Any], seed: int
+) -> Dict[str, np.ndarray]:
+    """
+    Draw shocks for every scenario as arrays.
+
+    The first scenarios are extreme stress cases, in blocks sized by
+    ``volatility_shock_scenarios``, ``correlation_break_scenarios`` and
+    ``liquidity_crisis_scenarios``; the rest are ordinary stochastic draws.
+
+    Args:
+        total_scenarios: Number of scenarios
+        simulation_params: BacktestingEngine simulation parameters
+        seed: Root seed for all shock streams
+
+    Returns:
+        Dict of per-scenario arrays: shock multipliers, ``scenario_type`` and
+        ``simulation_seed`` (seed for the backtest's own execution noise)
+    """
+    n = total_scenarios
+    children = np.random.SeedSequence(seed).spawn(len(SHOCK_STREAMS))
+    rng = {
+        name: np.random.default_rng(child)
+        for name, child in zip(SHOCK_STREAMS, children)
+    }
+
+    shocks = {
+        # Log-normal keeps multipliers positive
+        "volatility_multiplier": rng["volatility"].lognormal(0, 0.3, n),
+        # Beta distribution centered on 0.5
+        "liquidity_multiplier": rng["liquidity"].beta(2, 2, n),
+        "gas_price_multiplier": rng["gas"].lognormal(0, 0.5, n),
+        "correlation_shock": rng["correlation"].normal(0, 0.2, n),
+        # Low probability regime changes
+        "regime_change_probability": rng["regime"].beta(1, 9, n),
+        "scenario_type": np.full(n, "normal", dtype=object),
+        "simulation_seed": rng["simulation"].integers(
+            0, SEED_MODULUS, n, dtype=np.int64
+        ),
+    }
+
+    # Extreme scenarios for stress testing, in consecutive id blocks
+    volatility_end = min(n, simulation_params["volatility_shock_scenarios"])
+    correlation_end = min(
+        n, volatility_end + simulation_params["correlation_break_scenarios"]
+    )
+    liquidity_end = min(
+        n, correlation_end + simulation_params["liquidity_crisis_scenarios"]
+    )
+    stress = rng["stress"]
+
+    shocks["volatility_multiplier"][:volatility_end] = stress.uniform(
+        2.0, 4.0, volatility_end
+    )
+    shocks["scenario_type"][:volatility_end] = "high_volatility"
+
+    shocks["correlation_shock"][volatility_end:correlation_end] = stress.uniform(
+        -0.5, 0.5, correlation_end - volatility_end
+    )
+    shocks["scenario_type"][volatility_end:correlation_end] = "correlation_break"
+
+    shocks["liquidity_multiplier"][correlation_end:liquidity_end] = stress.uniform(
+        0.1, 0.3, liquidity_end - correlation_end
+    )
+    shocks["scenario_type"][correlation_end:liquidity_end] = "liquidity_crisis"
+
+    return shocks
+
+
+def scenario_specs(
+    shocks: Dict[str, np.ndarray], scenario_ids: Iterable[int]
+) -> List[ScenarioSpec]:
+    """
+    Build per-scenario worker inputs from the shock arrays.
+
+    Args:
+        shocks: Output of generate_scenario_shocks
+        scenario_ids: Scenario ids to include
+
+    Returns:
+        List of (scenario_id, shocks, simulation_seed)
+    """
+    specs = []
+    for scenario_id in scenario_ids:
+        scenario_shocks = {}
+        for key, values in shocks.items():
+            if key == "simulation_seed":
+                continue
+            value = values[scenario_id]
+            scenario_shocks[key] = value.item() if isinstance(value, np.generic) else value
+        specs.append(
+            (scenario_id, scenario_shocks, int(shocks["simulation_seed"][scenario_id]))
+        )
+    return specs
+
+
+def summarize_scenario_result(
+    scenario_id: int, result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Reduce a scenario backtest result to the figures the accumulator keeps"""
+    metrics = result.get("performance_metrics", {})
+    return {
+        "scenario_id": scenario_id,
+        "total_return": float(result.get("total_return", 0.0)),
+        "sharpe_ratio": float(metrics.get("sharpe_ratio", 0.0)),
+        "max_drawdown": float(metrics.get("max_drawdown", 0.0)),
+    }
+
+
+class MonteCarloAccumulator:
+    """
+    Fixed-size store of per-scenario returns, Sharpe ratios and drawdowns.
+
+    Example:
+        accumulator = MonteCarloAccumulator(total_scenarios)
+        for summary in summaries:
+            accumulator.add(summary)
+        var_95, cvar_95 = accumulator.value_at_risk(0.95)
+    """
+
+    def __init__(self, total_scenarios: int) -> None:
+        """
+        Initialize the accumulator.
+
+        Args:
+            total_scenarios: Number of scenarios that will be added
+        """
+        self.returns = np.full(total_scenarios, np.nan)
+        self.sharpe_ratios = np.full(total_scenarios, np.nan)
+        self.max_drawdowns = np.full(total_scenarios, np.nan)
+        self.completed = np.zeros(total_scenarios, dtype=bool)
+
+    def add(self, summary: Dict[str, Any]) -> None:
+        """Record one scenario summary"""
+        scenario_id = summary["scenario_id"]
+        self.returns[scenario_id] = summary["total_return"]
+        self.sharpe_ratios[scenario_id] = summary["sharpe_ratio"]
+        self.max_drawdowns[scenario_id] = summary["max_drawdown"]
+        self.completed[scenario_id] = True
+
+    @property
+    def completed_count(self) -> int:
+        """Number of scenarios recorded so far"""
+        return int(self.completed.sum())
+
+    def _completed_returns(self) -> np.ndarray:
+        return self.returns[self.completed]
+
+    def value_at_risk(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """
+        Historical VaR and CVaR of scenario returns.
+
+        Args:
+            confidence: Confidence level
+
+        Returns:
+            (VaR, CVaR) as returns (negative values are losses)
+        """
+        returns = self._completed_returns()
+        if len(returns) == 0:
+            return 0.0, 0.0
+        var = float(np.percentile(returns, (1 - confidence) * 100))
+        return var, float(np.mean(returns[returns <= var]))
+
+    def extreme_scenarios(self) -> Tuple[Optional[int], Optional[int]]:
+        """Scenario ids with the worst and best returns"""
+        if not self.completed.any():
+            return None, None
+        ids = np.flatnonzero(self.completed)
+        returns = self.returns[ids]
+        return int(ids[np.argmin(returns)]), int(ids[np.argmax(returns)])
+
+    def confidence_intervals(self) -> Dict[str, List[float]]:
+        """95% intervals for scenario returns and Sharpe ratios"""
+        if not self.completed.any():
+            return {}
+        returns = self._completed_returns()
+        sharpe_ratios = self.sharpe_ratios[self.completed]
+        return {
+            "return_95_ci": [
+                float(np.percentile(returns, 2.5)),
+                float(np.percentile(returns, 97.5)),
+            ],
+            "sharpe_95_ci": [
+                float(np.percentile(sharpe_ratios, 2.5)),
+                float(np.percentile(sharpe_ratios, 97.5)),
+            ],
+        }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Aggregate statistics over completed scenarios"""
+        returns = self._completed_returns()
+        if len(returns) == 0:
+            return {}
+
+        sharpe_ratios = self.sharpe_ratios[self.completed]
+        max_drawdowns = self.max_drawdowns[self.completed]
+        percentiles = np.percentile(returns, [5, 25, 50, 75, 95])
+
+        return {
+            "mean_return": float(np.mean(returns)),
+            "return_std": float(np.std(returns)),
+            "return_skewness": float(stats.skew(returns)),
+            "return_kurtosis": float(stats.kurtosis(returns)),
+            "mean_sharpe": float(np.mean(sharpe_ratios)),
+            "sharpe_std": float(np.std(sharpe_ratios)),
+            "mean_max_drawdown": float(np.mean(max_drawdowns)),
+            "probability_profit": float(np.mean(returns > 0)),
+            "probability_loss_10pct": float(np.mean(returns < -0.1)),
+            "probability_loss_20pct": float(np.mean(returns < -0.2)),
+            "best_return": float(np.max(returns)),
+            "worst_return": float(np.min(returns)),
+            "return_percentiles": {
+                str(p): float(v) for p, v in zip((5, 25, 50, 75, 95), percentiles)
+            },
+        }
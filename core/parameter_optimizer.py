@@ -27,6 +27,8 @@ from scipy import stats
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import Matern
 
+from core.backtest_runner import BacktestBatchRunner
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,7 +47,9 @@ class ParameterOptimizer:
         self.optimization_config = {
             # Grid search parameters
             "grid_search_points": 100,  # Maximum grid points to evaluate
-            "grid_search_parallel": 4,  # Parallel grid evaluations
+            # Evaluation execution
+            "evaluation_workers": 1,  # Backtest processes (1 = serial, None = all cores)
+            "random_seed": 42,  # Base seed for per-candidate backtest RNG
             # Genetic algorithm parameters
             "population_size": 50,  # GA population size
             "generations": 30,  # GA generations
@@ -110,6 +114,13 @@ class ParameterOptimizer:
         self.parameter_stability: Dict[str, Any] = {}
         self.validation_results: Dict[str, Any] = {}
 
+        # Backtest runner for the dataset of the optimization in progress
+        self._backtest_runner: Optional[BacktestBatchRunner] = None
+
+        # Candidate generation RNG (grid sampling, GA, BO); private so that
+        # seeding a run leaves NumPy's global RNG alone
+        self._rng = np.random.default_rng(self.optimization_config["random_seed"])
+
         logger.info("🔬 Parameter optimization framework initialized")
 
     async def optimize_strategy_parameters(
@@ -151,7 +162,24 @@ class ParameterOptimizer:
             "timestamp": datetime.now().isoformat(),
         }
 
+        # One runner (and process pool) serves every evaluation of this run,
+        # including nested runs from stability analysis on the same dataset
+        previous_runner = self._backtest_runner
+        owns_runner = previous_runner is None or previous_runner.dataset is not dataset
+
         try:
+            if owns_runner:
+                # Seed candidate generation (grid sampling, GA, BO) as well
+                self._rng = np.random.default_rng(
+                    self.optimization_config["random_seed"]
+                )
+                self._backtest_runner = BacktestBatchRunner(
+                    self.backtesting_engine,
+                    dataset,
+                    max_workers=self.optimization_config["evaluation_workers"],
+                    base_seed=self.optimization_config["random_seed"],
+                )
+
             # Get parameter space
             param_space = parameter_space or self.parameter_definitions.get(
                 strategy_name, {}
@@ -220,6 +248,11 @@ class ParameterOptimizer:
             logger.error(f"Error in parameter optimization for {strategy_name}: {e}")
             optimization_result["error"] = str(e)
 
+        finally:
+            if owns_runner and self._backtest_runner is not None:
+                self._backtest_runner.close()
+                self._backtest_runner = previous_runner
+
         return optimization_result
 
     async def _grid_search_optimization(
@@ -237,18 +270,22 @@ class ParameterOptimizer:
         param_grid = self._generate_parameter_grid(param_space)
         logger.info(f"Grid search: evaluating {len(param_grid)} parameter combinations")
 
-        # Evaluate each parameter combination
+        # Evaluate all parameter combinations as one batch
+        evaluation_results = await self._evaluate_parameter_batch(
+            strategy_name,
+            [(params, start_date, end_date) for params in param_grid],
+            dataset,
+            capital,
+        )
+
         best_score = float("-inf")
         best_params = {}
         optimization_path = []
 
-        for i, params in enumerate(param_grid):
+        for i, (params, evaluation_result) in enumerate(
+            zip(param_grid, evaluation_results)
+        ):
             try:
-                # Evaluate parameter combination
-                evaluation_result = await self._evaluate_parameter_combination(
-                    strategy_name, params, dataset, start_date, end_date, capital
-                )
-
                 score = evaluation_result["score"]
                 optimization_path.append(
                     {
@@ -330,7 +367,7 @@ class ParameterOptimizer:
             for _ in range(n_samples):
                 sample = {}
                 for param_name, values in param_values.items():
-                    sample[param_name] = np.random.choice(values)
+                    sample[param_name] = self._rng.choice(values)
                 grid_points.append(sample)
 
         return grid_points
@@ -361,17 +398,18 @@ class ParameterOptimizer:
         )
 
         for generation in range(generations):
-            # Evaluate fitness of current population
+            # Evaluate fitness of current population as one batch
             fitness_scores = []
-            evaluation_results = []
+            evaluation_results = await self._evaluate_parameter_batch(
+                strategy_name,
+                [(individual, start_date, end_date) for individual in population],
+                dataset,
+                capital,
+            )
 
-            for individual in population:
-                evaluation = await self._evaluate_parameter_combination(
-                    strategy_name, individual, dataset, start_date, end_date, capital
-                )
+            for individual, evaluation in zip(population, evaluation_results):
                 fitness = evaluation["score"]
                 fitness_scores.append(fitness)
-                evaluation_results.append(evaluation)
 
                 if fitness > best_fitness:
                     best_fitness = fitness
@@ -414,9 +452,9 @@ class ParameterOptimizer:
                 param_type = param_def["type"]
 
                 if param_type == "int":
-                    value = np.random.randint(param_min, param_max + 1)
+                    value = int(self._rng.integers(param_min, param_max + 1))
                 else:
-                    value = np.random.uniform(param_min, param_max)
+                    value = self._rng.uniform(param_min, param_max)
 
                 individual[param_name] = value
 
@@ -448,7 +486,7 @@ class ParameterOptimizer:
             parent2 = self._tournament_selection(population, fitness_scores)
 
             # Crossover
-            if np.random.random() < self.optimization_config["crossover_rate"]:
+            if self._rng.random() < self.optimization_config["crossover_rate"]:
                 child1, child2 = self._crossover(parent1, parent2, param_space)
             else:
                 child1, child2 = parent1.copy(), parent2.copy()
@@ -467,7 +505,7 @@ class ParameterOptimizer:
         """Tournament selection for genetic algorithm."""
 
         tournament_size = 3
-        tournament_indices = np.random.choice(
+        tournament_indices = self._rng.choice(
             len(population), tournament_size, replace=False
         )
         tournament_fitness = [fitness_scores[i] for i in tournament_indices]
@@ -487,7 +525,7 @@ class ParameterOptimizer:
         child2 = {}
 
         for param_name in param_space.keys():
-            if np.random.random() < 0.5:
+            if self._rng.random() < 0.5:
                 child1[param_name] = parent1[param_name]
                 child2[param_name] = parent2[param_name]
             else:
@@ -504,7 +542,7 @@ class ParameterOptimizer:
         mutated = individual.copy()
 
         for param_name, param_def in param_space.items():
-            if np.random.random() < self.optimization_config["mutation_rate"]:
+            if self._rng.random() < self.optimization_config["mutation_rate"]:
                 param_min = param_def["min"]
                 param_max = param_def["max"]
                 param_type = param_def["type"]
@@ -513,7 +551,7 @@ class ParameterOptimizer:
                 current_value = mutated[param_name]
                 mutation_strength = (param_max - param_min) * 0.1  # 10% of range
 
-                new_value = current_value + np.random.normal(0, mutation_strength)
+                new_value = current_value + self._rng.normal(0, mutation_strength)
 
                 # Ensure bounds
                 if param_type == "int":
@@ -555,10 +593,13 @@ class ParameterOptimizer:
         y_observed = []
 
         # Evaluate initial points
-        for params in initial_points:
-            evaluation = await self._evaluate_parameter_combination(
-                strategy_name, params, dataset, start_date, end_date, capital
-            )
+        initial_evaluations = await self._evaluate_parameter_batch(
+            strategy_name,
+            [(params, start_date, end_date) for params in initial_points],
+            dataset,
+            capital,
+        )
+        for params, evaluation in zip(initial_points, initial_evaluations):
             X_observed.append(list(params.values()))
             y_observed.append(evaluation["score"])
 
@@ -637,7 +678,7 @@ class ParameterOptimizer:
         # Random candidate
         candidate = []
         for bounds in param_bounds:
-            value = np.random.uniform(bounds[0], bounds[1])
+            value = self._rng.uniform(bounds[0], bounds[1])
             candidate.append(value)
 
         return np.array(candidate)
@@ -653,35 +694,108 @@ class ParameterOptimizer:
     ) -> Dict[str, Any]:
         """Evaluate a specific parameter combination."""
 
-        try:
-            # Create strategy configuration with parameters
-            strategy_config = self._create_strategy_config(strategy_name, parameters)
+        (evaluation,) = await self._evaluate_parameter_batch(
+            strategy_name, [(parameters, start_date, end_date)], dataset, capital
+        )
+        return evaluation
 
-            # Run backtest
-            backtest_result = await self.backtesting_engine.run_backtest(
-                strategy_config, dataset, start_date, end_date, capital
-            )
+    async def _evaluate_parameter_batch(
+        self,
+        strategy_name: str,
+        candidates: List[Tuple[Dict[str, Any], datetime, datetime]],
+        dataset: Dict[str, Any],
+        capital: float,
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate a batch of parameter combinations.
 
-            # Extract optimization target
-            performance_metrics = backtest_result.get("performance_metrics", {})
-            target_metric = self.optimization_config["optimization_target"]
-            score = performance_metrics.get(target_metric, 0)
-
-            # Apply risk adjustment if enabled
-            if self.optimization_config["risk_adjustment"]:
-                risk_penalty = self._calculate_risk_penalty(backtest_result)
-                score = score - risk_penalty
-
-            return {
-                "score": score,
-                "metrics": performance_metrics,
-                "risk_adjusted_score": score,
-                "backtest_result": backtest_result,
-            }
+        Candidates are run through the backtest runner, serially or across a
+        process pool depending on ``evaluation_workers``; both modes seed each
+        backtest identically, so the scores do not depend on the mode.
+
+        Args:
+            strategy_name: Strategy being optimized
+            candidates: (parameters, start_date, end_date) tuples
+            dataset: Historical dataset
+            capital: Starting capital
 
+        Returns:
+            Evaluation results in candidate order; a candidate whose backtest
+            fails is scored -inf without affecting the rest of the batch
+        """
+
+        evaluations: List[Optional[Dict[str, Any]]] = [None] * len(candidates)
+        requests = []
+        request_indices = []
+
+        for i, (parameters, start_date, end_date) in enumerate(candidates):
+            try:
+                strategy_config = self._create_strategy_config(
+                    strategy_name, parameters
+                )
+            except Exception as e:
+                evaluations[i] = self._failed_evaluation(e)
+                continue
+            requests.append((strategy_config, start_date, end_date, capital))
+            request_indices.append(i)
+
+        try:
+            backtest_results = await self._get_backtest_runner(dataset).run(
+                requests, return_exceptions=True
+            )
         except Exception as e:
-            logger.error(f"Error evaluating parameter combination: {e}")
-            return {"score": float("-inf"), "metrics": {}, "error": str(e)}
+            backtest_results = [e] * len(requests)
+
+        for i, backtest_result in zip(request_indices, backtest_results):
+            if isinstance(backtest_result, Exception):
+                evaluations[i] = self._failed_evaluation(backtest_result)
+                continue
+            try:
+                evaluations[i] = self._score_backtest_result(backtest_result)
+            except Exception as e:
+                evaluations[i] = self._failed_evaluation(e)
+
+        return evaluations
+
+    @staticmethod
+    def _failed_evaluation(error: Exception) -> Dict[str, Any]:
+        """Mark a single candidate unscorable."""
+        logger.error(f"Error evaluating parameter combination: {error}")
+        return {"score": float("-inf"), "metrics": {}, "error": str(error)}
+
+    def _get_backtest_runner(self, dataset: Dict[str, Any]) -> BacktestBatchRunner:
+        """Get the active runner for ``dataset``, or a serial one-off runner"""
+        if (
+            self._backtest_runner is not None
+            and self._backtest_runner.dataset is dataset
+        ):
+            return self._backtest_runner
+        return BacktestBatchRunner(
+            self.backtesting_engine,
+            dataset,
+            max_workers=1,
+            base_seed=self.optimization_config["random_seed"],
+        )
+
+    def _score_backtest_result(self, backtest_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a backtest result into an optimization score."""
+
+        # Extract optimization target
+        performance_metrics = backtest_result.get("performance_metrics", {})
+        target_metric = self.optimization_config["optimization_target"]
+        score = performance_metrics.get(target_metric, 0)
+
+        # Apply risk adjustment if enabled
+        if self.optimization_config["risk_adjustment"]:
+            risk_penalty = self._calculate_risk_penalty(backtest_result)
+            score = score - risk_penalty
+
+        return {
+            "score": score,
+            "metrics": performance_metrics,
+            "risk_adjusted_score": score,
+            "backtest_result": backtest_result,
+        }
 
     def _create_strategy_config(
         self, strategy_name: str, parameters: Dict[str, Any]
@@ -809,14 +923,15 @@ class ParameterOptimizer:
             days=int(total_days * (1 - self.optimization_config["out_of_sample_ratio"]))
         )
 
-        # In-sample performance (used for optimization)
-        in_sample_result = await self._evaluate_parameter_combination(
-            strategy_name, optimal_params, dataset, start_date, split_point, capital
-        )
-
-        # Out-of-sample performance
-        oos_result = await self._evaluate_parameter_combination(
-            strategy_name, optimal_params, dataset, split_point, end_date, capital
+        # In-sample (used for optimization) and out-of-sample performance
+        in_sample_result, oos_result = await self._evaluate_parameter_batch(
+            strategy_name,
+            [
+                (optimal_params, start_date, split_point),
+                (optimal_params, split_point, end_date),
+            ],
+            dataset,
+            capital,
         )
 
         return {
@@ -854,8 +969,8 @@ class ParameterOptimizer:
             await self.backtesting_engine.run_walk_forward_optimization(
                 [self._create_strategy_config(strategy_name, optimal_params)],
                 dataset,
-                start_date,
-                end_date,
+                optimization_target=self.optimization_config["optimization_target"],
+                backtest_runner=self._get_backtest_runner(dataset),
             )
         )
 
@@ -902,6 +1017,7 @@ class ParameterOptimizer:
         total_days = (end_date - start_date).days
         fold_size = total_days // cv_folds
 
+        folds = []
         for fold in range(cv_folds):
             fold_start = start_date + timedelta(days=fold * fold_size)
             fold_end = fold_start + timedelta(days=fold_size)
@@ -909,12 +1025,13 @@ class ParameterOptimizer:
             if fold_end > end_date:
                 fold_end = end_date
 
-            # Evaluate on this fold
-            fold_result = await self._evaluate_parameter_combination(
-                strategy_name, optimal_params, dataset, fold_start, fold_end, capital
-            )
+            folds.append((optimal_params, fold_start, fold_end))
 
-            cv_scores.append(fold_result["score"])
+        # Evaluate all folds as one batch
+        fold_results = await self._evaluate_parameter_batch(
+            strategy_name, folds, dataset, capital
+        )
+        cv_scores = [fold_result["score"] for fold_result in fold_results]
 
         return {
             "cv_scores": cv_scores,
@@ -960,17 +1077,17 @@ class ParameterOptimizer:
 
                 test_points.append(test_value)
 
-            # Evaluate each test point
-            param_scores = []
+            # Evaluate all test points as one batch
+            candidates = []
             for test_value in test_points:
                 test_params = optimal_params.copy()
                 test_params[param_name] = test_value
+                candidates.append((test_params, start_date, end_date))
 
-                result = await self._evaluate_parameter_combination(
-                    strategy_name, test_params, dataset, start_date, end_date, capital
-                )
-
-                param_scores.append(result["score"])
+            results = await self._evaluate_parameter_batch(
+                strategy_name, candidates, dataset, capital
+            )
+            param_scores = [result["score"] for result in results]
 
             # Calculate sensitivity metrics
             sensitivity = (
@@ -1048,13 +1165,17 @@ class ParameterOptimizer:
         }
 
         try:
-            # Monte Carlo robustness
+            # Monte Carlo robustness, sharing the active process pool if any
+            active_runner = self._backtest_runner
+            if active_runner is not None and active_runner.dataset is not dataset:
+                active_runner = None
             mc_results = await self.backtesting_engine.run_monte_carlo_stress_test(
                 self._create_strategy_config(strategy_name, optimal_params),
                 dataset,
                 start_date,
                 end_date,
                 capital,
+                backtest_runner=active_runner,
             )
 
             robustness_results["monte_carlo_robustness"] = {
@@ -27,6 +27,7 @@ import pandas as pd
 
 from core.market_maker_detector import MarketMakerDetector
 from core.market_maker_risk_manager import MarketMakerRiskManager
+from core.wallet_correlation import WalletCorrelationEngine
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,9 @@ class PerformanceAnalyzer:
         self.performance_data: List[Dict[str, Any]] = []
         self.max_performance_history = 10000
 
+        # Daily PnL correlation between wallets, updated as trades settle
+        self.correlation_engine = WalletCorrelationEngine()
+
         # Market condition tracking
         self.market_conditions = {
             "volatility_regime": "normal",  # normal, high, low
@@ -96,6 +100,14 @@ class PerformanceAnalyzer:
         # Store in performance history
         self.performance_data.append(enriched_record)
 
+        wallet_address = enriched_record.get("wallet_address")
+        if wallet_address and "pnl_usd" in enriched_record:
+            self.correlation_engine.record_pnl(
+                wallet_address,
+                enriched_record["pnl_usd"],
+                enriched_record["timestamp"],
+            )
+
         # Maintain history size limit
         if len(self.performance_data) > self.max_performance_history:
             # Keep most recent records
@@ -11,16 +11,24 @@ Features:
 - Market regime-aware score adjustments
 - Streaming data processing with buffering
 - Score prediction and forecasting
+
+Per-trade statistics (PnL moments, win/loss counts, drawdown, EWMA volatility)
+and score-stream statistics are kept in online accumulators, so a trade
+update and a score read cost O(1) regardless of history length or the number
+of tracked wallets. Full updates are scheduled on a min-heap keyed by due time.
 """
 
 import asyncio
+import heapq
 import json
 import logging
+import math
 import time
 from collections import deque
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
 import numpy as np
 from scipy import stats
@@ -31,6 +39,159 @@ from core.wallet_quality_scorer import WalletQualityScorer
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _TradeAccumulator:
+    """Running trade statistics for one wallet, updated in O(1) per trade"""
+
+    trade_count: int = 0
+    wins: int = 0
+    losses: int = 0
+    pnl_mean: float = 0.0
+    pnl_m2: float = 0.0  # Welford sum of squared deviations from the mean
+    cumulative_pnl: float = 0.0
+    peak_pnl: float = 0.0
+    max_drawdown: float = 0.0
+    ewma_variance: float = 0.0
+
+    # Trades since the last incremental update
+    batch_trades: int = 0
+    batch_wins: int = 0
+
+    def add_trade(self, pnl_pct: float, ewma_decay: float) -> None:
+        """Fold one trade's return into the running statistics"""
+        self.trade_count += 1
+        self.batch_trades += 1
+        if pnl_pct > 0:
+            self.wins += 1
+            self.batch_wins += 1
+        elif pnl_pct < 0:
+            self.losses += 1
+
+        delta = pnl_pct - self.pnl_mean
+        self.pnl_mean += delta / self.trade_count
+        self.pnl_m2 += delta * (pnl_pct - self.pnl_mean)
+
+        self.cumulative_pnl += pnl_pct
+        self.peak_pnl = max(self.peak_pnl, self.cumulative_pnl)
+        self.max_drawdown = max(self.max_drawdown, self.peak_pnl - self.cumulative_pnl)
+
+        if self.trade_count == 1:
+            self.ewma_variance = pnl_pct**2
+        else:
+            self.ewma_variance = (
+                ewma_decay * self.ewma_variance + (1 - ewma_decay) * pnl_pct**2
+            )
+
+    def reset_batch(self) -> None:
+        """Start a new incremental-update batch"""
+        self.batch_trades = 0
+        self.batch_wins = 0
+
+    def to_metrics(self) -> Dict[str, float]:
+        """Current trade metrics"""
+        n = self.trade_count
+        return {
+            "trade_count": n,
+            "wins": self.wins,
+            "losses": self.losses,
+            "win_rate": self.wins / n if n else 0.0,
+            "pnl_mean": self.pnl_mean,
+            "pnl_std": math.sqrt(self.pnl_m2 / (n - 1)) if n > 1 else 0.0,
+            "cumulative_pnl": self.cumulative_pnl,
+            "current_drawdown": self.peak_pnl - self.cumulative_pnl,
+            "max_drawdown": self.max_drawdown,
+            "ewma_volatility": math.sqrt(self.ewma_variance),
+        }
+
+
+class _ScoreWindow:
+    """
+    Running sums over a wallet's bounded score stream.
+
+    Mirrors the stream deque (told about each append and eviction) so the
+    mean, standard deviation, range, linear trend and momentum of the window
+    are read in O(1) instead of being recomputed from the scores.
+    """
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.sum_y = 0.0
+        self.sum_yy = 0.0
+        self.sum_xy = 0.0  # x = position in the window (0 = oldest)
+
+        # Monotonic deques of (sequence, score) for the window max and min
+        self._next_seq = 0
+        self._first_seq = 0
+        self._max_q: Deque[Tuple[int, float]] = deque()
+        self._min_q: Deque[Tuple[int, float]] = deque()
+
+    def push(self, score: float, evicted: Optional[float] = None) -> None:
+        """Add a score, removing ``evicted`` (the oldest score) if the stream dropped it"""
+        seq = self._next_seq
+        self._next_seq += 1
+
+        self.sum_xy += self.n * score
+        self.sum_y += score
+        self.sum_yy += score * score
+        self.n += 1
+
+        while self._max_q and self._max_q[-1][1] <= score:
+            self._max_q.pop()
+        self._max_q.append((seq, score))
+        while self._min_q and self._min_q[-1][1] >= score:
+            self._min_q.pop()
+        self._min_q.append((seq, score))
+
+        if evicted is not None:
+            self.sum_y -= evicted
+            self.sum_yy -= evicted * evicted
+            self.n -= 1
+            # The evicted score sat at x = 0; every remaining x shifts down by one
+            self.sum_xy -= self.sum_y
+
+            if self._max_q[0][0] == self._first_seq:
+                self._max_q.popleft()
+            if self._min_q[0][0] == self._first_seq:
+                self._min_q.popleft()
+            self._first_seq += 1
+
+    @property
+    def mean(self) -> float:
+        return self.sum_y / self.n if self.n else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the window"""
+        if not self.n:
+            return 0.0
+        return math.sqrt(max(0.0, self.sum_yy / self.n - self.mean**2))
+
+    @property
+    def score_range(self) -> float:
+        return self._max_q[0][1] - self._min_q[0][1] if self.n else 0.0
+
+    def linear_trend(self) -> Tuple[float, float]:
+        """Least-squares slope and its two-sided p-value (as scipy's linregress)"""
+        n = self.n
+        if n < 3:
+            return 0.0, 1.0
+
+        sum_x = n * (n - 1) / 2
+        s_xx = (n - 1) * n * (2 * n - 1) / 6 - sum_x**2 / n
+        s_xy = self.sum_xy - sum_x * self.sum_y / n
+        s_yy = max(0.0, self.sum_yy - self.sum_y**2 / n)
+
+        slope = s_xy / s_xx
+        if s_yy <= 1e-12:
+            return slope, 1.0
+
+        r = max(-1.0, min(1.0, s_xy / math.sqrt(s_xx * s_yy)))
+        if 1 - r * r <= 1e-15:
+            return slope, 0.0
+        t_stat = r * math.sqrt((n - 2) / ((1 - r) * (1 + r)))
+        return slope, float(2 * stats.t.sf(abs(t_stat), n - 2))
+
+
 class RealTimeScoringEngine:
     """
     Real-time scoring engine for continuous wallet quality evaluation.
@@ -55,6 +216,8 @@ class RealTimeScoringEngine:
             "prediction_horizon_hours": 24,  # Hours to predict score trends
             "alert_threshold_change": 0.1,  # 10% score change triggers alert
             "stability_threshold": 0.15,  # Score volatility threshold
+            "ewma_volatility_decay": 0.94,  # RiskMetrics decay for trade volatility
+            "momentum_window": 5,  # Recent scores compared against the rest
         }
 
         # Real-time state
@@ -63,6 +226,16 @@ class RealTimeScoringEngine:
         self.market_regime_state: Dict[str, Any] = {}
         self.pending_updates: Dict[str, List[Dict[str, Any]]] = {}
 
+        # Online accumulators (O(1) per trade and per score read)
+        self.trade_accumulators: Dict[str, _TradeAccumulator] = {}
+        self.score_windows: Dict[str, _ScoreWindow] = {}
+        self._wallets_with_pending: Set[str] = set()
+
+        # Full-update schedule: min-heap of (due_at, wallet); stale entries are
+        # skipped by comparing against _full_update_due
+        self._full_update_heap: List[Tuple[float, str]] = []
+        self._full_update_due: Dict[str, float] = {}
+
         # Prediction models
         self.score_predictors: Dict[str, Any] = {}
         self.trend_models: Dict[str, Any] = {}
@@ -108,9 +281,20 @@ class RealTimeScoringEngine:
                 maxlen=self.scoring_params["trend_analysis_window"]
             )
 
+            self.score_windows[wallet_address] = _ScoreWindow()
+
             # Initialize pending updates buffer
             self.pending_updates[wallet_address] = []
 
+            # Seed trade accumulators from the history (once, O(n))
+            accumulator = _TradeAccumulator()
+            for trade in initial_history or []:
+                accumulator.add_trade(
+                    self._trade_return(trade), self.scoring_params["ewma_volatility_decay"]
+                )
+            accumulator.reset_batch()
+            self.trade_accumulators[wallet_address] = accumulator
+
             # Perform initial scoring if history provided
             if initial_history and len(initial_history) >= 30:
                 await self._perform_full_score_update(wallet_address, initial_history)
@@ -143,6 +327,15 @@ class RealTimeScoringEngine:
             # Add to pending updates
             self.pending_updates[wallet_address].append(trade_data)
             self.active_wallets[wallet_address]["pending_trades"] += 1
+            self._wallets_with_pending.add(wallet_address)
+
+            # Fold the trade into the running statistics
+            self.trade_accumulators.setdefault(
+                wallet_address, _TradeAccumulator()
+            ).add_trade(
+                self._trade_return(trade_data),
+                self.scoring_params["ewma_volatility_decay"],
+            )
 
             # Check if incremental update is needed
             pending_count = len(self.pending_updates[wallet_address])
@@ -207,6 +400,7 @@ class RealTimeScoringEngine:
                 "last_update": wallet_state.get("last_incremental_update")
                 or wallet_state.get("last_full_update"),
                 "trade_count": wallet_state["trade_count"],
+                "trade_metrics": self._get_trade_metrics(wallet_address),
                 "data_freshness": self._calculate_data_freshness(wallet_address),
             }
 
@@ -256,11 +450,14 @@ class RealTimeScoringEngine:
                     "update_type": "full",
                 }
 
-                self.score_streams[wallet_address].append(score_entry)
+                self._append_score(wallet_address, score_entry)
 
                 # Clear pending updates (they're now incorporated)
-                self.pending_updates[wallet_address].clear()
-                wallet_state["pending_trades"] = 0
+                self._clear_pending(wallet_address)
+                self._schedule_full_update(
+                    wallet_address,
+                    time.time() + self.scoring_params["update_interval_seconds"],
+                )
 
             update_time = time.time() - start_time
             self.update_times.append(update_time)
@@ -284,6 +481,7 @@ class RealTimeScoringEngine:
             pending_trades = self.pending_updates[wallet_address]
 
             if not pending_trades:
+                self._wallets_with_pending.discard(wallet_address)
                 return
 
             # Get current score
@@ -295,7 +493,7 @@ class RealTimeScoringEngine:
 
             # Calculate incremental score adjustment
             score_adjustment = await self._calculate_incremental_score_adjustment(
-                wallet_address, pending_trades
+                wallet_address
             )
 
             # Apply adjustment with damping
@@ -319,11 +517,10 @@ class RealTimeScoringEngine:
                 "trades_processed": len(pending_trades),
             }
 
-            self.score_streams[wallet_address].append(score_entry)
+            self._append_score(wallet_address, score_entry)
 
             # Clear pending updates
-            self.pending_updates[wallet_address].clear()
-            wallet_state["pending_trades"] = 0
+            self._clear_pending(wallet_address)
 
             update_time = time.time() - start_time
             self.update_times.append(update_time)
@@ -337,25 +534,19 @@ class RealTimeScoringEngine:
                 f"Error performing incremental update for {wallet_address}: {e}"
             )
 
-    async def _calculate_incremental_score_adjustment(
-        self, wallet_address: str, new_trades: List[Dict[str, Any]]
-    ) -> float:
-        """Calculate score adjustment based on new trades."""
+    async def _calculate_incremental_score_adjustment(self, wallet_address: str) -> float:
+        """Calculate score adjustment based on trades since the last update."""
 
         try:
-            if not new_trades:
+            accumulator = self.trade_accumulators.get(wallet_address)
+            if accumulator is None or not accumulator.batch_trades:
                 return 0.0
 
             # Simple incremental adjustment based on recent trade performance
             # In practice, this would use more sophisticated incremental learning
 
-            # Calculate recent performance metrics
-            recent_returns = [t.get("pnl_pct", 0) for t in new_trades]
-            recent_win_rate = (
-                sum(1 for r in recent_returns if r > 0) / len(recent_returns)
-                if recent_returns
-                else 0
-            )
+            # Win rate of the batch, counted as the trades arrived
+            recent_win_rate = accumulator.batch_wins / accumulator.batch_trades
 
             # Compare to expected performance (simplified)
             expected_win_rate = 0.55  # Baseline expectation
@@ -438,27 +629,25 @@ class RealTimeScoringEngine:
 
         try:
             score_stream = self.score_streams.get(wallet_address, deque())
+            window = self.score_windows.get(wallet_address)
             if len(score_stream) < self.scoring_params["score_stability_window"]:
                 return {"stability_score": 0.5, "trend": "insufficient_data"}
+            if window is None or window.n != len(score_stream):
+                window = self._rebuild_score_window(wallet_address)
 
-            # Extract scores for stability analysis
-            recent_scores = [entry["score"] for entry in list(score_stream)]
-
-            # Calculate stability metrics
-            score_volatility = np.std(recent_scores)
-            score_range = max(recent_scores) - min(recent_scores)
+            # Stability metrics from the running sums
+            sample_count = window.n
+            score_volatility = window.std
+            score_range = window.score_range
 
             # Stability score (lower volatility = higher stability)
             max_reasonable_volatility = 15  # Scores typically vary by 15 points
             stability_score = max(0, 1 - (score_volatility / max_reasonable_volatility))
 
             # Calculate trend
-            if len(recent_scores) >= 5:
+            if sample_count >= 5:
                 # Linear trend
-                x = np.arange(len(recent_scores))
-                slope, intercept, r_value, p_value, std_err = stats.linregress(
-                    x, recent_scores
-                )
+                slope, p_value = window.linear_trend()
 
                 # Classify trend
                 if abs(slope) < 0.01:  # Very flat
@@ -482,12 +671,11 @@ class RealTimeScoringEngine:
                 trend_significant = False
 
             # Calculate momentum (recent trend vs overall)
-            if len(recent_scores) >= 10:
-                recent_half = recent_scores[-5:]  # Last 5 scores
-                earlier_half = recent_scores[:-5]  # Earlier scores
-
-                recent_avg = np.mean(recent_half)
-                earlier_avg = np.mean(earlier_half)
+            recent_count = self.scoring_params["momentum_window"]
+            if sample_count >= 2 * recent_count:
+                recent_sum = sum(score_stream[-i]["score"] for i in range(1, recent_count + 1))
+                recent_avg = recent_sum / recent_count  # Last 5 scores
+                earlier_avg = (window.sum_y - recent_sum) / (sample_count - recent_count)
 
                 momentum = (recent_avg - earlier_avg) / max(abs(earlier_avg), 0.1)
             else:
@@ -501,13 +689,70 @@ class RealTimeScoringEngine:
                 "trend_strength": trend_strength,
                 "trend_significant": trend_significant,
                 "momentum": momentum,
-                "samples_used": len(recent_scores),
+                "samples_used": sample_count,
             }
 
         except Exception as e:
             logger.error(f"Error calculating score stability for {wallet_address}: {e}")
             return {"stability_score": 0.5, "trend": "error", "error": str(e)}
 
+    @staticmethod
+    def _trade_return(trade_data: Dict[str, Any]) -> float:
+        """Trade return used by the accumulators (missing or invalid -> 0)"""
+        try:
+            return float(trade_data.get("pnl_pct", 0) or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _get_trade_metrics(self, wallet_address: str) -> Dict[str, float]:
+        """Running trade metrics for a wallet"""
+        accumulator = self.trade_accumulators.get(wallet_address)
+        return accumulator.to_metrics() if accumulator else {}
+
+    def _append_score(self, wallet_address: str, score_entry: Dict[str, Any]) -> None:
+        """Append to a wallet's score stream, keeping its running sums in step"""
+        stream = self.score_streams[wallet_address]
+        window = self.score_windows.get(wallet_address)
+        if window is None or window.n != len(stream):
+            window = self._rebuild_score_window(wallet_address)
+
+        evicted = stream[0]["score"] if len(stream) == stream.maxlen else None
+        stream.append(score_entry)
+        window.push(score_entry["score"], evicted)
+
+    def _rebuild_score_window(self, wallet_address: str) -> _ScoreWindow:
+        """Recompute a wallet's running sums from its score stream"""
+        window = _ScoreWindow()
+        for entry in self.score_streams.get(wallet_address, ()):
+            window.push(entry["score"])
+        self.score_windows[wallet_address] = window
+        return window
+
+    def _clear_pending(self, wallet_address: str) -> None:
+        """Mark a wallet's pending trades as incorporated into its score"""
+        self.pending_updates[wallet_address].clear()
+        self.active_wallets[wallet_address]["pending_trades"] = 0
+        self._wallets_with_pending.discard(wallet_address)
+        accumulator = self.trade_accumulators.get(wallet_address)
+        if accumulator is not None:
+            accumulator.reset_batch()
+
+    def _schedule_full_update(self, wallet_address: str, due_at: float) -> None:
+        """(Re)schedule a wallet's next full update"""
+        self._full_update_due[wallet_address] = due_at
+        heapq.heappush(self._full_update_heap, (due_at, wallet_address))
+
+    def _pop_due_full_updates(self, now: float) -> List[str]:
+        """Remove and return wallets whose full update is due, in due order"""
+        due_wallets = []
+        while self._full_update_heap and self._full_update_heap[0][0] <= now:
+            due_at, wallet_address = heapq.heappop(self._full_update_heap)
+            if self._full_update_due.get(wallet_address) != due_at:
+                continue  # Superseded by a later schedule
+            del self._full_update_due[wallet_address]
+            due_wallets.append(wallet_address)
+        return due_wallets
+
     async def _predict_score_trend(self, wallet_address: str) -> Dict[str, Any]:
         """Predict future score trends using time series forecasting."""
 
@@ -825,6 +1070,8 @@ class RealTimeScoringEngine:
                 "active_streams": active_streams,
                 "average_update_time": avg_update_time,
                 "total_updates_processed": len(self.update_times),
+                "wallets_with_pending_trades": len(self._wallets_with_pending),
+                "scheduled_full_updates": len(self._full_update_due),
                 "recent_alerts_count": len(recent_alerts),
                 "market_regime": self.market_regime_state.get(
                     "current_regime", "unknown"
@@ -855,6 +1102,17 @@ class RealTimeScoringEngine:
             with open(state_dir / "score_streams.json", "w") as f:
                 json.dump(score_streams_data, f, indent=2, default=str)
 
+            # Save trade accumulators
+            with open(state_dir / "trade_accumulators.json", "w") as f:
+                json.dump(
+                    {
+                        wallet: asdict(accumulator)
+                        for wallet, accumulator in self.trade_accumulators.items()
+                    },
+                    f,
+                    indent=2,
+                )
+
             # Save market regime state
             with open(state_dir / "market_regime.json", "w") as f:
                 json.dump(self.market_regime_state, f, indent=2, default=str)
@@ -886,6 +1144,26 @@ class RealTimeScoringEngine:
                             stream_data,
                             maxlen=self.scoring_params["trend_analysis_window"],
                         )
+                        self._rebuild_score_window(wallet)
+
+            # Load trade accumulators
+            accumulators_file = state_dir / "trade_accumulators.json"
+            if accumulators_file.exists():
+                with open(accumulators_file, "r") as f:
+                    self.trade_accumulators = {
+                        wallet: _TradeAccumulator(**fields)
+                        for wallet, fields in json.load(f).items()
+                    }
+
+            # Rebuild the full-update schedule (parses timestamps once, here)
+            self._full_update_heap = []
+            self._full_update_due = {}
+            interval = self.scoring_params["update_interval_seconds"]
+            for wallet, wallet_state in self.active_wallets.items():
+                last_full_update = wallet_state.get("last_full_update")
+                if last_full_update:
+                    due_at = datetime.fromisoformat(last_full_update).timestamp() + interval
+                    self._schedule_full_update(wallet, due_at)
 
             # Load market regime
             regime_file = state_dir / "market_regime.json"
@@ -907,28 +1185,19 @@ class RealTimeScoringEngine:
 
         while True:
             try:
-                # Process any pending updates
-                for wallet_address in list(self.active_wallets.keys()):
-                    pending_count = len(self.pending_updates.get(wallet_address, []))
-                    if pending_count > 0:
-                        await self._perform_incremental_update(wallet_address)
-
-                # Check for wallets needing full updates
-                current_time = datetime.now()
-                for wallet_address, wallet_state in self.active_wallets.items():
-                    last_full_update = wallet_state.get("last_full_update")
-                    if last_full_update:
-                        last_update_time = datetime.fromisoformat(last_full_update)
-                        time_since_update = (
-                            current_time - last_update_time
-                        ).total_seconds()
-
-                        if (
-                            time_since_update
-                            >= self.scoring_params["update_interval_seconds"]
-                        ):
-                            # Trigger full update (would need trade history)
-                            logger.debug(f"Due for full update: {wallet_address}")
+                # Process pending updates (only wallets that received trades)
+                for wallet_address in list(self._wallets_with_pending):
+                    await self._perform_incremental_update(wallet_address)
+
+                # Pop wallets needing full updates off the schedule heap
+                current_time = time.time()
+                for wallet_address in self._pop_due_full_updates(current_time):
+                    # Trigger full update (would need trade history)
+                    logger.debug(f"Due for full update: {wallet_address}")
+                    self._schedule_full_update(
+                        wallet_address,
+                        current_time + self.scoring_params["update_interval_seconds"],
+                    )
 
                 await asyncio.sleep(update_interval_seconds)
 
@@ -20,7 +20,6 @@ Version: 3.0 (Production-Ready with Blockchain Verification)
 
 import asyncio
 import time
-from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import ROUND_HALF_UP, Decimal, getcontext
@@ -30,6 +29,7 @@ from typing import Any, Dict, List, Optional, Set
 from loguru import logger
 
 from config.scanner_config import ScannerConfig
+from core.trade_cluster_index import TradeClusterIndex, get_trade_cluster_index
 from scanners.blockchain_api import BlockchainAPI
 from utils.helpers import BoundedCache
 from utils.logger import get_logger
@@ -207,6 +207,7 @@ class RedFlagDetector:
         confidence_threshold: Minimum confidence to auto-exclude (0.85)
         cache_ttl_seconds: Time-to-live for cached flags
         max_cache_size: Maximum number of cached wallets
+        cluster_index: Cross-wallet trade index (default: the shared one)
     """
 
     # Market maker detection thresholds (NON-NEGOTIABLE)
@@ -257,6 +258,7 @@ class RedFlagDetector:
         confidence_threshold: float = 0.85,
         cache_ttl_seconds: int = 86400,  # 24 hours
         max_cache_size: int = 1000,
+        cluster_index: Optional[TradeClusterIndex] = None,
     ) -> None:
         """
         Initialize red flag detector.
@@ -268,6 +270,8 @@ class RedFlagDetector:
             confidence_threshold: Minimum confidence to auto-exclude
             cache_ttl_seconds: TTL for cached flags
             max_cache_size: Maximum number of cached wallets
+            cluster_index: Cross-wallet trade index fed by every scan and by
+                the wallet monitor (default: the process-wide index)
         """
         self.config = config
         self.blockchain_api = blockchain_api
@@ -295,14 +299,8 @@ class RedFlagDetector:
             component_name="red_flag_detector.blockchain_cache",
         )
 
-        # Cluster analysis cache (for insider trading detection)
-        self._cluster_cache: BoundedCache = BoundedCache(
-            max_size=1000,
-            ttl_seconds=86400,  # 24 hours
-            memory_threshold_mb=50.0,
-            cleanup_interval_seconds=1800,
-            component_name="red_flag_detector.cluster_cache",
-        )
+        # Recent trades across all wallets (for insider cluster detection)
+        self.cluster_index = cluster_index or get_trade_cluster_index()
 
         # Manual exclusions (operator overrides)
         self._manual_exclusions: Set[str] = set()
@@ -793,94 +791,66 @@ class RedFlagDetector:
         Detect potential insider trading via cluster analysis.
 
         Cluster trading indicators:
-        1. 5+ top wallets taking same position within 1 hour
+        1. 5+ distinct wallets taking same position within 1 hour
         2. Same condition ID
         3. Same position side (all BUY or all SELL)
-        4. Volume anomaly (5x normal volume)
+
+        The wallet's trades are added to the shared cross-wallet index, which
+        also holds trades from other scanned and monitored wallets; clusters
+        are detected there once per event and only looked up here.
 
         Args:
             wallet_address: Wallet to analyze
             wallet_data: Wallet metrics and history
 
         Returns:
-            List of cluster-based red flags (0 or 1)
+            List of cluster-based red flags (one per cluster)
         """
         cluster_flags = []
 
         try:
-            trades = wallet_data.get("trades", [])
-            if len(trades) < 5:
-                return []
+            self.cluster_index.add_trades(
+                wallet_data.get("trades", []), wallet_address=wallet_address
+            )
+            self._cluster_analyses += 1
 
-            # Analyze recent trades (last 24 hours)
-            recent_time = time.time() - (86400)  # 24 hours ago
-            recent_trades = [t for t in trades if t.get("timestamp", 0) > recent_time]
+            for cluster in self.cluster_index.clusters_for_wallet(wallet_address):
+                condition_id, side = cluster.condition_id, cluster.side
+                cluster_duration = cluster.duration_seconds
+                avg_amount = cluster.avg_amount
 
-            if len(recent_trades) < 3:
-                return []
+                logger.warning(
+                    f"🚨 CLUSTER TRADING: {wallet_address[-6:]} "
+                    f"(condition={condition_id[-8:]}, "
+                    f"side={side}, "
+                    f"cluster_size={cluster.wallet_count}, "
+                    f"duration={cluster_duration:.0f}s, "
+                    f"avg_amount=${avg_amount:.2f}) - "
+                    f"INSIDER TRADING RISK"
+                )
 
-            # Check for clustering
-            trade_groups = defaultdict(list)
-            for trade in recent_trades:
-                key = (trade.get("condition_id"), trade.get("side"))
-                trade_groups[key].append(trade)
-
-            # Find clusters
-            for key, group in trade_groups.items():
-                if len(group) >= self.CLUSTER_WALLET_COUNT_THRESHOLD:
-                    condition_id, side = key
-
-                    # Check time window
-                    timestamps = [t.get("timestamp", 0) for t in group]
-                    cluster_duration = (
-                        max(timestamps) - min(timestamps) if len(timestamps) > 1 else 0
+                cluster_flags.append(
+                    RedFlag(
+                        flag_type=RedFlagType.INSIDER_TRADING,
+                        severity=RedFlagSeverity.CRITICAL,
+                        description=f"Part of suspicious trading cluster - {cluster.wallet_count} wallets trading {side} {condition_id[-8:]} within {cluster_duration:.0f}s",
+                        wallet_address=wallet_address,
+                        detection_time=cluster.detected_at,
+                        confidence=0.75,
+                        evidence={
+                            "cluster_id": cluster.cluster_id,
+                            "cluster_size": cluster.wallet_count,
+                            "cluster_wallets": sorted(cluster.wallets),
+                            "cluster_duration_seconds": cluster_duration,
+                            "condition_id": condition_id,
+                            "position_side": side,
+                            "avg_cluster_amount": avg_amount,
+                        },
+                        blockchain_verified=False,
+                        recommended_action="Exclude - potential coordinated insider trading",
+                        expiry_time=cluster.end + (86400 * 3),  # 3 days
                     )
-
-                    if cluster_duration <= self.CLUSTER_TIME_WINDOW_SECONDS:
-                        # Check volume anomaly
-                        group_amounts = [t.get("amount", 0.0) for t in group]
-                        avg_amount = (
-                            sum(group_amounts) / len(group_amounts)
-                            if group_amounts
-                            else 0.0
-                        )
-
-                        # Check if wallet is part of cluster
-                        wallet_in_cluster = any(
-                            t.get("wallet_address") == wallet_address for t in group
-                        )
-
-                        if wallet_in_cluster:
-                            logger.warning(
-                                f"🚨 CLUSTER TRADING: {wallet_address[-6:]} "
-                                f"(condition={condition_id[-8:]}, "
-                                f"side={side}, "
-                                f"cluster_size={len(group)}, "
-                                f"duration={cluster_duration:.0f}s, "
-                                f"avg_amount=${avg_amount:.2f}) - "
-                                f"INSIDER TRADING RISK"
-                            )
-
-                            cluster_flags.append(
-                                RedFlag(
-                                    flag_type=RedFlagType.INSIDER_TRADING,
-                                    severity=RedFlagSeverity.CRITICAL,
-                                    description=f"Part of suspicious trading cluster - {len(group)} wallets trading {side} {condition_id[-8:]} within {cluster_duration:.0f}s",
-                                    wallet_address=wallet_address,
-                                    detection_time=time.time(),
-                                    confidence=0.75,
-                                    evidence={
-                                        "cluster_size": len(group),
-                                        "cluster_duration_seconds": cluster_duration,
-                                        "condition_id": condition_id,
-                                        "position_side": side,
-                                        "avg_cluster_amount": avg_amount,
-                                    },
-                                    blockchain_verified=False,
-                                    recommended_action="Exclude - potential coordinated insider trading",
-                                    expiry_time=time.time() + (86400 * 3),  # 3 days
-                                )
-                            )
+                )
 
             return cluster_flags
 
@@ -1580,7 +1550,7 @@ class RedFlagDetector:
                 "cache_stats": {
                     "flag_cache": cache_stats,
                     "blockchain_cache": self._blockchain_cache.get_stats(),
-                    "cluster_cache": self._cluster_cache.get_stats(),
+                    "cluster_index": self.cluster_index.get_stats(),
                 },
                 "audit_trail_entries": len(self._audit_trail),
             }
@@ -1598,7 +1568,7 @@ class RedFlagDetector:
         try:
             self._flag_cache.cleanup()
             self._blockchain_cache.cleanup()
-            self._cluster_cache.cleanup()
+            self.cluster_index.evict_expired()
 
             # Clean up old audit trail entries (older than 30 days)
             cutoff_time = time.time() - (86400 * 30)
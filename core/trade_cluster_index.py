@@ -0,0 +1,374 @@
+"""
+Cross-Wallet Trade Cluster Index
+================================
+
+Keeps every recently seen trade from every scanned or monitored wallet in one
+time-bucketed index keyed by ``(condition_id, side)``, so coordinated
+"cluster" trading (several distinct wallets taking the same position within a
+short window) can be spotted across wallets instead of within one wallet's
+own history.
+
+Trades are placed into fixed-width time buckets. Buckets older than the
+retention period are dropped as newer trades arrive. Adding a trade only
+looks at the buckets within one cluster window of it, for its own
+``(condition_id, side)`` key, so the cost is bounded by the size of those
+buckets rather than by the number of wallets.
+
+A cluster is detected once, when the trade that completes it arrives. Later
+trades that fall into the same burst extend it. Each wallet's clusters are
+then a dictionary lookup, however often the wallet is rescanned.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from utils.helpers import normalize_address
+
+logger = logging.getLogger(__name__)
+
+# Cluster index constants
+DEFAULT_WINDOW_SECONDS = 3600  # Trades this close together can form a cluster
+DEFAULT_MIN_WALLETS = 5  # Distinct wallets needed for a cluster
+DEFAULT_RETENTION_SECONDS = 86400  # Trades and clusters kept for a day
+BUCKETS_PER_WINDOW = 12  # 5-minute buckets for a 1-hour window
+
+ClusterKey = Tuple[str, str]
+_Entry = Tuple[float, str, float]  # (timestamp, wallet, amount)
+
+
+@dataclass
+class TradeCluster:
+    """Distinct wallets taking the same side of a market within a short window"""
+
+    condition_id: str
+    side: str
+    wallets: Set[str]
+    start: float
+    end: float
+    trade_count: int
+    total_amount: float
+    detected_at: float = field(default_factory=time.time)
+
+    @property
+    def cluster_id(self) -> str:
+        return f"{self.condition_id}:{self.side}:{int(self.start)}"
+
+    @property
+    def wallet_count(self) -> int:
+        return len(self.wallets)
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.end - self.start
+
+    @property
+    def avg_amount(self) -> float:
+        return self.total_amount / self.trade_count if self.trade_count else 0.0
+
+
+def _epoch(timestamp: Any) -> float:
+    """Unix time of a float or datetime timestamp"""
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
+class TradeClusterIndex:
+    """
+    Sliding-window index of recent trades across all wallets.
+
+    Example:
+        index = get_trade_cluster_index()
+        cluster = index.add_trade(wallet, condition_id, "BUY", timestamp, 250.0)
+        flags = index.clusters_for_wallet(wallet)
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        min_wallets: int = DEFAULT_MIN_WALLETS,
+        retention_seconds: float = DEFAULT_RETENTION_SECONDS,
+        bucket_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            window_seconds: Maximum span of a cluster's qualifying trades
+            min_wallets: Distinct wallets needed to report a cluster
+            retention_seconds: How long trades and clusters are kept,
+                measured back from the newest trade seen
+            bucket_seconds: Bucket width (default: window / 12)
+        """
+        self.window_seconds = float(window_seconds)
+        self.min_wallets = max(2, min_wallets)
+        self.retention_seconds = max(float(retention_seconds), self.window_seconds)
+        self.bucket_seconds = float(bucket_seconds or self.window_seconds / BUCKETS_PER_WINDOW)
+
+        # bucket -> key -> trades, plus the ids already stored in each bucket
+        self._buckets: Dict[int, Dict[ClusterKey, List[_Entry]]] = {}
+        self._bucket_ids: Dict[int, Set[Hashable]] = {}
+        self._oldest_bucket: Optional[int] = None
+        self._newest_timestamp = 0.0
+
+        self._clusters: Dict[ClusterKey, List[TradeCluster]] = defaultdict(list)
+        self._wallet_clusters: Dict[str, List[TradeCluster]] = defaultdict(list)
+
+        self.stats = {
+            "trades_indexed": 0,
+            "duplicate_trades": 0,
+            "expired_trades": 0,
+            "clusters_detected": 0,
+            "buckets_evicted": 0,
+        }
+
+    def _bucket(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds)
+
+    def add_trade(
+        self,
+        wallet_address: str,
+        condition_id: str,
+        side: str,
+        timestamp: Any,
+        amount: float = 0.0,
+        trade_id: Optional[Hashable] = None,
+    ) -> Optional[TradeCluster]:
+        """
+        Index one trade and check whether it completes or grows a cluster.
+
+        Args:
+            wallet_address: Wallet that traded
+            condition_id: Market the trade was in
+            side: Position side (BUY or SELL)
+            timestamp: Trade time (Unix seconds or datetime)
+            amount: Trade amount in USD
+            trade_id: Unique id (e.g. tx hash) so rescanned trades are not
+                counted twice; defaults to wallet, market, side and time
+
+        Returns:
+            The cluster when this trade formed it or added a new wallet to
+            it, otherwise None
+        """
+        timestamp = _epoch(timestamp)
+        wallet = normalize_address(wallet_address)
+        key = (str(condition_id), str(side).upper())
+        if trade_id is None:
+            trade_id = (wallet, key, timestamp)
+
+        if timestamp > self._newest_timestamp:
+            self._newest_timestamp = timestamp
+            self._evict(timestamp - self.retention_seconds)
+        if timestamp < self._newest_timestamp - self.retention_seconds:
+            self.stats["expired_trades"] += 1
+            return None
+
+        bucket = self._bucket(timestamp)
+        ids = self._bucket_ids.setdefault(bucket, set())
+        if trade_id in ids:
+            self.stats["duplicate_trades"] += 1
+            return None
+        ids.add(trade_id)
+        self._buckets.setdefault(bucket, {}).setdefault(key, []).append(
+            (timestamp, wallet, float(amount or 0.0))
+        )
+        if self._oldest_bucket is None or bucket < self._oldest_bucket:
+            self._oldest_bucket = bucket
+        self.stats["trades_indexed"] += 1
+
+        return self._detect(key, timestamp)
+
+    def add_trades(
+        self, trades: Iterable[Dict[str, Any]], wallet_address: Optional[str] = None
+    ) -> List[TradeCluster]:
+        """
+        Index trade records, skipping ones without a market, side or time.
+
+        Args:
+            trades: Trade dicts with ``condition_id``, ``side``, ``timestamp``
+                and optionally ``amount``, ``wallet_address`` and ``tx_hash``
+            wallet_address: Wallet to use for trades that do not name one
+
+        Returns:
+            Clusters formed or grown by these trades
+        """
+        changed: List[TradeCluster] = []
+        for trade in trades:
+            wallet = trade.get("wallet_address") or wallet_address
+            condition_id = trade.get("condition_id")
+            side = trade.get("side")
+            timestamp = trade.get("timestamp")
+            if not wallet or not condition_id or not side or not timestamp:
+                continue
+            try:
+                cluster = self.add_trade(
+                    wallet,
+                    condition_id,
+                    side,
+                    timestamp,
+                    float(trade.get("amount") or 0.0),
+                    trade.get("tx_hash") or trade.get("id"),
+                )
+            except (TypeError, ValueError):
+                continue
+            if cluster is not None and cluster not in changed:
+                changed.append(cluster)
+        return changed
+
+    def _detect(self, key: ClusterKey, timestamp: float) -> Optional[TradeCluster]:
+        """Find the busiest window around ``timestamp`` and record it as a cluster"""
+        window = self.window_seconds
+        entries: List[_Entry] = []
+        for by_key in self._buckets_between(timestamp - window, timestamp + window):
+            entries.extend(e for e in by_key.get(key, ()) if abs(e[0] - timestamp) <= window)
+        if len(entries) < self.min_wallets:
+            return None
+        entries.sort()
+
+        # Two pointers over windows of width <= window that contain timestamp
+        counts: Dict[str, int] = defaultdict(int)
+        best: Optional[Tuple[int, int]] = None
+        best_wallets = 0
+        left = 0
+        for right, (ts, wallet, _) in enumerate(entries):
+            counts[wallet] += 1
+            while ts - entries[left][0] > window:
+                left_wallet = entries[left][1]
+                counts[left_wallet] -= 1
+                if not counts[left_wallet]:
+                    del counts[left_wallet]
+                left += 1
+            if entries[left][0] <= timestamp <= ts and len(counts) > best_wallets:
+                best, best_wallets = (left, right), len(counts)
+        if best is None or best_wallets < self.min_wallets:
+            return None
+
+        members = entries[best[0] : best[1] + 1]
+        return self._merge(key, members)
+
+    def _buckets_between(
+        self, start: float, end: float
+    ) -> Iterable[Dict[ClusterKey, List[_Entry]]]:
+        for bucket in range(self._bucket(start), self._bucket(end) + 1):
+            by_key = self._buckets.get(bucket)
+            if by_key:
+                yield by_key
+
+    def _refresh_totals(self, key: ClusterKey, cluster: TradeCluster) -> None:
+        """Recount the trades and volume inside a cluster's span"""
+        entries = [
+            e
+            for by_key in self._buckets_between(cluster.start, cluster.end)
+            for e in by_key.get(key, ())
+            if cluster.start <= e[0] <= cluster.end
+        ]
+        cluster.trade_count = len(entries)
+        cluster.total_amount = sum(amount for _, _, amount in entries)
+
+    def _merge(self, key: ClusterKey, members: List[_Entry]) -> Optional[TradeCluster]:
+        """Fold a qualifying window into an overlapping cluster, or start one"""
+        start, end = members[0][0], members[-1][0]
+        wallets = {wallet for _, wallet, _ in members}
+
+        for cluster in self._clusters.get(key, ()):
+            if cluster.start <= end and start <= cluster.end:
+                new_wallets = wallets - cluster.wallets
+                cluster.start = min(cluster.start, start)
+                cluster.end = max(cluster.end, end)
+                cluster.wallets |= new_wallets
+                for wallet in new_wallets:
+                    self._wallet_clusters[wallet].append(cluster)
+                self._refresh_totals(key, cluster)
+                return cluster if new_wallets else None
+
+        cluster = TradeCluster(
+            condition_id=key[0],
+            side=key[1],
+            wallets=wallets,
+            start=start,
+            end=end,
+            trade_count=len(members),
+            total_amount=sum(amount for _, _, amount in members),
+        )
+        self._clusters[key].append(cluster)
+        for wallet in wallets:
+            self._wallet_clusters[wallet].append(cluster)
+        self.stats["clusters_detected"] += 1
+        logger.info(
+            f"Trade cluster detected: {cluster.wallet_count} wallets "
+            f"{key[1]} {key[0][-8:]} within {cluster.duration_seconds:.0f}s"
+        )
+        return cluster
+
+    def clusters_for_wallet(self, wallet_address: str) -> List[TradeCluster]:
+        """Clusters the wallet took part in during the retention period"""
+        return list(self._wallet_clusters.get(normalize_address(wallet_address), ()))
+
+    def evict_expired(self, now: Optional[float] = None) -> int:
+        """Drop trades and clusters older than the retention period before ``now``"""
+        now = time.time() if now is None else now
+        return self._evict(now - self.retention_seconds)
+
+    def _evict(self, cutoff: float) -> int:
+        """Drop buckets that end before ``cutoff`` and clusters that ended before it"""
+        if self._oldest_bucket is None:
+            return 0
+        cutoff_bucket = self._bucket(cutoff)
+        if cutoff_bucket <= self._oldest_bucket:
+            return 0
+
+        if cutoff_bucket - self._oldest_bucket > len(self._buckets):
+            expired = [b for b in self._buckets if b < cutoff_bucket]
+        else:
+            expired = [b for b in range(self._oldest_bucket, cutoff_bucket) if b in self._buckets]
+        for bucket in expired:
+            del self._buckets[bucket]
+            self._bucket_ids.pop(bucket, None)
+        self._oldest_bucket = min(self._buckets) if self._buckets else None
+        self.stats["buckets_evicted"] += len(expired)
+
+        for key, clusters in list(self._clusters.items()):
+            expired_clusters = [c for c in clusters if c.end < cutoff]
+            if not expired_clusters:
+                continue
+            for cluster in expired_clusters:
+                for wallet in cluster.wallets:
+                    remaining = [c for c in self._wallet_clusters[wallet] if c is not cluster]
+                    if remaining:
+                        self._wallet_clusters[wallet] = remaining
+                    else:
+                        del self._wallet_clusters[wallet]
+            live = [c for c in clusters if c.end >= cutoff]
+            if live:
+                self._clusters[key] = live
+            else:
+                del self._clusters[key]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return sum(len(e) for by_key in self._buckets.values() for e in by_key.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index counters and sizes"""
+        return {
+            **self.stats,
+            "buckets": len(self._buckets),
+            "active_clusters": sum(len(c) for c in self._clusters.values()),
+            "wallets_in_clusters": len(self._wallet_clusters),
+        }
+
+
+# Process-wide index shared by the red flag detector and the wallet monitor
+_trade_cluster_index: Optional[TradeClusterIndex] = None
+
+
+def get_trade_cluster_index() -> TradeClusterIndex:
+    """Get the process-wide trade cluster index"""
+    global _trade_cluster_index
+    if _trade_cluster_index is None:
+        _trade_cluster_index = TradeClusterIndex()
+    return _trade_cluster_index
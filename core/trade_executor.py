@@ -227,6 +227,43 @@ class TradeExecutor:
                 ),
             )
 
+    async def screen_trade(
+        self, original_trade: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run the circuit breaker and risk checks without placing an order.
+
+        Lets a pipeline drop trades that would be refused before they take
+        an execution slot. execute_copy_trade repeats these checks, since
+        state can change while a trade waits to execute.
+
+        Returns:
+            The skip/rejection result execute_copy_trade would return, or
+            None if the trade may proceed
+        """
+        try:
+            trade_id = self._generate_trade_id(original_trade)
+            circuit_breaker_result = await self._check_circuit_breaker_for_trade(
+                trade_id
+            )
+            if circuit_breaker_result:
+                return circuit_breaker_result
+            return await self._validate_and_apply_risk_management(
+                original_trade, trade_id
+            )
+        except (ValidationError, ValueError, TypeError, KeyError) as e:
+            return await exception_handler.handle_exception(
+                e,
+                context={"original_trade": original_trade},
+                component="TradeExecutor",
+                operation="screen_trade",
+                default_return={
+                    "status": "invalid",
+                    "reason": f"Validation error: {str(e)[:100]}",
+                    "trade_id": "unknown",
+                },
+            )
+
     def _generate_trade_id(self, original_trade: Dict[str, Any]) -> str:
         """Generate a unique trade ID"""
         return f"{original_trade['tx_hash']}_{original_trade['wallet_address'][-6:]}"
@@ -492,7 +529,8 @@ class TradeExecutor:
             f"Amount: {copy_amount:.4f} shares\n"
             f"Price: ${original_trade['price']:.4f}\n"
             f"Order ID: `{result['orderID']}`\n"
-            f"Execution: {execution_time:.2f}s"
+            f"Execution: {execution_time:.2f}s",
+            alert_type="trade",
         )
 
     async def _handle_trade_execution_error(
@@ -886,31 +924,17 @@ class TradeExecutor:
 
     async def _get_current_prices_for_positions(self) -> Dict[str, float]:
         """Get current market prices for all open positions"""
-        unique_condition_ids = set(
-            position["original_trade"]["condition_id"]
-            for position in self.open_positions._cache.keys()
-        )
+        unique_condition_ids = set()
+        for position_key in list(self.open_positions._cache.keys()):
+            position = self.open_positions.get(position_key)
+            if position:
+                unique_condition_ids.add(position["original_trade"]["condition_id"])
 
-        # Get prices for all unique conditions concurrently
-        price_tasks = [
-            self.clob_client.get_current_price(condition_id)
-            for condition_id in unique_condition_ids
-        ]
-        price_results = await asyncio.gather(*price_tasks, return_exceptions=True)
+        # One batched price request covers every open market
+        price_map = await self.clob_client.get_current_prices(unique_condition_ids)
 
-        # Create price lookup map
-        price_map = {
-            condition_id: price_result
-            for condition_id, price_result in zip(unique_condition_ids, price_results)
-            if isinstance(price_result, float)
-        }
-
-        # Log warnings for failed price fetches
-        for condition_id, price_result in zip(unique_condition_ids, price_results):
-            if not isinstance(price_result, float):
-                logger.warning(
-                    f"Failed to get price for condition {condition_id}: {price_result}"
-                )
+        for condition_id in unique_condition_ids - price_map.keys():
+            logger.warning(f"Failed to get price for condition {condition_id}")
 
         return price_map
 
@@ -0,0 +1,315 @@
+"""
+Copy Trade Pipeline
+===================
+
+Streams detected trades from wallet fetches to execution through bounded
+asyncio queues:
+
+    wallet fetches -> detection -> risk gate -> execution
+
+- Fetch: ``WalletMonitor.iter_wallet_transactions`` yields each wallet's
+  transactions as soon as its fetch returns.
+- Detection: workers run ``BatchTransactionProcessor`` on one wallet's batch
+  and enqueue every trade it finds.
+- Risk gate: ``TradeExecutor.screen_trade`` drops trades the circuit breaker
+  or risk rules would refuse, so they never occupy an execution slot.
+- Execution: a fixed pool of workers calls ``execute_copy_trade``.
+
+A copied trade therefore waits for one wallet fetch, not for the whole
+monitoring cycle. Every queue is bounded: when execution falls behind, the
+gate and detection block on ``put``, the fetch stage blocks in turn, and no
+new wallet fetch starts until there is room.
+
+A cycle ends once every fetched batch has been through detection, at which
+point block cursors are advanced. Trades still queued for execution carry
+over and keep executing while the next cycle fetches; ``stop`` drains them
+before cancelling the workers, since their blocks are already behind the
+cursors and would not be fetched again.
+"""
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from core.wallet_monitor import BatchTransactionProcessor
+from utils.exception_handler import exception_handler
+
+if TYPE_CHECKING:
+    from core.trade_executor import TradeExecutor
+    from core.wallet_monitor import WalletMonitor
+
+logger = logging.getLogger(__name__)
+
+# Pipeline constants
+DEFAULT_QUEUE_SIZE = 100  # Items buffered between two stages
+DEFAULT_DETECTION_WORKERS = 2  # Wallet batches parsed concurrently
+DEFAULT_EXECUTION_WORKERS = 10  # Copy trades in flight
+DEFAULT_DRAIN_TIMEOUT = 60.0  # Seconds stop() waits for queued trades
+
+# Called with (trade, result) once a trade has been gated out or executed.
+# result is execute_copy_trade's / screen_trade's dict, or the exception raised.
+TradeResultCallback = Callable[[Dict[str, Any], Any], Awaitable[None]]
+
+# Queue items carry the time the wallet's transactions arrived
+_TransactionItem = Tuple[str, List[Dict[str, Any]], float]
+_TradeItem = Tuple[Dict[str, Any], float]
+
+
+class CopyTradePipeline:
+    """
+    Bounded-queue pipeline from wallet monitoring to copy trade execution.
+
+    Example:
+        pipeline = CopyTradePipeline(wallet_monitor, trade_executor)
+        pipeline.start()
+        while running:
+            await pipeline.run_cycle()
+            await asyncio.sleep(interval)
+        await pipeline.stop()
+    """
+
+    def __init__(
+        self,
+        wallet_monitor: "WalletMonitor",
+        trade_executor: "TradeExecutor",
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        detection_workers: int = DEFAULT_DETECTION_WORKERS,
+        execution_workers: int = DEFAULT_EXECUTION_WORKERS,
+        on_trade_result: Optional[TradeResultCallback] = None,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            wallet_monitor: Source of wallet transactions
+            trade_executor: Risk gate and order execution
+            queue_size: Capacity of each inter-stage queue
+            detection_workers: Concurrent trade detection workers
+            execution_workers: Concurrent execute_copy_trade calls
+            on_trade_result: Optional coroutine called for every gated or
+                executed trade
+        """
+        self.wallet_monitor = wallet_monitor
+        self.trade_executor = trade_executor
+        self.queue_size = max(1, queue_size)
+        self.detection_workers = max(1, detection_workers)
+        self.execution_workers = max(1, execution_workers)
+        self.on_trade_result = on_trade_result
+
+        self.batch_processor = BatchTransactionProcessor(wallet_monitor)
+        self.transaction_queue: "asyncio.Queue[_TransactionItem]" = asyncio.Queue(
+            self.queue_size
+        )
+        self.trade_queue: "asyncio.Queue[_TradeItem]" = asyncio.Queue(self.queue_size)
+        self.execution_queue: "asyncio.Queue[_TradeItem]" = asyncio.Queue(
+            self.queue_size
+        )
+        self._workers: List[asyncio.Task] = []
+
+        self.stats: Dict[str, Any] = {
+            "cycles_completed": 0,
+            "wallet_batches": 0,
+            "trades_detected": 0,
+            "trades_rejected": 0,
+            "trades_executed": 0,
+            "trades_successful": 0,
+            "execution_errors": 0,
+            "last_copy_latency": 0.0,
+            "avg_copy_latency": 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """Whether the stage workers have been started"""
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Start detection, risk gate and execution workers"""
+        if self._workers:
+            return
+        self._workers = [
+            *(
+                asyncio.create_task(self._detection_worker(), name=f"detect-{i}")
+                for i in range(self.detection_workers)
+            ),
+            asyncio.create_task(self._risk_gate(), name="risk-gate"),
+            *(
+                asyncio.create_task(self._execution_worker(), name=f"execute-{i}")
+                for i in range(self.execution_workers)
+            ),
+        ]
+        logger.info(
+            f"🚰 Started copy trade pipeline ({self.detection_workers} detection, "
+            f"{self.execution_workers} execution workers, queue size {self.queue_size})"
+        )
+
+    async def stop(self, drain_timeout: Optional[float] = DEFAULT_DRAIN_TIMEOUT) -> None:
+        """
+        Finish queued work, then cancel all stage workers.
+
+        Args:
+            drain_timeout: Seconds to wait for queued batches and trades to be
+                handled (None waits indefinitely); whatever is still queued
+                afterwards is dropped and logged
+        """
+        workers, self._workers = self._workers, []
+        if workers:
+            try:
+                await asyncio.wait_for(self.drain(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                pass
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        dropped = self.trade_queue.qsize() + self.execution_queue.qsize()
+        if dropped:
+            logger.error(
+                f"❌ Copy trade pipeline stopped after {drain_timeout}s with "
+                f"{dropped} trades still queued; they were not executed"
+            )
+
+    async def drain(self) -> None:
+        """Wait until every queued batch and trade has been handled"""
+        await self.transaction_queue.join()
+        await self.trade_queue.join()
+        await self.execution_queue.join()
+
+    async def run_cycle(self) -> Dict[str, Any]:
+        """
+        Fetch every target wallet once and feed the results into the pipeline.
+
+        Returns when all fetched transactions have been through detection;
+        execution of the detected trades may still be in progress.
+
+        Returns:
+            Cycle summary with wallet count, trades detected and timings
+        """
+        if not self._workers:
+            self.start()
+
+        cycle = await self.wallet_monitor.plan_monitoring_cycle()
+        if cycle is None:
+            return {"wallets": 0, "trades_detected": 0, "cycle_time": 0.0}
+        current_block, wallets, block_ranges = cycle
+
+        cycle_start = time.time()
+        detected_before = self.stats["trades_detected"]
+        latencies: List[float] = []
+        async for wallet, transactions, latency in (
+            self.wallet_monitor.iter_wallet_transactions(
+                wallets, block_ranges, current_block
+            )
+        ):
+            latencies.append(latency)
+            if transactions:
+                await self.transaction_queue.put((wallet, transactions, time.time()))
+        fetch_time = time.time() - cycle_start
+
+        await self.transaction_queue.join()
+        cycle_time = time.time() - cycle_start
+        await self.wallet_monitor.complete_monitoring_cycle(
+            wallets, current_block, latencies, fetch_time, cycle_time
+        )
+
+        self.stats["cycles_completed"] += 1
+        return {
+            "wallets": len(wallets),
+            "trades_detected": self.stats["trades_detected"] - detected_before,
+            "fetch_time": fetch_time,
+            "cycle_time": cycle_time,
+        }
+
+    async def _detection_worker(self) -> None:
+        """Parse wallet batches into trades"""
+        while True:
+            wallet, transactions, received_at = await self.transaction_queue.get()
+            try:
+                trades = await self.batch_processor.process_transaction_batch(
+                    transactions, wallet
+                )
+                self.stats["wallet_batches"] += 1
+                if trades:
+                    logger.info(
+                        f"Detected {len(trades)} trades for {wallet}",
+                        extra={"wallet": wallet, "trade_count": len(trades)},
+                    )
+                for trade in trades:
+                    self.stats["trades_detected"] += 1
+                    await self.trade_queue.put((trade, received_at))
+            except Exception as e:
+                exception_handler.log_exception(
+                    e,
+                    context={"wallet": wallet, "transaction_count": len(transactions)},
+                    component="CopyTradePipeline",
+                    operation="detect_trades",
+                )
+            finally:
+                self.transaction_queue.task_done()
+
+    async def _risk_gate(self) -> None:
+        """Forward trades that pass the circuit breaker and risk checks"""
+        while True:
+            trade, received_at = await self.trade_queue.get()
+            try:
+                rejection = await self.trade_executor.screen_trade(trade)
+                if rejection:
+                    self.stats["trades_rejected"] += 1
+                    await self._report(trade, rejection)
+                else:
+                    await self.execution_queue.put((trade, received_at))
+            except Exception as e:
+                exception_handler.log_exception(
+                    e,
+                    context={"trade": trade},
+                    component="CopyTradePipeline",
+                    operation="risk_gate",
+                )
+            finally:
+                self.trade_queue.task_done()
+
+    async def _execution_worker(self) -> None:
+        """Execute gated trades"""
+        while True:
+            trade, received_at = await self.execution_queue.get()
+            try:
+                try:
+                    result: Any = await self.trade_executor.execute_copy_trade(trade)
+                except Exception as e:
+                    self.stats["execution_errors"] += 1
+                    logger.error(f"Trade {trade.get('tx_hash', 'unknown')} failed: {str(e)[:100]}")
+                    result = e
+                self._record_execution(result, time.time() - received_at)
+                await self._report(trade, result)
+            finally:
+                self.execution_queue.task_done()
+
+    def _record_execution(self, result: Any, copy_latency: float) -> None:
+        """Update execution counters and copy latency"""
+        self.stats["trades_executed"] += 1
+        if isinstance(result, dict) and result.get("status") == "success":
+            self.stats["trades_successful"] += 1
+
+        executed = self.stats["trades_executed"]
+        self.stats["last_copy_latency"] = copy_latency
+        self.stats["avg_copy_latency"] += (
+            copy_latency - self.stats["avg_copy_latency"]
+        ) / executed
+
+    async def _report(self, trade: Dict[str, Any], result: Any) -> None:
+        """Hand a trade outcome to the result callback"""
+        if self.on_trade_result is None:
+            return
+        try:
+            await self.on_trade_result(trade, result)
+        except Exception as e:
+            logger.warning(f"⚠️ Trade result callback failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pipeline counters and current queue depths"""
+        return {
+            **self.stats,
+            "transaction_queue_depth": self.transaction_queue.qsize(),
+            "trade_queue_depth": self.trade_queue.qsize(),
+            "execution_queue_depth": self.execution_queue.qsize(),
+        }
@@ -0,0 +1,650 @@
+"""
+Wallet Behavior Storage Backends
+================================
+
+Pluggable persistence backends for WalletBehaviorStore.
+
+- SQLiteBehaviorBackend (default): WAL-mode SQLite database. Classifications
+  are upserted by primary key and behavior history is appended row by row
+  with a (wallet, timestamp) index, so a single-wallet write touches only that
+  wallet's rows and ``days_back`` queries are index range scans.
+- GzipJSONBehaviorBackend (legacy): the original zlib-compressed JSON files,
+  rewritten in full on every write. Kept for compatibility and as the source
+  format for migration.
+
+Use migrate_legacy_json() (or scripts/migrate_wallet_behavior_store.py) to
+move existing gzip JSON data into SQLite.
+"""
+
+import json
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# File names inside the store's data directory
+LEGACY_CLASSIFICATIONS_FILE = "classifications.json.gz"
+LEGACY_BEHAVIOR_HISTORY_FILE = "behavior_history.json.gz"
+SQLITE_DB_FILE = "wallet_behavior.db"
+
+# Sort key for entries without a parseable timestamp (oldest possible)
+MISSING_TIMESTAMP = 0.0
+
+
+def entry_timestamp(entry: Dict[str, Any]) -> float:
+    """
+    Get a sortable epoch timestamp for a behavior history entry.
+
+    Entries carry ISO-8601 ``timestamp`` strings, which may be naive or
+    timezone-aware; converting to epoch seconds lets both be compared.
+
+    Args:
+        entry: Behavior history entry
+
+    Returns:
+        Epoch seconds, or MISSING_TIMESTAMP if absent or unparseable
+    """
+    value = entry.get("timestamp")
+    if value is None:
+        return MISSING_TIMESTAMP
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except (ValueError, OverflowError, OSError):
+        return MISSING_TIMESTAMP
+
+
+class BehaviorStorageBackend(ABC):
+    """Interface implemented by WalletBehaviorStore persistence backends"""
+
+    name = "abstract"
+
+    @abstractmethod
+    def put_classification(self, wallet_address: str, data: Dict[str, Any]) -> None:
+        """Insert or replace a wallet classification"""
+
+    @abstractmethod
+    def get_classification(self, wallet_address: str) -> Optional[Dict[str, Any]]:
+        """Get a wallet classification, if stored"""
+
+    @abstractmethod
+    def get_all_classifications(self) -> Dict[str, Any]:
+        """Get all wallet classifications keyed by wallet address"""
+
+    @abstractmethod
+    def append_history(
+        self, wallet_address: str, entry: Dict[str, Any], max_entries: int
+    ) -> None:
+        """Append a history entry, keeping at most max_entries per wallet"""
+
+    @abstractmethod
+    def get_history(
+        self,
+        wallet_address: str,
+        since: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get a wallet's history entries at or after ``since``, newest first"""
+
+    @abstractmethod
+    def get_recent_history(self, since: float) -> Dict[str, List[Dict[str, Any]]]:
+        """Get all history entries at or after ``since``, oldest first per wallet"""
+
+    @abstractmethod
+    def count_classifications(self) -> int:
+        """Number of stored classifications"""
+
+    @abstractmethod
+    def count_history(self) -> Dict[str, int]:
+        """History counts: total_entries and wallets_with_history"""
+
+    @abstractmethod
+    def trim_history(self, keep: int) -> int:
+        """Keep only the newest ``keep`` entries per wallet; return rows removed"""
+
+    @abstractmethod
+    def compact(self) -> None:
+        """Reclaim space after deletes"""
+
+    @abstractmethod
+    def data_files(self) -> List[Path]:
+        """Files holding this backend's data (for size reporting and backups)"""
+
+    @abstractmethod
+    def backup_files(self, staging_dir: Path) -> List[Path]:
+        """Return consistent copies of the data files, staged in staging_dir if needed"""
+
+    @abstractmethod
+    def reload(self) -> None:
+        """Drop in-memory state after files were replaced (e.g. restore)"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Backend-specific statistics"""
+        return {"backend": self.name}
+
+    def close(self) -> None:
+        """Release any open resources"""
+
+
+class SQLiteBehaviorBackend(BehaviorStorageBackend):
+    """
+    Append-only, indexed SQLite backend running in WAL mode.
+
+    Writes are single-row upserts/inserts committed in their own transaction;
+    WAL mode keeps readers unblocked while a write is in progress.
+    """
+
+    name = "sqlite"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS classifications (
+            wallet TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            stored_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS behavior_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            wallet TEXT NOT NULL,
+            ts REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_history_wallet_ts
+            ON behavior_history (wallet, ts);
+        CREATE INDEX IF NOT EXISTS idx_history_ts
+            ON behavior_history (ts);
+    """
+
+    def __init__(self, db_path: Path, synchronous: str = "NORMAL") -> None:
+        """
+        Open (and create if needed) the SQLite database.
+
+        Args:
+            db_path: Database file path
+            synchronous: SQLite synchronous pragma; NORMAL is durable in WAL
+                mode except for the last transactions on power loss
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.synchronous = synchronous
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection and ensure the schema exists"""
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            conn.executescript(self.SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _dumps(data: Any) -> str:
+        return json.dumps(data, default=str, separators=(",", ":"))
+
+    def put_classification(self, wallet_address: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO classifications (wallet, data, stored_at) "
+                    "VALUES (?, ?, ?)",
+                    (wallet_address, self._dumps(data), time.time()),
+                )
+
+    def get_classification(self, wallet_address: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT data FROM classifications WHERE wallet = ?",
+                    (wallet_address,),
+                )
+                .fetchone()
+            )
+        return json.loads(row[0]) if row else None
+
+    def get_all_classifications(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute("SELECT wallet, data FROM classifications")
+                .fetchall()
+            )
+        return {wallet: json.loads(data) for wallet, data in rows}
+
+    def append_history(
+        self, wallet_address: str, entry: Dict[str, Any], max_entries: int
+    ) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO behavior_history (wallet, ts, data) VALUES (?, ?, ?)",
+                    (wallet_address, entry_timestamp(entry), self._dumps(entry)),
+                )
+                # Drop anything older than the newest max_entries rows; the
+                # subquery only touches this wallet's (bounded) index range
+                conn.execute(
+                    "DELETE FROM behavior_history WHERE wallet = ? AND id <= ("
+                    "SELECT id FROM behavior_history WHERE wallet = ? "
+                    "ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                    (wallet_address, wallet_address, max_entries),
+                )
+
+    def get_history(
+        self,
+        wallet_address: str,
+        since: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT data FROM behavior_history "
+                    "WHERE wallet = ? AND ts >= ? "
+                    "ORDER BY ts DESC, id DESC LIMIT ?",
+                    (
+                        wallet_address,
+                        since if since is not None else MISSING_TIMESTAMP,
+                        limit if limit else -1,
+                    ),
+                )
+                .fetchall()
+            )
+        return [json.loads(data) for (data,) in rows]
+
+    def get_recent_history(self, since: float) -> Dict[str, List[Dict[str, Any]]]:
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT wallet, data FROM behavior_history WHERE ts >= ? "
+                    "ORDER BY wallet, ts, id",
+                    (since,),
+                )
+                .fetchall()
+            )
+        history: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for wallet, data in rows:
+            history[wallet].append(json.loads(data))
+        return dict(history)
+
+    def count_classifications(self) -> int:
+        with self._lock:
+            return (
+                self._connect()
+                .execute("SELECT COUNT(*) FROM classifications")
+                .fetchone()[0]
+            )
+
+    def count_history(self) -> Dict[str, int]:
+        with self._lock:
+            total, wallets = (
+                self._connect()
+                .execute("SELECT COUNT(*), COUNT(DISTINCT wallet) FROM behavior_history")
+                .fetchone()
+            )
+        return {"total_entries": total, "wallets_with_history": wallets}
+
+    def trim_history(self, keep: int) -> int:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute(
+                    "DELETE FROM behavior_history WHERE id IN ("
+                    "SELECT id FROM (SELECT id, ROW_NUMBER() OVER ("
+                    "PARTITION BY wallet ORDER BY id DESC) AS rn "
+                    "FROM behavior_history) WHERE rn > ?)",
+                    (keep,),
+                )
+            return cursor.rowcount
+
+    def import_data(
+        self,
+        classifications: Dict[str, Any],
+        behavior_history: Dict[str, List[Dict[str, Any]]],
+        max_entries: int,
+    ) -> Dict[str, int]:
+        """
+        Bulk-load classifications and history in a single transaction.
+
+        Args:
+            classifications: Wallet -> classification data
+            behavior_history: Wallet -> history entries in append order
+            max_entries: Newest entries kept per wallet
+
+        Returns:
+            Counts of imported classifications and history entries
+        """
+        now = time.time()
+        history_rows = []
+        for wallet, entries in behavior_history.items():
+            for entry in entries[-max_entries:]:
+                history_rows.append(
+                    (wallet, entry_timestamp(entry), self._dumps(entry))
+                )
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO classifications (wallet, data, stored_at) "
+                    "VALUES (?, ?, ?)",
+                    (
+                        (wallet, self._dumps(data), now)
+                        for wallet, data in classifications.items()
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO behavior_history (wallet, ts, data) VALUES (?, ?, ?)",
+                    history_rows,
+                )
+
+        return {
+            "classifications": len(classifications),
+            "history_entries": len(history_rows),
+        }
+
+    def compact(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.execute("VACUUM")
+
+    def data_files(self) -> List[Path]:
+        return [
+            path
+            for path in (
+                self.db_path,
+                self.db_path.with_name(self.db_path.name + "-wal"),
+                self.db_path.with_name(self.db_path.name + "-shm"),
+            )
+            if path.exists()
+        ]
+
+    def backup_files(self, staging_dir: Path) -> List[Path]:
+        # Copying a live WAL database file is not safe; use the backup API
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        snapshot = staging_dir / self.db_path.name
+        with self._lock:
+            target = sqlite3.connect(str(snapshot))
+            try:
+                self._connect().backup(target)
+            finally:
+                target.close()
+        return [snapshot]
+
+    def reload(self) -> None:
+        self.close()
+        # A restored database replaces the old one; stale WAL/SHM must go too
+        for suffix in ("-wal", "-shm"):
+            stale = self.db_path.with_name(self.db_path.name + suffix)
+            if stale.exists():
+                stale.unlink()
+        self._connect()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.name,
+            "database_file": str(self.db_path),
+            "journal_mode": "wal",
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class GzipJSONBehaviorBackend(BehaviorStorageBackend):
+    """
+    Legacy backend storing each dataset as one zlib-compressed JSON document.
+
+    Every write loads and rewrites the whole file, so write cost grows with
+    the number of tracked wallets. Prefer SQLiteBehaviorBackend.
+    """
+
+    name = "gzip_json"
+
+    def __init__(
+        self,
+        data_dir: Path,
+        compression_level: int = 6,
+        cache_ttl: int = 300,
+        create: bool = True,
+    ) -> None:
+        """
+        Initialize the legacy JSON backend.
+
+        Args:
+            data_dir: Directory holding the compressed JSON files
+            compression_level: zlib compression level
+            cache_ttl: Seconds loaded files are served from memory
+            create: Create empty data files if they do not exist
+        """
+        self.data_dir = Path(data_dir)
+        self.classifications_file = self.data_dir / LEGACY_CLASSIFICATIONS_FILE
+        self.behavior_history_file = self.data_dir / LEGACY_BEHAVIOR_HISTORY_FILE
+        self.compression_level = compression_level
+        self.cache_ttl = cache_ttl
+
+        self._classifications_cache: Optional[Dict[str, Any]] = None
+        self._behavior_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._last_cache_update = 0.0
+
+        if create:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            if not self.classifications_file.exists():
+                self._save_compressed_json(self.classifications_file, {})
+            if not self.behavior_history_file.exists():
+                self._save_compressed_json(self.behavior_history_file, {})
+
+    def put_classification(self, wallet_address: str, data: Dict[str, Any]) -> None:
+        classifications = self.load_classifications()
+        classifications[wallet_address] = data
+        self._save_compressed_json(self.classifications_file, classifications)
+        self.reload()
+
+    def get_classification(self, wallet_address: str) -> Optional[Dict[str, Any]]:
+        return self.load_classifications().get(wallet_address)
+
+    def get_all_classifications(self) -> Dict[str, Any]:
+        return self.load_classifications()
+
+    def append_history(
+        self, wallet_address: str, entry: Dict[str, Any], max_entries: int
+    ) -> None:
+        behavior_history = self.load_behavior_history()
+        history = behavior_history.setdefault(wallet_address, [])
+        history.append(entry)
+        if len(history) > max_entries:
+            behavior_history[wallet_address] = history[-max_entries:]
+        self._save_compressed_json(self.behavior_history_file, behavior_history)
+        self.reload()
+
+    def get_history(
+        self,
+        wallet_address: str,
+        since: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        history = list(self.load_behavior_history().get(wallet_address, []))
+        if since is not None:
+            history = [entry for entry in history if entry_timestamp(entry) >= since]
+        history.sort(key=entry_timestamp, reverse=True)
+        return history[:limit] if limit else history
+
+    def get_recent_history(self, since: float) -> Dict[str, List[Dict[str, Any]]]:
+        recent: Dict[str, List[Dict[str, Any]]] = {}
+        for wallet, history in self.load_behavior_history().items():
+            entries = [entry for entry in history if entry_timestamp(entry) >= since]
+            if entries:
+                recent[wallet] = sorted(entries, key=entry_timestamp)
+        return recent
+
+    def count_classifications(self) -> int:
+        return len(self.load_classifications())
+
+    def count_history(self) -> Dict[str, int]:
+        behavior_history = self.load_behavior_history()
+        return {
+            "total_entries": sum(len(h) for h in behavior_history.values()),
+            "wallets_with_history": len(behavior_history),
+        }
+
+    def trim_history(self, keep: int) -> int:
+        behavior_history = self.load_behavior_history()
+        removed = 0
+        for wallet_address, history in behavior_history.items():
+            if len(history) > keep:
+                removed += len(history) - keep
+                behavior_history[wallet_address] = history[-keep:]
+        if removed > 0:
+            self._save_compressed_json(self.behavior_history_file, behavior_history)
+            self.reload()
+        return removed
+
+    def compact(self) -> None:
+        # Reload and resave all data with current compression settings
+        self._save_compressed_json(
+            self.classifications_file, self.load_classifications()
+        )
+        self._save_compressed_json(
+            self.behavior_history_file, self.load_behavior_history()
+        )
+
+    def data_files(self) -> List[Path]:
+        return [
+            path
+            for path in (self.classifications_file, self.behavior_history_file)
+            if path.exists()
+        ]
+
+    def backup_files(self, staging_dir: Path) -> List[Path]:
+        return self.data_files()
+
+    def reload(self) -> None:
+        self._classifications_cache = None
+        self._behavior_cache = None
+        self._last_cache_update = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": self.name, "compression_ratio": self._compression_ratio()}
+
+    def load_classifications(self) -> Dict[str, Any]:
+        """Load classifications with caching"""
+        if self._classifications_cache is not None and self._cache_fresh():
+            return self._classifications_cache
+        self._classifications_cache = self._load_compressed_json(
+            self.classifications_file
+        )
+        self._last_cache_update = time.time()
+        return self._classifications_cache
+
+    def load_behavior_history(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Load behavior history with caching"""
+        if self._behavior_cache is not None and self._cache_fresh():
+            return self._behavior_cache
+        self._behavior_cache = self._load_compressed_json(self.behavior_history_file)
+        self._last_cache_update = time.time()
+        return self._behavior_cache
+
+    def _cache_fresh(self) -> bool:
+        return time.time() - self._last_cache_update < self.cache_ttl
+
+    def _load_compressed_json(self, file_path: Path) -> Any:
+        """Load compressed JSON data"""
+        if not file_path.exists():
+            return {}
+
+        try:
+            with open(file_path, "rb") as f:
+                json_data = zlib.decompress(f.read())
+            return json.loads(json_data.decode("utf-8"))
+        except Exception as e:
+            logger.error(f"Error loading compressed JSON from {file_path}: {e}")
+            return {}
+
+    def _save_compressed_json(self, file_path: Path, data: Any) -> None:
+        """Save data as compressed JSON"""
+        try:
+            json_str = json.dumps(data, default=str, separators=(",", ":"))
+            compressed_data = zlib.compress(
+                json_str.encode("utf-8"), level=self.compression_level
+            )
+            with open(file_path, "wb") as f:
+                f.write(compressed_data)
+        except Exception as e:
+            logger.error(f"Error saving compressed JSON to {file_path}: {e}")
+
+    def _compression_ratio(self) -> float:
+        """Calculate effective compression ratio"""
+        try:
+            uncompressed_size = len(
+                json.dumps(self.load_classifications(), default=str)
+            ) + len(json.dumps(self.load_behavior_history(), default=str))
+            compressed_size = sum(path.stat().st_size for path in self.data_files())
+            return uncompressed_size / compressed_size if compressed_size > 0 else 1
+        except Exception:
+            return 1
+
+
+def has_legacy_data(data_dir: Path) -> bool:
+    """Check whether a directory holds legacy gzip JSON behavior data"""
+    data_dir = Path(data_dir)
+    return (data_dir / LEGACY_CLASSIFICATIONS_FILE).exists() or (
+        data_dir / LEGACY_BEHAVIOR_HISTORY_FILE
+    ).exists()
+
+
+def migrate_legacy_json(
+    data_dir: Path,
+    target: SQLiteBehaviorBackend,
+    max_entries: int = 200,
+    archive: bool = False,
+) -> Dict[str, int]:
+    """
+    Copy legacy gzip JSON behavior data into a SQLite backend.
+
+    Args:
+        data_dir: Directory containing the legacy .json.gz files
+        target: Destination SQLite backend
+        max_entries: Newest history entries kept per wallet
+        archive: Move the legacy files into ``data_dir/legacy`` afterwards
+
+    Returns:
+        Counts of migrated classifications and history entries
+    """
+    source = GzipJSONBehaviorBackend(data_dir, create=False)
+    counts = target.import_data(
+        source.load_classifications(), source.load_behavior_history(), max_entries
+    )
+
+    if archive:
+        legacy_dir = Path(data_dir) / "legacy"
+        legacy_dir.mkdir(exist_ok=True)
+        for path in source.data_files():
+            shutil.move(str(path), str(legacy_dir / path.name))
+
+    logger.info(
+        f"📦 Migrated {counts['classifications']} classifications and "
+        f"{counts['history_entries']} history entries from {data_dir} "
+        f"to {target.db_path}"
+    )
+    return counts
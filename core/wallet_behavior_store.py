@@ -4,25 +4,35 @@ Wallet Behavior Data Storage System
 
 Persistent storage system for wallet behavior analysis, classifications,
 and historical tracking. Provides efficient data management with
-compression, indexing, and automatic cleanup.
+indexing, automatic cleanup and a pluggable persistence backend.
 
 Features:
-- Compressed JSON storage with metadata
-- Time-series data management
-- Automatic data cleanup and optimization
+- Append-only SQLite (WAL) storage with per-wallet indexes (default)
+- Legacy compressed JSON storage via GzipJSONBehaviorBackend
+- Automatic one-time migration from the legacy gzip JSON files
+- Time-series data management with indexed range queries
 - Backup and recovery capabilities
-- Performance analytics and caching
 """
 
 import json
 import logging
+import tarfile
+import tempfile
 import time
-import zlib
 from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from core.wallet_behavior_backends import (
+    SQLITE_DB_FILE,
+    BehaviorStorageBackend,
+    SQLiteBehaviorBackend,
+    entry_timestamp,
+    has_legacy_data,
+    migrate_legacy_json,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,63 +45,75 @@ class WalletBehaviorStore:
     - Historical behavior analysis results
     - Performance metrics and trends
     - Market maker detection data
+
+    Single-wallet writes only touch that wallet's rows; they no longer
+    rewrite every tracked wallet.
     """
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        data_dir: Optional[Path] = None,
+        backend: Optional[BehaviorStorageBackend] = None,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            data_dir: Directory for data, metadata and backups
+            backend: Persistence backend (default: SQLite database in data_dir)
+        """
         self.data_dir = data_dir or Path("data/wallet_behavior")
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
         # Storage paths
-        self.classifications_file = self.data_dir / "classifications.json.gz"
-        self.behavior_history_file = self.data_dir / "behavior_history.json.gz"
         self.metadata_file = self.data_dir / "metadata.json"
         self.backups_dir = self.data_dir / "backups"
         self.backups_dir.mkdir(exist_ok=True)
 
-        # In-memory caches
-        self._classifications_cache: Optional[Dict[str, Any]] = None
-        self._behavior_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        # Metadata cache
         self._metadata_cache: Optional[Dict[str, Any]] = None
 
-        # Cache settings
-        self.cache_ttl = 300  # 5 minutes
-        self._last_cache_update = 0
-
         # Storage settings
-        self.compression_level = 6  # zlib compression level
         self.max_history_per_wallet = 200  # Maximum history entries per wallet
+        self.optimize_keep_per_wallet = 100  # Entries kept by optimize_storage
         self.backup_interval_days = 7  # Backup frequency
 
+        if backend is None:
+            db_path = self.data_dir / SQLITE_DB_FILE
+            is_new_database = not db_path.exists()
+            backend = SQLiteBehaviorBackend(db_path)
+            if is_new_database and has_legacy_data(self.data_dir):
+                migrate_legacy_json(
+                    self.data_dir, backend, max_entries=self.max_history_per_wallet
+                )
+        self.backend = backend
+
         # Initialize storage
         self._initialize_storage()
 
-        logger.info(f"💾 Wallet behavior store initialized at {self.data_dir}")
+        logger.info(
+            f"💾 Wallet behavior store initialized at {self.data_dir} "
+            f"({self.backend.name} backend)"
+        )
 
     def _initialize_storage(self):
-        """Initialize storage files and directories"""
-        # Create metadata if it doesn't exist
+        """Initialize metadata"""
         if not self.metadata_file.exists():
             metadata = {
                 "created_at": datetime.now().isoformat(),
-                "version": "1.0",
+                "version": "2.0",
+                "backend": self.backend.name,
                 "total_wallets": 0,
                 "last_backup": None,
                 "storage_stats": {
                     "total_classifications": 0,
                     "total_history_entries": 0,
-                    "compressed_size_mb": 0,
+                    "size_mb": 0,
                     "last_optimization": None,
                 },
             }
             self._save_metadata(metadata)
 
-        # Create empty data files if they don't exist
-        if not self.classifications_file.exists():
-            self._save_compressed_json(self.classifications_file, {})
-
-        if not self.behavior_history_file.exists():
-            self._save_compressed_json(self.behavior_history_file, {})
-
     def store_wallet_classification(
         self, wallet_address: str, classification_data: Dict[str, Any]
     ) -> bool:
@@ -106,24 +128,11 @@ class WalletBehaviorStore:
             Success status
         """
         try:
-            # Load current classifications
-            classifications = self._load_classifications()
-
             # Add metadata
             classification_data["_stored_at"] = datetime.now().isoformat()
             classification_data["_version"] = "1.0"
 
-            # Store classification
-            classifications[wallet_address] = classification_data
-
-            # Save to disk
-            self._save_compressed_json(self.classifications_file, classifications)
-
-            # Update metadata
-            self._update_metadata_stats()
-
-            # Clear cache
-            self._invalidate_cache()
+            self.backend.put_classification(wallet_address, classification_data)
 
             logger.debug(f"💾 Stored classification for {wallet_address}")
             return True
@@ -146,34 +155,13 @@ class WalletBehaviorStore:
             Success status
         """
         try:
-            # Load current behavior history
-            behavior_history = self._load_behavior_history()
-
-            # Initialize wallet history if needed
-            if wallet_address not in behavior_history:
-                behavior_history[wallet_address] = []
-
             # Add metadata
             behavior_entry["_stored_at"] = datetime.now().isoformat()
 
-            # Append new entry
-            behavior_history[wallet_address].append(behavior_entry)
-
-            # Maintain size limits (keep most recent entries)
-            if len(behavior_history[wallet_address]) > self.max_history_per_wallet:
-                # Keep the most recent entries
-                behavior_history[wallet_address] = behavior_history[wallet_address][
-                    -self.max_history_per_wallet :
-                ]
-
-            # Save to disk
-            self._save_compressed_json(self.behavior_history_file, behavior_history)
-
-            # Update metadata
-            self._update_metadata_stats()
-
-            # Clear cache
-            self._invalidate_cache()
+            # Append, keeping the most recent entries per wallet
+            self.backend.append_history(
+                wallet_address, behavior_entry, self.max_history_per_wallet
+            )
 
             logger.debug(f"💾 Stored behavior history entry for {wallet_address}")
             return True
@@ -186,8 +174,11 @@ class WalletBehaviorStore:
         self, wallet_address: str
     ) -> Optional[Dict[str, Any]]:
         """Retrieve wallet classification data"""
-        classifications = self._load_classifications()
-        return classifications.get(wallet_address)
+        try:
+            return self.backend.get_classification(wallet_address)
+        except Exception as e:
+            logger.error(f"Error loading classification for {wallet_address}: {e}")
+            return None
 
     def get_wallet_behavior_history(
         self,
@@ -206,45 +197,26 @@ class WalletBehaviorStore:
         Returns:
             List of behavior history entries (newest first)
         """
-        behavior_history = self._load_behavior_history()
-
-        if wallet_address not in behavior_history:
+        since = time.time() - days_back * 86400 if days_back else None
+        try:
+            return self.backend.get_history(wallet_address, since=since, limit=limit)
+        except Exception as e:
+            logger.error(f"Error loading behavior history for {wallet_address}: {e}")
             return []
 
-        history = behavior_history[wallet_address].copy()
-
-        # Filter by days back if specified
-        if days_back:
-            cutoff_date = datetime.now() - timedelta(days=days_back)
-            history = [
-                entry
-                for entry in history
-                if datetime.fromisoformat(
-                    entry.get("timestamp", datetime.min.isoformat())
-                )
-                >= cutoff_date
-            ]
-
-        # Sort by timestamp (newest first)
-        history.sort(
-            key=lambda x: x.get("timestamp", datetime.min.isoformat()), reverse=True
-        )
-
-        # Apply limit
-        if limit:
-            history = history[:limit]
-
-        return history
-
     def get_all_classifications(self) -> Dict[str, Any]:
         """Get all wallet classifications"""
-        return self._load_classifications()
+        try:
+            return self.backend.get_all_classifications()
+        except Exception as e:
+            logger.error(f"Error loading classifications: {e}")
+            return {}
 
     def get_behavior_summary_stats(self) -> Dict[str, Any]:
         """Get summary statistics for stored behavior data"""
 
-        classifications = self._load_classifications()
-        behavior_history = self._load_behavior_history()
+        classifications = self.get_all_classifications()
+        history_counts = self.backend.count_history()
 
         # Classification distribution
         classification_counts = defaultdict(int)
@@ -261,20 +233,14 @@ class WalletBehaviorStore:
             mm_probabilities.append(mm_prob)
             confidence_scores.append(conf_score)
 
-        # Behavior history stats
-        total_history_entries = sum(
-            len(history) for history in behavior_history.values()
-        )
-        wallets_with_history = len(behavior_history)
-
         # Market maker concentration
         market_makers = classification_counts.get("market_maker", 0)
         total_classified = len(classifications)
 
         return {
             "total_wallets_classified": total_classified,
-            "total_history_entries": total_history_entries,
-            "wallets_with_history": wallets_with_history,
+            "total_history_entries": history_counts["total_entries"],
+            "wallets_with_history": history_counts["wallets_with_history"],
             "classification_distribution": dict(classification_counts),
             "market_maker_percentage": (
                 market_makers / total_classified if total_classified > 0 else 0
@@ -306,32 +272,24 @@ class WalletBehaviorStore:
             List of wallets with classification changes
         """
         changes = []
-        behavior_history = self._load_behavior_history()
-        cutoff_time = datetime.now() - timedelta(hours=hours_back)
+        now = time.time()
 
-        for wallet_address, history in behavior_history.items():
-            if len(history) < 2:
-                continue
-
-            # Get recent entries
-            recent_entries = [
-                entry
-                for entry in history
-                if datetime.fromisoformat(
-                    entry.get("timestamp", datetime.min.isoformat())
-                )
-                >= cutoff_time
-            ]
+        try:
+            # Index range scan; entries come back oldest first per wallet
+            recent_history = self.backend.get_recent_history(now - hours_back * 3600)
+        except Exception as e:
+            logger.error(f"Error loading recent behavior history: {e}")
+            return changes
 
+        for wallet_address, recent_entries in recent_history.items():
             if len(recent_entries) < 2:
                 continue
 
-            # Sort by timestamp
-            recent_entries.sort(key=lambda x: x.get("timestamp", ""))
-
             # Check for classification changes
-            first_classification = recent_entries[0].get("classification")
-            last_classification = recent_entries[-1].get("classification")
+            first_entry = recent_entries[0]
+            last_entry = recent_entries[-1]
+            first_classification = first_entry.get("classification")
+            last_classification = last_entry.get("classification")
 
             if first_classification != last_classification:
                 changes.append(
@@ -339,30 +297,23 @@ class WalletBehaviorStore:
                         "wallet_address": wallet_address,
                         "previous_classification": first_classification,
                         "current_classification": last_classification,
-                        "change_timestamp": recent_entries[-1].get("timestamp"),
+                        "change_timestamp": last_entry.get("timestamp"),
                         "hours_since_change": (
-                            datetime.now()
-                            - datetime.fromisoformat(
-                                recent_entries[-1].get(
-                                    "timestamp", datetime.now().isoformat()
-                                )
-                            )
-                        ).total_seconds()
+                            now - (entry_timestamp(last_entry) or now)
+                        )
                         / 3600,
-                        "confidence_current": recent_entries[-1].get(
-                            "confidence_score", 0
-                        ),
-                        "mm_probability_change": recent_entries[-1].get(
+                        "confidence_current": last_entry.get("confidence_score", 0),
+                        "mm_probability_change": last_entry.get(
                             "market_maker_probability", 0
                         )
-                        - recent_entries[0].get("market_maker_probability", 0),
+                        - first_entry.get("market_maker_probability", 0),
                     }
                 )
 
         return changes
 
     def optimize_storage(self) -> Dict[str, Any]:
-        """Optimize storage by cleaning up old data and compressing"""
+        """Optimize storage by cleaning up old data and compacting"""
 
         optimization_stats = {
             "old_entries_removed": 0,
@@ -376,32 +327,20 @@ class WalletBehaviorStore:
             # Get current size
             optimization_stats["size_before_mb"] = self._get_directory_size_mb()
 
-            # Clean up old behavior history entries (keep last 100 per wallet)
-            behavior_history = self._load_behavior_history()
-            entries_removed = 0
-
-            for wallet_address, history in behavior_history.items():
-                if len(history) > 100:
-                    removed = len(history) - 100
-                    behavior_history[wallet_address] = history[-100:]
-                    entries_removed += removed
-
-            # Save optimized data
+            # Clean up old behavior history entries
+            entries_removed = self.backend.trim_history(self.optimize_keep_per_wallet)
             if entries_removed > 0:
-                self._save_compressed_json(self.behavior_history_file, behavior_history)
                 logger.info(
                     f"🧹 Removed {entries_removed} old behavior history entries"
                 )
 
             optimization_stats["old_entries_removed"] = entries_removed
 
-            # Recompress all files with optimal settings
-            self._recompress_all_files()
+            # Reclaim space (VACUUM / recompress)
+            self.backend.compact()
 
             # Update metadata
-            metadata = self._load_metadata()
-            metadata["storage_stats"]["last_optimization"] = datetime.now().isoformat()
-            self._save_metadata(metadata)
+            self._update_metadata_stats(last_optimization=datetime.now().isoformat())
 
             # Get new size
             optimization_stats["size_after_mb"] = self._get_directory_size_mb()
@@ -412,9 +351,6 @@ class WalletBehaviorStore:
                 else 1
             )
 
-            # Clear cache
-            self._invalidate_cache()
-
             logger.info(
                 f"✅ Storage optimization complete: "
                 f"{optimization_stats['size_before_mb']:.2f}MB → {optimization_stats['size_after_mb']:.2f}MB "
@@ -435,18 +371,14 @@ class WalletBehaviorStore:
                 self.backups_dir / f"wallet_behavior_backup_{timestamp}.tar.gz"
             )
 
-            # Create backup archive
-            import tarfile
+            with tempfile.TemporaryDirectory() as staging_dir:
+                data_files = self.backend.backup_files(Path(staging_dir))
 
-            with tarfile.open(backup_file, "w:gz") as tar:
-                # Add all data files
-                for file_path in [
-                    self.classifications_file,
-                    self.behavior_history_file,
-                    self.metadata_file,
-                ]:
-                    if file_path.exists():
-                        tar.add(file_path, arcname=file_path.name)
+                # Create backup archive
+                with tarfile.open(backup_file, "w:gz") as tar:
+                    for file_path in data_files + [self.metadata_file]:
+                        if file_path.exists():
+                            tar.add(file_path, arcname=file_path.name)
 
             # Update metadata
             metadata = self._load_metadata()
@@ -464,14 +396,16 @@ class WalletBehaviorStore:
         """Restore data from backup file"""
 
         try:
-            import tarfile
+            # Release open files before they are replaced
+            self.backend.close()
 
             # Extract backup
             with tarfile.open(backup_file, "r:gz") as tar:
                 tar.extractall(self.data_dir, filter="data")
 
-            # Clear cache
-            self._invalidate_cache()
+            # Reopen backend and drop cached metadata
+            self.backend.reload()
+            self._metadata_cache = None
 
             logger.info(f"🔄 Restored from backup: {backup_file}")
             return True
@@ -484,91 +418,49 @@ class WalletBehaviorStore:
         """Get detailed storage statistics"""
 
         try:
-            classifications_size = (
-                self.classifications_file.stat().st_size
-                if self.classifications_file.exists()
-                else 0
-            )
-            behavior_size = (
-                self.behavior_history_file.stat().st_size
-                if self.behavior_history_file.exists()
-                else 0
+            data_size = sum(
+                path.stat().st_size for path in self.backend.data_files()
             )
             metadata_size = (
                 self.metadata_file.stat().st_size if self.metadata_file.exists() else 0
             )
 
-            total_size_mb = (classifications_size + behavior_size + metadata_size) / (
-                1024 * 1024
-            )
-
-            classifications = self._load_classifications()
-            behavior_history = self._load_behavior_history()
-
-            total_history_entries = sum(
-                len(history) for history in behavior_history.values()
-            )
+            total_classifications = self.backend.count_classifications()
+            total_history_entries = self.backend.count_history()["total_entries"]
+            metadata = self._load_metadata()
 
-            return {
-                "total_size_mb": round(total_size_mb, 2),
-                "classifications_file_mb": round(
-                    classifications_size / (1024 * 1024), 2
-                ),
-                "behavior_history_file_mb": round(behavior_size / (1024 * 1024), 2),
+            stats = {
+                "total_size_mb": round((data_size + metadata_size) / (1024 * 1024), 2),
+                "data_files_mb": round(data_size / (1024 * 1024), 2),
                 "metadata_file_mb": round(metadata_size / (1024 * 1024), 2),
-                "total_wallets": len(classifications),
+                "total_wallets": total_classifications,
                 "total_history_entries": total_history_entries,
                 "avg_history_per_wallet": (
-                    total_history_entries / len(classifications)
-                    if classifications
+                    total_history_entries / total_classifications
+                    if total_classifications
                     else 0
                 ),
-                "compression_ratio": self._calculate_compression_ratio(),
-                "last_backup": self._load_metadata().get("last_backup"),
-                "last_optimization": self._load_metadata()
-                .get("storage_stats", {})
-                .get("last_optimization"),
+                "last_backup": metadata.get("last_backup"),
+                "last_optimization": metadata.get("storage_stats", {}).get(
+                    "last_optimization"
+                ),
             }
+            stats.update(self.backend.get_stats())
+            return stats
 
         except Exception as e:
             logger.error(f"Error getting storage stats: {e}")
             return {}
 
-    # Private helper methods
-
-    def _load_classifications(self) -> Dict[str, Any]:
-        """Load classifications with caching"""
-        if self._should_use_cache():
-            if self._classifications_cache is not None:
-                return self._classifications_cache
+    def close(self) -> None:
+        """Close the storage backend"""
+        self.backend.close()
 
-        try:
-            classifications = self._load_compressed_json(self.classifications_file)
-            self._classifications_cache = classifications
-            self._last_cache_update = time.time()
-            return classifications
-        except Exception as e:
-            logger.error(f"Error loading classifications: {e}")
-            return {}
-
-    def _load_behavior_history(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Load behavior history with caching"""
-        if self._should_use_cache():
-            if self._behavior_cache is not None:
-                return self._behavior_cache
-
-        try:
-            behavior_history = self._load_compressed_json(self.behavior_history_file)
-            self._behavior_cache = behavior_history
-            self._last_cache_update = time.time()
-            return behavior_history
-        except Exception as e:
-            logger.error(f"Error loading behavior history: {e}")
-            return {}
+    # Private helper methods
 
     def _load_metadata(self) -> Dict[str, Any]:
         """Load metadata"""
-        if self._metadata_cache is not None and self._should_use_cache():
+        if self._metadata_cache is not None:
             return self._metadata_cache
 
         try:
@@ -592,68 +484,30 @@ class WalletBehaviorStore:
         except Exception as e:
             logger.error(f"Error saving metadata: {e}")
 
-    def _should_use_cache(self) -> bool:
-        """Check if cache should be used"""
-        return time.time() - self._last_cache_update < self.cache_ttl
-
-    def _invalidate_cache(self):
-        """Invalidate all caches"""
-        self._classifications_cache = None
-        self._behavior_cache = None
-        self._metadata_cache = None
-        self._last_cache_update = 0
-
-    def _update_metadata_stats(self):
-        """Update storage statistics in metadata"""
+    def _update_metadata_stats(self, last_optimization: Optional[str] = None):
+        """Update storage statistics in metadata (maintenance only, not per write)"""
         try:
             metadata = self._load_metadata()
             stats = metadata.get("storage_stats", {})
 
-            classifications = self._load_classifications()
-            behavior_history = self._load_behavior_history()
-
-            stats["total_classifications"] = len(classifications)
-            stats["total_history_entries"] = sum(
-                len(history) for history in behavior_history.values()
-            )
-            stats["compressed_size_mb"] = self._get_directory_size_mb()
+            total_classifications = self.backend.count_classifications()
+            stats["total_classifications"] = total_classifications
+            stats["total_history_entries"] = self.backend.count_history()[
+                "total_entries"
+            ]
+            stats["size_mb"] = self._get_directory_size_mb()
+            if last_optimization:
+                stats["last_optimization"] = last_optimization
 
             metadata["storage_stats"] = stats
-            metadata["total_wallets"] = len(classifications)
+            metadata["total_wallets"] = total_classifications
+            metadata["backend"] = self.backend.name
 
             self._save_metadata(metadata)
 
         except Exception as e:
             logger.error(f"Error updating metadata stats: {e}")
 
-    def _load_compressed_json(self, file_path: Path) -> Any:
-        """Load compressed JSON data"""
-        if not file_path.exists():
-            return {}
-
-        try:
-            with open(file_path, "rb") as f:
-                compressed_data = f.read()
-                json_data = zlib.decompress(compressed_data)
-                return json.loads(json_data.decode("utf-8"))
-        except Exception as e:
-            logger.error(f"Error loading compressed JSON from {file_path}: {e}")
-            return {}
-
-    def _save_compressed_json(self, file_path: Path, data: Any):
-        """Save data as compressed JSON"""
-        try:
-            json_str = json.dumps(data, default=str, separators=(",", ":"))
-            compressed_data = zlib.compress(
-                json_str.encode("utf-8"), level=self.compression_level
-            )
-
-            with open(file_path, "wb") as f:
-                f.write(compressed_data)
-
-        except Exception as e:
-            logger.error(f"Error saving compressed JSON to {file_path}: {e}")
-
     def _get_directory_size_mb(self) -> float:
         """Get total size of data directory in MB"""
         try:
@@ -665,47 +519,6 @@ class WalletBehaviorStore:
         except Exception:
             return 0
 
-    def _calculate_compression_ratio(self) -> float:
-        """Calculate effective compression ratio"""
-        try:
-            # Estimate by comparing compressed vs uncompressed sizes
-            classifications = self._load_classifications()
-            behavior_history = self._load_behavior_history()
-
-            # Rough estimate of uncompressed size
-            uncompressed_size = len(json.dumps(classifications, default=str)) + len(
-                json.dumps(behavior_history, default=str)
-            )
-            compressed_size = (
-                self.classifications_file.stat().st_size
-                if self.classifications_file.exists()
-                else 0
-            ) + (
-                self.behavior_history_file.stat().st_size
-                if self.behavior_history_file.exists()
-                else 0
-            )
-
-            return uncompressed_size / compressed_size if compressed_size > 0 else 1
-
-        except Exception:
-            return 1
-
-    def _recompress_all_files(self):
-        """Recompress all data files with optimal settings"""
-        try:
-            # Reload and resave all data with current compression settings
-            classifications = self._load_classifications()
-            self._save_compressed_json(self.classifications_file, classifications)
-
-            behavior_history = self._load_behavior_history()
-            self._save_compressed_json(self.behavior_history_file, behavior_history)
-
-            logger.debug("🔄 Recompressed all data files")
-
-        except Exception as e:
-            logger.error(f"Error recompressing files: {e}")
-
     def cleanup_old_backups(self, keep_days: int = 30):
         """Clean up old backup files"""
         try:
@@ -0,0 +1,332 @@
+"""
+Wallet Return Correlation Engine
+================================
+
+Tracks how closely wallets' profits move together, for diversified wallet
+selection and portfolio construction.
+
+Settled trade PnL is summed into one daily bucket per wallet. When a day
+closes, its PnL vector is appended to a dense ``(wallets x days)`` history
+matrix and folded into an exponentially weighted mean and covariance:
+
+    delta = x - mean
+    mean += alpha * delta
+    cov = (1 - alpha) * (cov + alpha * outer(delta, delta))
+
+so nothing is ever recomputed from the full history. The correlation matrix
+is derived from the covariance lazily, once per closed day, which makes
+pairwise, sub-matrix and top-k queries cheap even for thousands of wallets.
+"""
+
+import logging
+import math
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from utils.helpers import normalize_address
+
+logger = logging.getLogger(__name__)
+
+# Correlation engine constants
+SECONDS_PER_DAY = 86400
+DEFAULT_HALFLIFE_DAYS = 20.0  # Weight of a day's PnL halves after this many days
+DEFAULT_HISTORY_DAYS = 90  # Daily PnL columns kept per wallet
+DEFAULT_MIN_OBSERVATIONS = 10  # Closed days before a wallet's correlations count
+INITIAL_CAPACITY = 256  # Wallet rows preallocated; doubled when full
+MAX_EMPTY_DAYS_APPLIED = 365  # Cap on idle days folded in after a long gap
+
+Timestamp = Union[float, int, str, datetime, None]
+
+
+def _to_epoch(timestamp: Timestamp) -> float:
+    """Unix time of a float, ISO string or datetime (None means now)"""
+    if timestamp is None:
+        return time.time()
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    return float(timestamp)
+
+
+class WalletCorrelationEngine:
+    """
+    Incremental exponentially weighted correlation of wallet daily PnL.
+
+    Example:
+        engine = WalletCorrelationEngine()
+        engine.record_pnl(wallet, 12.5, timestamp)
+        similar = engine.top_correlated(wallet, k=5)
+        matrix = engine.correlation_matrix(candidate_wallets)
+    """
+
+    def __init__(
+        self,
+        halflife_days: float = DEFAULT_HALFLIFE_DAYS,
+        history_days: int = DEFAULT_HISTORY_DAYS,
+        min_observations: int = DEFAULT_MIN_OBSERVATIONS,
+        initial_capacity: int = INITIAL_CAPACITY,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            halflife_days: Half-life of the exponential weighting in days
+            history_days: Number of closed daily PnL values kept per wallet
+            min_observations: Closed days a wallet needs before it is
+                reported as correlated with anything
+            initial_capacity: Wallet rows to preallocate
+        """
+        self.alpha = 1.0 - math.exp(math.log(0.5) / halflife_days)
+        self.history_days = max(1, history_days)
+        self.min_observations = min_observations
+
+        self._index: Dict[str, int] = {}
+        self._addresses: List[str] = []
+        capacity = max(1, initial_capacity)
+        self._today = np.zeros(capacity)
+        self._mean = np.zeros(capacity)
+        self._cov = np.zeros((capacity, capacity))
+        self._series = np.zeros((capacity, self.history_days))
+        self._observations = np.zeros(capacity, dtype=np.int64)
+        self._series_slot = 0  # Column the next closed day is written to
+        self._current_day: Optional[int] = None
+
+        self._corr: Optional[np.ndarray] = None  # Cached; None when stale
+
+        self.stats = {"trades_recorded": 0, "days_closed": 0, "late_trades": 0}
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    def __contains__(self, wallet_address: str) -> bool:
+        return normalize_address(wallet_address) in self._index
+
+    def _row(self, wallet_address: str) -> int:
+        """Row of a wallet, adding it (and growing the arrays) if new"""
+        wallet = normalize_address(wallet_address)
+        row = self._index.get(wallet)
+        if row is not None:
+            return row
+
+        row = len(self._addresses)
+        if row == len(self._mean):
+            self._grow(2 * row)
+        self._index[wallet] = row
+        self._addresses.append(wallet)
+        self._corr = None
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        n = len(self._addresses)
+        cov = np.zeros((capacity, capacity))
+        cov[:n, :n] = self._cov[:n, :n]
+        self._cov = cov
+        series = np.zeros((capacity, self.history_days))
+        series[:n] = self._series[:n]
+        self._series = series
+        for name in ("_today", "_mean", "_observations"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+
+    def add_wallets(self, wallet_addresses: Iterable[str]) -> None:
+        """Start tracking wallets so their future PnL days are recorded"""
+        for wallet_address in wallet_addresses:
+            self._row(wallet_address)
+
+    def record_pnl(
+        self, wallet_address: str, pnl_usd: float, timestamp: Timestamp = None
+    ) -> None:
+        """
+        Record the PnL of a settled trade.
+
+        Args:
+            wallet_address: Wallet that made the trade
+            pnl_usd: Realised profit or loss in USD
+            timestamp: Settlement time; defaults to now
+        """
+        row = self._row(wallet_address)
+        self._advance_to(int(_to_epoch(timestamp) // SECONDS_PER_DAY))
+        self._today[row] += pnl_usd
+        self.stats["trades_recorded"] += 1
+
+    def record_trades(self, trades: Iterable[Dict[str, Any]]) -> int:
+        """
+        Record many settled trades, e.g. when loading history.
+
+        Trades need ``wallet_address``, ``pnl_usd`` and ``timestamp``;
+        records missing any of them are skipped.
+
+        Returns:
+            Number of trades recorded
+        """
+        parsed: List[Tuple[int, int, float]] = []
+        for trade in trades:
+            wallet_address = trade.get("wallet_address")
+            pnl_usd = trade.get("pnl_usd")
+            if not wallet_address or pnl_usd is None or not trade.get("timestamp"):
+                continue
+            try:
+                day = int(_to_epoch(trade["timestamp"]) // SECONDS_PER_DAY)
+                parsed.append((day, self._row(wallet_address), float(pnl_usd)))
+            except (TypeError, ValueError):
+                continue
+        if not parsed:
+            return 0
+
+        parsed.sort(key=lambda item: item[0])
+        days = np.array([p[0] for p in parsed])
+        rows = np.array([p[1] for p in parsed])
+        pnl = np.array([p[2] for p in parsed])
+        # One scatter-add per distinct day, then close it
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        ends = np.r_[starts[1:], len(days)]
+        for start, end in zip(starts, ends):
+            self._advance_to(int(days[start]))
+            np.add.at(self._today, rows[start:end], pnl[start:end])
+
+        self.stats["trades_recorded"] += len(parsed)
+        return len(parsed)
+
+    def _advance_to(self, day: int) -> None:
+        """Close every day before ``day``"""
+        if self._current_day is None:
+            self._current_day = day
+            return
+        if day < self._current_day:
+            # A closed day cannot be revised incrementally; count it today
+            self.stats["late_trades"] += 1
+            return
+
+        elapsed = day - self._current_day
+        for _ in range(min(elapsed, MAX_EMPTY_DAYS_APPLIED)):
+            self._close_day()
+        self._current_day = day
+
+    def _close_day(self) -> None:
+        """Fold the open day's PnL into the EW statistics and history"""
+        n = len(self._addresses)
+        alpha = self.alpha
+        x = self._today[:n]
+
+        delta = x - self._mean[:n]
+        self._mean[:n] += alpha * delta
+        cov = self._cov[:n, :n]
+        cov += alpha * np.outer(delta, delta)
+        cov *= 1.0 - alpha
+
+        self._series[:n, self._series_slot] = x
+        self._series_slot = (self._series_slot + 1) % self.history_days
+        self._observations[:n] += 1
+        x[:] = 0.0
+
+        self._corr = None
+        self.stats["days_closed"] += 1
+
+    def _correlations(self) -> np.ndarray:
+        """Correlation matrix of all tracked wallets (cached until a day closes)"""
+        if self._corr is None:
+            n = len(self._addresses)
+            cov = self._cov[:n, :n]
+            std = np.sqrt(np.maximum(np.diag(cov), 0.0))
+            usable = (std > 0) & (self._observations[:n] >= self.min_observations)
+            scale = np.where(usable, 1.0 / np.where(usable, std, 1.0), 0.0)
+            corr = cov * scale[:, None]
+            corr *= scale[None, :]
+            np.clip(corr, -1.0, 1.0, out=corr)
+            np.fill_diagonal(corr, 1.0)
+            self._corr = corr
+        return self._corr
+
+    def correlation(self, wallet_a: str, wallet_b: str) -> float:
+        """Correlation of two wallets' daily PnL (0.0 when unknown)"""
+        row_a = self._index.get(normalize_address(wallet_a))
+        row_b = self._index.get(normalize_address(wallet_b))
+        if row_a is None or row_b is None:
+            return 0.0
+        return float(self._correlations()[row_a, row_b])
+
+    def correlation_matrix(self, wallet_addresses: List[str]) -> np.ndarray:
+        """
+        Correlations between the given wallets, in the given order.
+
+        Untracked wallets, and wallets with too little history, have zero
+        correlation with everything else.
+        """
+        rows = [self._index.get(normalize_address(w), -1) for w in wallet_addresses]
+        matrix = np.eye(len(rows))
+        known = [i for i, row in enumerate(rows) if row >= 0]
+        if known:
+            known_rows = [rows[i] for i in known]
+            matrix[np.ix_(known, known)] = self._correlations()[
+                np.ix_(known_rows, known_rows)
+            ]
+            np.fill_diagonal(matrix, 1.0)
+        return matrix
+
+    def top_correlated(
+        self,
+        wallet_address: str,
+        k: int = 10,
+        candidates: Optional[List[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Wallets most positively correlated with ``wallet_address``.
+
+        Args:
+            wallet_address: Wallet to compare against
+            k: Maximum number of wallets to return
+            candidates: Restrict the search to these wallets (default: all)
+
+        Returns:
+            (wallet, correlation) pairs, highest correlation first
+        """
+        row = self._index.get(normalize_address(wallet_address))
+        if row is None or k <= 0:
+            return []
+
+        if candidates is None:
+            rows = np.arange(len(self._addresses))
+        else:
+            rows = np.array(
+                [
+                    r
+                    for r in (self._index.get(normalize_address(c)) for c in candidates)
+                    if r is not None
+                ],
+                dtype=np.int64,
+            )
+        rows = rows[rows != row]
+        if len(rows) == 0:
+            return []
+
+        values = self._correlations()[row, rows]
+        if len(rows) > k:
+            best = np.argpartition(-values, k - 1)[:k]
+        else:
+            best = np.arange(len(rows))
+        best = best[np.argsort(-values[best], kind="stable")]
+        return [(self._addresses[rows[i]], float(values[i])) for i in best]
+
+    def pnl_series(self, wallet_address: str) -> np.ndarray:
+        """Closed daily PnL of a wallet, oldest first (at most history_days)"""
+        row = self._index.get(normalize_address(wallet_address))
+        if row is None:
+            return np.zeros(0)
+        count = min(int(self._observations[row]), self.history_days)
+        columns = (self._series_slot - count + np.arange(count)) % self.history_days
+        return self._series[row, columns]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Engine counters and sizes"""
+        return {
+            **self.stats,
+            "wallets": len(self._addresses),
+            "capacity": len(self._mean),
+            "current_day": self._current_day,
+        }
@@ -3,22 +3,37 @@
 import asyncio
 import logging
 import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from decimal import ROUND_HALF_UP, Decimal, getcontext
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from config.settings import Settings
 
-import re
-
 import aiohttp
 import numpy as np
+from web3 import Web3
 from web3.exceptions import BadFunctionCallOutput, Web3ValidationError
 
+from core.block_cursor_store import BlockCursorStore
+from core.block_source import FALLBACK_SCAN_BLOCKS, Web3BlockSource
+from core.exchange_calldata import (
+    POLYMARKET_EXCHANGE_CONTRACTS,
+    OrderFill,
+    decode_order_fills,
+    decode_transactions,
+    fill_for_wallet,
+    is_order_fill,
+)
 from core.exceptions import APIError, PolygonscanError, RateLimitError
+from core.market_data_cache import MarketDataCache
 from core.market_maker_detector import MarketMakerDetector
+from core.trade_cluster_index import get_trade_cluster_index
+from risk_management.rate_limiter import TokenBucket
 from utils.exception_handler import exception_handler, safe_execute
+from utils.http_client import get_http_client
 from utils.helpers import (
     BoundedCache,
     calculate_confidence_score,
@@ -70,21 +85,30 @@ class BatchTransactionProcessor:
                 )
                 return []
 
-            # Phase 2: Batch confidence scoring
+            # Phase 2: Decode exchange fill calldata
+            decoded_fills = decode_transactions(filtered_txs)
+            filtered_txs = [tx for tx in filtered_txs if tx["hash"] in decoded_fills]
+            if not filtered_txs:
+                return []
+
+            # Phase 3: Batch confidence scoring
             confidence_scores = await self._batch_confidence_scoring(filtered_txs)
 
-            # Phase 3: Parallel trade detection
+            # Phase 4: Parallel trade detection
             trades = await self._parallel_trade_detection(
-                filtered_txs, confidence_scores
+                filtered_txs, confidence_scores, decoded_fills
             )
 
-            # Phase 4: Batch deduplication and processing
+            # Phase 5: Batch deduplication and processing
             unique_trades = self._deduplicate_trades(trades)
             self._batch_stats["trades_detected"] += len(unique_trades)
 
-            # Phase 5: Batch update processed transactions in batch
+            # Phase 6: Batch update processed transactions in batch
             await self._batch_update_processed_transactions(unique_trades)
 
+            # Phase 7: Feed the cross-wallet cluster index
+            await self.monitor.index_trades_for_clusters(unique_trades)
+
             processing_time = time.time() - start_time
             self._batch_stats["total_processed"] += len(transactions)
             self._batch_stats["avg_processing_time"] = (
@@ -156,18 +180,22 @@ class BatchTransactionProcessor:
             if normalize_address(tx.get("to", "")) in polymarket_contract_set
         ]
 
-        # Filter 3: Skip very old transactions
+        # Filter 3: Skip calls that are not order fills (selector lookup)
+        fill_txs = [tx for tx in relevant_txs if is_order_fill(tx.get("input"))]
+
+        # Filter 4: Skip very old transactions
         current_time = int(time.time())
         recent_txs = [
             tx
-            for tx in relevant_txs
+            for tx in fill_txs
             if abs(current_time - int(tx.get("timeStamp", current_time)))
             < 3600  # Last hour
         ]
 
         logger.debug(
             f"🧹 Pre-filtering: {len(transactions)} -> {len(unprocessed_txs)} (unprocessed) "
-            f"-> {len(relevant_txs)} (relevant) -> {len(recent_txs)} (recent)"
+            f"-> {len(relevant_txs)} (relevant) -> {len(fill_txs)} (fills) "
+            f"-> {len(recent_txs)} (recent)"
         )
 
         return recent_txs
@@ -205,38 +233,30 @@ class BatchTransactionProcessor:
         # Input length scoring
         scores += np.where(input_lengths > 100, 0.1, 0)
 
-        # Pattern matching scoring (batch version)
-        pattern_scores = await self._batch_pattern_scoring(transactions)
-        scores += pattern_scores
+        # Exchange fill calls score like a matched trade pattern
+        scores += await self._batch_selector_scoring(transactions)
 
         # Clip to 0.0-1.0 range
         scores = np.clip(scores, 0.0, 1.0)
 
         return {tx["hash"]: float(score) for tx, score in zip(transactions, scores)}
 
-    async def _batch_pattern_scoring(
+    async def _batch_selector_scoring(
         self, transactions: List[Dict[str, Any]]
     ) -> np.ndarray:
-        """Batch pattern matching for trade detection"""
-        pattern_scores = np.zeros(len(transactions))
-
-        # Compile patterns once
-        patterns = [re.compile(p, re.IGNORECASE) for p in self.monitor.trade_patterns]
-
-        # Process in chunks to avoid memory issues
-        chunk_size = 50
-        for i in range(0, len(transactions), chunk_size):
-            chunk = transactions[i : i + chunk_size]
-            chunk_inputs = [tx.get("input", "").lower() for tx in chunk]
-
-            for pattern in patterns:
-                matches = np.array([bool(pattern.search(inp)) for inp in chunk_inputs])
-                pattern_scores[i : i + len(chunk)] += np.where(matches, 0.1, 0)
-
-        return pattern_scores
+        """Score transactions whose selector is an exchange fill function"""
+        is_fill = np.fromiter(
+            (is_order_fill(tx.get("input")) for tx in transactions),
+            dtype=bool,
+            count=len(transactions),
+        )
+        return np.where(is_fill, 0.1, 0.0)
 
     async def _parallel_trade_detection(
-        self, transactions: List[Dict[str, Any]], confidence_scores: Dict[str, float]
+        self,
+        transactions: List[Dict[str, Any]],
+        confidence_scores: Dict[str, float],
+        decoded_fills: Dict[str, List[OrderFill]],
     ) -> List[Dict[str, Any]]:
         """Detect trades in parallel using asyncio.gather"""
         # Prepare tasks
@@ -249,7 +269,9 @@ class BatchTransactionProcessor:
             if confidence_score < self.monitor.settings.monitoring.min_confidence_score:
                 continue
 
-            task = asyncio.create_task(self._detect_single_trade(tx, confidence_score))
+            task = asyncio.create_task(
+                self._detect_single_trade(tx, confidence_score, decoded_fills[tx_hash])
+            )
             tasks.append(task)
 
         # Execute in parallel with rate limiting
@@ -269,7 +291,7 @@ class BatchTransactionProcessor:
         return trades
 
     async def _detect_single_trade(
-        self, tx: Dict[str, Any], confidence_score: float
+        self, tx: Dict[str, Any], confidence_score: float, fills: List[OrderFill]
     ) -> Optional[Dict[str, Any]]:
         """Detect a single trade with confidence score"""
         try:
@@ -283,6 +305,7 @@ class BatchTransactionProcessor:
 
             # Parse trade (optimized version) - use Decimal for monetary values
             value_wei = int(tx.get("value", 0))
+            fill = fill_for_wallet(fills, tx["from"])
             trade = {
                 "tx_hash": tx["hash"],
                 "timestamp": timestamp,
@@ -298,10 +321,12 @@ class BatchTransactionProcessor:
                 "condition_id": self._extract_condition_id(tx),
                 "market_id": self._derive_market_id(tx),
                 "outcome_index": self._extract_outcome_index(tx),
-                "side": self._determine_trade_side_batch(tx),
-                "amount": self._extract_trade_amount_batch(tx),
-                "price": self._extract_trade_price_batch(tx),
-                "token_id": self._extract_token_id(tx),
+                "side": fill.side_for(tx["from"]),
+                "amount": fill.amount,
+                "size": fill.size,
+                "price": fill.price,
+                "token_id": fill.token_id,
+                "exchange_function": fill.function,
                 "confidence_score": confidence_score,
             }
 
@@ -370,34 +395,6 @@ class BatchTransactionProcessor:
         input_data = tx.get("input", "")
         return hash(input_data) % 2  # Simple heuristic
 
-    def _determine_trade_side_batch(self, tx: Dict[str, Any]) -> str:
-        """Determine trade side (BUY/SELL)"""
-        # Simple heuristic based on gas price patterns
-        gas_price = int(tx.get("gasPrice", 0))
-        return "BUY" if gas_price > 50000000000 else "SELL"  # 50 gwei threshold
-
-    def _extract_trade_amount_batch(self, tx: Dict[str, Any]) -> Decimal:
-        """Extract trade amount using Decimal for precision"""
-        value_wei = int(tx.get("value", 0))
-        if value_wei > 0:
-            # Convert wei to USDC (6 decimals) using Decimal
-            return Decimal(value_wei) / Decimal(10**18)
-        else:
-            # Default to 1.0 if no value
-            return Decimal("1.0")
-
-    def _extract_trade_price_batch(self, tx: Dict[str, Any]) -> Decimal:
-        """Extract trade price using Decimal for precision"""
-        # Placeholder - would decode from actual transaction data
-        # Using hash to generate pseudo-random price for demonstration
-        price_value = 0.5 + (hash(tx.get("hash", "")) % 100) / 200
-        return Decimal(str(price_value))
-
-    def _extract_token_id(self, tx: Dict[str, Any]) -> str:
-        """Extract token ID from transaction"""
-        # Placeholder - would decode from actual transaction data
-        return f"token_{hash(tx.get('input', '')) % 10000}"
-
     def get_batch_stats(self) -> Dict[str, Any]:
         """Get batch processing statistics"""
         return self._batch_stats.copy()
@@ -411,6 +408,7 @@ class WalletMonitor:
         settings: "Settings",
         trade_executor: Optional[Any] = None,
         target_wallets: Optional[List[str]] = None,
+        market_data: Optional[MarketDataCache] = None,
     ) -> None:
         """
         Initialize wallet monitor with configuration settings.
@@ -420,10 +418,14 @@ class WalletMonitor:
             trade_executor: Optional trade executor instance
             target_wallets: Optional list of wallet addresses to monitor.
                 If not provided, uses settings.monitoring.target_wallets
+            market_data: Market cache used to map fill token ids to
+                condition ids (default: the trade executor client's cache)
         """
         self.settings = settings
         self.trade_executor = trade_executor
-        self.web3 = None
+        rpc_url = settings.network.polygon_rpc_url
+        self.web3 = Web3(Web3.HTTPProvider(rpc_url)) if rpc_url else None
+        self._block_source = Web3BlockSource(self.web3)
         self.polygonscan_api_key = settings.network.polygonscan_api_key
 
         # Initialize rate-limited clients
@@ -441,6 +443,16 @@ class WalletMonitor:
         # Initialize market maker detector
         self.market_maker_detector = MarketMakerDetector(settings)
 
+        # Cross-wallet trade index shared with the red flag detector
+        self.cluster_index = get_trade_cluster_index()
+        if market_data is None:
+            client_cache = getattr(
+                getattr(trade_executor, "clob_client", None), "market_data", None
+            )
+            if isinstance(client_cache, MarketDataCache):
+                market_data = client_cache
+        self.market_data = market_data
+
         # Transaction processing state - reduced size and 30-minute TTL
         self.processed_transactions = BoundedCache(
             max_size=50000,  # Reduced from 100k to prevent memory bloat
@@ -451,16 +463,32 @@ class WalletMonitor:
         self.last_checked_block = 0
         self.last_monitor_time = 0.0
 
-        # Rate limiting
-        self.api_call_delay = 0.1  # 10 calls per second max for v2 API
-        self.last_api_call = 0
-        self.rate_limit_lock = asyncio.Lock()
+        # Per-wallet incremental block cursors (persisted across restarts)
+        self.block_cursors = BlockCursorStore(
+            Path(settings.monitoring.block_cursor_file),
+            reorg_rewind_blocks=settings.monitoring.reorg_rewind_blocks,
+        )
+        # Highest block covered by each wallet's last successful fetch
+        self._fetch_completed_through: Dict[str, int] = {}
+
+        # Rate limiting - one token bucket shared by every Polygonscan call so
+        # concurrent wallet fetches stay inside a single request budget
+        monitoring_config = settings.monitoring
+        self.api_rate_limiter = TokenBucket(
+            capacity=monitoring_config.api_burst_capacity,
+            refill_rate=monitoring_config.api_rate_limit_per_second,
+        )
+        self.api_call_delay = 1.0 / monitoring_config.api_rate_limit_per_second
+        self.last_api_call = 0.0
+        self.concurrent_fetch_enabled = monitoring_config.concurrent_fetch_enabled
+        self.max_concurrent_fetches = monitoring_config.max_concurrent_fetches
 
-        # Polymarket contract addresses
-        self.polymarket_contracts = [
-            "0x4D97DCc4e5c36A3b0c9072A2F5B3C1b1C1B1B1B1",  # Placeholder - replace with real contracts
-            "0x8c16f85a4d5f8f23d29e9c7e3d4a3a5a6e4f2b2e",  # Polymarket CTF Exchange
-        ]
+        # Per-cycle fetch latency statistics (last 100 cycles)
+        self.cycle_stats_history: deque = deque(maxlen=100)
+        self.last_cycle_stats: Dict[str, Any] = {}
+
+        # Polymarket exchange contracts (CTF and NegRisk)
+        self.polymarket_contracts = list(POLYMARKET_EXCHANGE_CONTRACTS)
 
         # Trade patterns for confidence scoring (regex patterns)
         self.trade_patterns = [
@@ -502,6 +530,45 @@ class WalletMonitor:
             f"Initialized wallet monitor for {len(self.target_wallets)} wallets"
         )
 
+    @property
+    def block_source(self) -> Web3BlockSource:
+        """Off-loop block source bound to the current web3 instance"""
+        if self._block_source.web3 is not self.web3:
+            self._block_source = Web3BlockSource(self.web3)
+        return self._block_source
+
+    async def _get_current_block(self) -> Optional[int]:
+        """
+        Latest block number without blocking the event loop.
+
+        Asks the Web3 provider first and Polygonscan second.
+
+        Returns:
+            Chain head, or None when neither source could provide it
+        """
+        try:
+            if await self.block_source.is_connected():
+                return await self.block_source.get_block_number()
+        except Exception as e:
+            exception_handler.log_exception(
+                e,
+                component="WalletMonitor",
+                operation="get_current_block",
+                include_stack_trace=False,
+            )
+
+        if self.polygonscan_client:
+            try:
+                return await self.polygonscan_client.get_block_number()
+            except Exception as e:
+                exception_handler.log_exception(
+                    e,
+                    component="WalletMonitor",
+                    operation="get_current_block",
+                    include_stack_trace=False,
+                )
+        return None
+
     async def update_target_wallets(
         self,
         new_wallet_addresses: List[str],
@@ -532,6 +599,9 @@ class WalletMonitor:
                 # The cache will rebuild as new transactions are fetched
                 self.transaction_cache.clear()
 
+            # Drop block cursors for wallets that are no longer monitored
+            self.block_cursors.retain(self.target_wallets)
+
             # Update trade history tracking for new wallets
             for wallet in self.target_wallets:
                 if wallet not in self.wallet_trade_history:
@@ -544,14 +614,75 @@ class WalletMonitor:
 
     async def monitor_wallets(self) -> list[dict[str, Any]]:
         """Main monitoring function with batch processing"""
-        self.last_monitor_time = time.time()
-        current_block = (
-            self.web3.eth.block_number
-            if self.web3.is_connected()
-            else self.last_checked_block + 100
-        )
+        cycle = await self.plan_monitoring_cycle()
+        if cycle is None:
+            return []
+        current_block, validated_wallets, block_ranges = cycle
         all_detected_trades = []
 
+        cycle_start = time.time()
+        if not self.polygonscan_client:
+            # Web3 fallback: one pass over the blocks serves every wallet
+            wallet_results, fetch_latencies = await self._fetch_wallets_from_blocks(
+                validated_wallets, block_ranges, current_block
+            )
+        elif self.concurrent_fetch_enabled:
+            wallet_results, fetch_latencies = await self._fetch_wallets_concurrently(
+                validated_wallets, block_ranges
+            )
+        else:
+            wallet_results, fetch_latencies = await self._fetch_wallets_sequentially(
+                validated_wallets, block_ranges
+            )
+        fetch_time = time.time() - cycle_start
+
+        # Process each wallet's transactions
+        batch_processor = BatchTransactionProcessor(self)
+        for wallet in validated_wallets:
+            transactions = wallet_results.get(wallet)
+
+            if not transactions:
+                continue
+
+            # Use batch processor for efficient trade detection
+            trades = await batch_processor.process_transaction_batch(
+                transactions, wallet
+            )
+
+            if trades:
+                logger.info(
+                    f"Detected {len(trades)} trades for {wallet}",
+                    extra={"wallet": wallet, "trade_count": len(trades)},
+                )
+                all_detected_trades.extend(trades)
+
+        await self.complete_monitoring_cycle(
+            validated_wallets,
+            current_block,
+            fetch_latencies,
+            fetch_time,
+            time.time() - cycle_start,
+        )
+
+        return all_detected_trades
+
+    async def plan_monitoring_cycle(
+        self,
+    ) -> Optional[Tuple[int, List[str], Dict[str, Tuple[int, int]]]]:
+        """
+        Validate target wallets and compute each wallet's block range.
+
+        Returns:
+            (current_block, validated_wallets, block_ranges), or None if there
+            is no valid wallet to monitor
+        """
+        self.last_monitor_time = time.time()
+        current_block = await self._get_current_block()
+        if current_block is None:
+            # Never guess the head: cursors would persist blocks never scanned
+            logger.warning("⚠️ Chain head unavailable, skipping monitoring cycle")
+            return None
+
         # Validate wallet addresses before processing
         validated_wallets = []
         for wallet in self.target_wallets:
@@ -564,60 +695,104 @@ class WalletMonitor:
 
         if not validated_wallets:
             logger.warning("⚠️ No valid wallet addresses to monitor")
-            return []
+            return None
+
+        # Each wallet only asks for blocks after its own cursor
+        block_ranges = {
+            wallet: self.block_cursors.get_block_range(wallet, current_block)
+            for wallet in validated_wallets
+        }
+        earliest_block = min(start for start, _ in block_ranges.values())
 
         logger.info(
-            f"🔍 Monitoring {len(validated_wallets)} wallets from block {self.last_checked_block} to {current_block}",
+            f"🔍 Monitoring {len(validated_wallets)} wallets from block {earliest_block} to {current_block}",
             extra={
                 "wallet_count": len(validated_wallets),
-                "start_block": self.last_checked_block,
+                "start_block": earliest_block,
                 "end_block": current_block,
             },
         )
+        return current_block, validated_wallets, block_ranges
 
-        # Process wallets in batches to avoid overwhelming APIs
-        batch_size = 5
-        for i in range(0, len(validated_wallets), batch_size):
-            wallet_batch = validated_wallets[i : i + batch_size]
+    async def iter_wallet_transactions(
+        self,
+        wallets: List[str],
+        block_ranges: Dict[str, Tuple[int, int]],
+        current_block: int,
+    ) -> AsyncIterator[Tuple[str, List[Dict[str, Any]], float]]:
+        """
+        Yield (wallet, transactions, latency) as each wallet's fetch completes.
 
-            # Get transactions for all wallets sequentially to respect rate limits
-            batch_results = {}
-            for wallet in wallet_batch:
-                transactions = await safe_execute(
-                    self.get_wallet_transactions,
-                    wallet,
-                    self.last_checked_block,
-                    current_block,
-                    context={
-                        "wallet": wallet,
-                        "start_block": self.last_checked_block,
-                        "end_block": current_block,
-                    },
-                    component="WalletMonitor",
-                    operation="get_wallet_transactions",
-                    default_return=[],
+        A finished fetch is replaced by the next wallet's, so at most
+        max_concurrent_fetches requests (one in sequential mode) are in flight
+        and a slow consumer holds back new fetches instead of buffering them.
+        The Web3 fallback scans blocks once for all wallets and yields them
+        together.
+        """
+        if not self.polygonscan_client:
+            results, latencies = await self._fetch_wallets_from_blocks(
+                wallets, block_ranges, current_block
+            )
+            # latencies is empty when the block scan failed
+            for wallet, latency in zip(wallets, latencies):
+                yield wallet, results.get(wallet, []), latency
+            return
+
+        window = self.max_concurrent_fetches if self.concurrent_fetch_enabled else 1
+        pending = iter(wallets)
+        in_flight: Dict["asyncio.Task[Tuple[List[Dict[str, Any]], float]]", str] = {}
+
+        def start_next_fetch() -> None:
+            wallet = next(pending, None)
+            if wallet is not None:
+                task = asyncio.create_task(
+                    self._fetch_wallet_timed(wallet, block_ranges[wallet])
                 )
-                batch_results[wallet] = transactions
+                in_flight[task] = wallet
 
-            # Process each wallet's transactions
-            for wallet in wallet_batch:
-                transactions = batch_results[wallet]
+        for _ in range(window):
+            start_next_fetch()
 
-                if not transactions:
-                    continue
-
-                # Use batch processor for efficient trade detection
-                batch_processor = BatchTransactionProcessor(self)
-                trades = await batch_processor.process_transaction_batch(
-                    transactions, wallet
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
                 )
+                for task in done:
+                    wallet = in_flight.pop(task)
+                    start_next_fetch()
+                    try:
+                        transactions, latency = task.result()
+                    except Exception as e:
+                        exception_handler.log_exception(
+                            e,
+                            context={"wallet": wallet},
+                            component="WalletMonitor",
+                            operation="iter_wallet_transactions",
+                            include_stack_trace=False,
+                        )
+                        continue
+                    yield wallet, transactions, latency
+        finally:
+            for task in in_flight:
+                task.cancel()
 
-                if trades:
-                    logger.info(
-                        f"Detected {len(trades)} trades for {wallet}",
-                        extra={"wallet": wallet, "trade_count": len(trades)},
-                    )
-                    all_detected_trades.extend(trades)
+    async def complete_monitoring_cycle(
+        self,
+        wallets: List[str],
+        current_block: int,
+        fetch_latencies: List[float],
+        fetch_time: float,
+        cycle_time: float,
+    ) -> None:
+        """
+        Finish a monitoring cycle once its transactions have been processed.
+
+        Advances block cursors for wallets whose fetch completed, records
+        cycle statistics and runs the periodic market maker analysis.
+        """
+        self._advance_block_cursors(wallets)
+        self._record_cycle_stats(fetch_latencies, fetch_time, cycle_time)
 
         self.last_checked_block = current_block
 
@@ -651,10 +826,193 @@ class WalletMonitor:
                     f"🎯 Market maker analysis complete: {market_makers}/{len(market_maker_analyses)} potential market makers detected"
                 )
 
-        # Clean up processed transactions cache periodically
-        # BoundedCache handles cleanup automatically
+    async def _fetch_wallet_timed(
+        self, wallet: str, block_range: Tuple[int, int]
+    ) -> Tuple[List[Dict[str, Any]], float]:
+        """Fetch one wallet's transactions and measure the round-trip latency"""
+        start_block, end_block = block_range
+        fetch_start = time.time()
+        transactions = await safe_execute(
+            self.get_wallet_transactions,
+            wallet,
+            start_block,
+            end_block,
+            context={
+                "wallet": wallet,
+                "start_block": start_block,
+                "end_block": end_block,
+            },
+            component="WalletMonitor",
+            operation="get_wallet_transactions",
+            default_return=[],
+        )
+        return transactions or [], time.time() - fetch_start
+
+    async def _fetch_wallets_sequentially(
+        self, wallets: List[str], block_ranges: Dict[str, Tuple[int, int]]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[float]]:
+        """Fetch transactions one wallet at a time (legacy mode)"""
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        latencies: List[float] = []
+        for wallet in wallets:
+            transactions, latency = await self._fetch_wallet_timed(
+                wallet, block_ranges[wallet]
+            )
+            results[wallet] = transactions
+            latencies.append(latency)
+        return results, latencies
 
-        return all_detected_trades
+    async def _fetch_wallets_concurrently(
+        self, wallets: List[str], block_ranges: Dict[str, Tuple[int, int]]
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[float]]:
+        """
+        Fetch transactions for all wallets with many requests in flight.
+
+        Concurrency is capped by max_concurrent_fetches while the shared
+        api_rate_limiter token bucket paces the actual API calls, so cycle
+        time is bounded by the API rate limit rather than by wallet count.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+        async def fetch(wallet: str) -> Tuple[List[Dict[str, Any]], float]:
+            async with semaphore:
+                return await self._fetch_wallet_timed(wallet, block_ranges[wallet])
+
+        outcomes = await asyncio.gather(
+            *(fetch(wallet) for wallet in wallets), return_exceptions=True
+        )
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        latencies: List[float] = []
+        for wallet, outcome in zip(wallets, outcomes):
+            if isinstance(outcome, BaseException):
+                exception_handler.log_exception(
+                    outcome,
+                    context={"wallet": wallet},
+                    component="WalletMonitor",
+                    operation="fetch_wallets_concurrently",
+                    include_stack_trace=False,
+                )
+                results[wallet] = []
+                continue
+            transactions, latency = outcome
+            results[wallet] = transactions
+            latencies.append(latency)
+        return results, latencies
+
+    async def _fetch_wallets_from_blocks(
+        self,
+        wallets: List[str],
+        block_ranges: Dict[str, Tuple[int, int]],
+        current_block: int,
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[float]]:
+        """
+        Fetch transactions for all wallets from raw blocks in one pass.
+
+        Each block in the union of the wallets' ranges (limited to the most
+        recent FALLBACK_SCAN_BLOCKS) is fetched once, off the event loop, and
+        its transactions are handed to wallets through a sender index. When
+        a block cannot be fetched, wallets only get (and are only marked as
+        scanned through) the blocks before it, so it is retried next cycle.
+        """
+        fetch_start = time.time()
+        scan_start = max(0, current_block - FALLBACK_SCAN_BLOCKS)
+        earliest_block = max(scan_start, min(start for start, _ in block_ranges.values()))
+
+        try:
+            if not await self.block_source.is_connected():
+                logger.error("Not connected to Web3 provider")
+                return {wallet: [] for wallet in wallets}, []
+
+            by_sender, failed_blocks = await self.block_source.get_transactions_by_sender(
+                earliest_block, current_block, wallets
+            )
+        except (ConnectionError, TimeoutError, asyncio.TimeoutError) as e:
+            exception_handler.log_exception(
+                e,
+                context={"start_block": earliest_block, "end_block": current_block},
+                component="WalletMonitor",
+                operation="fetch_wallets_from_blocks",
+                include_stack_trace=False,
+            )
+            return {wallet: [] for wallet in wallets}, []
+
+        if failed_blocks:
+            logger.warning(
+                f"⚠️ {len(failed_blocks)} blocks could not be fetched "
+                f"(first {failed_blocks[0]}); cursors stop before it"
+            )
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for wallet in wallets:
+            start_block, end_block = block_ranges[wallet]
+            start_block = max(start_block, scan_start)
+            end_block = self._last_contiguous_block(end_block, failed_blocks)
+            results[wallet] = [
+                tx
+                for tx in by_sender.get(normalize_address(wallet), [])
+                if start_block <= tx["blockNumber"] <= end_block
+            ]
+            self._mark_fetch_completed(wallet, end_block)
+
+        fetch_latency = time.time() - fetch_start
+        logger.debug(
+            f"Basic monitoring scanned {current_block - earliest_block + 1} blocks "
+            f"for {len(wallets)} wallets in {fetch_latency:.3f}s"
+        )
+        return results, [fetch_latency] * len(wallets)
+
+    @staticmethod
+    def _last_contiguous_block(end_block: int, failed_blocks: List[int]) -> int:
+        """Last block up to end_block that precedes the first failed block"""
+        if failed_blocks and failed_blocks[0] <= end_block:
+            return failed_blocks[0] - 1
+        return end_block
+
+    def _advance_block_cursors(self, wallets: List[str]) -> None:
+        """Advance cursors for wallets whose fetch completed, then persist them"""
+        for wallet in wallets:
+            completed_through = self._fetch_completed_through.pop(
+                normalize_address(wallet), None
+            )
+            if completed_through is not None:
+                self.block_cursors.advance(wallet, completed_through)
+        self.block_cursors.save()
+
+    def _mark_fetch_completed(self, wallet_address: str, end_block: int) -> None:
+        """Record that a wallet's transactions were fetched through end_block"""
+        self._fetch_completed_through[normalize_address(wallet_address)] = end_block
+
+    def _record_cycle_stats(
+        self, latencies: List[float], fetch_time: float, cycle_time: float
+    ) -> None:
+        """Record fetch latency percentiles for the completed monitoring cycle"""
+        if latencies:
+            latency_array = np.asarray(latencies, dtype=float)
+            p50, p95, p99 = np.percentile(latency_array, [50, 95, 99])
+            max_latency = float(latency_array.max())
+        else:
+            p50 = p95 = p99 = max_latency = 0.0
+
+        stats = {
+            "timestamp": time.time(),
+            "mode": "concurrent" if self.concurrent_fetch_enabled else "sequential",
+            "wallets_fetched": len(latencies),
+            "fetch_time": fetch_time,
+            "cycle_time": cycle_time,
+            "latency_p50": float(p50),
+            "latency_p95": float(p95),
+            "latency_p99": float(p99),
+            "latency_max": max_latency,
+        }
+        self.last_cycle_stats = stats
+        self.cycle_stats_history.append(stats)
+
+        logger.debug(
+            f"⏱️ Fetched {stats['wallets_fetched']} wallets in {fetch_time:.2f}s "
+            f"({stats['mode']}) - latency p50={stats['latency_p50']:.3f}s "
+            f"p95={stats['latency_p95']:.3f}s p99={stats['latency_p99']:.3f}s"
+        )
 
     async def _monitor_single_wallet(self, wallet_address: str) -> List[Dict[str, Any]]:
         """Monitor a single wallet for trades with performance optimizations"""
@@ -754,25 +1112,23 @@ class WalletMonitor:
             if cached_data is not None:
                 # cache_hits tracked internally by BoundedCache
                 logger.debug(f"Cache hit for {validated_wallet}")
+                if end_block is not None:
+                    self._mark_fetch_completed(validated_wallet, end_block)
                 return cached_data
 
             # Rate limiting with performance tracking
             call_start = time.time()
-            async with self.rate_limit_lock:
-                time_since_last = now - self.last_api_call
-                if time_since_last < self.api_call_delay:
-                    sleep_time = self.api_call_delay - time_since_last
-                    await asyncio.sleep(sleep_time)
-                self.last_api_call = time.time()
+            await self._apply_transaction_rate_limiting()
 
             # Optimize block range queries for performance
             start_block = start_block or max(0, self.last_checked_block - 1000)
-            current_block = (
-                self.web3.eth.block_number
-                if self.web3 and self.web3.is_connected()
-                else start_block + 100
-            )
-            end_block = end_block or current_block
+            if end_block is None:
+                end_block = await self._get_current_block()
+                if end_block is None:
+                    logger.warning(
+                        f"⚠️ Chain head unavailable, not fetching {validated_wallet}"
+                    )
+                    return []
 
             # Prevent excessive block ranges (performance optimization)
             max_blocks = 2000  # Limit to 2000 blocks per call to prevent timeouts
@@ -799,79 +1155,81 @@ class WalletMonitor:
                 # API key moved to headers for v2
             }
 
-            # Use optimized HTTP client settings for better performance
-            connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
-            timeout = aiohttp.ClientTimeout(total=15, connect=5)
+            # Reuse the shared keep-alive connection pool
+            session = await get_http_client().get_session()
+            async with session.get(url, params=params, headers=headers) as response:
+                call_time = time.time() - call_start
+                self.api_call_times.set(str(now), call_time)
 
-            async with aiohttp.ClientSession(
-                connector=connector, timeout=timeout
-            ) as session:
-                async with session.get(url, params=params, headers=headers) as response:
-                    call_time = time.time() - call_start
-                    self.api_call_times.set(str(now), call_time)
+                if response.status == 200:
+                    data = await response.json()
 
-                    if response.status == 200:
-                        data = await response.json()
+                    # Validate API response structure
+                    InputValidator.validate_api_response(data, dict)
 
-                        # Validate API response structure
-                        InputValidator.validate_api_response(data, dict)
+                    # Handle both v1 and v2 API response formats
+                    if (
+                        data.get("status") == "1" and data.get("message") == "OK"
+                    ) or data.get("status") == "success":
+                        transactions = data.get("result", [])
 
-                        # Handle both v1 and v2 API response formats
+                        # Handle different response structures
                         if (
-                            data.get("status") == "1" and data.get("message") == "OK"
-                        ) or data.get("status") == "success":
-                            transactions = data.get("result", [])
-
-                            # Handle different response structures
-                            if (
-                                isinstance(transactions, dict)
-                                and "transactions" in transactions
-                            ):
-                                transactions = transactions["transactions"]
-
-                            if not isinstance(transactions, list):
-                                logger.warning(
-                                    f"Unexpected transaction data format for {validated_wallet}: {type(transactions)}"
-                                )
-                                return []
-
-                            # Limit transactions for performance
-                            if len(transactions) > max_transactions:
-                                transactions = transactions[:max_transactions]
-                                logger.debug(
-                                    f"Limited transactions to {max_transactions} for performance"
-                                )
-
-                            # Cache successful results
-                            self.transaction_cache.set(cache_key, transactions.copy())
-                            # cache_misses tracked internally by BoundedCache
+                            isinstance(transactions, dict)
+                            and "transactions" in transactions
+                        ):
+                            transactions = transactions["transactions"]
 
-                            logger.debug(
-                                f"Retrieved {len(transactions)} transactions for {validated_wallet} in {call_time:.3f}s"
-                            )
-                            return transactions
-                        else:
-                            error_msg = data.get(
-                                "message", data.get("error", "Unknown error")
-                            )
+                        if not isinstance(transactions, list):
                             logger.warning(
-                                f"Polygonscan v2 API error for {validated_wallet}: {error_msg} (status: {data.get('status')})"
+                                f"Unexpected transaction data format for {validated_wallet}: {type(transactions)}"
                             )
                             return []
-                    else:
-                        # Try to get error details from response
-                        try:
-                            error_data = await response.json()
-                            error_msg = error_data.get(
-                                "message", f"HTTP {response.status}"
+
+                        # Limit transactions for performance
+                        if len(transactions) > max_transactions:
+                            transactions = transactions[:max_transactions]
+                            logger.debug(
+                                f"Limited transactions to {max_transactions} for performance"
                             )
-                        except (ValueError, aiohttp.ContentTypeError):
-                            error_msg = f"HTTP {response.status}"
 
-                        logger.error(
-                            f"Polygonscan v2 API returned status {response.status} for {validated_wallet}: {error_msg}"
+                        # Cache successful results
+                        self.transaction_cache.set(cache_key, transactions.copy())
+                        # cache_misses tracked internally by BoundedCache
+                        self._mark_fetch_completed(validated_wallet, end_block)
+
+                        logger.debug(
+                            f"Retrieved {len(transactions)} transactions for {validated_wallet} in {call_time:.3f}s"
                         )
+                        return transactions
+                    elif str(data.get("message", "")).startswith(
+                        "No transactions found"
+                    ):
+                        # Empty result is a successful fetch for cursor purposes
+                        self._mark_fetch_completed(validated_wallet, end_block)
                         return []
+                    else:
+                        error_msg = data.get(
+                            "message", data.get("error", "Unknown error")
+                        )
+                        logger.warning(
+                            f"Polygonscan v2 API error for {validated_wallet}: {error_msg} (status: {data.get('status')})"
+                        )
+                        return []
+                else:
+                    # Try to get error details from response
+                    try:
+                        error_data = await response.json()
+                        error_msg = error_data.get(
+                            "message", f"HTTP {response.status}"
+                        )
+                    except (ValueError, aiohttp.ContentTypeError):
+                        error_msg = f"HTTP {response.status}"
+
+                    logger.error(
+                        f"Polygonscan v2 API returned status {response.status} for {validated_wallet}: {error_msg}"
+                    )
+                    return []
 
         except asyncio.TimeoutError as e:
             return await exception_handler.handle_exception(
@@ -955,25 +1313,20 @@ class WalletMonitor:
 
     async def _apply_transaction_rate_limiting(self) -> None:
         """Apply rate limiting before making API calls"""
-        async with self.rate_limit_lock:
-            now = time.time()
-            time_since_last = now - self.last_api_call
-            if time_since_last < self.api_call_delay:
-                sleep_time = self.api_call_delay - time_since_last
-                await asyncio.sleep(sleep_time)
-            self.last_api_call = time.time()
+        wait_time = await self.api_rate_limiter.reserve(1)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        self.last_api_call = time.time()
 
     async def _optimize_transaction_block_range(
         self, wallet_address: str, start_block: Optional[int], end_block: Optional[int]
-    ) -> Tuple[int, int]:
-        """Optimize block range for transaction queries"""
+    ) -> Optional[Tuple[int, int]]:
+        """Optimize block range for transaction queries (None if the head is unknown)"""
         start_block = start_block or max(0, self.last_checked_block - 1000)
-        current_block = (
-            self.web3.eth.block_number
-            if self.web3 and self.web3.is_connected()
-            else start_block + 100
-        )
-        end_block = end_block or current_block
+        if end_block is None:
+            end_block = await self._get_current_block()
+            if end_block is None:
+                return None
 
         # Prevent excessive block ranges
         max_blocks = 2000
@@ -992,58 +1345,31 @@ class WalletMonitor:
     ) -> List[Dict[str, Any]]:
         """Fallback method to get transactions using web3.py"""
         try:
-            if not self.web3 or not self.web3.is_connected():
+            if not await self.block_source.is_connected():
                 logger.error("Not connected to Web3 provider")
                 return []
 
-            start_block = start_block or max(0, self.web3.eth.block_number - 100)
-            current_block = self.web3.eth.block_number
-
-            transactions = []
-
-            # Limit block range for performance (only check recent blocks)
-            for block_num in range(
-                max(start_block, current_block - 50), current_block + 1
-            ):
-                try:
-                    block = self.web3.eth.get_block(block_num, full_transactions=True)
-                    for tx in block.transactions:
-                        if hasattr(tx, "from") and normalize_address(
-                            tx["from"]
-                        ) == normalize_address(wallet_address):
-                            tx_dict = dict(tx)
-                            tx_dict["blockNumber"] = block_num
-                            tx_dict["timeStamp"] = block.timestamp
-                            tx_dict["hash"] = tx.hash.hex()
-                            transactions.append(tx_dict)
-                except (
-                    Web3ValidationError,
-                    BadFunctionCallOutput,
-                    ValueError,
-                    TypeError,
-                    KeyError,
-                ) as e:
-                    exception_handler.log_exception(
-                        e,
-                        context={"block_num": block_num, "wallet": wallet_address},
-                        component="WalletMonitor",
-                        operation="process_block",
-                        include_stack_trace=False,
-                    )
-                    continue
-                except Exception as e:
-                    exception_handler.log_exception(
-                        e,
-                        context={"block_num": block_num, "wallet": wallet_address},
-                        component="WalletMonitor",
-                        operation="process_block",
-                        include_stack_trace=False,
-                    )
-                    continue
+            current_block = await self.block_source.get_block_number()
+            start_block = start_block or max(0, current_block - 100)
+
+            # Limit block range for performance (only check recent blocks).
+            # Blocks are fetched off the event loop and cached, so other
+            # wallets scanning the same range reuse them.
+            scan_start = max(start_block, current_block - FALLBACK_SCAN_BLOCKS)
+            by_sender, failed_blocks = await self.block_source.get_transactions_by_sender(
+                scan_start, current_block, [wallet_address]
+            )
+            end_block = self._last_contiguous_block(current_block, failed_blocks)
+            transactions = [
+                tx
+                for tx in by_sender[normalize_address(wallet_address)]
+                if tx["blockNumber"] <= end_block
+            ]
 
             logger.info(
                 f"Basic monitoring found {len(transactions)} transactions for {wallet_address}"
             )
+            self._mark_fetch_completed(wallet_address, end_block)
             return transactions
 
         except (
@@ -1146,6 +1472,44 @@ class WalletMonitor:
 
         return polymarket_trades
 
+    async def index_trades_for_clusters(self, trades: List[Dict[str, Any]]) -> None:
+        """
+        Add detected trades to the cross-wallet cluster index.
+
+        The index is keyed by condition id, like the red flag detector's
+        trades, so each fill's outcome token is mapped to its market first.
+        Trades whose market cannot be resolved are left out.
+        """
+        trades = [t for t in trades if t.get("token_id")]
+        if not trades or self.market_data is None:
+            return
+
+        condition_ids = await asyncio.gather(
+            *(self.market_data.get_condition_id(t["token_id"]) for t in trades)
+        )
+        for trade, condition_id in zip(trades, condition_ids):
+            if not condition_id:
+                logger.debug(
+                    f"No market for token {str(trade['token_id'])[-8:]}; "
+                    f"trade {trade['tx_hash'][:10]} not indexed for clusters"
+                )
+                continue
+            cluster = self.cluster_index.add_trade(
+                trade["wallet_address"],
+                condition_id,
+                trade["side"],
+                trade["timestamp"],
+                trade["amount"],
+                trade_id=trade["tx_hash"],
+            )
+            if cluster is not None:
+                logger.warning(
+                    f"Cluster trading: {cluster.wallet_count} wallets {cluster.side} "
+                    f"condition {cluster.condition_id[-8:]} within "
+                    f"{cluster.duration_seconds:.0f}s "
+                    f"(latest {mask_wallet_address(trade['wallet_address'])})"
+                )
+
     def _cleanup_processed_transactions(self) -> None:
         """Clean up old processed transactions to prevent memory exhaustion"""
         # BoundedCache handles cleanup automatically - this method is kept for compatibility
@@ -1169,7 +1533,12 @@ class WalletMonitor:
             if confidence_score < self.settings.monitoring.min_confidence_score:
                 return None
 
-            # Basic trade structure - this would need actual ABI decoding in production
+            # Decode the exchange fill; any other call is not a trade
+            fills = decode_order_fills(tx.get("input"))
+            if not fills:
+                return None
+            fill = fill_for_wallet(fills, tx["from"])
+
             # Use Decimal for monetary values
             value_wei = int(tx.get("value", 0)) if tx.get("value") else 0
             trade = {
@@ -1189,12 +1558,12 @@ class WalletMonitor:
                 "condition_id": tx.get("to", ""),  # Placeholder
                 "market_id": "unknown",  # Placeholder
                 "outcome_index": 0,  # Placeholder
-                "side": "BUY",  # Placeholder
-                "amount": float(Decimal(value_wei) / Decimal(10**18))
-                if value_wei > 0
-                else 0.0,
-                "price": 0.5,  # Placeholder
-                "token_id": "unknown",  # Placeholder
+                "side": fill.side_for(tx["from"]),
+                "amount": float(fill.amount),
+                "size": float(fill.size),
+                "price": float(fill.price),
+                "token_id": fill.token_id,
+                "exchange_function": fill.function,
             }
 
             return trade
@@ -1266,7 +1635,6 @@ class WalletMonitor:
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics for monitoring"""
-        self.cache_hits + self.cache_misses
         avg_call_time = (
             # BoundedCache handles timing stats internally
             0.1  # Default average call time
@@ -1298,6 +1666,9 @@ class WalletMonitor:
             ],
             "total_api_calls": self.api_call_times.get_stats()["size"],
             "batch_processing_stats": batch_stats,
+            "last_cycle_stats": dict(self.last_cycle_stats),
+            "http_client_stats": get_http_client().get_stats(),
+            "block_cursor_stats": self.block_cursors.get_stats(),
         }
 
     def _should_run_market_maker_analysis(self) -> bool:
@@ -34,7 +34,8 @@ from loguru import logger
 
 from config.scanner_config import ScannerConfig
 from core.circuit_breaker import CircuitBreaker
-from utils.helpers import BoundedCache
+from core.wallet_scoring_kernel import TradeBatch, compute_wallet_metrics, pack_trades
+from utils.bounded_cache import BoundedCache
 from utils.logger import get_logger
 from utils.validation import InputValidator, ValidationError
 
@@ -198,6 +199,9 @@ class WalletQualityScorer:
     VOLATILITY_WINDOW = 864000  # 10 days
     RECOVERY_WINDOW = 604800  # 7 days
 
+    # Batch scoring
+    BATCH_MAX_TRADES = 250_000  # Trades per vectorized kernel call
+
     def __init__(
         self,
         config: ScannerConfig,
@@ -307,47 +311,14 @@ class WalletQualityScorer:
             is_market_maker = self._detect_market_maker_advanced(history, risk_metrics)
             red_flags = self._detect_red_flags(history, risk_metrics, domain_expertise)
 
-            # Calculate component scores
-            performance_score = self._calculate_performance_score(history, risk_metrics)
-            risk_score = self._calculate_risk_score(risk_metrics, red_flags)
-            consistency_score = self._calculate_consistency_score(history, risk_metrics)
-            domain_score = self._calculate_domain_score(domain_expertise)
-
-            # Calculate total score
-            total_score = self._calculate_total_score(
-                performance_score=performance_score,
-                risk_score=risk_score,
-                consistency_score=consistency_score,
-                domain_score=domain_score,
-                red_flags=red_flags,
-            )
-
-            # Determine quality tier
-            quality_tier = self._determine_quality_tier(total_score)
-
-            # Calculate confidence score
-            confidence_score = self._calculate_confidence_score(
-                history, risk_metrics, total_score, domain_expertise
-            )
-
-            # Build comprehensive score
-            quality_score = QualityScore(
-                wallet_address=wallet_address,
-                quality_tier=quality_tier,
-                total_score=total_score,
-                performance_score=performance_score,
-                risk_score=risk_score,
-                consistency_score=consistency_score,
-                domain_expertise=domain_expertise,
-                risk_metrics=risk_metrics,
-                is_market_maker=is_market_maker,
-                red_flags=red_flags,
-                confidence_score=confidence_score,
-                last_updated=time.time(),
-                metadata={
-                    "trades_analyzed": history.total_trades,
-                    "calculation_timestamp": datetime.now(timezone.utc).isoformat(),
-                },
+            quality_score = self._compose_quality_score(
+                wallet_address,
+                history,
+                self._history_time_span(history),
+                risk_metrics,
+                domain_expertise,
+                is_market_maker,
+                red_flags,
             )
 
             # Store in cache
@@ -355,15 +326,11 @@ class WalletQualityScorer:
             self._history_cache.set(f"history_{wallet_address}", history)
 
             # Update metrics
-            self._total_scores += 1
-            if is_market_maker:
-                self._mm_detections += 1
-            if red_flags:
-                self._red_flag_detections += len(red_flags)
+            self._record_score(quality_score)
 
             logger.info(
                 f"✅ Scored wallet {wallet_address[-6:]}: "
-                f"{quality_tier.value} ({total_score:.2f}/10), "
+                f"{quality_score.quality_tier.value} ({quality_score.total_score:.2f}/10), "
                 f"Profit Factor: {risk_metrics.profit_factor:.2f}, "
                 f"Max Drawdown: {risk_metrics.max_drawdown:.1%}, "
                 f"Win Rate: {risk_metrics.win_rate:.1%} "
@@ -390,6 +357,76 @@ class WalletQualityScorer:
             )
             return None
 
+    def _compose_quality_score(
+        self,
+        wallet_address: str,
+        history: TradingHistory,
+        time_span: Optional[float],
+        risk_metrics: RiskMetrics,
+        domain_expertise: DomainExpertiseMetrics,
+        is_market_maker: bool,
+        red_flags: List[Tuple[RedFlagType, str]],
+    ) -> QualityScore:
+        """Combine wallet metrics into component scores, tier and confidence"""
+        # Calculate component scores
+        performance_score = self._calculate_performance_score(history, risk_metrics)
+        risk_score = self._calculate_risk_score(risk_metrics, red_flags)
+        consistency_score = self._calculate_consistency_score(
+            history.total_trades, time_span, risk_metrics
+        )
+        domain_score = self._calculate_domain_score(domain_expertise)
+
+        # Calculate total score
+        total_score = self._calculate_total_score(
+            performance_score=performance_score,
+            risk_score=risk_score,
+            consistency_score=consistency_score,
+            domain_score=domain_score,
+            red_flags=red_flags,
+        )
+
+        # Determine quality tier
+        quality_tier = self._determine_quality_tier(total_score)
+
+        # Calculate confidence score
+        confidence_score = self._calculate_confidence_score(
+            history.total_trades, time_span, risk_metrics, total_score, domain_expertise
+        )
+
+        # Build comprehensive score
+        return QualityScore(
+            wallet_address=wallet_address,
+            quality_tier=quality_tier,
+            total_score=total_score,
+            performance_score=performance_score,
+            risk_score=risk_score,
+            consistency_score=consistency_score,
+            domain_expertise=domain_expertise,
+            risk_metrics=risk_metrics,
+            is_market_maker=is_market_maker,
+            red_flags=red_flags,
+            confidence_score=confidence_score,
+            last_updated=time.time(),
+            metadata={
+                "trades_analyzed": history.total_trades,
+                "calculation_timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+
+    def _record_score(self, quality_score: QualityScore) -> None:
+        """Update scoring counters for a newly computed score"""
+        self._total_scores += 1
+        if quality_score.is_market_maker:
+            self._mm_detections += 1
+        if quality_score.red_flags:
+            self._red_flag_detections += len(quality_score.red_flags)
+
+    def _history_time_span(self, history: TradingHistory) -> Optional[float]:
+        """Seconds between first and last trade, or None with fewer than two"""
+        if len(history.timestamps) >= 2:
+            return max(history.timestamps) - min(history.timestamps)
+        return None
+
     def _build_trading_history(
         self, wallet_address: str, wallet_data: Dict[str, Any]
     ) -> TradingHistory:
@@ -841,12 +878,29 @@ class WalletQualityScorer:
             else:
                 avg_hold_time = 3600
 
+            return self._is_market_maker(
+                history.wallet_address, history.total_trades, avg_hold_time, risk_metrics
+            )
+
+        except Exception as e:
+            logger.exception(f"Error detecting market maker: {e}")
+            return False
+
+    def _is_market_maker(
+        self,
+        wallet_address: str,
+        total_trades: int,
+        avg_hold_time: float,
+        risk_metrics: RiskMetrics,
+    ) -> bool:
+        """Apply the market maker criteria to a wallet's summary figures"""
+        try:
             # Check win rate range
             win_rate = risk_metrics.win_rate
             in_mm_range = self.MM_WIN_RATE_MIN <= win_rate <= self.MM_WIN_RATE_MAX
 
             # Calculate profit per trade (approximate)
-            if history.total_trades > 0:
+            if total_trades > 0:
                 profit_per_trade = float(
                     risk_metrics.profit_factor * 0.01
                 )  # Approximate 1% baseline
@@ -855,7 +909,7 @@ class WalletQualityScorer:
 
             # Market maker detection (ALL criteria must be true)
             is_mm = (
-                history.total_trades > self.MM_TRADE_COUNT_THRESHOLD  # High frequency
+                total_trades > self.MM_TRADE_COUNT_THRESHOLD  # High frequency
                 and avg_hold_time < self.MM_AVG_HOLD_TIME_THRESHOLD  # Low hold time
                 and in_mm_range  # Break-even win rate
                 and profit_per_trade
@@ -864,8 +918,8 @@ class WalletQualityScorer:
 
             if is_mm:
                 logger.info(
-                    f"🚨 MARKET MAKER DETECTED: {history.wallet_address[-6:]} "
-                    f"(trades={history.total_trades}, "
+                    f"🚨 MARKET MAKER DETECTED: {wallet_address[-6:]} "
+                    f"(trades={total_trades}, "
                     f"hold_time={avg_hold_time:.0f}s, "
                     f"win_rate={win_rate:.1%}, "
                     f"profit_per_trade={profit_per_trade:.2%})"
@@ -884,15 +938,36 @@ class WalletQualityScorer:
         domain_expertise: DomainExpertiseMetrics,
     ) -> List[Tuple[RedFlagType, str]]:
         """Detect red flags for wallet exclusion"""
+        try:
+            return self._red_flags_for(
+                total_trades=history.total_trades,
+                wallet_age_days=self._calculate_wallet_age_days(history),
+                max_position_size=(
+                    max(history.position_sizes) if history.position_sizes else 0
+                ),
+                num_categories=(
+                    len(set(history.categories)) if history.categories else 1
+                ),
+                risk_metrics=risk_metrics,
+            )
+
+        except Exception as e:
+            logger.exception(f"Error detecting red flags: {e}")
+            return []
+
+    def _red_flags_for(
+        self,
+        total_trades: int,
+        wallet_age_days: int,
+        max_position_size: float,
+        num_categories: int,
+        risk_metrics: RiskMetrics,
+    ) -> List[Tuple[RedFlagType, str]]:
+        """Apply the red flag rules to a wallet's summary figures"""
         red_flags = []
 
         try:
             # 1. NEW_WALLET_LARGE_BET
-            wallet_age_days = self._calculate_wallet_age_days(history)
-            max_position_size = (
-                max(history.position_sizes) if history.position_sizes else 0
-            )
-
             if wallet_age_days < self.NEW_WALLET_MAX_DAYS and max_position_size > float(
                 self.NEW_WALLET_MAX_BET
             ):
@@ -906,12 +981,12 @@ class WalletQualityScorer:
             # 2. LUCK_NOT_SKILL
             if (
                 risk_metrics.win_rate > self.LUCK_WIN_RATE_THRESHOLD
-                and history.total_trades < self.LUCK_MIN_TRADES
+                and total_trades < self.LUCK_MIN_TRADES
             ):
                 red_flags.append(
                     (
                         RedFlagType.LUCK_NOT_SKILL,
-                        f"Extreme win rate ({risk_metrics.win_rate:.1%}) with low trade count ({history.total_trades})",
+                        f"Extreme win rate ({risk_metrics.win_rate:.1%}) with low trade count ({total_trades})",
                     )
                 )
 
@@ -925,7 +1000,6 @@ class WalletQualityScorer:
                 )
 
             # 4. NO_SPECIALIZATION
-            num_categories = len(set(history.categories)) if history.categories else 1
             if num_categories > self.MAX_CATEGORIES_THRESHOLD:
                 red_flags.append(
                     (
@@ -945,13 +1019,13 @@ class WalletQualityScorer:
 
             # 6. LOW_WIN_RATE
             if (
-                history.total_trades >= self.MIN_TRADES_FOR_STATS
+                total_trades >= self.MIN_TRADES_FOR_STATS
                 and risk_metrics.win_rate < self.MIN_WIN_RATE_THRESHOLD
             ):
                 red_flags.append(
                     (
                         RedFlagType.LOW_WIN_RATE,
-                        f"Low win rate ({risk_metrics.win_rate:.1%}) with {history.total_trades} trades",
+                        f"Low win rate ({risk_metrics.win_rate:.1%}) with {total_trades} trades",
                     )
                 )
 
@@ -964,11 +1038,14 @@ class WalletQualityScorer:
     def _calculate_wallet_age_days(self, history: TradingHistory) -> int:
         """Calculate wallet age in days from first trade timestamp"""
         if history.timestamps:
-            first_trade = min(history.timestamps)
-            age_seconds = time.time() - first_trade
-            return int(age_seconds / 86400)
+            return self._wallet_age_days(min(history.timestamps))
         return 0
 
+    def _wallet_age_days(self, first_trade: float) -> int:
+        """Whole days since the first trade"""
+        age_seconds = time.time() - first_trade
+        return int(age_seconds / 86400)
+
     def _calculate_performance_score(
         self, history: TradingHistory, risk_metrics: RiskMetrics
     ) -> float:
@@ -1064,7 +1141,7 @@ class WalletQualityScorer:
             return 0.0
 
     def _calculate_consistency_score(
-        self, history: TradingHistory, risk_metrics: RiskMetrics
+        self, total_trades: int, time_span: Optional[float], risk_metrics: RiskMetrics
     ) -> float:
         """Calculate consistency score (0.0 to 10.0)"""
         try:
@@ -1078,12 +1155,10 @@ class WalletQualityScorer:
             )  # Normalize: 0.1 std = 8.0 score
 
             # Trade count score (more trades = more consistency)
-            trade_count = history.total_trades
-            tc_score = min(trade_count / 50.0 * 10.0, 10.0)
+            tc_score = min(total_trades / 50.0 * 10.0, 10.0)
 
             # Time span score (consistent activity over time)
-            if len(history.timestamps) >= 2:
-                time_span = max(history.timestamps) - min(history.timestamps)
+            if time_span is not None:
                 time_span_days = time_span / 86400
                 ts_score = min(time_span_days / 180.0 * 10.0, 10.0)
             else:
@@ -1200,7 +1275,8 @@ class WalletQualityScorer:
 
     def _calculate_confidence_score(
         self,
-        history: TradingHistory,
+        total_trades: int,
+        time_span: Optional[float],
         risk_metrics: RiskMetrics,
         total_score: float,
         domain_expertise: DomainExpertiseMetrics,
@@ -1211,11 +1287,10 @@ class WalletQualityScorer:
             base_confidence = total_score / 10.0
 
             # Data completeness bonus (more data = higher confidence)
-            data_bonus = min(history.total_trades / 100.0 * 0.2, 0.2)  # Max 0.2 bonus
+            data_bonus = min(total_trades / 100.0 * 0.2, 0.2)  # Max 0.2 bonus
 
             # Time span bonus (longer history = higher confidence)
-            if len(history.timestamps) >= 2:
-                time_span = max(history.timestamps) - min(history.timestamps)
+            if time_span is not None:
                 time_span_days = time_span / 86400
                 time_bonus = min(time_span_days / 90.0 * 0.15, 0.15)  # Max 0.15 bonus
             else:
@@ -1363,20 +1438,197 @@ class WalletQualityScorer:
             return False
 
     async def batch_score_wallets(
-        self, wallets_data: List[Dict[str, Any]]
+        self, wallets_data: List[Dict[str, Any]], use_cache: bool = True
     ) -> List[QualityScore]:
-        """Score multiple wallets in parallel (with rate limiting)"""
-        async with self._rate_limiter:  # Limit to 10 concurrent calls
-            tasks = [
-                self.score_wallet(wallet_data.get("address", ""), wallet_data)
-                for wallet_data in wallets_data
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Filter out None results (errors)
-        valid_results = [r for r in results if r is not None]
-
-        return valid_results
+        """
+        Score multiple wallets with the vectorized batch kernel.
+
+        Produces the same QualityScore objects as score_wallet (cached and
+        counted the same way), but the trade-level metrics of every wallet
+        are computed together in NumPy passes instead of per-trade loops.
+
+        Args:
+            wallets_data: Wallet dicts with ``address`` and ``trades``
+            use_cache: Whether to reuse cached scores (default: True)
+
+        Returns:
+            Scores in input order; wallets that fail validation are omitted
+        """
+        scores: Dict[int, QualityScore] = {}
+        pending: List[Tuple[int, str, Dict[str, Any]]] = []
+
+        for position, wallet_data in enumerate(wallets_data):
+            wallet_address = wallet_data.get("address", "")
+            try:
+                validated_address = InputValidator.validate_wallet_address(
+                    wallet_address
+                )
+            except ValidationError as e:
+                logger.error(f"Skipping invalid wallet in batch: {e}")
+                continue
+
+            if self.circuit_breaker and self.circuit_breaker.is_active():
+                scores[position] = await self._get_cached_or_placeholder_score(
+                    validated_address
+                )
+                continue
+
+            if use_cache:
+                cached = self._score_cache.get(f"score_{validated_address}")
+                if cached:
+                    scores[position] = cached
+                    continue
+
+            pending.append((position, validated_address, wallet_data))
+
+        if pending:
+            await self._check_rate_limit("polymarket_api")
+
+            started = time.perf_counter()
+            chunk: List[Tuple[int, str, Dict[str, Any]]] = []
+            chunk_trades = 0
+            for entry in pending:
+                trade_count = len(entry[2].get("trades") or [])
+                if chunk and chunk_trades + trade_count > self.BATCH_MAX_TRADES:
+                    scores.update(await self._score_batch_chunk(chunk))
+                    chunk, chunk_trades = [], 0
+                chunk.append(entry)
+                chunk_trades += trade_count
+            scores.update(await self._score_batch_chunk(chunk))
+
+            logger.info(
+                f"Batch scored {len(pending)} wallets in "
+                f"{time.perf_counter() - started:.2f}s "
+                f"({len(wallets_data) - len(pending)} cached or skipped)"
+            )
+
+        return [scores[position] for position in sorted(scores)]
+
+    async def _score_batch_chunk(
+        self, chunk: List[Tuple[int, str, Dict[str, Any]]]
+    ) -> Dict[int, QualityScore]:
+        """Score one chunk of wallets through the vectorized kernel"""
+        trade_lists = [wallet_data.get("trades") or [] for _, _, wallet_data in chunk]
+        # The kernel is CPU-bound; run it in a worker thread so the event loop
+        # keeps serving other tasks. Scores are composed back on the loop.
+        batch, metrics = await asyncio.to_thread(self._compute_batch_metrics, trade_lists)
+
+        scores: Dict[int, QualityScore] = {}
+        for index, (position, validated_address, wallet_data) in enumerate(chunk):
+            wallet_address = wallet_data.get("address", "")
+            try:
+                quality_score = self._score_from_batch_metrics(
+                    wallet_address, wallet_data, batch, metrics, index
+                )
+            except Exception as e:
+                logger.exception(
+                    f"Unexpected error batch scoring wallet {wallet_address[-6:]}: {e}"
+                )
+                continue
+
+            self._score_cache.set(f"score_{validated_address}", quality_score)
+            self._record_score(quality_score)
+            scores[position] = quality_score
+        return scores
+
+    def _compute_batch_metrics(
+        self, trade_lists: List[List[Dict[str, Any]]]
+    ) -> Tuple[TradeBatch, Dict[str, Any]]:
+        """Pack trade lists and compute their metric arrays (worker thread)"""
+        batch = pack_trades(trade_lists, self._parse_timestamp)
+        return batch, compute_wallet_metrics(batch, self.RECOVERY_WINDOW)
+
+    def _score_from_batch_metrics(
+        self,
+        wallet_address: str,
+        wallet_data: Dict[str, Any],
+        batch: TradeBatch,
+        metrics: Dict[str, Any],
+        index: int,
+    ) -> QualityScore:
+        """Build one wallet's QualityScore from the kernel's metric arrays"""
+        total_trades = int(metrics["trade_counts"][index])
+        if total_trades == 0:
+            # Nothing to vectorize: the scalar path is O(1) without trades
+            history = self._build_trading_history(wallet_address, wallet_data)
+            risk_metrics = self._calculate_risk_metrics(history)
+            domain_expertise = self._calculate_domain_expertise(history)
+            return self._compose_quality_score(
+                wallet_address,
+                history,
+                None,
+                risk_metrics,
+                domain_expertise,
+                self._detect_market_maker_advanced(history, risk_metrics),
+                self._detect_red_flags(history, risk_metrics, domain_expertise),
+            )
+
+        # Counts-only history: what the scalar helpers read besides trades
+        history = TradingHistory(
+            wallet_address=wallet_address,
+            total_trades=total_trades,
+            profitable_trades=int(metrics["profitable_trades"][index]),
+        )
+
+        def value(name: str) -> float:
+            return float(metrics[name][index])
+
+        if total_trades < self.MIN_TRADES_FOR_STATS:
+            risk_metrics = self._get_default_risk_metrics(history)
+            domain_expertise = self._calculate_domain_expertise(history)
+        else:
+            risk_metrics = RiskMetrics(
+                profit_factor=value("profit_factor"),
+                max_drawdown=value("max_drawdown"),
+                max_drawdown_duration=value("max_drawdown_duration"),
+                win_rate=value("win_rate"),
+                win_rate_std=value("win_rate_std"),
+                win_rate_consistency=value("win_rate_consistency"),
+                volatility=value("volatility"),
+                sharpe_ratio=value("sharpe_ratio"),
+                sortino_ratio=value("sortino_ratio"),
+                calmar_ratio=value("calmar_ratio"),
+                time_to_recovery_ratio=1.0,  # As in _calculate_drawdown_metrics
+                tail_risk=value("tail_risk"),
+                position_sizing_std=value("position_sizing_std"),
+            )
+            num_categories = int(metrics["num_categories"][index])
+            domain_expertise = DomainExpertiseMetrics(
+                primary_domain=batch.category_names[
+                    int(metrics["primary_category"][index])
+                ],
+                specialization_score=value("specialization_score"),
+                domain_trades=int(metrics["domain_trades"][index]),
+                domain_win_rate=value("domain_win_rate"),
+                domain_roi=Decimal(str(value("domain_roi"))),
+                category_diversity=1.0 / num_categories,
+                consistency_score=0.7,  # As in _calculate_domain_expertise
+            )
+
+        first_timestamp = value("first_timestamp")
+        time_span = value("last_timestamp") - first_timestamp if total_trades >= 2 else None
+        is_market_maker = total_trades >= self.MM_TRADE_COUNT_THRESHOLD and (
+            self._is_market_maker(
+                wallet_address, total_trades, value("avg_hold_time"), risk_metrics
+            )
+        )
+        red_flags = self._red_flags_for(
+            total_trades=total_trades,
+            wallet_age_days=self._wallet_age_days(first_timestamp),
+            max_position_size=value("max_position_size"),
+            num_categories=int(metrics["num_categories"][index]),
+            risk_metrics=risk_metrics,
+        )
+
+        return self._compose_quality_score(
+            wallet_address,
+            history,
+            time_span,
+            risk_metrics,
+            domain_expertise,
+            is_market_maker,
+            red_flags,
+        )
 
     async def get_top_wallets(
         self,
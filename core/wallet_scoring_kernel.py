@@ -0,0 +1,438 @@
+"""
+Vectorized Risk-Metric Kernel for Batch Wallet Scoring
+
+WalletQualityScorer.score_wallet evaluates one wallet at a time with
+per-trade Python loops and Decimal arithmetic. For leaderboard-sized
+batches this module packs every wallet's trades into flat NumPy arrays
+indexed by per-wallet offsets (CSR layout: the trades of wallet ``i`` are
+``offsets[i]:offsets[i + 1]``) and computes the same metrics for all
+wallets in whole-array passes:
+
+- Sums, means and sample standard deviations with ``np.bincount`` over
+  wallet ids (profit factor, volatility, Sharpe/Sortino, sizing std)
+- Rolling 30-trade win rates from prefix sums over timestamp tie groups
+- Drawdown state advanced one trade position at a time for all wallets
+  at once; wallets are ordered by trade count so the wallets still
+  active at a position are always a prefix of the state arrays
+- Drawdown recovery found by binary lifting over a sparse max table
+- Primary-domain statistics from (wallet, category) pair counts
+
+The definitions follow score_wallet exactly, including its quirks (e.g.
+the drawdown ratio update rule), so both paths produce the same scores.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+# Kernel constants (mirroring WalletQualityScorer's scalar calculations)
+RISK_FREE_RATE = 0.02
+ROLLING_WIN_RATE_TRADES = 30  # Trades per rolling win-rate window
+TAIL_LOSS_COUNT = 20  # Losses summed for the tail-risk figure
+SECONDS_PER_HOUR = 3600
+DEFAULT_HOLD_TIME_SECONDS = 3600.0
+
+# Fallbacks score_wallet uses when a statistic is undefined
+DEFAULT_WIN_RATE_STD = 0.1
+DEFAULT_VOLATILITY = 0.2
+DEFAULT_EXCESS_STD = 0.1
+DEFAULT_SHARPE = 0.5
+DEFAULT_SORTINO = 0.6
+DEFAULT_SIZING_STD = 0.2
+
+
+@dataclass
+class TradeBatch:
+    """Parsed trades of many wallets in CSR layout (wallet order preserved)"""
+
+    offsets: np.ndarray  # int64, len(wallets) + 1
+    timestamps: np.ndarray  # float64 seconds
+    pnls: np.ndarray  # float64 USD
+    position_sizes: np.ndarray  # float64
+    profitable: np.ndarray  # bool, the trade's is_profitable flag
+    categories: np.ndarray  # int64 codes into category_names
+    category_names: List[Any]
+
+    @property
+    def wallet_count(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def trade_counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def wallet_ids(self) -> np.ndarray:
+        """Wallet index of every trade"""
+        return np.repeat(np.arange(self.wallet_count), self.trade_counts)
+
+
+def pack_trades(
+    trade_lists: List[List[Dict[str, Any]]],
+    parse_timestamp: Callable[[Any], float],
+) -> TradeBatch:
+    """
+    Parse raw trade dicts into a TradeBatch.
+
+    Trades are read like WalletQualityScorer._build_trading_history reads
+    them; a trade whose pnl, size or timestamp cannot be parsed is skipped.
+
+    Args:
+        trade_lists: One list of trade dicts per wallet
+        parse_timestamp: Converts a raw timestamp to epoch seconds
+
+    Returns:
+        Packed trades, one CSR row per input list
+    """
+    counts = np.zeros(len(trade_lists), dtype=np.int64)
+    timestamps: List[float] = []
+    pnls: List[float] = []
+    sizes: List[float] = []
+    profitable: List[bool] = []
+    categories: List[int] = []
+    category_codes: Dict[Any, int] = {}
+
+    for wallet_index, trades in enumerate(trade_lists):
+        for trade in trades:
+            try:
+                timestamp = parse_timestamp(trade.get("timestamp"))
+                pnl = float(str(trade.get("pnl", "0.0")))
+                size = float(trade.get("position_size", 100))
+            except (TypeError, ValueError):
+                continue
+            category = trade.get("category", "general")
+            code = category_codes.setdefault(category, len(category_codes))
+
+            timestamps.append(timestamp)
+            pnls.append(pnl)
+            sizes.append(size)
+            profitable.append(bool(trade.get("is_profitable", False)))
+            categories.append(code)
+            counts[wallet_index] += 1
+
+    offsets = np.zeros(len(trade_lists) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return TradeBatch(
+        offsets=offsets,
+        timestamps=np.array(timestamps, dtype=np.float64),
+        pnls=np.array(pnls, dtype=np.float64),
+        position_sizes=np.array(sizes, dtype=np.float64),
+        profitable=np.array(profitable, dtype=bool),
+        categories=np.array(categories, dtype=np.int64),
+        category_names=list(category_codes),
+    )
+
+
+def _segment_mean_std(
+    values: np.ndarray, ids: np.ndarray, counts: np.ndarray
+) -> tuple:
+    """Per-segment mean and sample standard deviation (NaN where undefined)"""
+    size = len(counts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.bincount(ids, values, minlength=size) / counts
+        deviations = values - means[ids]
+        variance = np.bincount(ids, deviations * deviations, minlength=size) / (
+            counts - 1
+        )
+    std = np.where(counts > 1, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+    return means, std
+
+
+def _first_at_least(
+    values: np.ndarray, starts: np.ndarray, thresholds: np.ndarray
+) -> np.ndarray:
+    """
+    For each query, the first index ``i >= start`` with ``values[i] >= threshold``.
+
+    Uses binary lifting over a sparse table of block maxima, so every query
+    is answered in O(log n) vectorized steps. Returns ``len(values)`` for
+    queries with no such index.
+    """
+    size = len(values)
+    if size == 0 or len(starts) == 0:
+        return np.full(len(starts), size, dtype=np.int64)
+
+    # table[k][i] = max(values[i : i + 2**k])
+    table = [values]
+    width = 1
+    while width * 2 <= size:
+        previous = table[-1]
+        table.append(np.maximum(previous[:-width], previous[width:]))
+        width *= 2
+
+    position = starts.astype(np.int64)
+    for level in range(len(table) - 1, -1, -1):
+        block_max = table[level]
+        inside = position < len(block_max)
+        index = np.minimum(position, len(block_max) - 1)
+        skip = inside & (block_max[index] < thresholds)
+        position = position + np.where(skip, 1 << level, 0)
+
+    found = (position < size) & (
+        values[np.minimum(position, size - 1)] >= thresholds
+    )
+    return np.where(found, position, size)
+
+
+def compute_wallet_metrics(
+    batch: TradeBatch, recovery_window_seconds: float
+) -> Dict[str, np.ndarray]:
+    """
+    Compute per-wallet summary, risk and domain metrics for a batch.
+
+    Risk and domain figures follow score_wallet's definitions for wallets
+    with enough trades for statistics; callers decide which wallets use
+    them (score_wallet falls back to defaults below MIN_TRADES_FOR_STATS).
+
+    Args:
+        batch: Packed trades
+        recovery_window_seconds: How far after a drawdown point recovery
+            is searched for (WalletQualityScorer.RECOVERY_WINDOW)
+
+    Returns:
+        Mapping of metric name -> array with one value per wallet
+    """
+    wallet_count = batch.wallet_count
+    counts = batch.trade_counts
+    ids = batch.wallet_ids
+    pnls = batch.pnls
+    timestamps = batch.timestamps
+    has_trades = counts > 0
+
+    def per_wallet_sum(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(ids, weights, minlength=wallet_count)
+
+    # Trades sorted by (wallet, timestamp); lexsort is stable so ties keep
+    # their original order, as Python's sorted() does
+    order = np.lexsort((timestamps, ids))
+    sorted_ids = ids[order]
+    sorted_times = timestamps[order]
+    sorted_pnls = pnls[order]
+    sorted_profitable = batch.profitable[order]
+
+    metrics: Dict[str, np.ndarray] = {"trade_counts": counts}
+    profitable_counts = per_wallet_sum(batch.profitable.astype(np.float64))
+    metrics["profitable_trades"] = profitable_counts.astype(np.int64)
+
+    # Summary figures for red flags, consistency and confidence
+    first = batch.offsets[:-1]
+    last = batch.offsets[1:] - 1
+    safe_first = np.minimum(first, max(len(sorted_times) - 1, 0))
+    safe_last = np.maximum(last, 0)
+    if len(sorted_times):
+        metrics["first_timestamp"] = np.where(has_trades, sorted_times[safe_first], np.nan)
+        metrics["last_timestamp"] = np.where(has_trades, sorted_times[safe_last], np.nan)
+        max_size = np.full(wallet_count, -np.inf)
+        np.maximum.at(max_size, ids, batch.position_sizes)
+    else:
+        metrics["first_timestamp"] = np.full(wallet_count, np.nan)
+        metrics["last_timestamp"] = np.full(wallet_count, np.nan)
+        max_size = np.zeros(wallet_count)
+    metrics["max_position_size"] = np.where(has_trades, max_size, 0.0)
+
+    # Mean gap between consecutive trades (score_wallet's hold-time proxy)
+    same_wallet = sorted_ids[1:] == sorted_ids[:-1]
+    gaps = np.bincount(
+        sorted_ids[1:][same_wallet],
+        (sorted_times[1:] - sorted_times[:-1])[same_wallet],
+        minlength=wallet_count,
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        metrics["avg_hold_time"] = np.where(
+            counts >= 2, gaps / (counts - 1), DEFAULT_HOLD_TIME_SECONDS
+        )
+
+    # Profit factor and win rate
+    gross_profits = per_wallet_sum(np.where(pnls > 0, pnls, 0.0))
+    gross_losses = per_wallet_sum(np.where(pnls < 0, -pnls, 0.0))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        metrics["profit_factor"] = np.where(
+            gross_losses > 0, gross_profits / gross_losses, 1.0
+        )
+        metrics["win_rate"] = np.where(has_trades, profitable_counts / counts, 0.0)
+
+    # Volatility and risk-adjusted ratios
+    pnl_means, pnl_std = _segment_mean_std(pnls, ids, counts)
+    metrics["volatility"] = np.where(counts > 1, pnl_std, DEFAULT_VOLATILITY)
+    excess_mean, excess_std = _segment_mean_std(pnls - RISK_FREE_RATE, ids, counts)
+    avg_excess = np.where(counts > 1, excess_mean, 0.0)
+    excess_std = np.where(counts > 1, excess_std, DEFAULT_EXCESS_STD)
+    _, downside_std = _segment_mean_std(np.minimum(pnls, 0.0), ids, counts)
+    downside_std = np.where(counts > 1, downside_std, DEFAULT_EXCESS_STD)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        metrics["sharpe_ratio"] = np.where(
+            excess_std > 0, avg_excess / excess_std, DEFAULT_SHARPE
+        )
+        metrics["sortino_ratio"] = np.where(
+            downside_std > 0, avg_excess / downside_std, DEFAULT_SORTINO
+        )
+
+    # Position sizing consistency
+    size_means, size_std = _segment_mean_std(batch.position_sizes, ids, counts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        metrics["position_sizing_std"] = np.where(
+            (counts > 1) & (size_means > 0), size_std / size_means, DEFAULT_SIZING_STD
+        )
+
+    # Tail risk: the smallest TAIL_LOSS_COUNT losses over the number of losses
+    loss_mask = pnls < 0
+    loss_ids = ids[loss_mask]
+    losses = -pnls[loss_mask]
+    loss_order = np.lexsort((losses, loss_ids))
+    loss_ids = loss_ids[loss_order]
+    loss_counts = np.bincount(loss_ids, minlength=wallet_count)
+    loss_starts = np.concatenate(([0], np.cumsum(loss_counts)[:-1]))
+    loss_rank = np.arange(len(loss_ids)) - loss_starts[loss_ids]
+    smallest = loss_rank < TAIL_LOSS_COUNT
+    tail_sum = np.bincount(
+        loss_ids[smallest], losses[loss_order][smallest], minlength=wallet_count
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tail_value = np.where(loss_counts > 0, tail_sum / loss_counts, 0.0)
+        metrics["tail_risk"] = np.where(pnl_means > 0, tail_value / pnl_means, 1.0)
+
+    # Timestamp tie groups in (wallet, timestamp) order
+    new_group = np.ones(len(sorted_times), dtype=bool)
+    new_group[1:] = (sorted_ids[1:] != sorted_ids[:-1]) | (
+        sorted_times[1:] != sorted_times[:-1]
+    )
+    group_of = np.cumsum(new_group) - 1
+    group_first = np.flatnonzero(new_group)
+    group_last = np.concatenate((group_first[1:], [len(sorted_times)])) - 1
+    group_times = sorted_times[group_first]
+    wallet_group_end = np.zeros(wallet_count, dtype=np.int64)
+    wallet_group_end[has_trades] = group_of[last[has_trades]] + 1
+
+    # Rolling win rate over the trades in [t[i - 30], t[i]) for each i >= 30
+    local = np.arange(len(sorted_times)) - batch.offsets[sorted_ids]
+    window_end = np.flatnonzero(local >= ROLLING_WIN_RATE_TRADES)
+    lower = group_first[group_of[window_end - ROLLING_WIN_RATE_TRADES]]
+    upper = group_first[group_of[window_end]]
+    wins_before = np.concatenate(([0], np.cumsum(sorted_profitable)))
+    in_window = upper - lower
+    valid = in_window > 0
+    rolling_ids = sorted_ids[window_end][valid]
+    rolling_rates = (wins_before[upper] - wins_before[lower])[valid] / in_window[valid]
+    rolling_counts = np.bincount(rolling_ids, minlength=wallet_count)
+    _, rolling_std = _segment_mean_std(rolling_rates, rolling_ids, rolling_counts)
+    win_rate_std = np.where(rolling_counts > 1, rolling_std, DEFAULT_WIN_RATE_STD)
+    metrics["win_rate_std"] = win_rate_std
+    metrics["win_rate_consistency"] = np.maximum(0.0, 1.0 - np.minimum(win_rate_std, 0.2))
+
+    # Drawdown: replay score_wallet's running state for every wallet at once
+    wallet_order = np.argsort(-counts, kind="stable")
+    ordered_starts = batch.offsets[wallet_order]
+    descending_counts = -counts[wallet_order]
+    cumulative = np.zeros(wallet_count)
+    peak = np.zeros(wallet_count)
+    peak_time = np.zeros(wallet_count)
+    max_drawdown = np.zeros(wallet_count)
+    sorted_cumulative = np.empty(len(sorted_times))
+    event_positions: List[np.ndarray] = []
+    event_peaks: List[np.ndarray] = []
+    event_peak_times: List[np.ndarray] = []
+
+    for step in range(int(counts.max()) if wallet_count else 0):
+        active = int(np.searchsorted(descending_counts, -step, side="left"))
+        positions = ordered_starts[:active] + step
+        cum = cumulative[:active]
+        cum += sorted_pnls[positions]
+        sorted_cumulative[positions] = cum
+
+        top = peak[:active]
+        new_peak = cum > top
+        top[new_peak] = cum[new_peak]
+        peak_time[:active][new_peak] = sorted_times[positions[new_peak]]
+
+        drawdown = top - cum
+        worst = max_drawdown[:active]
+        update = (cum < top) & (drawdown > worst)
+        if update.any():
+            update_peak = top[update]
+            worst[update] = np.where(
+                update_peak > 0,
+                drawdown[update] / np.where(update_peak > 0, update_peak, 1.0),
+                drawdown[update],
+            )
+            event_positions.append(positions[update])
+            event_peaks.append(update_peak)
+            event_peak_times.append(peak_time[:active][update])
+
+    unordered = np.empty_like(wallet_order)
+    unordered[wallet_order] = np.arange(wallet_count)
+    metrics["max_drawdown"] = max_drawdown[unordered]
+    final_peak = peak[unordered]
+    totals = per_wallet_sum(pnls)
+    metrics["calmar_ratio"] = np.where(
+        final_peak > 0, totals / np.maximum(1.0, final_peak), 1.0
+    )
+
+    # Recovery: for each drawdown update, the first later timestamp group
+    # whose closing cumulative PnL regains the peak, searched up to and
+    # including the first group past the recovery window
+    duration = np.zeros(wallet_count)
+    if event_positions:
+        positions = np.concatenate(event_positions)
+        thresholds = np.concatenate(event_peaks)
+        peak_times = np.concatenate(event_peak_times)
+        event_wallets = sorted_ids[positions]
+        next_group = group_of[positions] + 1
+
+        group_cumulative = sorted_cumulative[group_last]
+        reached = _first_at_least(group_cumulative, next_group, thresholds)
+        window_limit = np.nextafter(
+            sorted_times[positions] + recovery_window_seconds, np.inf
+        )
+        past_window = _first_at_least(group_times, next_group, window_limit)
+
+        recovered = (reached < wallet_group_end[event_wallets]) & (reached <= past_window)
+        recovery_time = np.where(
+            recovered,
+            group_times[np.minimum(reached, len(group_times) - 1)] - peak_times,
+            0.0,
+        )
+        counted = recovery_time > 0
+        np.maximum.at(
+            duration, event_wallets[counted], recovery_time[counted] / SECONDS_PER_HOUR
+        )
+    metrics["max_drawdown_duration"] = duration
+
+    # Domain expertise from (wallet, category) pair statistics
+    category_count = max(len(batch.category_names), 1)
+    pair_keys = ids * category_count + batch.categories
+    pair_keys, pair_first, pair_of, pair_counts = np.unique(
+        pair_keys, return_index=True, return_inverse=True, return_counts=True
+    )
+    pair_wallets = pair_keys // category_count
+    pair_profitable = np.bincount(
+        pair_of, batch.profitable.astype(np.float64), minlength=len(pair_keys)
+    )
+    pair_pnl = np.bincount(pair_of, pnls, minlength=len(pair_keys))
+    # Most trades first; ties go to the category seen first
+    pair_order = np.lexsort((pair_first, -pair_counts, pair_wallets))
+    is_primary = np.ones(len(pair_order), dtype=bool)
+    is_primary[1:] = pair_wallets[pair_order][1:] != pair_wallets[pair_order][:-1]
+    primary_pairs = pair_order[is_primary]
+    primary_wallets = pair_wallets[primary_pairs]
+
+    primary_category = np.full(wallet_count, -1, dtype=np.int64)
+    primary_category[primary_wallets] = pair_keys[primary_pairs] % category_count
+    domain_trades = np.zeros(wallet_count, dtype=np.int64)
+    domain_trades[primary_wallets] = pair_counts[primary_pairs]
+    domain_wins = np.zeros(wallet_count)
+    domain_wins[primary_wallets] = pair_profitable[primary_pairs]
+    domain_pnl = np.zeros(wallet_count)
+    domain_pnl[primary_wallets] = pair_pnl[primary_pairs]
+
+    metrics["num_categories"] = np.bincount(pair_wallets, minlength=wallet_count)
+    metrics["primary_category"] = primary_category
+    metrics["domain_trades"] = domain_trades
+    with np.errstate(invalid="ignore", divide="ignore"):
+        metrics["domain_win_rate"] = np.where(
+            domain_trades > 0, domain_wins / domain_trades, 0.5
+        )
+        metrics["specialization_score"] = np.where(has_trades, domain_trades / counts, 0.0)
+    metrics["domain_roi"] = domain_pnl / np.maximum(100.0, counts * 10.0)
+
+    return metrics
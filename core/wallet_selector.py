@@ -25,6 +25,7 @@ from sklearn.cluster import KMeans
 if TYPE_CHECKING:
     pass
 
+from core.wallet_correlation import WalletCorrelationEngine
 from utils.time_utils import get_current_time_utc
 
 logger = logging.getLogger(__name__)
@@ -38,7 +39,11 @@ class AutomaticWalletSelector:
     across wallets while maintaining diversification and risk constraints.
     """
 
-    def __init__(self, real_time_scorer: Any) -> None:
+    def __init__(
+        self,
+        real_time_scorer: Any,
+        correlation_engine: Optional[WalletCorrelationEngine] = None,
+    ) -> None:
         self.real_time_scorer = real_time_scorer
 
         # Selection parameters
@@ -68,7 +73,8 @@ class AutomaticWalletSelector:
         self.override_audit_log: List[Dict[str, Any]] = []
 
         # Correlation and clustering data
-        self.wallet_correlations: Dict[str, Dict[str, float]] = {}
+        # Share the PerformanceAnalyzer's engine to filter on real PnL history
+        self.correlation_engine = correlation_engine or WalletCorrelationEngine()
         self.wallet_clusters: Dict[str, int] = {}
 
         # Performance tracking
@@ -309,22 +315,12 @@ class AutomaticWalletSelector:
             return selected_wallets  # Return original selection on error
 
     async def _update_wallet_correlations(self, wallets: List[Dict[str, Any]]):
-        """Update correlation matrix for wallet diversification."""
+        """Track selected wallets in the correlation engine."""
 
         try:
-            wallet_addresses = [w["address"] for w in wallets]
-
-            # Calculate or retrieve correlations
-            # In practice, this would use historical return correlations
-            for i, wallet1 in enumerate(wallet_addresses):
-                for j, wallet2 in enumerate(wallet_addresses):
-                    if i != j:
-                        # Simplified correlation calculation
-                        # In practice, would use actual return series
-                        correlation = 0.1 + 0.1 * np.random.random()  # Placeholder
-                        self.wallet_correlations.setdefault(wallet1, {})[wallet2] = (
-                            correlation
-                        )
+            # Correlations are maintained incrementally as trades settle;
+            # registering makes newly selected wallets start accumulating
+            self.correlation_engine.add_wallets(w["address"] for w in wallets)
 
         except Exception as e:
             logger.error(f"Error updating wallet correlations: {e}")
@@ -335,23 +331,18 @@ class AutomaticWalletSelector:
         """Filter wallets based on correlation constraints."""
 
         max_correlation = criteria["correlation_constraint"]
-        filtered_wallets = []
-
-        for wallet in wallets:
-            wallet_address = wallet["address"]
-
-            # Check correlation with already selected wallets
-            correlations = [
-                self.wallet_correlations.get(wallet_address, {}).get(
-                    selected["address"], 0
-                )
-                for selected in filtered_wallets
-            ]
+        matrix = self.correlation_engine.correlation_matrix(
+            [wallet["address"] for wallet in wallets]
+        )
+        selected: List[int] = []
 
-            if not correlations or max(correlations) <= max_correlation:
-                filtered_wallets.append(wallet)
+        # Wallets arrive best first; keep each one not too correlated with
+        # any wallet already kept
+        for i in range(len(wallets)):
+            if not selected or matrix[i, selected].max() <= max_correlation:
+                selected.append(i)
 
-        return filtered_wallets
+        return [wallets[i] for i in selected]
 
     async def _apply_cluster_diversification(
         self, wallets: List[Dict[str, Any]], criteria: Dict[str, Any]
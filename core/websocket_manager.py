@@ -74,6 +74,7 @@ class WebSocketManager:
         wallet_address: Optional[str] = None,
         on_message: Optional[Callable[[Dict[str, Any]], None]] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
+        on_connect: Optional[Callable[[], None]] = None,
         alert_on_disconnect: bool = True,
     ) -> None:
         """
@@ -84,12 +85,15 @@ class WebSocketManager:
             wallet_address: Wallet address being monitored (for logging/alerts)
             on_message: Callback function for received messages
             on_error: Callback function for errors
+            on_connect: Callback run after every (re)connection, e.g. to
+                restore subscriptions the server dropped with the old socket
             alert_on_disconnect: Whether to send alerts on disconnection
         """
         self.ws_url = ws_url
         self.wallet_address = wallet_address or "unknown"
         self.on_message = on_message
         self.on_error = on_error
+        self.on_connect = on_connect
         self.alert_on_disconnect = alert_on_disconnect
 
         # Connection state
@@ -108,8 +112,10 @@ class WebSocketManager:
         self.heartbeat_task: Optional[asyncio.Task] = None
         self.receive_task: Optional[asyncio.Task] = None
 
-        # Subscriptions
+        # Subscriptions: server subscription ids, and request ids still
+        # waiting for the server to confirm them
         self.active_subscriptions: Set[str] = set()
+        self._pending_subscriptions: Set[Any] = set()
 
         # Performance metrics
         self.metrics = {
@@ -161,6 +167,9 @@ class WebSocketManager:
                 self.last_connect_time = time.time()
                 self.metrics["connection_start_time"] = time.time()
                 self.metrics["total_reconnects"] += 1
+                # Subscriptions do not survive the old connection
+                self.active_subscriptions.clear()
+                self._pending_subscriptions.clear()
 
             logger.info("✅ WebSocket connected successfully")
 
@@ -169,6 +178,9 @@ class WebSocketManager:
             self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
             self.health_check_task = asyncio.create_task(self._health_check_loop())
 
+            if self.on_connect:
+                await self._safe_callback(self.on_connect)
+
             return True
 
         except asyncio.TimeoutError:
@@ -250,7 +262,7 @@ class WebSocketManager:
             }
 
             await self.websocket.send(json.dumps(message))
-            self.active_subscriptions.add(subscription_id)
+            self._pending_subscriptions.add(subscription_id)
 
             logger.info(f"📡 Subscribed to events: {subscription_id}")
             return True
@@ -264,7 +276,7 @@ class WebSocketManager:
         Unsubscribe from events.
 
         Args:
-            subscription_id: Subscription ID to unsubscribe
+            subscription_id: Server subscription ID to unsubscribe
 
         Returns:
             True if unsubscription successful, False otherwise
@@ -311,6 +323,9 @@ class WebSocketManager:
                         timezone.utc
                     ).isoformat()
 
+                    if isinstance(data, dict):
+                        self._record_subscription_confirmation(data)
+
                     # Update metrics
                     if self.metrics["connection_start_time"]:
                         uptime = time.time() - self.metrics["connection_start_time"]
@@ -344,6 +359,16 @@ class WebSocketManager:
                 self.state = ConnectionState.DISCONNECTED
             await self._handle_disconnection()
 
+    def _record_subscription_confirmation(self, data: Dict[str, Any]) -> None:
+        """Track the server id returned for a pending subscription request"""
+        request_id = data.get("id")
+        if request_id is None or request_id not in self._pending_subscriptions:
+            return
+        self._pending_subscriptions.discard(request_id)
+        server_id = data.get("result")
+        if isinstance(server_id, str):
+            self.active_subscriptions.add(server_id)
+
     async def _heartbeat_loop(self) -> None:
         """Send periodic heartbeat to keep connection alive"""
         while self.running and self.state == ConnectionState.CONNECTED:
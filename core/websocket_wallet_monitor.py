@@ -2,10 +2,10 @@
 WebSocket-based Wallet Monitor for Real-time Trade Detection
 
 Provides:
-- Real-time transaction monitoring via WebSocket
+- Real-time trade monitoring via WebSocket log subscriptions
+- One multiplexed connection for every target wallet
 - Event-driven trade detection pipeline
 - Automatic fallback to polling on WebSocket failure
-- Single wallet monitoring (pilot implementation)
 - Performance metrics and latency tracking
 """
 
@@ -13,73 +13,115 @@ import asyncio
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+from core.exchange_calldata import POLYMARKET_EXCHANGE_CONTRACTS, TOKEN_DECIMALS
 from core.websocket_manager import ConnectionState, WebSocketManager
+from utils.bounded_cache import BoundedCache
 from utils.helpers import normalize_address
 from utils.rate_limited_client import RateLimitedPolygonscanClient
 
 logger = logging.getLogger(__name__)
 
+# keccak256("OrderFilled(bytes32,address,address,uint256,uint256,uint256,uint256,uint256)")
+ORDER_FILLED_TOPIC = "0xd0a08e8c493f9c94f29311604c9de1b4e8c8d4c06bd0c789af57f2d65bfec0f6"
+
+# OrderFilled indexes (orderHash, maker, taker) as topics 1-3
+MAKER_TOPIC_INDEX = 2
+TAKER_TOPIC_INDEX = 3
+
+# Recently processed events, evicted oldest first
+DEDUP_CACHE_SIZE = 10000
+DEDUP_TTL_SECONDS = 3600
+
+
+def address_to_topic(address: str) -> str:
+    """Left-pad an address to the 32-byte topic form used for indexed params"""
+    return "0x" + normalize_address(address)[2:].rjust(64, "0")
+
 
 class WebSocketWalletMonitor:
     """
-    Real-time wallet monitoring using WebSocket with polling fallback.
-
-    This is a pilot implementation for single wallet monitoring before
-    full rollout to all wallets.
+    Real-time monitoring of many wallets over one WebSocket connection.
 
     Features:
-    - WebSocket-based real-time transaction monitoring
+    - One connection and one log filter set covering all target wallets
     - Event-driven trade detection (sub-second latency)
+    - O(1) routing of each event to its wallet by topic lookup
+    - Wallets added/removed by re-subscribing on the live connection
     - Automatic fallback to polling when WebSocket fails
     - Performance benchmarking (latency comparison)
-    - Maintains all existing risk management safeguards
 
     Architecture:
         1. Attempts WebSocket connection to blockchain provider
-        2. Subscribes to wallet transaction events
-        3. Processes events through existing trade detection pipeline
+        2. Subscribes to OrderFilled logs from the Polymarket exchanges where a
+           target wallet is the maker, and where one is the taker
+        3. Routes each log to its wallet(s) and emits a trade per wallet
         4. Falls back to polling if WebSocket fails/disconnects
         5. Tracks performance metrics for comparison
     """
 
     def __init__(
         self,
-        wallet_address: str,
+        wallet_addresses: Union[str, Iterable[str]],
         ws_url: str,
         polygonscan_client: Optional[RateLimitedPolygonscanClient],
         trade_detection_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
         fallback_polling_interval: int = 15,
+        contract_addresses: Optional[List[str]] = None,
     ) -> None:
         """
         Initialize WebSocket wallet monitor.
 
         Args:
-            wallet_address: Wallet address to monitor
+            wallet_addresses: Wallet address(es) to monitor
             ws_url: WebSocket URL for blockchain provider
             polygonscan_client: Polygonscan client for fallback polling
             trade_detection_callback: Callback function for detected trades
             fallback_polling_interval: Polling interval when WebSocket unavailable (seconds)
+            contract_addresses: Exchange contracts to watch (defaults to the
+                Polymarket CTF and NegRisk exchanges)
         """
-        self.wallet_address = normalize_address(wallet_address)
+        if isinstance(wallet_addresses, str):
+            wallet_addresses = [wallet_addresses]
+
         self.ws_url = ws_url
         self.polygonscan_client = polygonscan_client
         self.trade_detection_callback = trade_detection_callback
         self.fallback_polling_interval = fallback_polling_interval
+        self.contract_addresses = [
+            normalize_address(c)
+            for c in (contract_addresses or POLYMARKET_EXCHANGE_CONTRACTS)
+        ]
+
+        # Topic-encoded address -> wallet address, for routing log events
+        self.wallet_topics: Dict[str, str] = {}
+        self._set_wallets(wallet_addresses)
 
         # WebSocket manager
         self.ws_manager: Optional[WebSocketManager] = None
 
+        # Log subscriptions: request id -> server subscription id (None until
+        # confirmed). Requests from superseded filters are unsubscribed as
+        # soon as their server id is known.
+        self.subscription_requests: Dict[str, Optional[str]] = {}
+        self._active_requests: List[str] = []
+        self._filter_generation = 0
+        self._subscription_lock = asyncio.Lock()
+
         # Fallback polling
         self.fallback_active = False
         self.fallback_task: Optional[asyncio.Task] = None
-        self.last_polled_block = 0
+        self.last_polled_block: Dict[str, int] = {}
 
         # Performance metrics
         self.metrics = {
             "websocket_messages": 0,
             "websocket_trades_detected": 0,
+            "websocket_events_routed": 0,
+            "websocket_events_unmatched": 0,
+            "duplicate_events": 0,
+            "subscription_updates": 0,
             "polling_cycles": 0,
             "polling_trades_detected": 0,
             "fallback_activations": 0,
@@ -91,14 +133,30 @@ class WebSocketWalletMonitor:
             "last_trade_detection_method": None,
         }
 
-        # Processed transactions cache (for deduplication)
-        self.processed_tx_hashes: set[str] = set()
-        self.max_cache_size = 10000
+        # Processed events (for deduplication), oldest evicted first
+        self.processed_events = BoundedCache(
+            max_size=DEDUP_CACHE_SIZE,
+            ttl_seconds=DEDUP_TTL_SECONDS,
+            component_name="websocket_wallet_monitor.processed_events",
+        )
 
         logger.info(
-            f"WebSocket wallet monitor initialized for {self.wallet_address[:6]}...{self.wallet_address[-4:]}"
+            f"WebSocket wallet monitor initialized for {len(self.wallet_topics)} wallets"
         )
 
+    @property
+    def wallet_addresses(self) -> List[str]:
+        """Currently monitored wallet addresses"""
+        return list(self.wallet_topics.values())
+
+    def _set_wallets(self, wallet_addresses: Iterable[str]) -> None:
+        """Rebuild the topic -> wallet routing table"""
+        self.wallet_topics = {}
+        for address in wallet_addresses:
+            wallet = normalize_address(address)
+            if wallet:
+                self.wallet_topics[address_to_topic(wallet)] = wallet
+
     async def start(self) -> bool:
         """
         Start monitoring (WebSocket with polling fallback).
@@ -107,22 +165,21 @@ class WebSocketWalletMonitor:
             True if started successfully, False otherwise
         """
         logger.info(
-            f"🚀 Starting WebSocket monitoring for wallet {self.wallet_address[-6:]}"
+            f"🚀 Starting WebSocket monitoring for {len(self.wallet_topics)} wallets"
         )
 
-        # Initialize WebSocket manager
+        # Initialize WebSocket manager (one connection for all wallets)
         self.ws_manager = WebSocketManager(
             ws_url=self.ws_url,
-            wallet_address=self.wallet_address,
+            wallet_address=f"{len(self.wallet_topics)} wallets",
             on_message=self._handle_websocket_message,
             on_error=self._handle_websocket_error,
+            on_connect=self._handle_websocket_connect,
             alert_on_disconnect=True,
         )
 
-        # Attempt WebSocket connection
+        # Attempt WebSocket connection (subscribes via the on_connect hook)
         if await self.ws_manager.connect():
-            # Subscribe to wallet transactions
-            await self._subscribe_to_wallet_transactions()
             logger.info("✅ WebSocket monitoring active")
             return True
         else:
@@ -136,7 +193,7 @@ class WebSocketWalletMonitor:
     async def stop(self) -> None:
         """Stop monitoring"""
         logger.info(
-            f"🛑 Stopping WebSocket monitoring for wallet {self.wallet_address[-6:]}"
+            f"🛑 Stopping WebSocket monitoring for {len(self.wallet_topics)} wallets"
         )
 
         # Stop WebSocket
@@ -153,100 +210,276 @@ class WebSocketWalletMonitor:
 
         logger.info("✅ Monitoring stopped")
 
-    async def _subscribe_to_wallet_transactions(self) -> None:
-        """Subscribe to wallet transaction events via WebSocket"""
+    async def update_target_wallets(
+        self,
+        new_wallet_addresses: List[str],
+        position_size_factors: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """Replace the monitored wallets without reconnecting.
+
+        The new log filters are subscribed on the live connection before the
+        old ones are dropped, so no event is missed during the swap; the
+        overlap is absorbed by deduplication.
+
+        Args:
+            new_wallet_addresses: List of wallet addresses to monitor.
+            position_size_factors: Accepted for signature compatibility with
+                WalletMonitor.update_target_wallets; unused here.
+        """
+        try:
+            old_topics = set(self.wallet_topics)
+            self._set_wallets(new_wallet_addresses)
+            if set(self.wallet_topics) == old_topics:
+                return
+
+            logger.info(
+                f"Updated WebSocket target wallets: {len(old_topics)} → {len(self.wallet_topics)}"
+            )
+
+            for wallet in list(self.last_polled_block):
+                if wallet not in self.wallet_topics.values():
+                    del self.last_polled_block[wallet]
+
+            if self.ws_manager and self.ws_manager.is_connected():
+                await self._subscribe_to_wallet_logs()
+
+        except Exception as e:
+            logger.error(f"Failed to update WebSocket target wallets: {e}", exc_info=True)
+
+    def _build_log_filters(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """eth_subscribe log filters matching target wallets as maker or taker"""
+        wallet_topics = list(self.wallet_topics)
+        # Topic positions are ANDed and values within a position ORed, so
+        # maker and taker matches need one filter each
+        return [
+            (
+                "maker",
+                {
+                    "address": self.contract_addresses,
+                    "topics": [ORDER_FILLED_TOPIC, None, wallet_topics],
+                },
+            ),
+            (
+                "taker",
+                {
+                    "address": self.contract_addresses,
+                    "topics": [ORDER_FILLED_TOPIC, None, None, wallet_topics],
+                },
+            ),
+        ]
+
+    async def _subscribe_to_wallet_logs(self) -> None:
+        """Subscribe to trade logs for the current wallets, replacing old filters"""
         if not self.ws_manager:
             return
 
-        # Subscribe to new pending transactions for this wallet
-        # Format depends on provider (Alchemy, QuickNode, etc.)
-        subscription_params = {
-            "id": f"wallet_{self.wallet_address}",
-            "params": [
-                "newPendingTransactions",
-                {"address": self.wallet_address},  # Provider-specific format
-            ],
-        }
+        async with self._subscription_lock:
+            previous_requests = self._active_requests
+            self._filter_generation += 1
+            self._active_requests = []
 
-        # Alternative: Subscribe to new blocks and filter transactions
-        # This is more reliable across providers
-        block_subscription = {
-            "id": f"blocks_{self.wallet_address}",
-            "params": ["newHeads"],
-        }
+            if self.wallet_topics:
+                for role, log_filter in self._build_log_filters():
+                    request_id = f"wallet_logs_{role}_{self._filter_generation}"
+                    self.subscription_requests[request_id] = None
+                    if await self.ws_manager.subscribe(
+                        {"id": request_id, "params": ["logs", log_filter]}
+                    ):
+                        self._active_requests.append(request_id)
+                    else:
+                        del self.subscription_requests[request_id]
 
-        # Subscribe to both (provider may support one or both)
-        await self.ws_manager.subscribe(subscription_params)
-        await self.ws_manager.subscribe(block_subscription)
+            # Drop superseded filters once the new ones are in place
+            for request_id in previous_requests:
+                await self._release_subscription(request_id)
+
+            self.metrics["subscription_updates"] += 1
 
         logger.info(
-            f"📡 Subscribed to transaction events for {self.wallet_address[-6:]}"
+            f"📡 Subscribed to trade logs for {len(self.wallet_topics)} wallets "
+            f"on {len(self.contract_addresses)} contracts"
         )
 
+    async def _handle_websocket_connect(self) -> None:
+        """Resubscribe after a (re)connect; the server dropped the old filters"""
+        async with self._subscription_lock:
+            self._active_requests = []
+            self.subscription_requests.clear()
+        await self._subscribe_to_wallet_logs()
+
+    async def _release_subscription(self, request_id: str) -> None:
+        """Unsubscribe a superseded request once its server id is known"""
+        server_id = self.subscription_requests.get(request_id)
+        if server_id is None:
+            # Not confirmed yet; released when the confirmation arrives
+            return
+        del self.subscription_requests[request_id]
+        if self.ws_manager:
+            await self.ws_manager.unsubscribe(server_id)
+
     async def _handle_websocket_message(self, message: Dict[str, Any]) -> None:
         """Handle incoming WebSocket message"""
         try:
-            # Parse message based on provider format
-            # Example formats:
-            # - Alchemy: {"jsonrpc": "2.0", "method": "eth_subscription", "params": {...}}
-            # - QuickNode: Similar format
-            # - Direct RPC: {"result": {...}}
-
+            # Log notification:
+            #   {"method": "eth_subscription",
+            #    "params": {"subscription": "0x..", "result": {log}}}
+            # Subscription confirmation:
+            #   {"id": "wallet_logs_maker_1", "result": "0x.."}
             method = message.get("method")
-            params = message.get("params", {})
 
             if method == "eth_subscription":
-                # Subscription notification
-                subscription_data = params.get("result", {})
-                await self._process_subscription_data(subscription_data)
+                log = message.get("params", {}).get("result")
+                if isinstance(log, dict):
+                    await self._process_log(log)
 
-            elif "result" in message:
-                # Direct result (block data, transaction data, etc.)
-                await self._process_transaction_data(message["result"])
+            elif message.get("id") in self.subscription_requests:
+                await self._confirm_subscription(message)
 
             self.metrics["websocket_messages"] += 1
 
         except Exception as e:
             logger.exception(f"❌ Error handling WebSocket message: {e}")
 
-    async def _process_subscription_data(self, data: Dict[str, Any]) -> None:
-        """Process subscription data (transaction or block)"""
-        # Check if this is a transaction for our wallet
-        if isinstance(data, str):
-            # Transaction hash - fetch full transaction details
-            tx_hash = data
-            await self._process_transaction_hash(tx_hash)
-        elif isinstance(data, dict):
-            # Block data - check for transactions
-            if "transactions" in data:
-                for tx in data["transactions"]:
-                    if self._is_wallet_transaction(tx):
-                        await self._process_transaction(tx)
-
-    async def _process_transaction_data(self, data: Any) -> None:
-        """Process transaction data"""
-        if isinstance(data, dict):
-            if self._is_wallet_transaction(data):
-                await self._process_transaction(data)
-        elif isinstance(data, str):
-            # Transaction hash
-            await self._process_transaction_hash(data)
-
-    async def _process_transaction_hash(self, tx_hash: str) -> None:
-        """Fetch and process transaction by hash"""
-        if not self.polygonscan_client:
+    async def _confirm_subscription(self, message: Dict[str, Any]) -> None:
+        """Record the server id for a subscription request"""
+        request_id = message["id"]
+        server_id = message.get("result")
+        if not isinstance(server_id, str):
+            logger.warning(
+                f"⚠️ Log subscription {request_id} rejected: {message.get('error')}"
+            )
+            self.subscription_requests.pop(request_id, None)
             return
 
+        self.subscription_requests[request_id] = server_id
+        if request_id not in self._active_requests:
+            # Superseded while the confirmation was in flight
+            await self._release_subscription(request_id)
+
+    def _route_log(self, log: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Wallets (and their maker/taker role) a log belongs to"""
+        topics = log.get("topics") or []
+        if not topics or str(topics[0]).lower() != ORDER_FILLED_TOPIC:
+            return []
+
+        matches = []
+        for index, role in ((MAKER_TOPIC_INDEX, "maker"), (TAKER_TOPIC_INDEX, "taker")):
+            if len(topics) > index:
+                wallet = self.wallet_topics.get(str(topics[index]).lower())
+                if wallet:
+                    matches.append((wallet, role))
+        return matches
+
+    async def _process_log(self, log: Dict[str, Any]) -> None:
+        """Route an OrderFilled log to its wallets and emit trades"""
+        start_time = time.time()
+
         try:
-            # Fetch transaction details
-            tx = await self.polygonscan_client.get_transaction(tx_hash)
-            if tx and self._is_wallet_transaction(tx):
-                await self._process_transaction(tx)
+            if log.get("removed"):
+                # Log dropped by a chain reorg
+                return
+
+            tx_hash = log.get("transactionHash")
+            if not tx_hash:
+                return
+
+            # Overlapping maker/taker filters can deliver the same log twice
+            event_key = f"{tx_hash}:{log.get('logIndex')}"
+            if event_key in self.processed_events:
+                self.metrics["duplicate_events"] += 1
+                return
+            self.processed_events.set(event_key, start_time)
+
+            matches = self._route_log(log)
+            if not matches:
+                # Wallet removed since the filter was installed
+                self.metrics["websocket_events_unmatched"] += 1
+                return
+            self.metrics["websocket_events_routed"] += 1
+
+            trades = [
+                trade
+                for wallet, role in matches
+                if (trade := self._decode_order_filled(log, wallet, role)) is not None
+            ]
+            if trades:
+                await self._emit_trades(trades, "websocket", start_time, tx_hash)
+
         except Exception as e:
-            logger.debug(f"Error fetching transaction {tx_hash}: {e}")
+            logger.exception(f"❌ Error processing log event: {e}")
+
+    def _decode_order_filled(
+        self, log: Dict[str, Any], wallet: str, role: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a trade from an OrderFilled log as seen by one wallet.
+
+        Data words: makerAssetId, takerAssetId, makerAmountFilled,
+        takerAmountFilled, fee. Asset id 0 is USDC; any other id is an
+        outcome token.
+        """
+        data = str(log.get("data", ""))[2:]
+        if len(data) < 5 * 64:
+            return None
+        maker_asset, taker_asset, maker_amount, taker_amount, fee = (
+            int(data[i * 64 : (i + 1) * 64], 16) for i in range(5)
+        )
+
+        # The maker buys outcome tokens when paying USDC
+        maker_buys = maker_asset == 0
+        token_id = taker_asset if maker_buys else maker_asset
+        usdc_amount = maker_amount if maker_buys else taker_amount
+        token_amount = taker_amount if maker_buys else maker_amount
+        if token_amount == 0:
+            return None
 
-    async def _process_transaction(self, tx: Dict[str, Any]) -> None:
-        """Process a transaction and detect trades"""
+        is_buy = maker_buys if role == "maker" else not maker_buys
+        return {
+            "tx_hash": log["transactionHash"],
+            "log_index": int(str(log.get("logIndex", "0x0")), 16),
+            "block_number": int(str(log.get("blockNumber", "0x0")), 16),
+            "wallet_address": wallet,
+            "role": role,
+            "contract_address": normalize_address(log.get("address", "")),
+            "token_id": str(token_id),
+            "side": "BUY" if is_buy else "SELL",
+            "amount": token_amount / TOKEN_DECIMALS,
+            "price": usdc_amount / token_amount,
+            "fee": fee / TOKEN_DECIMALS,
+            "detection_method": "websocket",
+        }
+
+    async def _emit_trades(
+        self,
+        trades: List[Dict[str, Any]],
+        method: str,
+        start_time: float,
+        tx_hash: str,
+    ) -> None:
+        """Record metrics for detected trades and invoke the callback"""
+        self.metrics[f"{method}_trades_detected"] += len(trades)
+        self.metrics["last_trade_detection_time"] = datetime.now(
+            timezone.utc
+        ).isoformat()
+        self.metrics["last_trade_detection_method"] = method
+
+        # Calculate latency
+        latency = time.time() - start_time
+        if method == "websocket":
+            self._update_latency_metric("websocket", latency)
+
+        # Callback with detected trades
+        if self.trade_detection_callback:
+            for trade in trades:
+                await self._safe_callback(self.trade_detection_callback, trade)
+
+        logger.info(
+            f"⚡ {method.capitalize()}: Detected {len(trades)} trades in {latency * 1000:.1f}ms "
+            f"(tx: {tx_hash[:8]}...)"
+        )
+
+    async def _process_transaction(self, tx: Dict[str, Any], wallet: str) -> None:
+        """Process a polled transaction and detect trades"""
         start_time = time.time()
 
         try:
@@ -255,55 +488,31 @@ class WebSocketWalletMonitor:
                 return
 
             # Deduplication check
-            if tx_hash in self.processed_tx_hashes:
+            if tx_hash in self.processed_events:
+                self.metrics["duplicate_events"] += 1
                 return
-
-            # Add to processed cache
-            self.processed_tx_hashes.add(tx_hash)
-            if len(self.processed_tx_hashes) > self.max_cache_size:
-                # Remove oldest entries (simple FIFO)
-                self.processed_tx_hashes.pop()
+            self.processed_events.set(tx_hash, start_time)
 
             # Detect trades using existing pipeline
             # This integrates with the existing trade detection logic
-            trades = await self._detect_trades_from_transaction(tx)
+            trades = await self._detect_trades_from_transaction(tx, wallet)
 
             if trades:
-                self.metrics["websocket_trades_detected"] += len(trades)
-                self.metrics["last_trade_detection_time"] = datetime.now(
-                    timezone.utc
-                ).isoformat()
-                self.metrics["last_trade_detection_method"] = "websocket"
-
-                # Calculate latency
-                latency = time.time() - start_time
-                self._update_latency_metric("websocket", latency)
-
-                # Callback with detected trades
-                if self.trade_detection_callback:
-                    for trade in trades:
-                        await self._safe_callback(self.trade_detection_callback, trade)
-
-                logger.info(
-                    f"⚡ WebSocket: Detected {len(trades)} trades in {latency * 1000:.1f}ms "
-                    f"(tx: {tx_hash[:8]}...)"
-                )
+                await self._emit_trades(trades, "polling", start_time, tx_hash)
 
         except Exception as e:
             logger.exception(f"❌ Error processing transaction: {e}")
 
     def _is_wallet_transaction(self, tx: Dict[str, Any]) -> bool:
-        """Check if transaction involves monitored wallet"""
-        wallet_lower = self.wallet_address.lower()
-
-        # Check from/to addresses
-        from_addr = (tx.get("from") or "").lower()
-        to_addr = (tx.get("to") or "").lower()
-
-        return wallet_lower in from_addr or wallet_lower in to_addr
+        """Check if transaction involves a monitored wallet"""
+        wallets = self.wallet_topics.values()
+        return (
+            normalize_address(tx.get("from") or "") in wallets
+            or normalize_address(tx.get("to") or "") in wallets
+        )
 
     async def _detect_trades_from_transaction(
-        self, tx: Dict[str, Any]
+        self, tx: Dict[str, Any], wallet: str
     ) -> List[Dict[str, Any]]:
         """
         Detect trades from transaction using existing detection logic.
@@ -318,7 +527,7 @@ class WebSocketWalletMonitor:
         # Example integration:
         # from core.wallet_monitor import BatchTransactionProcessor
         # processor = BatchTransactionProcessor(self.monitor)
-        # trades = await processor.process_transaction_batch([tx], self.wallet_address)
+        # trades = await processor.process_transaction_batch([tx], wallet)
         # return trades
 
         return []
@@ -354,7 +563,7 @@ class WebSocketWalletMonitor:
 
             await send_telegram_alert(
                 f"⚠️ **Polling Fallback Activated**\n"
-                f"**Wallet:** `{self.wallet_address[-6:]}`\n"
+                f"**Wallets:** {len(self.wallet_topics)}\n"
                 f"**Reason:** WebSocket unavailable\n"
                 f"**Polling Interval:** {self.fallback_polling_interval}s"
             )
@@ -363,7 +572,7 @@ class WebSocketWalletMonitor:
 
     async def _polling_loop(self) -> None:
         """Polling fallback loop"""
-        logger.info(f"🔄 Starting polling fallback for {self.wallet_address[-6:]}")
+        logger.info(f"🔄 Starting polling fallback for {len(self.wallet_topics)} wallets")
 
         while self.fallback_active:
             try:
@@ -376,29 +585,27 @@ class WebSocketWalletMonitor:
 
                 current_block = await self.polygonscan_client.get_latest_block()
 
-                # Get transactions since last poll
-                if self.last_polled_block == 0:
-                    self.last_polled_block = (
-                        current_block - 100
-                    )  # Start from 100 blocks ago
+                for wallet in self.wallet_addresses:
+                    # Start new wallets from 100 blocks ago
+                    from_block = self.last_polled_block.get(wallet, current_block - 100)
 
-                transactions = await self.polygonscan_client.get_transactions(
-                    self.wallet_address, self.last_polled_block, current_block
-                )
+                    transactions = await self.polygonscan_client.get_transactions(
+                        wallet, from_block, current_block
+                    )
+
+                    # Process transactions
+                    for tx in transactions:
+                        await self._process_transaction(tx, wallet)
 
-                # Process transactions
-                for tx in transactions:
-                    if tx.get("hash") not in self.processed_tx_hashes:
-                        await self._process_transaction(tx)
+                    self.last_polled_block[wallet] = current_block
 
-                self.last_polled_block = current_block
                 self.metrics["polling_cycles"] += 1
 
                 # Calculate latency
                 latency = time.time() - start_time
                 self._update_latency_metric("polling", latency)
 
-                # Check if WebSocket recovered
+                # Check if WebSocket recovered (its on_connect hook resubscribed)
                 if self.ws_manager and self.ws_manager.is_connected():
                     logger.info("✅ WebSocket recovered - switching back from polling")
                     self.fallback_active = False
@@ -453,7 +660,9 @@ class WebSocketWalletMonitor:
             else False,
             "fallback_active": self.fallback_active,
             "websocket_state": ws_state.get("state", "unknown"),
-            "processed_transactions": len(self.processed_tx_hashes),
+            "processed_events": len(self.processed_events),
+            "monitored_wallets": len(self.wallet_topics),
+            "active_log_subscriptions": len(self._active_requests),
         }
 
     def get_performance_comparison(self) -> Dict[str, Any]:
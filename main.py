@@ -46,7 +46,7 @@ import signal
 import sys
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 
 from config import (
@@ -58,10 +58,17 @@ from config import (
 from core.clob_client import PolymarketClient
 from core.endgame_sweeper import EndgameSweeper
 from core.trade_executor import TradeExecutor
+from core.trade_pipeline import CopyTradePipeline
 from core.wallet_monitor import WalletMonitor
 from scanners.leaderboard_scanner import LeaderboardScanner
-from utils.alerts import send_error_alert, send_performance_report, send_telegram_alert
+from utils.alerts import (
+    close_alerts,
+    send_error_alert,
+    send_performance_report,
+    send_telegram_alert,
+)
 from utils.helpers import get_environment_info
+from utils.http_client import close_http_client, get_http_client
 from utils.logging_config import setup_logging
 from utils.security import generate_session_id
 
@@ -70,6 +77,7 @@ setup_logging(
     level=os.getenv("LOG_LEVEL", "INFO"),
     log_dir="logs",
     json_logging=os.getenv("JSON_LOGGING", "true").lower() == "true",
+    queued=os.getenv("QUEUED_LOGGING", "false").lower() == "true",
 )
 
 logger = logging.getLogger(__name__)
@@ -126,6 +134,10 @@ class PolymarketCopyBot:
         self.leaderboard_scanner: Optional[LeaderboardScanner] = None
         self.endgame_sweeper: Optional[EndgameSweeper] = None
 
+        # Streaming detect -> execute pipeline and independent periodic tasks
+        self.trade_pipeline: Optional[CopyTradePipeline] = None
+        self.periodic_tasks: List[asyncio.Task] = []
+
         # Production monitoring server (MCP)
         self.monitoring_server: Optional[Any] = None
         self.monitoring_task: Optional[asyncio.Task] = None
@@ -166,6 +178,10 @@ class PolymarketCopyBot:
             validate_settings()
             validate_scanner_config()
 
+            # Start shared keep-alive HTTP pool used by all Polygonscan/RPC calls
+            await get_http_client().start()
+            logger.info("✅ Shared HTTP client started")
+
             # Initialize CLOB client
             self.clob_client = PolymarketClient()
             logger.info("✅ CLOB client initialized")
@@ -235,7 +251,10 @@ class PolymarketCopyBot:
                 return
 
             # Get top wallets from scanner
-            top_wallets = self.leaderboard_scanner.get_top_wallets()
+            if self.leaderboard_scanner.delta_mode:
+                top_wallets = await self.leaderboard_scanner.get_top_wallets_async()
+            else:
+                top_wallets = self.leaderboard_scanner.get_top_wallets()
 
             if not top_wallets:
                 logger.warning("⚠️ No qualified wallets found in leaderboard scan")
@@ -382,159 +401,143 @@ class PolymarketCopyBot:
         This method coordinates the main trading loop components:
         1. Periodic wallet updates from leaderboard scanner
         2. Health checks before processing
-        3. Wallet monitoring and trade execution
-        4. Position management
-        5. Maintenance and cleanup tasks
-        6. Performance monitoring and reporting
+        3. Wallet monitoring, streaming detected trades to execution
+        4. Maintenance and cleanup tasks
+        5. Performance monitoring and reporting
+
+        Position management and the endgame sweeper run as independent
+        periodic tasks, so neither waits behind wallet scans or trade
+        execution.
         """
         logger.info(
             f"🔍 Starting monitoring loop. Checking every {self.settings.monitor_interval} seconds"
         )
+        self._start_trading_tasks()
 
-        while self.running:
-            cycle_start = time.time()
+        try:
+            while self.running:
+                cycle_start = time.time()
+
+                try:
+                    # Periodically update target wallets from scanner
+                    if time.time() - self.last_wallet_update > self.wallet_update_interval:
+                        await self.update_target_wallets()
+
+                    # Pre-cycle health check
+                    if not await self._perform_health_check():
+                        await asyncio.sleep(5)
+                        continue
+
+                    # Main cycle operations
+                    await self._monitor_wallets_and_execute_trades()
+                    await self._perform_maintenance_tasks()
+
+                    # Calculate sleep time to maintain consistent interval
+                    cycle_time = time.time() - cycle_start
+                    sleep_time = max(0, self.settings.monitor_interval - cycle_time)
+
+                    if sleep_time > 0:
+                        await asyncio.sleep(sleep_time)
+
+                except asyncio.CancelledError:
+                    logger.info("🛑 Monitoring loop cancelled")
+                    break
+                except Exception as e:
+                    await self._handle_monitoring_cycle_error(e, cycle_start)
+        finally:
+            await self._stop_trading_tasks()
+
+    def _start_trading_tasks(self) -> None:
+        """Start the copy trade pipeline and the periodic position tasks"""
+        if self.wallet_monitor and self.trade_executor and not self.trade_pipeline:
+            monitoring = self.settings.monitoring
+            self.trade_pipeline = CopyTradePipeline(
+                self.wallet_monitor,
+                self.trade_executor,
+                queue_size=monitoring.pipeline_queue_size,
+                execution_workers=monitoring.max_concurrent_executions,
+                on_trade_result=self._record_trade_result,
+            )
+        if self.trade_pipeline:
+            self.trade_pipeline.start()
+
+        if self.periodic_tasks:
+            return
+        if self.trade_executor:
+            self.periodic_tasks.append(
+                asyncio.create_task(
+                    self._run_periodic_task(
+                        "position management",
+                        self._manage_positions,
+                        self.settings.monitoring.monitor_interval,
+                    )
+                )
+            )
+        if self.endgame_sweeper:
+            self.periodic_tasks.append(
+                asyncio.create_task(
+                    self._run_periodic_task(
+                        "endgame sweeper",
+                        self._run_endgame_sweeper,
+                        self.settings.endgame.scan_interval_seconds,
+                    )
+                )
+            )
+
+    async def _stop_trading_tasks(self) -> None:
+        """Stop the periodic position tasks and the copy trade pipeline"""
+        tasks, self.periodic_tasks = self.periodic_tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
+        if self.trade_pipeline:
+            await self.trade_pipeline.stop()
+
+    async def _run_periodic_task(
+        self, name: str, operation: Callable[[], Awaitable[None]], interval: float
+    ) -> None:
+        """Run an operation every interval seconds while the bot is running"""
+        while self.running:
+            started = time.time()
             try:
-                # Periodically update target wallets from scanner
-                if time.time() - self.last_wallet_update > self.wallet_update_interval:
-                    await self.update_target_wallets()
-
-                # Pre-cycle health check
-                if not await self._perform_health_check():
-                    await asyncio.sleep(5)
-                    continue
-
-                # Main cycle operations
-                await self._monitor_wallets_and_execute_trades()
-                await self._manage_positions()
-                await self._run_endgame_sweeper()
-                await self._perform_maintenance_tasks()
-
-                # Calculate sleep time to maintain consistent interval
-                cycle_time = time.time() - cycle_start
-                sleep_time = max(0, self.settings.monitor_interval - cycle_time)
-
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-
-            except asyncio.CancelledError:
-                logger.info("🛑 Monitoring loop cancelled")
-                break
+                await operation()
             except Exception as e:
-                await self._handle_monitoring_cycle_error(e, cycle_start)
+                logger.error(f"❌ Error in {name}: {e}", exc_info=True)
+            await asyncio.sleep(max(0, interval - (time.time() - started)))
 
     async def _perform_health_check(self) -> bool:
         """Perform health check before proceeding with monitoring cycle"""
         return await self.health_check()
 
     async def _monitor_wallets_and_execute_trades(self) -> None:
-        """Monitor wallets for new trades and execute copy trades"""
+        """Stream newly detected trades from every wallet into the execution pipeline"""
         if not self.wallet_monitor:
             logger.error("❌ Wallet monitor not initialized")
             return
-
-        wallet_start = time.time()
-        detected_trades = await self.wallet_monitor.monitor_wallets()
-        wallet_time = time.time() - wallet_start
-
-        if not detected_trades:
+        if not self.trade_pipeline:
+            logger.error("❌ Trade pipeline not initialized")
             return
 
-        trade_count = len(detected_trades)
-        logger.info(
-            f"🎯 Detected {trade_count} new trades to copy (wallet scan: {wallet_time:.3f}s)",
-            extra={"trade_count": trade_count, "scan_time": wallet_time},
-        )
-
-        # Execute trades with performance optimizations
-        success_count = await self._execute_detected_trades(
-            detected_trades, wallet_start, wallet_time, trade_count
-        )
-
-        # Update performance stats
-        cycle_time = time.time() - wallet_start
-        await self._update_performance_stats(cycle_time, trade_count, success_count)
-
-    async def _execute_detected_trades(
-        self,
-        detected_trades: List[Dict[str, Any]],
-        wallet_start: float,
-        wallet_time: float,
-        trade_count: int,
-    ) -> int:
-        """Execute detected trades with batching and performance monitoring"""
-        max_concurrent_trades = min(
-            10, len(detected_trades)
-        )  # Max 10 concurrent trades
-
-        if trade_count <= max_concurrent_trades:
-            # Execute all trades concurrently for small batches
-            results = await self._execute_trade_batch(detected_trades)
-        else:
-            # Execute in batches for large numbers of trades
-            results = await self._execute_trade_batches(
-                detected_trades, max_concurrent_trades
-            )
-
-        # Analyze results
-        success_count, error_count = self._analyze_trade_results(results, trade_count)
-
-        # Performance monitoring
-        trade_execution_time = time.time() - wallet_start - wallet_time
-        if trade_count > 0:
-            avg_time_per_trade = trade_execution_time / trade_count
-            logger.debug(
-                f"⏱️ Trade execution: {trade_execution_time:.3f}s total, {avg_time_per_trade:.3f}s per trade"
+        cycle = await self.trade_pipeline.run_cycle()
+        trade_count = cycle["trades_detected"]
+        if trade_count:
+            logger.info(
+                f"🎯 Detected {trade_count} new trades to copy "
+                f"(wallet scan: {cycle['cycle_time']:.3f}s)",
+                extra={"trade_count": trade_count, "scan_time": cycle["cycle_time"]},
             )
 
-        return success_count
-
-    async def _execute_trade_batch(self, trades: List[Dict[str, Any]]) -> List[Any]:
-        """Execute a batch of trades concurrently"""
-        if not self.trade_executor:
-            logger.error("❌ Trade executor not initialized")
-            return [Exception("Trade executor not initialized") for _ in trades]
-
-        tasks = [self.trade_executor.execute_copy_trade(trade) for trade in trades]
-        return await asyncio.gather(*tasks, return_exceptions=True)
-
-    async def _execute_trade_batches(
-        self, trades: List[Dict[str, Any]], batch_size: int
-    ) -> List[Any]:
-        """Execute trades in batches to prevent overload"""
-        results = []
-        for i in range(0, len(trades), batch_size):
-            batch = trades[i : i + batch_size]
-            batch_results = await self._execute_trade_batch(batch)
-            results.extend(batch_results)
-
-            # Small delay between batches to prevent API overload
-            if i + batch_size < len(trades):
-                await asyncio.sleep(0.1)
-
-        return results
-
-    def _analyze_trade_results(
-        self, results: List[Any], trade_count: int
-    ) -> Tuple[int, int]:
-        """Analyze trade execution results and log summary"""
-        success_count = sum(
-            1 for r in results if isinstance(r, dict) and r.get("status") == "success"
-        )
-        error_count = sum(1 for r in results if isinstance(r, Exception))
+        await self._update_performance_stats(cycle["cycle_time"], trade_count)
 
-        if success_count > 0:
+    async def _record_trade_result(self, trade: Dict[str, Any], result: Any) -> None:
+        """Count and log successful copy trades (the pipeline logs failures)"""
+        if isinstance(result, dict) and result.get("status") == "success":
+            self.performance_stats["trades_successful"] += 1
             logger.info(
-                f"✅ Successfully copied {success_count}/{trade_count} trades",
-                extra={"successful_trades": success_count, "total_trades": trade_count},
+                f"✅ Copied trade {result.get('trade_id', trade.get('tx_hash'))}",
+                extra={"wallet": trade.get("wallet_address")},
             )
-        if error_count > 0:
-            logger.warning(f"⚠️ {error_count} trades failed during execution")
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Trade {i} failed: {str(result)[:100]}")
-
-        return success_count, error_count
 
     async def _manage_positions(self) -> None:
         """Manage open positions (stop loss/take profit)"""
@@ -596,7 +599,10 @@ class PolymarketCopyBot:
         try:
             # Start scanner background tasks
             if self.leaderboard_scanner:
-                self.leaderboard_scanner.start_scanning()
+                if self.scanner_config.DELTA_SCAN_ENABLED:
+                    await self.leaderboard_scanner.start_async_scanning()
+                else:
+                    self.leaderboard_scanner.start_scanning()
                 logger.info("✅ Started leaderboard scanner background task")
 
             # Start cache cleanup tasks
@@ -613,7 +619,10 @@ class PolymarketCopyBot:
         """Stop background cleanup tasks for all caches"""
         try:
             if self.leaderboard_scanner:
-                self.leaderboard_scanner.stop_scanning()
+                if self.leaderboard_scanner.delta_mode:
+                    await self.leaderboard_scanner.stop_async_scanning()
+                else:
+                    self.leaderboard_scanner.stop_scanning()
             if self.trade_executor:
                 await self.trade_executor.stop_background_tasks()
             if self.wallet_monitor:
@@ -788,12 +797,24 @@ class PolymarketCopyBot:
         except Exception as e:
             logger.error(f"Error sending shutdown alert: {e}")
 
+        # Deliver queued alerts (including the shutdown alert)
+        try:
+            await close_alerts()
+        except Exception as e:
+            logger.warning(f"⚠️ Error flushing queued alerts: {e}")
+
         # Stop background tasks
         await self._stop_background_cleanup_tasks()
 
         # Stop monitoring server
         await self._stop_monitoring_server()
 
+        # Close shared HTTP connection pool
+        try:
+            await close_http_client()
+        except Exception as e:
+            logger.warning(f"⚠️ Error closing shared HTTP client: {e}")
+
         # Stop endgame sweeper
         if self.endgame_sweeper:
             await self.endgame_sweeper.stop()
@@ -802,12 +823,11 @@ class PolymarketCopyBot:
         logger.info("✅ Bot shutdown completed successfully")
 
     async def _update_performance_stats(
-        self, cycle_time: float, trades_processed: int, trades_successful: int
+        self, cycle_time: float, trades_processed: int
     ):
         """Update performance statistics for monitoring"""
         self.performance_stats["cycles_completed"] += 1
         self.performance_stats["trades_processed"] += trades_processed
-        self.performance_stats["trades_successful"] += trades_successful
         self.performance_stats["total_cycle_time"] += cycle_time
         self.performance_stats["last_cycle_time"] = cycle_time
 
@@ -899,6 +919,14 @@ class PolymarketCopyBot:
 
             logger.info(f"📊 Performance report sent - Health: {performance_health}")
 
+            http_stats = get_http_client().get_stats()
+            logger.info(
+                f"🔌 HTTP pool: {http_stats['requests']} requests, "
+                f"{http_stats['connections_created']} connections opened, "
+                f"{http_stats['connections_reused']} reused "
+                f"({http_stats['connection_reuse_ratio']:.1%} reuse)"
+            )
+
         except Exception as e:
             logger.error(
                 f"Error generating performance report: {str(e)[:100]}", exc_info=True
@@ -363,7 +363,8 @@ class AlertHealthChecker:
             test_message += f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
             # Send via our alert system
-            success = await send_telegram_alert(test_message)
+            # Sent directly (force) so a failed delivery is reported, not just queued
+            success = await send_telegram_alert(test_message, force=True)
 
             if success:
                 logger.info("✅ Test alert sent successfully")
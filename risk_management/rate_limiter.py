@@ -13,7 +13,7 @@ import logging
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import aiohttp
 
@@ -42,11 +42,105 @@ HTTP_STATUS_RATE_LIMITED = 429
 HTTP_TIMEOUT_TOTAL_SECONDS = 30  # Total HTTP timeout
 HTTP_TIMEOUT_CONNECT_SECONDS = 10  # Connection timeout
 
+# JSON-RPC Batch Constants
+DEFAULT_RPC_BATCH_SIZE = 100  # Calls packed into one JSON-RPC array request
+MAX_BATCH_RETRIES = 2  # Retry rounds for failed or missing calls in a batch
+RETRYABLE_RPC_ERROR_CODES = frozenset(
+    {-32005, -32603, 429}  # Limit exceeded, internal error, rate limited
+)
+
+# Multicall3 Constants (same address on every EVM chain, including Polygon)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_AGGREGATE3_SELECTOR = "82ad56cb"  # aggregate3((address,bool,bytes)[])
+DEFAULT_MULTICALL_CHUNK_SIZE = 200  # eth_calls aggregated into one Multicall3 call
+ABI_WORD_HEX = 64  # Hex characters in one 32-byte ABI word
+
 # Response Time Calculation Constants
 RESPONSE_TIME_AVG_WEIGHT_RECENT = 0.1  # Weight for recent response time
 RESPONSE_TIME_AVG_WEIGHT_HISTORICAL = 0.9  # Weight for historical average
 
 
+def _abi_word(value: int) -> str:
+    """Encode an unsigned integer as one hex ABI word"""
+    return format(value, "064x")
+
+
+def _encode_aggregate3(calls: Sequence[Tuple[str, str]]) -> str:
+    """Encode Multicall3 ``aggregate3`` calldata with allowFailure=True for every call.
+
+    Args:
+        calls: (target address, hex calldata) pairs
+
+    Returns:
+        "0x"-prefixed calldata
+    """
+    tuples = []
+    for target, data in calls:
+        data = data[2:] if data.startswith("0x") else data
+        padded = data + "0" * (-len(data) % ABI_WORD_HEX)
+        tuples.append(
+            _abi_word(int(target, 16))
+            + _abi_word(1)  # allowFailure
+            + _abi_word(3 * 32)  # Offset of callData within the tuple
+            + _abi_word(len(data) // 2)
+            + padded
+        )
+
+    # Element offsets are relative to the start of the offset table
+    offsets = []
+    position = 32 * len(tuples)
+    for encoded in tuples:
+        offsets.append(_abi_word(position))
+        position += len(encoded) // 2
+
+    return (
+        "0x"
+        + MULTICALL3_AGGREGATE3_SELECTOR
+        + _abi_word(32)  # Offset of the array
+        + _abi_word(len(tuples))
+        + "".join(offsets)
+        + "".join(tuples)
+    )
+
+
+def _decode_aggregate3(result: str) -> List[Tuple[bool, str]]:
+    """Decode the ``(bool success, bytes returnData)[]`` result of ``aggregate3``.
+
+    Args:
+        result: "0x"-prefixed hex return data
+
+    Returns:
+        (success, "0x"-prefixed return data) per call
+
+    Raises:
+        APIError: If the return data is malformed
+    """
+    data = result[2:] if result and result.startswith("0x") else (result or "")
+
+    def word(byte_offset: int) -> int:
+        chunk = data[byte_offset * 2 : byte_offset * 2 + ABI_WORD_HEX]
+        if len(chunk) != ABI_WORD_HEX:
+            raise ValueError(f"truncated at byte {byte_offset}")
+        return int(chunk, 16)
+
+    try:
+        array = word(0)
+        count = word(array)
+        decoded = []
+        for i in range(count):
+            element = array + 32 + word(array + 32 + 32 * i)
+            success = word(element) != 0
+            payload = element + word(element + 32)
+            length = word(payload)
+            start = (payload + 32) * 2
+            if start + length * 2 > len(data):
+                raise ValueError(f"return data of call {i} out of range")
+            decoded.append((success, "0x" + data[start : start + length * 2]))
+        return decoded
+    except ValueError as e:
+        raise APIError(f"Malformed Multicall3 response: {e}") from e
+
+
 class EndpointStatus(Enum):
     """Status enumeration for RPC endpoint health.
 
@@ -203,6 +297,33 @@ class TokenBucket:
             self.tokens = 0.0
             return wait_time
 
+    async def reserve(self, tokens: int = 1) -> float:
+        """
+        Reserve tokens, borrowing against future refills if necessary.
+
+        Unlike acquire(), a shortfall is recorded as debt (negative balance),
+        so concurrent callers are queued one refill interval apart instead of
+        all waking at the same moment.
+
+        Args:
+            tokens: Number of tokens to reserve
+
+        Returns:
+            Wait time in seconds before the reservation may be used
+        """
+        async with self._lock:
+            now = time.time()
+            elapsed = now - self.last_refill
+            self.tokens = min(
+                self.capacity, self.tokens + (elapsed * self._refill_rate)
+            )
+            self.last_refill = now
+
+            self.tokens -= tokens
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self._refill_rate
+
     async def get_available_tokens(self) -> float:
         """Get current available tokens"""
         async with self._lock:
@@ -463,6 +584,12 @@ class QuickNodeRPCClient:
         # Statistics
         self.request_count = 0
         self.last_stats_log = time.time()
+        self.batch_stats = {
+            "batch_requests": 0,
+            "batched_calls": 0,
+            "batch_splits": 0,
+            "batch_retries": 0,
+        }
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session.
@@ -523,6 +650,43 @@ class QuickNodeRPCClient:
         Returns:
             RPC response data
 
+        Raises:
+            RateLimitError: If rate limited and all retries exhausted
+            APIError: If request fails
+        """
+        payload = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": self.request_count,
+        }
+        data = await self._post(payload, endpoint)
+
+        if "error" in data:
+            error_msg = data["error"].get("message", "Unknown RPC error")
+            raise APIError(f"RPC error: {error_msg}")
+
+        return data.get("result")
+
+    async def _post(
+        self,
+        payload: Union[Dict[str, Any], List[Dict[str, Any]]],
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        """
+        POST a JSON-RPC request (single call or batch array) with rate limiting,
+        endpoint health tracking and failover.
+
+        One HTTP request costs one rate limiter token, however many calls
+        the payload holds.
+
+        Args:
+            payload: JSON-RPC request object or array of request objects
+            endpoint: Specific endpoint to use (None for auto-selection)
+
+        Returns:
+            Decoded JSON response body
+
         Raises:
             RateLimitError: If rate limited and all retries exhausted
             APIError: If request fails
@@ -537,13 +701,6 @@ class QuickNodeRPCClient:
             session = await self._get_session()
             start_time = time.time()
 
-            payload = {
-                "jsonrpc": "2.0",
-                "method": method,
-                "params": params,
-                "id": self.request_count,
-            }
-
             async with session.post(
                 endpoint, json=payload, headers={"Content-Type": "application/json"}
             ) as response:
@@ -583,9 +740,7 @@ class QuickNodeRPCClient:
                             endpoint,
                         )
                         await asyncio.sleep(wait_time)
-                        return await self._make_request(
-                            method, params, self.primary_endpoint
-                        )
+                        return await self._post(payload, self.primary_endpoint)
 
                     # If primary is rate limited, try fallbacks
                     for fallback in self.fallback_endpoints:
@@ -598,9 +753,7 @@ class QuickNodeRPCClient:
                                 )
                                 self.current_endpoint = fallback
                                 await asyncio.sleep(wait_time)
-                                return await self._make_request(
-                                    method, params, fallback
-                                )
+                                return await self._post(payload, fallback)
 
                     # All endpoints rate limited
                     raise RateLimitError(retry_after=int(wait_time), endpoint=endpoint)
@@ -614,13 +767,7 @@ class QuickNodeRPCClient:
 
                     await self.rate_limiter.handle_success()
 
-                    data = await response.json()
-
-                    if "error" in data:
-                        error_msg = data["error"].get("message", "Unknown RPC error")
-                        raise APIError(f"RPC error: {error_msg}")
-
-                    return data.get("result")
+                    return await response.json()
 
                 else:
                     # Other error
@@ -706,6 +853,231 @@ class QuickNodeRPCClient:
         """
         return await self._make_request(method, params, endpoint)
 
+    async def call_batch(
+        self,
+        calls: Sequence[Tuple[str, List[Any]]],
+        batch_size: int = DEFAULT_RPC_BATCH_SIZE,
+        return_exceptions: bool = False,
+        endpoint: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Make many RPC calls as JSON-RPC batch (array) requests.
+
+        Calls are packed ``batch_size`` to a request and the chunks are sent
+        concurrently; each HTTP request costs one rate limiter token. Results
+        are matched to calls by id, so providers may answer in any order.
+        A request that fails as a whole is split in half and retried, and
+        calls that are missing from the response or fail with a transient
+        error code are retried, up to MAX_BATCH_RETRIES rounds.
+
+        Args:
+            calls: (method, params) pairs
+            batch_size: Maximum calls per HTTP request
+            return_exceptions: Return APIError instances in place of failed
+                calls instead of raising the first one
+            endpoint: Optional specific endpoint to use
+
+        Returns:
+            Results in the same order as ``calls``
+
+        Raises:
+            RateLimitError: If rate limited on all endpoints
+            APIError: If a call fails and return_exceptions is False
+        """
+        calls = list(calls)
+        results: List[Any] = [None] * len(calls)
+        batch_size = max(1, batch_size)
+
+        await asyncio.gather(
+            *(
+                self._run_batch(
+                    calls,
+                    list(range(start, min(start + batch_size, len(calls)))),
+                    results,
+                    endpoint,
+                    MAX_BATCH_RETRIES,
+                )
+                for start in range(0, len(calls), batch_size)
+            )
+        )
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    async def _run_batch(
+        self,
+        calls: List[Tuple[str, List[Any]]],
+        indices: List[int],
+        results: List[Any],
+        endpoint: Optional[str],
+        retries: int,
+    ) -> None:
+        """Send the calls at ``indices`` as one request and store their results"""
+        if len(indices) == 1:
+            method, params = calls[indices[0]]
+            try:
+                results[indices[0]] = await self._make_request(method, params, endpoint)
+            except RateLimitError:
+                raise
+            except APIError as e:
+                results[indices[0]] = e
+            return
+
+        # The position in ``calls`` doubles as the JSON-RPC id
+        payload = [
+            {"jsonrpc": "2.0", "method": calls[i][0], "params": calls[i][1], "id": i}
+            for i in indices
+        ]
+        self.batch_stats["batch_requests"] += 1
+        self.batch_stats["batched_calls"] += len(indices)
+
+        try:
+            data = await self._post(payload, endpoint)
+            if not isinstance(data, list):
+                # Some providers answer an oversized batch with one error object
+                error = data.get("error", {}) if isinstance(data, dict) else {}
+                raise APIError(f"RPC batch rejected: {error.get('message', data)}")
+        except RateLimitError:
+            raise
+        except APIError as e:
+            if retries <= 0:
+                for i in indices:
+                    results[i] = e
+                return
+            logger.debug("RPC batch of %d failed (%s), splitting", len(indices), e)
+            self.batch_stats["batch_splits"] += 1
+            middle = len(indices) // 2
+            await asyncio.gather(
+                self._run_batch(calls, indices[:middle], results, endpoint, retries - 1),
+                self._run_batch(calls, indices[middle:], results, endpoint, retries - 1),
+            )
+            return
+
+        responses = {item.get("id"): item for item in data if isinstance(item, dict)}
+        retry: List[int] = []
+        for i in indices:
+            item = responses.get(i)
+            if item is None:
+                results[i] = APIError(f"RPC batch response missing id {i}")
+                retry.append(i)
+            elif "error" in item:
+                error = item["error"] if isinstance(item["error"], dict) else {}
+                results[i] = APIError(f"RPC error: {error.get('message', 'Unknown RPC error')}")
+                if error.get("code") in RETRYABLE_RPC_ERROR_CODES:
+                    retry.append(i)
+            else:
+                results[i] = item.get("result")
+
+        if retry and retries > 0:
+            self.batch_stats["batch_retries"] += len(retry)
+            await self._run_batch(calls, retry, results, endpoint, retries - 1)
+
+    async def multicall(
+        self,
+        calls: Sequence[Tuple[str, str]],
+        block: str = "latest",
+        chunk_size: int = DEFAULT_MULTICALL_CHUNK_SIZE,
+    ) -> List[Optional[str]]:
+        """
+        Run many ``eth_call`` contract reads through Multicall3.
+
+        Reads are aggregated ``chunk_size`` at a time into ``aggregate3``
+        calls (with allowFailure set), and the aggregated calls themselves
+        go out as one JSON-RPC batch.
+
+        Args:
+            calls: (contract address, hex calldata) pairs
+            block: Block tag or hex block number to read at
+            chunk_size: Maximum reads per Multicall3 call
+
+        Returns:
+            Hex return data per read ("0x..."), or None for a read that reverted
+
+        Raises:
+            APIError: If a Multicall3 call fails
+        """
+        calls = list(calls)
+        chunk_size = max(1, chunk_size)
+        chunks = [calls[i : i + chunk_size] for i in range(0, len(calls), chunk_size)]
+
+        responses = await self.call_batch(
+            [
+                ("eth_call", [{"to": MULTICALL3_ADDRESS, "data": _encode_aggregate3(chunk)}, block])
+                for chunk in chunks
+            ]
+        )
+
+        results: List[Optional[str]] = []
+        for chunk, response in zip(chunks, responses):
+            decoded = _decode_aggregate3(response)
+            if len(decoded) != len(chunk):
+                raise APIError(
+                    f"Multicall3 returned {len(decoded)} results for {len(chunk)} calls"
+                )
+            results.extend(data if success else None for success, data in decoded)
+        return results
+
+    async def get_balances(self, addresses: Sequence[str], block: str = "latest") -> List[int]:
+        """Get native balances (in wei) for many addresses in batched requests.
+
+        Args:
+            addresses: Addresses to query.
+            block: Block tag or hex block number.
+
+        Returns:
+            Balances in the same order as ``addresses``.
+
+        Raises:
+            APIError: If any balance lookup fails.
+        """
+        results = await self.call_batch(
+            [("eth_getBalance", [address, block]) for address in addresses]
+        )
+        return [int(result, 16) for result in results]
+
+    async def get_transaction_receipts(
+        self, tx_hashes: Sequence[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Get transaction receipts for many transactions in batched requests.
+
+        Args:
+            tx_hashes: Transaction hashes.
+
+        Returns:
+            Receipts in the same order as ``tx_hashes`` (None if not yet mined).
+
+        Raises:
+            APIError: If any receipt lookup fails.
+        """
+        return await self.call_batch(
+            [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes]
+        )
+
+    async def get_blocks(
+        self, block_numbers: Sequence[int], full_transactions: bool = False
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Get many blocks in batched requests.
+
+        Args:
+            block_numbers: Block numbers to fetch.
+            full_transactions: Include full transaction objects instead of hashes.
+
+        Returns:
+            Blocks in the same order as ``block_numbers``.
+
+        Raises:
+            APIError: If any block lookup fails.
+        """
+        return await self.call_batch(
+            [
+                ("eth_getBlockByNumber", [hex(number), full_transactions])
+                for number in block_numbers
+            ]
+        )
+
     async def get_block_number(self) -> int:
         """Get current block number from the blockchain.
 
@@ -750,6 +1122,7 @@ class QuickNodeRPCClient:
             Dictionary containing:
             - current_endpoint: Currently active endpoint URL
             - rate_limiter_stats: Statistics from rate limiter
+            - batch_stats: JSON-RPC batch request, split and retry counters
             - endpoints: Health metrics for each endpoint including:
                 - status: Endpoint status
                 - success_rate: Success rate (0.0-1.0)
@@ -763,6 +1136,7 @@ class QuickNodeRPCClient:
         return {
             "current_endpoint": self.current_endpoint,
             "rate_limiter_stats": self.rate_limiter.get_stats(),
+            "batch_stats": dict(self.batch_stats),
             "endpoints": {
                 url: {
                     "status": health.status.value,
@@ -1,3 +1,4 @@
+import asyncio
 import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -6,6 +7,7 @@ from web3 import Web3
 from web3.middleware import ExtraDataToPOAMiddleware
 
 from config.scanner_config import ScannerConfig
+from utils.http_client import get_http_client
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -45,6 +47,30 @@ class BlockchainAPI:
             time.sleep(self.rate_limit_delay - elapsed)
         self.last_request_time = time.time()
 
+    async def _respect_rate_limits_async(self) -> None:
+        """Non-blocking variant of _respect_rate_limits for coroutine callers"""
+        elapsed = time.time() - self.last_request_time
+        if elapsed < self.rate_limit_delay:
+            await asyncio.sleep(self.rate_limit_delay - elapsed)
+        self.last_request_time = time.time()
+
+    async def _rpc_call(self, method: str, params: List[Any]) -> Any:
+        """Send a JSON-RPC request over the shared keep-alive HTTP pool"""
+        await self._respect_rate_limits_async()
+
+        session = await get_http_client().get_session()
+        payload = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
+        async with session.post(self.rpc_url, json=payload) as response:
+            if response.status != 200:
+                raise ConnectionError(f"RPC {method} failed: HTTP {response.status}")
+            data = await response.json()
+
+        if "error" in data:
+            raise ConnectionError(
+                f"RPC {method} error: {data['error'].get('message', 'unknown')}"
+            )
+        return data.get("result")
+
     async def get_wallet_transactions(
         self,
         wallet_address: str,
@@ -53,10 +79,8 @@ class BlockchainAPI:
     ) -> List[Dict[str, Any]]:
         """Get recent transactions for a wallet using event filtering"""
         try:
-            self._respect_rate_limits()
-
             # Get current block number if not provided
-            current_block = self.web3.eth.block_number
+            current_block = int(await self._rpc_call("eth_blockNumber", []), 16)
             if end_block is None:
                 end_block = current_block
             if start_block is None:
@@ -65,7 +89,12 @@ class BlockchainAPI:
                 )  # Look back 1000 blocks (~2 hours)
 
             # Get transaction count to estimate activity
-            tx_count = self.web3.eth.get_transaction_count(wallet_address)
+            tx_count = int(
+                await self._rpc_call(
+                    "eth_getTransactionCount", [wallet_address, "latest"]
+                ),
+                16,
+            )
             logger.debug(f"Wallet {wallet_address[:8]} has {tx_count} transactions")
 
             # This is a simplified version - in production you'd want to use event filters
@@ -86,38 +115,37 @@ class BlockchainAPI:
 
         try:
             # Scan recent blocks for transactions involving this wallet
+            wallet_lower = wallet_address.lower()
             for block_num in range(
                 end_block, max(start_block, end_block - 50), -1
             ):  # Scan last 50 blocks
-                self._respect_rate_limits()
-                block = self.web3.eth.get_block(block_num, full_transactions=True)
-
-                for tx in block.transactions:
-                    if hasattr(tx, "hash"):
-                        tx_hash = tx.hash.hex()
-                        tx_from = tx["from"].lower() if "from" in tx else ""
-                        tx_to = tx["to"].lower() if "to" in tx and tx["to"] else ""
-
-                        if (tx_from == wallet_address.lower()) or (
-                            tx_to == wallet_address.lower()
-                        ):
-                            transactions.append(
-                                {
-                                    "hash": tx_hash,
-                                    "from": tx_from,
-                                    "to": tx_to,
-                                    "value": tx.value / 1e18
-                                    if hasattr(tx, "value")
-                                    else 0,
-                                    "gasPrice": tx.gasPrice
-                                    if hasattr(tx, "gasPrice")
-                                    else 0,
-                                    "blockNumber": block_num,
-                                    "timestamp": block.timestamp,
-                                    "gasUsed": 0,  # Would need receipt for this
-                                    "status": 1,  # Assume success, would need receipt for actual status
-                                }
-                            )
+                block = await self._rpc_call(
+                    "eth_getBlockByNumber", [hex(block_num), True]
+                )
+                if not block:
+                    continue
+                block_timestamp = int(block.get("timestamp", "0x0"), 16)
+
+                for tx in block.get("transactions", []):
+                    if not isinstance(tx, dict) or "hash" not in tx:
+                        continue
+                    tx_from = (tx.get("from") or "").lower()
+                    tx_to = (tx.get("to") or "").lower()
+
+                    if (tx_from == wallet_lower) or (tx_to == wallet_lower):
+                        transactions.append(
+                            {
+                                "hash": tx["hash"],
+                                "from": tx_from,
+                                "to": tx_to,
+                                "value": int(tx.get("value", "0x0"), 16) / 1e18,
+                                "gasPrice": int(tx.get("gasPrice", "0x0"), 16),
+                                "blockNumber": block_num,
+                                "timestamp": block_timestamp,
+                                "gasUsed": 0,  # Would need receipt for this
+                                "status": 1,  # Assume success, would need receipt for actual status
+                            }
+                        )
 
                 if len(transactions) >= 100:  # Limit results
                     break
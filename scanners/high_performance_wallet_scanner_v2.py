@@ -45,7 +45,7 @@ from dataclasses import dataclass, field
 from decimal import Decimal, getcontext, ROUND_HALF_UP, InvalidOperation
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 import traceback
 
 from pydantic import BaseModel
@@ -135,6 +135,10 @@ class ScanStatistics:
     cache_hits: int = 0
     cache_misses: int = 0
     errors: int = 0
+    stage1_processed: int = 0
+    stage2_processed: int = 0
+    stage3_processed: int = 0
+    stage_throughput: Dict[str, float] = field(default_factory=dict)  # Wallets/second
     start_time_utc: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     end_time_utc: Optional[datetime] = None
 
@@ -155,6 +159,18 @@ class ProcessingMetrics:
 
 
 @dataclass
+class _WalletJob:
+    """A wallet moving through the stage queues."""
+
+    index: int
+    address: str
+    summary: Dict[str, Any] = field(default_factory=dict)
+    wallet_data: Optional[Dict[str, Any]] = None
+    stage1_result: Dict[str, Any] = field(default_factory=dict)
+    stage2_result: Dict[str, Any] = field(default_factory=dict)
+    processing_time_ms: float = 0.0
+
+
 class RiskFrameworkConfig(BaseModel):
     """
     Risk framework configuration with exact thresholds.
@@ -190,13 +206,19 @@ class RiskFrameworkConfig(BaseModel):
 
     # Processing Limits
     MAX_TRADES_FOR_ANALYSIS: int = 100  # Limit to 100 most recent trades
-    WALLET_BATCH_SIZE: int = 50  # Process wallets in batches
+    WALLET_BATCH_SIZE: int = 50  # Wallets queued ahead of each stage
+
+    # Pipeline Workers (Stage 1 fetches summaries, Stage 2 full trade history)
+    STAGE1_WORKERS: int = 20
+    STAGE2_WORKERS: int = 10
+    STAGE3_WORKERS: int = 4
 
     # Memory Management
     MAX_MEMORY_MB: int = 500  # Maximum memory usage in MB
     CACHE_API_MAX_SIZE: int = 1000  # Max items in API cache
     CACHE_ANALYSIS_MAX_SIZE: int = 2000  # Max items in analysis cache
     CACHE_WALLET_MAX_SIZE: int = 500  # Max items in wallet cache
+    CACHE_SUMMARY_MAX_SIZE: int = 5000  # Max items in wallet summary cache
 
     # Circuit Breaker Settings
     MAX_ERROR_RATE: float = 0.10  # 10% error rate triggers circuit breaker
@@ -275,6 +297,17 @@ class HighPerformanceWalletScanner:
             logger.error(f"Failed to initialize WalletAnalyzer: {e}")
             raise PolymarketAPIError(f"Wallet analyzer initialization failed: {e}")
 
+        # Tiered fetching needs a summary endpoint; scanners.wallet_analyzer's
+        # WalletAnalyzer has none yet, so Stage 1 then uses full wallet data
+        self.tiered_fetch_enabled = callable(
+            getattr(self.wallet_analyzer, "get_wallet_summary", None)
+        )
+        if not self.tiered_fetch_enabled:
+            logger.warning(
+                "Wallet analyzer has no get_wallet_summary; tiered fetching is "
+                "inactive and Stage 1 downloads full wallet data"
+            )
+
         # ============================================================================
         # CRITICAL FIX #1-2: Memory Leak Prevention
         # All caches use BoundedCache with component_name for MCP monitoring
@@ -301,6 +334,13 @@ class HighPerformanceWalletScanner:
             component_name="scanner.wallet_cache",  # Required for MCP monitoring
         )
 
+        # Wallet summary cache - cheap Stage 1 data, 30 min TTL
+        self.summary_cache = BoundedCache(
+            max_size=self.risk_config.CACHE_SUMMARY_MAX_SIZE,
+            ttl_seconds=1800,  # 30 minutes for wallet summaries
+            component_name="scanner.summary_cache",  # Required for MCP monitoring
+        )
+
         # Viral wallet list (known influencers to avoid)
         self.viral_wallets: Set[str] = set()
         self._load_viral_wallets()
@@ -316,6 +356,10 @@ class HighPerformanceWalletScanner:
         self.max_concurrent_wallets = 50
         self.wallet_semaphore = asyncio.Semaphore(self.max_concurrent_wallets)
 
+        # Pipeline progress: stage -> [first start, last finish] (time.time())
+        self._stage_windows: Dict[int, List[float]] = {}
+        self._completed_wallets = 0
+
         # Circuit breaker state tracking
         self.circuit_breaker_active = False
         self.circuit_breaker_activation_time: Optional[datetime] = None
@@ -407,6 +451,12 @@ class HighPerformanceWalletScanner:
         """
         Scan a batch of wallets with high-performance filtering pipeline.
 
+        Wallets stream through per-stage queues, each with its own worker
+        pool, so a slow wallet never holds up the wallets behind it. When
+        the wallet analyzer provides a summary endpoint, Stage 1 runs on the
+        cheap summary and full trade history is only fetched for wallets
+        that pass it (see ``tiered_fetch_enabled``).
+
         PERFORMANCE TARGETS:
             - Stage 1: ~10ms per wallet (80% rejection rate)
             - Stage 2: ~50ms per wallet (additional 15% rejection)
@@ -415,14 +465,15 @@ class HighPerformanceWalletScanner:
 
         Args:
             wallet_list: List of wallet addresses to scan
-            batch_size: Optional batch size (uses config default if None)
+            batch_size: Maximum wallets queued ahead of each stage
+                (uses config default if None)
 
         Returns:
             Tuple of (scan results, statistics)
 
         Raises:
             ValidationError: If wallet_list is invalid or circuit breaker is active
-            NetworkError: If API calls fail consistently
+            APIError: If API calls fail consistently
         """
         # Validate input
         if not wallet_list:
@@ -455,7 +506,8 @@ class HighPerformanceWalletScanner:
             f"🚀 Starting high-performance scan of {len(wallet_list)} wallets",
             extra={
                 "batch_size": batch_size,
-                "concurrency": self.max_concurrent_wallets,
+                "stage_workers": f"{self.risk_config.STAGE1_WORKERS}/"
+                f"{self.risk_config.STAGE2_WORKERS}/{self.risk_config.STAGE3_WORKERS}",
                 "start_time_utc": scan_start_time.isoformat(),
             },
         )
@@ -466,36 +518,12 @@ class HighPerformanceWalletScanner:
         )
         self.metrics = ProcessingMetrics(start_time_utc=scan_start_time)
 
-        # Process wallets in batches for memory efficiency
-        all_results = []
-        processed_count = 0
-
+        # Stream wallets through the stage queues (no batch barrier)
         try:
-            for i in range(0, len(wallet_list), batch_size):
-                batch = wallet_list[i : i + batch_size]
-
-                # Process batch concurrently
-                batch_results = await self._process_wallet_batch(batch)
-
-                # Filter out None results (errors)
-                valid_results = [r for r in batch_results if r is not None]
-                all_results.extend(valid_results)
-
-                processed_count += len(batch)
-
-                # Log progress every 100 wallets
-                if processed_count % 100 == 0:
-                    logger.info(
-                        f"Progress: {processed_count}/{len(wallet_list)} wallets processed "
-                        f"({processed_count / len(wallet_list):.1%})",
-                        extra={
-                            "processed": processed_count,
-                            "total": len(wallet_list),
-                            "progress_percent": f"{processed_count / len(wallet_list):.1%}",
-                        },
-                    )
+            results = await self._run_pipeline(wallet_list, queue_size=batch_size)
+            all_results = [r for r in results if r is not None]
 
-        except (APIError, NetworkError) as e:
+        except APIError as e:
             logger.error(f"API/Network error during scan: {e}")
             self.metrics.errors += 1
             self.statistics.errors += 1
@@ -541,6 +569,10 @@ class HighPerformanceWalletScanner:
                 "wallets_per_minute": f"{len(wallet_list) / (duration_seconds / 60):.0f}"
                 if duration_seconds > 0
                 else 0,
+                "stage_throughput": {
+                    stage: f"{rate:.1f}/s"
+                    for stage, rate in self.statistics.stage_throughput.items()
+                },
             },
         )
 
@@ -550,40 +582,128 @@ class HighPerformanceWalletScanner:
     # Private Helper Methods
     # =========================================================================
 
-    async def _process_wallet_batch(
-        self, wallet_batch: List[str]
+    async def _run_pipeline(
+        self,
+        wallet_list: List[str],
+        queue_size: int,
     ) -> List[Optional[WalletScanResult]]:
         """
-        Process a batch of wallets concurrently.
+        Stream wallets through per-stage queues with dedicated workers.
+
+        Stage 1 workers fetch wallet summaries, Stage 2 workers fetch full
+        trade history for survivors, and Stage 3 workers do the final
+        scoring. Bounded queues between stages provide backpressure.
 
         Args:
-            wallet_batch: List of wallet addresses to process
+            wallet_list: List of wallet addresses to process
+            queue_size: Maximum wallets waiting in front of each stage
 
         Returns:
-            List of scan results (None for errors)
+            List of scan results in input order (None for errors)
         """
-        # Process wallets concurrently with semaphore
-        tasks = [self._scan_single_wallet(address) for address in wallet_batch]
+        results: List[Optional[WalletScanResult]] = [None] * len(wallet_list)
+        stages = [
+            (self._pipeline_stage1, self.risk_config.STAGE1_WORKERS),
+            (self._pipeline_stage2, self.risk_config.STAGE2_WORKERS),
+            (self._pipeline_stage3, self.risk_config.STAGE3_WORKERS),
+        ]
+        queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=max(1, queue_size)) for _ in stages]
+        self._stage_windows = {}
+        self._completed_wallets = 0
+
+        workers: List[List[asyncio.Task]] = []
+        for stage, (handler, worker_count) in enumerate(stages, start=1):
+            outbox = queues[stage] if stage < len(queues) else None
+            workers.append(
+                [
+                    asyncio.create_task(
+                        self._stage_worker(stage, handler, queues[stage - 1], outbox, results)
+                    )
+                    for _ in range(max(1, worker_count))
+                ]
+            )
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            for index, address in enumerate(wallet_list):
+                await queues[0].put(_WalletJob(index=index, address=address))
+
+            # A job is queued downstream before it is marked done upstream, so
+            # once a stage's queue has drained nothing more can reach it
+            for queue, stage_workers in zip(queues, workers):
+                await queue.join()
+                for task in stage_workers:
+                    task.cancel()
+        finally:
+            all_workers = [task for stage_workers in workers for task in stage_workers]
+            for task in all_workers:
+                task.cancel()
+            await asyncio.gather(*all_workers, return_exceptions=True)
+
+        for stage, (first_start, last_end) in self._stage_windows.items():
+            elapsed = last_end - first_start
+            processed = getattr(self.statistics, f"stage{stage}_processed")
+            self.statistics.stage_throughput[f"stage{stage}"] = (
+                processed / elapsed if elapsed > 0 else 0.0
+            )
 
-        # Handle exceptions and convert to None
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(
-                    f"Error processing wallet {wallet_batch[i][:8]}...: {result}",
-                    extra={
-                        "wallet": mask_wallet_address(wallet_batch[i]),
-                        "error_type": type(result).__name__,
-                    },
-                )
-                processed_results.append(None)
-                self.metrics.errors += 1
-            else:
-                processed_results.append(result)
+        return results
+
+    async def _stage_worker(
+        self,
+        stage: int,
+        handler: Callable[[_WalletJob], Awaitable[Optional[WalletScanResult]]],
+        inbox: asyncio.Queue,
+        outbox: Optional[asyncio.Queue],
+        results: List[Optional[WalletScanResult]],
+    ) -> None:
+        """
+        Run one stage's handler on queued wallets until cancelled.
+
+        A handler returns a final result, or None to pass the wallet on to
+        the next stage.
+        """
+        while True:
+            job = await inbox.get()
+            try:
+                started = time.time()
+                window = self._stage_windows.setdefault(stage, [started, started])
+                advance = False
+                result = None
+                try:
+                    result = await handler(job)
+                    advance = result is None and outbox is not None
+                except Exception as e:
+                    await self._handle_wallet_error(job.address, e)
+                window[1] = max(window[1], time.time())
+
+                if advance:
+                    await outbox.put(job)
+                else:
+                    self._complete_wallet(job, result, results)
+            finally:
+                inbox.task_done()
 
-        return processed_results
+    def _complete_wallet(
+        self,
+        job: _WalletJob,
+        result: Optional[WalletScanResult],
+        results: List[Optional[WalletScanResult]],
+    ) -> None:
+        """Store a wallet's final result and log progress every 100 wallets"""
+        results[job.index] = result
+        self._completed_wallets += 1
+
+        if self._completed_wallets % 100 == 0:
+            total = len(results)
+            logger.info(
+                f"Progress: {self._completed_wallets}/{total} wallets processed "
+                f"({self._completed_wallets / total:.1%})",
+                extra={
+                    "processed": self._completed_wallets,
+                    "total": total,
+                    "progress_percent": f"{self._completed_wallets / total:.1%}",
+                },
+            )
 
     async def _scan_single_wallet(self, address: str) -> Optional[WalletScanResult]:
         """
@@ -600,151 +720,208 @@ class HighPerformanceWalletScanner:
         Returns:
             WalletScanResult or None if error occurred
         """
-        wallet_start_time = datetime.now(timezone.utc)
-
+        job = _WalletJob(index=0, address=address)
         try:
-            # Check cache first
-            cached_result = self.analysis_cache.get(address)
-            if cached_result:
-                self.metrics.cache_hits += 1
-                self.statistics.cache_hits += 1
-                return cached_result
-
-            self.metrics.cache_misses += 1
-            self.statistics.cache_misses += 1
-
-            # Get wallet data (with rate limiting)
-            async with self.api_semaphore:
-                wallet_data = await self._fetch_wallet_data(address)
-                self.metrics.api_calls += 1
-                self.statistics.api_calls += 1
+            for handler in (
+                self._pipeline_stage1,
+                self._pipeline_stage2,
+                self._pipeline_stage3,
+            ):
+                result = await handler(job)
+                if result is not None:
+                    return result
+            return None
 
-            # Stage 1: Basic validation
-            stage1_start = time.time()
-            stage1_result = await self._stage1_basic_validation(address, wallet_data)
-            stage1_time = (time.time() - stage1_start) * 1000  # Convert to ms
-            self.metrics.stage1_times.append(stage1_time)
-
-            if not stage1_result["pass"]:
-                self.statistics.stage1_rejected += 1
-                result = WalletScanResult(
-                    address=address,
-                    classification="REJECT",
-                    total_score=0.0,
-                    specialization_score=0.0,
-                    risk_behavior_score=0.0,
-                    market_structure_score=0.0,
-                    confidence_score=0.0,
-                    rejection_reasons=stage1_result["reasons"],
-                    metrics={},
-                    processing_time_ms=stage1_time,
-                    scan_stage_completed=1,
-                    timestamp_utc=datetime.now(timezone.utc),
-                )
-                return result
-
-            # Stage 2: Risk behavior analysis
-            stage2_start = time.time()
-            stage2_result = await self._stage2_risk_analysis(address, wallet_data)
-            stage2_time = (time.time() - stage2_start) * 1000
-            self.metrics.stage2_times.append(stage2_time)
-
-            if not stage2_result["pass"]:
-                self.statistics.stage2_rejected += 1
-                result = WalletScanResult(
-                    address=address,
-                    classification="WATCHLIST",
-                    total_score=stage2_result["score"],
-                    specialization_score=stage1_result["specialization_score"],
-                    risk_behavior_score=stage2_result["risk_score"],
-                    market_structure_score=0.0,
-                    confidence_score=stage2_result["confidence_score"],
-                    rejection_reasons=stage2_result["reasons"],
-                    metrics=stage2_result["metrics"],
-                    processing_time_ms=stage1_time + stage2_time,
-                    scan_stage_completed=2,
-                    timestamp_utc=datetime.now(timezone.utc),
-                )
-                return result
-
-            # Stage 3: Full scoring
-            stage3_start = time.time()
-            stage3_result = await self._stage3_full_scoring(address, wallet_data)
-            stage3_time = (time.time() - stage3_start) * 1000
-            self.metrics.stage3_times.append(stage3_time)
-
-            # Determine classification
-            total_score = stage3_result["score"]
-
-            if total_score >= self.risk_config.TARGET_WALLET_SCORE:
-                classification = "TARGET"
-                self.statistics.targets_found += 1
-
-                # Send alert for TARGET wallet
-                await self._send_target_alert(address, total_score, stage3_result)
-
-            elif total_score >= self.risk_config.WATCHLIST_SCORE:
-                classification = "WATCHLIST"
-                self.statistics.watchlist_found += 1
-            else:
-                classification = "REJECT"
-                self.statistics.stage3_rejected += 1
-
-            result = WalletScanResult(
-                address=address,
-                classification=classification,
-                total_score=total_score,
-                specialization_score=stage3_result["specialization_score"],
-                risk_behavior_score=stage3_result["risk_score"],
-                market_structure_score=stage3_result["structure_score"],
-                confidence_score=stage3_result["confidence_score"],
-                rejection_reasons=stage3_result["reasons"],
-                metrics=stage3_result["metrics"],
-                processing_time_ms=stage1_time + stage2_time + stage3_time,
-                scan_stage_completed=3,
-                timestamp_utc=datetime.now(timezone.utc),
-            )
+        except Exception as e:
+            await self._handle_wallet_error(address, e)
+            return None
 
-            # Cache successful results
-            self.analysis_cache.set(address, result)
+    async def _handle_wallet_error(self, address: str, error: Exception) -> None:
+        """
+        Log and count a failed wallet (called from the except block).
 
-            return result
+        Args:
+            address: Wallet address that failed
+            error: Exception raised while scanning it
+        """
+        self.metrics.errors += 1
+        self.statistics.errors += 1
 
-        except (APIError, NetworkError) as e:
+        if isinstance(error, APIError):
             logger.warning(
-                f"API/Network error for wallet {mask_wallet_address(address)}: {e}",
-                extra={"wallet": mask_wallet_address(address), "error": str(e)},
+                f"API/Network error for wallet {mask_wallet_address(address)}: {error}",
+                extra={"wallet": mask_wallet_address(address), "error": str(error)},
             )
-            self.metrics.errors += 1
-            self.statistics.errors += 1
-
             # Check circuit breaker
             await self._check_circuit_breaker()
 
-            return None
-
-        except ValidationError as e:
+        elif isinstance(error, ValidationError):
             logger.warning(
-                f"Validation error for wallet {mask_wallet_address(address)}: {e}",
-                extra={"wallet": mask_wallet_address(address), "error": str(e)},
+                f"Validation error for wallet {mask_wallet_address(address)}: {error}",
+                extra={"wallet": mask_wallet_address(address), "error": str(error)},
             )
-            self.metrics.errors += 1
-            self.statistics.errors += 1
-            return None
 
-        except Exception as e:
+        else:
             logger.exception(
-                f"Unexpected error scanning wallet {mask_wallet_address(address)}: {e}",
+                f"Unexpected error scanning wallet {mask_wallet_address(address)}: {error}",
                 extra={
                     "wallet": mask_wallet_address(address),
-                    "error_type": type(e).__name__,
+                    "error_type": type(error).__name__,
                     "traceback": traceback.format_exc(),
                 },
             )
-            self.metrics.errors += 1
-            self.statistics.errors += 1
+
+    async def _pipeline_stage1(self, job: _WalletJob) -> Optional[WalletScanResult]:
+        """
+        Stage 1 step: analysis cache lookup, summary fetch and basic validation.
+
+        Args:
+            job: Wallet being scanned
+
+        Returns:
+            Final result (cached or REJECT), or None if the wallet passed
+        """
+        self.statistics.stage1_processed += 1
+
+        # Check cache first
+        cached_result = self.analysis_cache.get(job.address)
+        if cached_result:
+            self.metrics.cache_hits += 1
+            self.statistics.cache_hits += 1
+            return cached_result
+
+        self.metrics.cache_misses += 1
+        self.statistics.cache_misses += 1
+
+        # Tier 1 data: a cheap summary when the analyzer offers one, otherwise
+        # the full wallet data (kept on the job so Stage 2 does not refetch)
+        if self.tiered_fetch_enabled:
+            job.summary = await self._fetch_wallet_summary(job.address)
+        else:
+            job.wallet_data = await self._fetch_wallet_data(job.address)
+            job.summary = job.wallet_data
+
+        stage1_start = time.time()
+        job.stage1_result = await self._stage1_basic_validation(job.address, job.summary)
+        stage1_time = (time.time() - stage1_start) * 1000  # Convert to ms
+        self.metrics.stage1_times.append(stage1_time)
+        job.processing_time_ms += stage1_time
+
+        if job.stage1_result["pass"]:
             return None
 
+        self.statistics.stage1_rejected += 1
+        return WalletScanResult(
+            address=job.address,
+            classification="REJECT",
+            total_score=0.0,
+            specialization_score=0.0,
+            risk_behavior_score=0.0,
+            market_structure_score=0.0,
+            confidence_score=0.0,
+            rejection_reasons=job.stage1_result["reasons"],
+            metrics={},
+            processing_time_ms=job.processing_time_ms,
+            scan_stage_completed=1,
+            timestamp_utc=datetime.now(timezone.utc),
+        )
+
+    async def _pipeline_stage2(self, job: _WalletJob) -> Optional[WalletScanResult]:
+        """
+        Stage 2 step: full trade history fetch and risk behavior analysis.
+
+        Args:
+            job: Wallet that passed Stage 1
+
+        Returns:
+            WATCHLIST result if the wallet is held back, or None if it passed
+        """
+        self.statistics.stage2_processed += 1
+
+        # Tier 2 data: full trade history, only for Stage 1 survivors
+        if job.wallet_data is None:
+            job.wallet_data = await self._fetch_wallet_data(job.address)
+
+        stage2_start = time.time()
+        job.stage2_result = await self._stage2_risk_analysis(job.address, job.wallet_data)
+        stage2_time = (time.time() - stage2_start) * 1000
+        self.metrics.stage2_times.append(stage2_time)
+        job.processing_time_ms += stage2_time
+
+        if job.stage2_result["pass"]:
+            return None
+
+        self.statistics.stage2_rejected += 1
+        return WalletScanResult(
+            address=job.address,
+            classification="WATCHLIST",
+            total_score=job.stage2_result["score"],
+            specialization_score=job.stage1_result["specialization_score"],
+            risk_behavior_score=job.stage2_result["risk_score"],
+            market_structure_score=0.0,
+            confidence_score=job.stage2_result["confidence_score"],
+            rejection_reasons=job.stage2_result["reasons"],
+            metrics=job.stage2_result["metrics"],
+            processing_time_ms=job.processing_time_ms,
+            scan_stage_completed=2,
+            timestamp_utc=datetime.now(timezone.utc),
+        )
+
+    async def _pipeline_stage3(self, job: _WalletJob) -> WalletScanResult:
+        """
+        Stage 3 step: full scoring, classification and TARGET alerting.
+
+        Args:
+            job: Wallet that passed Stage 2
+
+        Returns:
+            Final classified result
+        """
+        self.statistics.stage3_processed += 1
+
+        stage3_start = time.time()
+        stage3_result = await self._stage3_full_scoring(job.address, job.wallet_data)
+        stage3_time = (time.time() - stage3_start) * 1000
+        self.metrics.stage3_times.append(stage3_time)
+        job.processing_time_ms += stage3_time
+
+        # Determine classification
+        total_score = stage3_result["score"]
+
+        if total_score >= self.risk_config.TARGET_WALLET_SCORE:
+            classification = "TARGET"
+            self.statistics.targets_found += 1
+
+            # Send alert for TARGET wallet
+            await self._send_target_alert(job.address, total_score, stage3_result)
+
+        elif total_score >= self.risk_config.WATCHLIST_SCORE:
+            classification = "WATCHLIST"
+            self.statistics.watchlist_found += 1
+        else:
+            classification = "REJECT"
+            self.statistics.stage3_rejected += 1
+
+        result = WalletScanResult(
+            address=job.address,
+            classification=classification,
+            total_score=total_score,
+            specialization_score=stage3_result["specialization_score"],
+            risk_behavior_score=stage3_result["risk_score"],
+            market_structure_score=stage3_result["structure_score"],
+            confidence_score=stage3_result["confidence_score"],
+            rejection_reasons=stage3_result["reasons"],
+            metrics=stage3_result["metrics"],
+            processing_time_ms=job.processing_time_ms,
+            scan_stage_completed=3,
+            timestamp_utc=datetime.now(timezone.utc),
+        )
+
+        # Cache successful results
+        self.analysis_cache.set(job.address, result)
+
+        return result
+
     # =========================================================================
     # Stage 1: Basic Validation (10ms target)
     # =========================================================================
@@ -760,9 +937,12 @@ class HighPerformanceWalletScanner:
         Target: 10ms per wallet
         Purpose: Eliminate 80% of wallets immediately
 
+        Works on either a wallet summary (``category_volumes``) or full
+        wallet data (``trades``).
+
         Args:
             address: Wallet address to validate
-            wallet_data: Wallet data from API
+            wallet_data: Wallet summary or full wallet data from API
 
         Returns:
             Dict with 'pass' boolean, 'specialization_score', and 'reasons' list
@@ -795,10 +975,12 @@ class HighPerformanceWalletScanner:
 
         # PILLAR 1: Specialization check (generalist rejection)
         # Calculate specialization score efficiently
-        trades = wallet_data.get("trades", [])
-        if trades:
-            specialization_score, top_category = (
-                self._calculate_specialization_score_fast(trades)
+        category_volumes = wallet_data.get("category_volumes")
+        if category_volumes is None:
+            category_volumes = self._aggregate_category_volumes(wallet_data.get("trades", []))
+        if category_volumes:
+            specialization_score, top_category = self._specialization_from_volumes(
+                category_volumes
             )
 
             # Early rejection for generalists
@@ -822,7 +1004,6 @@ class HighPerformanceWalletScanner:
             return {"pass": False, "specialization_score": 0.0, "reasons": reasons}
 
         # Stage 1 passed
-        specialization_score, _ = self._calculate_specialization_score_fast(trades)
         return {
             "pass": True,
             "specialization_score": specialization_score,
@@ -849,9 +1030,20 @@ class HighPerformanceWalletScanner:
         Returns:
             Tuple of (specialization_score, top_category_name)
         """
+        return self._specialization_from_volumes(self._aggregate_category_volumes(trades))
+
+    def _aggregate_category_volumes(self, trades: List[Dict]) -> Dict[str, Decimal]:
+        """
+        Sum traded volume per market category in O(n).
+
+        Args:
+            trades: List of trade dictionaries
+
+        Returns:
+            Dictionary of category name to total volume (Decimal)
+        """
         # CRITICAL FIX #33: Use Decimal for all financial calculations
         categories = defaultdict(lambda: Decimal("0"))
-        total_vol = Decimal("0")
 
         for t in trades:
             cat = t.get("category", "Uncategorized")
@@ -865,8 +1057,31 @@ class HighPerformanceWalletScanner:
                 vol = Decimal("0")
 
             categories[cat] += vol
-            total_vol += vol
 
+        return dict(categories)
+
+    def _specialization_from_volumes(
+        self,
+        category_volumes: Dict[str, Any],
+    ) -> Tuple[float, str]:
+        """
+        Calculate specialization score from per-category volumes.
+
+        Args:
+            category_volumes: Category name to traded volume
+
+        Returns:
+            Tuple of (specialization_score, top_category_name)
+        """
+        categories: Dict[str, Decimal] = {}
+        for cat, volume in category_volumes.items():
+            try:
+                categories[cat] = Decimal(str(volume))
+            except (InvalidOperation, ValueError) as e:
+                logger.warning(f"Invalid category volume: {volume}: {e}")
+                categories[cat] = Decimal("0")
+
+        total_vol = sum(categories.values(), Decimal("0"))
         if total_vol == Decimal("0"):
             return 0.0, "NO_DATA"
 
@@ -1178,12 +1393,64 @@ class HighPerformanceWalletScanner:
     # Data Fetching
     # =========================================================================
 
+    async def _fetch_wallet_summary(
+        self,
+        address: str,
+    ) -> Dict[str, Any]:
+        """
+        Fetch the cheap wallet summary Stage 1 needs (Tier 1 data).
+
+        The summary holds ``trade_count``, ``wallet_age_days`` and
+        ``category_volumes`` (category -> traded volume) instead of the
+        full trade list, so the ~80% of wallets rejected in Stage 1 never
+        have their trade history downloaded. Only used when the analyzer
+        implements ``get_wallet_summary``.
+
+        Args:
+            address: Wallet address to fetch
+
+        Returns:
+            Dictionary with wallet summary
+
+        Raises:
+            APIError: If API call fails
+        """
+        # Check cache first
+        cached_summary = self.summary_cache.get(address)
+        if cached_summary:
+            return cached_summary
+
+        # Fetch from API
+        try:
+            async with self.api_semaphore:
+                summary = await self.wallet_analyzer.get_wallet_summary(address)
+                self.metrics.api_calls += 1
+                self.statistics.api_calls += 1
+
+            # Cache the result
+            self.summary_cache.set(address, summary)
+
+            return summary
+
+        except APIError as e:
+            logger.warning(
+                f"API error fetching wallet summary {mask_wallet_address(address)}: {e}"
+            )
+            raise
+
+        except Exception as e:
+            # CRITICAL FIX #3-9: Specific exception handling
+            logger.exception(
+                f"Unexpected error fetching wallet summary {mask_wallet_address(address)}: {e}"
+            )
+            raise APIError(f"Failed to fetch wallet summary: {e}")
+
     async def _fetch_wallet_data(
         self,
         address: str,
     ) -> Dict[str, Any]:
         """
-        Fetch wallet data from API with caching.
+        Fetch full wallet data including trade history (Tier 2 data).
 
         PERFORMANCE: Checks cache first, only calls API on cache miss
         MEMORY: Uses BoundedCache with component_name for MCP monitoring
@@ -1196,7 +1463,6 @@ class HighPerformanceWalletScanner:
 
         Raises:
             APIError: If API call fails
-            NetworkError: If network connectivity issue
         """
         # Check cache first
         cached_data = self.wallet_cache.get(address)
@@ -1205,14 +1471,17 @@ class HighPerformanceWalletScanner:
 
         # Fetch from API
         try:
-            wallet_data = await self.wallet_analyzer.analyze_wallet(address)
+            async with self.api_semaphore:
+                wallet_data = await self.wallet_analyzer.analyze_wallet(address)
+                self.metrics.api_calls += 1
+                self.statistics.api_calls += 1
 
             # Cache the result
             self.wallet_cache.set(address, wallet_data)
 
             return wallet_data
 
-        except (APIError, NetworkError) as e:
+        except APIError as e:
             logger.warning(
                 f"API error fetching wallet {mask_wallet_address(address)}: {e}"
             )
@@ -2,10 +2,13 @@ import asyncio
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
 
 from config.scanner_config import ScannerConfig, WalletScore
+from risk_management.rate_limiter import TokenBucket
 from scanners.wallet_analyzer import WalletAnalyzer
+from scanners.wallet_score_table import WalletScoreTable, wallet_fingerprint
 from utils.alerts import send_error_alert, send_telegram_alert
 from utils.logger import get_logger
 
@@ -50,7 +53,9 @@ class SimpleErrorCounter:
 class LeaderboardScanner:
     """Production-grade leaderboard scanner with circuit breakers and monitoring"""
 
-    def __init__(self, config: ScannerConfig) -> None:
+    def __init__(
+        self, config: ScannerConfig, score_table: Optional[WalletScoreTable] = None
+    ) -> None:
         self.config = config
         # Pass API failure callback to wallet analyzer
         self.wallet_analyzer = WalletAnalyzer(
@@ -72,6 +77,28 @@ class LeaderboardScanner:
         self.is_running = False
         self.scan_thread = None
 
+        # Async delta rescoring mode: unchanged wallets are served from the score table
+        if score_table is None:
+            score_table = WalletScoreTable(
+                Path(config.SCORE_TABLE_FILE),
+                max_age_seconds=config.SCORE_MAX_AGE_HOURS * 3600,
+            )
+        self.score_table = score_table
+        self.rescore_budget = TokenBucket(
+            capacity=max(1, config.DELTA_RESCORE_CONCURRENCY),
+            refill_rate=config.DELTA_RESCORE_RATE_PER_SECOND,
+        )
+        self.delta_stats = {
+            "scans": 0,
+            "wallets_seen": 0,
+            "wallets_rescored": 0,
+            "wallets_reused": 0,
+            "rescore_errors": 0,
+        }
+        self._async_scan_lock: Optional[asyncio.Lock] = None
+        self._scan_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
     def start_scanning(self) -> None:
         """Start continuous scanning in background thread"""
         if self.is_running:
@@ -142,28 +169,142 @@ class LeaderboardScanner:
                         "✅ Scan successful while in fallback mode - API may have recovered"
                     )
 
-                # Store results
-                self.last_scan_results = results
-                self.last_scan_time = time.time()
-                scan_duration = time.time() - start_time
+                self._record_scan_results(results, start_time)
+                return results
 
-                # Log results
-                logger.info(f"Scan completed in {scan_duration:.2f} seconds")
-                logger.info(f"Found {len(results)} qualified wallets:")
-                for i, wallet in enumerate(results[:10], 1):  # Log top 10
-                    logger.info(
-                        f"{i}. {wallet.address[:8]}... - Score: {wallet.total_score:.3f}, "
-                        f"ROI: {wallet.metrics.get('roi_30d', 0):.1f}%, "
-                        f"Risk: {wallet.risk_score:.2f}"
+            except Exception as e:
+                logger.error(f"Scan failed: {e}")
+
+                # Handle API-specific failures
+                self._handle_scan_failure(e)
+
+                # Also record general circuit breaker error
+                self.circuit_breaker.record_error()
+                raise
+
+    def _record_scan_results(self, results: List[WalletScore], start_time: float) -> None:
+        """Store and log a successful scan's results and relax failure tracking"""
+        # Store results
+        self.last_scan_results = results
+        self.last_scan_time = time.time()
+        scan_duration = time.time() - start_time
+
+        # Log results
+        logger.info(f"Scan completed in {scan_duration:.2f} seconds")
+        logger.info(f"Found {len(results)} qualified wallets:")
+        for i, wallet in enumerate(results[:10], 1):  # Log top 10
+            logger.info(
+                f"{i}. {wallet.address[:8]}... - Score: {wallet.total_score:.3f}, "
+                f"ROI: {wallet.metrics.get('roi_30d', 0):.1f}%, "
+                f"Risk: {wallet.risk_score:.2f}"
+            )
+
+        # Reset circuit breaker and API failure count on success
+        self.circuit_breaker.reset()
+        if not self.fallback_mode:
+            self.api_failure_count = max(
+                0, self.api_failure_count - 1
+            )  # Gradually reduce on success
+
+    # ------------------------------------------------------------------
+    # Async delta rescoring mode
+    # ------------------------------------------------------------------
+
+    @property
+    def delta_mode(self) -> bool:
+        """Whether the scanner is running as an asyncio task (delta rescoring)"""
+        return self._scan_task is not None and not self._scan_task.done()
+
+    async def start_async_scanning(self) -> None:
+        """Start continuous delta scanning as an asyncio task"""
+        if self.is_running:
+            logger.warning("Scanner already running")
+            return
+
+        self.is_running = True
+        self._loop = asyncio.get_running_loop()
+        self._scan_task = asyncio.create_task(
+            self._async_scan_loop(), name="LeaderboardScanner"
+        )
+        logger.info("Leaderboard scanner started in async delta mode")
+
+    async def stop_async_scanning(self) -> None:
+        """Stop the async scanner and persist the score table"""
+        self.is_running = False
+        if self._scan_task is not None:
+            self._scan_task.cancel()
+            await asyncio.gather(self._scan_task, return_exceptions=True)
+            self._scan_task = None
+        self.score_table.save()
+        logger.info("Leaderboard scanner stopped")
+
+    async def _async_scan_loop(self) -> None:
+        """Asyncio version of _scan_loop with the same breaker and backoff rules"""
+        while self.is_running:
+            try:
+                if self.circuit_breaker.is_tripped():
+                    logger.warning(
+                        "Scanner circuit breaker tripped. Waiting for reset..."
                     )
+                    await asyncio.sleep(300)  # Wait 5 minutes before checking again
+                    continue
 
-                # Reset circuit breaker and API failure count on success
-                self.circuit_breaker.reset()
-                if not self.fallback_mode:
-                    self.api_failure_count = max(
-                        0, self.api_failure_count - 1
-                    )  # Gradually reduce on success
+                await self.run_delta_scan()
+
+                # Wait for next scan interval
+                await asyncio.sleep(self.config.SCAN_INTERVAL_HOURS * 3600)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Critical error in scan loop: {e}")
+                self.circuit_breaker.record_error()
 
+                # Exponential backoff on errors
+                error_count = self.circuit_breaker.error_count
+                backoff_time = min(300, 30 * (2**error_count))  # Max 5 minutes
+                logger.warning(f"Backing off for {backoff_time} seconds after error")
+                await asyncio.sleep(backoff_time)
+
+    async def run_delta_scan(self) -> List[WalletScore]:
+        """
+        Execute a scan that only rescores wallets whose data changed.
+
+        Each leaderboard entry is fingerprinted (last trade, trade count,
+        volume, ...). Wallets with an unchanged fingerprint reuse their score
+        from the persisted score table; changed wallets are analyzed
+        concurrently under the rescoring rate budget, off the event loop.
+        A scan therefore costs about one performance fetch per changed wallet.
+
+        Returns:
+            Ranked qualified wallets, as from run_scan
+        """
+        if self._async_scan_lock is None:
+            self._async_scan_lock = asyncio.Lock()
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+
+        async with self._async_scan_lock:
+            try:
+                # Check if we should recover from fallback mode
+                self._check_fallback_mode_recovery()
+
+                logger.info("Starting delta leaderboard scan...")
+                if self.fallback_mode:
+                    logger.info("🔄 Operating in fallback mode due to API failures")
+                start_time = time.time()
+
+                leaderboard_data = await asyncio.to_thread(
+                    self.wallet_analyzer.get_leaderboard_data
+                )
+                if leaderboard_data:
+                    scores = await self._delta_rescore(leaderboard_data)
+                    results = self.wallet_analyzer.rank_wallet_scores(scores)
+                else:
+                    logger.critical("🚨 All data sources failed - using safe defaults")
+                    results = self.wallet_analyzer._get_safe_default_wallets()
+
+                self._record_scan_results(results, start_time)
                 return results
 
             except Exception as e:
@@ -176,6 +317,87 @@ class LeaderboardScanner:
                 self.circuit_breaker.record_error()
                 raise
 
+    async def _delta_rescore(
+        self, leaderboard_data: List[Dict[str, Any]]
+    ) -> List[WalletScore]:
+        """Score the leaderboard, analyzing only wallets missing a fresh table entry"""
+        scores: List[WalletScore] = []
+        changed: List[Tuple[Dict[str, Any], Optional[str]]] = []
+        addresses = []
+
+        for wallet_data in leaderboard_data:
+            address = wallet_data.get("address")
+            if not address:
+                continue
+            addresses.append(address)
+
+            fingerprint = wallet_fingerprint(wallet_data)
+            hit, score = self.score_table.lookup(address, fingerprint)
+            if not hit:
+                changed.append((wallet_data, fingerprint))
+            elif score is not None:
+                scores.append(score)
+
+        semaphore = asyncio.Semaphore(max(1, self.config.DELTA_RESCORE_CONCURRENCY))
+
+        async def rescore(
+            wallet_data: Dict[str, Any], fingerprint: Optional[str]
+        ) -> Optional[WalletScore]:
+            address = wallet_data["address"]
+            async with semaphore:
+                wait_time = await self.rescore_budget.reserve()
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
+                try:
+                    score = await asyncio.to_thread(
+                        self.wallet_analyzer._analyze_single_wallet, wallet_data
+                    )
+                except Exception as e:
+                    logger.error(f"Error analyzing wallet {address}: {e}")
+                    self.delta_stats["rescore_errors"] += 1
+                    # Keep serving the previous score; retried next scan
+                    return self.score_table.get_score(address)
+
+            self.score_table.store(address, fingerprint, score)
+            return score
+
+        rescored = await asyncio.gather(*(rescore(data, fp) for data, fp in changed))
+        scores.extend(score for score in rescored if score is not None)
+
+        self.score_table.retain(addresses)
+        self.score_table.save()
+
+        self.delta_stats["scans"] += 1
+        self.delta_stats["wallets_seen"] += len(addresses)
+        self.delta_stats["wallets_rescored"] += len(changed)
+        self.delta_stats["wallets_reused"] += len(addresses) - len(changed)
+        logger.info(
+            f"Delta scan rescored {len(changed)}/{len(addresses)} wallets "
+            f"({len(addresses) - len(changed)} served from score table)"
+        )
+        return scores
+
+    async def get_top_wallets_async(self) -> List[Dict[str, Any]]:
+        """get_top_wallets for delta mode: scans without blocking the event loop"""
+        if not self.last_scan_results:
+            logger.warning("No scan results available. Running delta scan now...")
+            await self.run_delta_scan()
+        return self.get_top_wallets()
+
+    def _schedule_alert(self, alert: Coroutine[Any, Any, Any]) -> None:
+        """Run an alert coroutine on the event loop, from the loop or a worker thread"""
+        try:
+            asyncio.get_running_loop().create_task(alert)
+            return
+        except RuntimeError:
+            pass
+
+        if self._loop is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(alert, self._loop)
+        else:
+            alert.close()
+            logger.debug("No event loop available, alert dropped")
+
     def get_top_wallets(self) -> List[Dict[str, Any]]:
         """Get top wallets in format compatible with trading bot"""
         if not self.last_scan_results:
@@ -243,7 +465,7 @@ class LeaderboardScanner:
 
         # Send appropriate alert based on severity
         if self.api_failure_count == 1:
-            asyncio.create_task(
+            self._schedule_alert(
                 send_telegram_alert(
                     f"⚠️ API Warning: Endpoint {endpoint} failed\n"
                     f"Attempt: {attempt}/{max_attempts}\n"
@@ -252,7 +474,7 @@ class LeaderboardScanner:
             )
 
         elif self.api_failure_count >= 3:
-            asyncio.create_task(
+            self._schedule_alert(
                 send_error_alert(
                     f"🚨 CRITICAL API FAILURE - {failure_severity} SEVERITY",
                     {
@@ -273,7 +495,7 @@ class LeaderboardScanner:
             )
             self.fallback_mode = True
             self.fallback_start_time = time.time()
-            asyncio.create_task(
+            self._schedule_alert(
                 send_telegram_alert(
                     f"🔥 FALLBACK MODE ACTIVATED\n"
                     f"Reason: {self.api_failure_count} consecutive API failures\n"
@@ -296,7 +518,7 @@ class LeaderboardScanner:
             )
 
             # Alert operations team
-            asyncio.create_task(
+            self._schedule_alert(
                 self.send_error_alert(
                     "API FAILURE THRESHOLD EXCEEDED",
                     {
@@ -385,7 +607,7 @@ class LeaderboardScanner:
                 if not (circuit_ok and has_results):
                     from utils.alerts import send_error_alert
 
-                    asyncio.create_task(
+                    self._schedule_alert(
                         send_error_alert(
                             "Scanner Health Check Failed",
                             {
@@ -424,5 +646,10 @@ class LeaderboardScanner:
                     else 0
                 ),
             },
+            "delta_scan": {
+                "enabled": self.delta_mode,
+                **self.delta_stats,
+                "score_table": self.score_table.get_stats(),
+            },
             "top_wallets": [w.address for w in self.last_scan_results[:5]],
         }
@@ -30,56 +30,7 @@ class WalletAnalyzer:
         try:
             logger.info("Starting comprehensive leaderboard wallet analysis...")
 
-            # Primary source: Polymarket API
-            leaderboard_data = None
-            try:
-                leaderboard_data = self.polymarket_api.get_leaderboard(limit=200)
-                if leaderboard_data:
-                    logger.info(
-                        f"✅ Primary API successful: Retrieved {len(leaderboard_data)} wallets from Polymarket"
-                    )
-                else:
-                    logger.warning("⚠️ Primary Polymarket API returned no data")
-                    # Report API issue even if it returns empty data
-                    if self.api_failure_callback:
-                        self.api_failure_callback(
-                            "/api/leaderboard",
-                            Exception("Empty response from API"),
-                            1,
-                            1,
-                        )
-            except Exception as e:
-                logger.error(f"❌ Primary Polymarket API failed: {e}")
-                # Report API failure for monitoring and alerting
-                if self.api_failure_callback:
-                    self.api_failure_callback("/api/leaderboard", e, 1, 1)
-
-            # Secondary source: Blockchain analysis (if primary fails)
-            if not leaderboard_data:
-                logger.info(
-                    "🔍 Primary API failed, falling back to blockchain analysis"
-                )
-                try:
-                    blockchain_wallets = self._analyze_blockchain_wallets()
-                    if blockchain_wallets:
-                        leaderboard_data = blockchain_wallets
-                        logger.info(
-                            f"✅ Blockchain analysis successful: Retrieved {len(leaderboard_data)} wallets"
-                        )
-                    else:
-                        logger.warning("⚠️ Blockchain analysis also failed")
-                except Exception as e:
-                    logger.error(f"❌ Blockchain analysis failed: {e}")
-
-            # Tertiary source: Community-curated wallet list
-            if not leaderboard_data:
-                logger.warning(
-                    "⚠️ All primary sources failed, using community-curated wallets"
-                )
-                leaderboard_data = self._get_community_wallets()
-                logger.info(
-                    f"✅ Community wallet fallback: Retrieved {len(leaderboard_data)} wallets"
-                )
+            leaderboard_data = self.get_leaderboard_data()
 
             # Ensure we have some data
             if not leaderboard_data:
@@ -99,20 +50,72 @@ class WalletAnalyzer:
                     )
                     continue
 
-            # Apply final filtering and ranking
-            filtered_wallets = self._apply_risk_filters(analyzed_wallets)
-            ranked_wallets = self._rank_wallets(filtered_wallets)
-
-            logger.info(
-                f"Analysis complete. Found {len(ranked_wallets)} qualified wallets"
-            )
-            return ranked_wallets[: self.config.MAX_WALLETS_TO_MONITOR]
+            return self.rank_wallet_scores(analyzed_wallets)
 
         except Exception as e:
             logger.critical(f"Critical error in wallet analysis: {e}")
             # Always have a fallback
             return self._get_safe_default_wallets()
 
+    def get_leaderboard_data(self) -> List[Dict[str, Any]]:
+        """Fetch leaderboard entries from the first data source that returns any"""
+        # Primary source: Polymarket API
+        leaderboard_data = None
+        try:
+            leaderboard_data = self.polymarket_api.get_leaderboard(limit=200)
+            if leaderboard_data:
+                logger.info(
+                    f"✅ Primary API successful: Retrieved {len(leaderboard_data)} wallets from Polymarket"
+                )
+            else:
+                logger.warning("⚠️ Primary Polymarket API returned no data")
+                # Report API issue even if it returns empty data
+                if self.api_failure_callback:
+                    self.api_failure_callback(
+                        "/api/leaderboard",
+                        Exception("Empty response from API"),
+                        1,
+                        1,
+                    )
+        except Exception as e:
+            logger.error(f"❌ Primary Polymarket API failed: {e}")
+            # Report API failure for monitoring and alerting
+            if self.api_failure_callback:
+                self.api_failure_callback("/api/leaderboard", e, 1, 1)
+
+        # Secondary source: Blockchain analysis (if primary fails)
+        if not leaderboard_data:
+            logger.info("🔍 Primary API failed, falling back to blockchain analysis")
+            try:
+                blockchain_wallets = self._analyze_blockchain_wallets()
+                if blockchain_wallets:
+                    leaderboard_data = blockchain_wallets
+                    logger.info(
+                        f"✅ Blockchain analysis successful: Retrieved {len(leaderboard_data)} wallets"
+                    )
+                else:
+                    logger.warning("⚠️ Blockchain analysis also failed")
+            except Exception as e:
+                logger.error(f"❌ Blockchain analysis failed: {e}")
+
+        # Tertiary source: Community-curated wallet list
+        if not leaderboard_data:
+            logger.warning("⚠️ All primary sources failed, using community-curated wallets")
+            leaderboard_data = self._get_community_wallets()
+            logger.info(
+                f"✅ Community wallet fallback: Retrieved {len(leaderboard_data)} wallets"
+            )
+
+        return leaderboard_data or []
+
+    def rank_wallet_scores(self, wallet_scores: List[WalletScore]) -> List[WalletScore]:
+        """Apply final filtering and ranking, keeping the wallets to monitor"""
+        filtered_wallets = self._apply_risk_filters(wallet_scores)
+        ranked_wallets = self._rank_wallets(filtered_wallets)
+
+        logger.info(f"Analysis complete. Found {len(ranked_wallets)} qualified wallets")
+        return ranked_wallets[: self.config.MAX_WALLETS_TO_MONITOR]
+
     def _analyze_single_wallet(
         self, wallet_data: Dict[str, Any]
     ) -> Optional[WalletScore]:
@@ -0,0 +1,234 @@
+"""
+Persisted wallet score table for delta leaderboard rescoring.
+
+Each leaderboard wallet is stored with a fingerprint of its source data
+(last trade id, trade count, volume, PnL, ...) and the score computed from
+it. A scan only rescores wallets whose fingerprint changed (or whose score
+is older than the maximum age); everything else is served from the table.
+The table is persisted to disk so a restart does not rescore the whole
+leaderboard.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from config.scanner_config import WalletScore
+from utils.helpers import normalize_address
+
+logger = logging.getLogger(__name__)
+
+# Score table constants
+DEFAULT_SCORE_MAX_AGE_SECONDS = 24 * 3600  # Rescore unchanged wallets daily (ROI windows roll)
+
+# Leaderboard fields that change whenever a wallet trades
+FINGERPRINT_FIELDS = (
+    "last_trade_id",
+    "last_trade_timestamp",
+    "last_active",
+    "trade_count",
+    "volume",
+    "pnl",
+    "roi",
+)
+
+
+def wallet_fingerprint(wallet_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Fingerprint the parts of a leaderboard entry that change when a wallet trades.
+
+    Args:
+        wallet_data: Leaderboard entry for one wallet
+
+    Returns:
+        Hex digest, or None if the entry has none of the fingerprint fields
+        (such wallets are always rescored)
+    """
+    values = [(name, wallet_data.get(name)) for name in FINGERPRINT_FIELDS]
+    if all(value is None for _, value in values):
+        return None
+    encoded = json.dumps(values, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class WalletScoreTable:
+    """
+    Persistent mapping of wallet address -> (fingerprint, score).
+
+    A stored score of None records that the wallet was scored and did not
+    qualify, so it is not re-analyzed until its data changes.
+
+    Example:
+        table = WalletScoreTable(Path("data/leaderboard/wallet_scores.json"))
+        hit, score = table.lookup(address, fingerprint)
+        if not hit:
+            score = analyze(address)
+            table.store(address, fingerprint, score)
+        table.save()
+    """
+
+    def __init__(
+        self,
+        table_file: Path,
+        max_age_seconds: float = DEFAULT_SCORE_MAX_AGE_SECONDS,
+    ) -> None:
+        """
+        Initialize the score table and load persisted scores.
+
+        Args:
+            table_file: JSON file used to persist scores across restarts
+            max_age_seconds: Scores older than this are treated as stale
+        """
+        self.table_file = Path(table_file)
+        self.max_age_seconds = max_age_seconds
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._last_save = 0.0
+        self.hits = 0
+        self.misses = 0
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load scores from disk, starting empty if the file is missing or corrupt"""
+        if not self.table_file.exists():
+            return
+
+        try:
+            with open(self.table_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._entries = {
+                normalize_address(wallet): {
+                    "fingerprint": entry["fingerprint"],
+                    "scored_at": float(entry["scored_at"]),
+                    "score": entry.get("score"),
+                }
+                for wallet, entry in data.get("wallets", {}).items()
+            }
+            logger.info(
+                f"📍 Loaded {len(self._entries)} wallet scores from {self.table_file}"
+            )
+        except (IOError, OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning(f"Could not load wallet scores from {self.table_file}: {e}")
+            self._entries = {}
+
+    def save(self, force: bool = False) -> bool:
+        """
+        Persist scores atomically if they changed since the last save.
+
+        Args:
+            force: Write even when nothing changed
+
+        Returns:
+            True if the file was written
+        """
+        if not self._dirty and not force:
+            return False
+
+        try:
+            self.table_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.table_file.with_suffix(self.table_file.suffix + ".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"updated_at": time.time(), "wallets": self._entries}, f)
+            os.replace(tmp_file, self.table_file)
+            self._dirty = False
+            self._last_save = time.time()
+            return True
+        except (IOError, OSError) as e:
+            logger.error(f"Failed to save wallet scores to {self.table_file}: {e}")
+            return False
+
+    def lookup(
+        self, wallet_address: str, fingerprint: Optional[str]
+    ) -> Tuple[bool, Optional[WalletScore]]:
+        """
+        Get a wallet's stored score if its source data is unchanged.
+
+        Args:
+            wallet_address: Wallet to look up
+            fingerprint: Fingerprint of the wallet's current leaderboard entry
+
+        Returns:
+            Tuple of (hit, score); score is None for a wallet that did not qualify
+        """
+        entry = self._entries.get(normalize_address(wallet_address))
+        if (
+            entry is None
+            or fingerprint is None
+            or entry["fingerprint"] != fingerprint
+            or time.time() - entry["scored_at"] > self.max_age_seconds
+        ):
+            self.misses += 1
+            return False, None
+
+        self.hits += 1
+        score = entry["score"]
+        return True, WalletScore(**score) if score is not None else None
+
+    def get_score(self, wallet_address: str) -> Optional[WalletScore]:
+        """Get the last stored score for a wallet regardless of freshness"""
+        entry = self._entries.get(normalize_address(wallet_address))
+        if entry is None or entry["score"] is None:
+            return None
+        return WalletScore(**entry["score"])
+
+    def store(
+        self,
+        wallet_address: str,
+        fingerprint: Optional[str],
+        score: Optional[WalletScore],
+    ) -> None:
+        """
+        Record a freshly computed score (a snapshot, later mutation is not stored).
+
+        Args:
+            wallet_address: Wallet that was scored
+            fingerprint: Fingerprint of the entry the score was computed from
+            score: Computed score, or None if the wallet did not qualify
+        """
+        if fingerprint is None:
+            return
+        self._entries[normalize_address(wallet_address)] = {
+            "fingerprint": fingerprint,
+            "scored_at": time.time(),
+            "score": score.model_dump() if score is not None else None,
+        }
+        self._dirty = True
+
+    def retain(self, wallet_addresses: Iterable[str]) -> int:
+        """
+        Drop scores for wallets that left the leaderboard.
+
+        Args:
+            wallet_addresses: Wallets whose scores should be kept
+
+        Returns:
+            Number of scores removed
+        """
+        keep = {normalize_address(w) for w in wallet_addresses}
+        removed = [w for w in self._entries if w not in keep]
+        for wallet in removed:
+            del self._entries[wallet]
+        if removed:
+            self._dirty = True
+        return len(removed)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get score table statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "tracked_wallets": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "last_save": self._last_save,
+        }
+
+    def __len__(self) -> int:
+        """Number of wallets with a stored score"""
+        return len(self._entries)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+BoundedCache Microbenchmark
+===========================
+
+Measures per-operation cost of utils.bounded_cache.BoundedCache as the cache
+grows. With O(1) get/set the insert cost should stay flat from 1k to 1M
+entries; the previous implementation scanned every entry on each insert.
+
+For each size the cache is filled to capacity, then timed for:
+- set on a full cache (every insert evicts the LRU entry)
+- get hits (each hit moves the entry to the MRU end)
+
+Usage:
+    python scripts/benchmark_bounded_cache.py
+    python scripts/benchmark_bounded_cache.py --sizes 1000 10000 --ops 50000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.bounded_cache import BoundedCache  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_OPS = 100_000
+MAX_FLAT_RATIO = 3.0  # Largest/smallest insert cost still considered flat
+
+
+def benchmark_size(size: int, ops: int) -> Dict[str, float]:
+    """
+    Benchmark a cache of the given capacity.
+
+    Args:
+        size: Cache capacity (filled before timing)
+        ops: Number of timed operations per measurement
+
+    Returns:
+        Dictionary with fill time and ns/op for set and get
+    """
+    cache = BoundedCache(max_size=size, ttl_seconds=3600, component_name="benchmark")
+    value = {"tx_hash": "0x" + "ab" * 32, "block": 50_000_000, "amount": 12.5}
+
+    start = time.perf_counter()
+    for i in range(size):
+        cache.set(f"wallet:{i}", value)
+    fill_seconds = time.perf_counter() - start
+
+    # Inserts on a full cache: each one evicts the least recently used entry
+    start = time.perf_counter()
+    for i in range(size, size + ops):
+        cache.set(f"wallet:{i}", value)
+    set_ns = (time.perf_counter() - start) / ops * 1e9
+
+    # Hits spread across the live key range
+    live_start = size + ops - len(cache)
+    stride = max(1, len(cache) // ops)
+    keys = [f"wallet:{live_start + (i * stride) % len(cache)}" for i in range(ops)]
+    start = time.perf_counter()
+    for key in keys:
+        cache.get(key)
+    get_ns = (time.perf_counter() - start) / ops * 1e9
+
+    stats = cache.get_stats()
+    return {
+        "size": size,
+        "fill_seconds": fill_seconds,
+        "set_ns": set_ns,
+        "get_ns": get_ns,
+        "memory_mb": stats["estimated_memory_mb"],
+        "hit_rate": stats["hit_rate"],
+    }
+
+
+def main() -> int:
+    """Run the benchmark and report whether insert cost stays flat"""
+    parser = argparse.ArgumentParser(description="BoundedCache microbenchmark")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Cache capacities to benchmark",
+    )
+    parser.add_argument(
+        "--ops", type=int, default=DEFAULT_OPS, help="Timed operations per size"
+    )
+    args = parser.parse_args()
+
+    print("BoundedCache microbenchmark")
+    print("=" * 72)
+    print(
+        f"{'entries':>10} {'fill (s)':>10} {'set (ns/op)':>12} "
+        f"{'get (ns/op)':>12} {'memory (MB)':>12} {'hit rate':>9}"
+    )
+
+    results: List[Dict[str, float]] = []
+    for size in args.sizes:
+        result = benchmark_size(size, args.ops)
+        results.append(result)
+        print(
+            f"{result['size']:>10,} {result['fill_seconds']:>10.2f} "
+            f"{result['set_ns']:>12.0f} {result['get_ns']:>12.0f} "
+            f"{result['memory_mb']:>12.1f} {result['hit_rate']:>9.2f}"
+        )
+
+    set_costs = [r["set_ns"] for r in results]
+    ratio = max(set_costs) / min(set_costs)
+    print("=" * 72)
+    print(f"Insert cost ratio (max/min): {ratio:.2f}x")
+    if ratio <= MAX_FLAT_RATIO:
+        print("✅ Insert cost is flat across cache sizes")
+        return 0
+    print(f"❌ Insert cost grew more than {MAX_FLAT_RATIO:.1f}x across cache sizes")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
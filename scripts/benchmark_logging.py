@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Logging Overhead Benchmark
+==========================
+
+Measures how long the calling thread spends in logging during a simulated
+monitoring cycle: one structured INFO record per wallet (as
+BatchTransactionProcessor logs) plus one per detected trade, written to the
+JSON log file configured by utils.logging_config.setup_logging.
+
+Configurations:
+- sync/json:    file handler on the calling thread, stdlib json
+- sync/orjson:  file handler on the calling thread, orjson (if installed)
+- queued:       records handed to the background writer thread
+
+The caller-side cost is what blocks the event loop; the drain time is how
+long the background writer needs to catch up after the last cycle.
+
+Usage:
+    python scripts/benchmark_logging.py
+    python scripts/benchmark_logging.py --wallets 200 --trades 20 --cycles 100
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.logging_config import (  # noqa: E402
+    QueuedLogHandler,
+    orjson_available,
+    set_orjson_enabled,
+    setup_logging,
+)
+
+DEFAULT_WALLETS = 100
+DEFAULT_TRADES = 10
+DEFAULT_CYCLES = 50
+
+
+def run_cycles(
+    logger: logging.Logger, wallets: int, trades: int, cycles: int
+) -> List[float]:
+    """Log a monitoring cycle repeatedly, returning caller-side seconds per cycle"""
+    addresses = [f"0x{i:040x}" for i in range(wallets)]
+    durations = []
+    for cycle in range(cycles):
+        start = time.perf_counter()
+        for i, wallet in enumerate(addresses):
+            logger.info(
+                "Batch processed %d transactions for %s in %.3fs",
+                25,
+                wallet[-6:],
+                0.012,
+                extra={"wallet_address": wallet, "block_number": 50_000_000 + cycle},
+            )
+            if i < trades:
+                logger.info(
+                    "Trade detected: BUY %.2f @ %.3f",
+                    125.5,
+                    0.615,
+                    extra={
+                        "wallet": wallet,
+                        "tx_hash": f"0x{cycle:032x}{i:032x}",
+                        "side": "BUY",
+                        "amount": 125.5,
+                        "price": 0.615,
+                    },
+                )
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def benchmark(mode: str, wallets: int, trades: int, cycles: int) -> Dict[str, float]:
+    """
+    Benchmark one logging configuration.
+
+    Args:
+        mode: "sync/json", "sync/orjson" or "queued"
+        wallets: Wallets logged per cycle
+        trades: Trades logged per cycle
+        cycles: Cycles to time
+
+    Returns:
+        Caller-side microseconds per cycle and per record, and drain time
+    """
+    orjson_was_enabled = set_orjson_enabled(mode != "sync/json")
+    try:
+        with tempfile.TemporaryDirectory() as log_dir:
+            setup_logging(
+                level="INFO",
+                log_dir=log_dir,
+                console_level="CRITICAL",
+                queued=mode == "queued",
+            )
+            logger = logging.getLogger("benchmark.monitor")
+            durations = run_cycles(logger, wallets, trades, cycles)
+
+            start = time.perf_counter()
+            for handler in logging.getLogger().handlers:
+                handler.flush()
+            drain_seconds = time.perf_counter() - start
+
+            dropped = 0
+            for handler in list(logging.getLogger().handlers):
+                if isinstance(handler, QueuedLogHandler):
+                    dropped = handler.dropped
+                logging.getLogger().removeHandler(handler)
+                handler.close()
+    finally:
+        set_orjson_enabled(orjson_was_enabled)
+
+    durations.sort()
+    records = wallets + min(trades, wallets)
+    median = durations[len(durations) // 2]
+    return {
+        "cycle_us": median * 1e6,
+        "p95_cycle_us": durations[int(len(durations) * 0.95) - 1] * 1e6,
+        "record_us": median / records * 1e6,
+        "drain_ms": drain_seconds * 1e3,
+        "dropped": dropped,
+    }
+
+
+def main() -> int:
+    """Run the benchmark for each logging configuration"""
+    parser = argparse.ArgumentParser(description="Logging overhead benchmark")
+    parser.add_argument("--wallets", type=int, default=DEFAULT_WALLETS, help="Wallets per cycle")
+    parser.add_argument("--trades", type=int, default=DEFAULT_TRADES, help="Trades per cycle")
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES, help="Cycles to time")
+    args = parser.parse_args()
+
+    modes = ["sync/json", "queued"]
+    if orjson_available():
+        modes.insert(1, "sync/orjson")
+
+    print("Logging overhead per monitoring cycle (calling thread)")
+    print("=" * 72)
+    print(
+        f"{'mode':<12} {'cycle (us)':>11} {'p95 (us)':>10} "
+        f"{'record (us)':>12} {'drain (ms)':>11} {'dropped':>8}"
+    )
+
+    results = {}
+    for mode in modes:
+        result = benchmark(mode, args.wallets, args.trades, args.cycles)
+        results[mode] = result
+        print(
+            f"{mode:<12} {result['cycle_us']:>11.0f} {result['p95_cycle_us']:>10.0f} "
+            f"{result['record_us']:>12.1f} {result['drain_ms']:>11.1f} "
+            f"{result['dropped']:>8}"
+        )
+
+    print("=" * 72)
+    speedup = results["sync/json"]["cycle_us"] / results["queued"]["cycle_us"]
+    print(f"Queued logging cuts caller-side cost by {speedup:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
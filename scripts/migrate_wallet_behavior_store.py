@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Wallet Behavior Store Migration
+===============================
+
+Migrates legacy gzip JSON wallet behavior data (classifications.json.gz and
+behavior_history.json.gz) into the indexed SQLite backend used by
+WalletBehaviorStore.
+
+WalletBehaviorStore performs this migration automatically the first time it
+creates its database; use this script to migrate ahead of time, into a
+different database, or to archive the legacy files afterwards.
+
+Usage:
+    python scripts/migrate_wallet_behavior_store.py
+    python scripts/migrate_wallet_behavior_store.py --data-dir data/wallet_behavior --archive
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.wallet_behavior_backends import (  # noqa: E402
+    SQLITE_DB_FILE,
+    SQLiteBehaviorBackend,
+    has_legacy_data,
+    migrate_legacy_json,
+)
+
+DEFAULT_DATA_DIR = Path("data/wallet_behavior")
+DEFAULT_MAX_ENTRIES = 200  # Matches WalletBehaviorStore.max_history_per_wallet
+
+
+def main() -> int:
+    """Run the migration"""
+    parser = argparse.ArgumentParser(
+        description="Migrate wallet behavior gzip JSON files to SQLite"
+    )
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=DEFAULT_DATA_DIR,
+        help="Directory containing the legacy .json.gz files",
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=None,
+        help=f"Target database (default: <data-dir>/{SQLITE_DB_FILE})",
+    )
+    parser.add_argument(
+        "--max-entries",
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help="Newest history entries kept per wallet",
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Move legacy files to <data-dir>/legacy after migrating",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Migrate even if the target database already holds data",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if not has_legacy_data(args.data_dir):
+        print(f"❌ No legacy gzip JSON data found in {args.data_dir}")
+        return 1
+
+    db_path = args.db or args.data_dir / SQLITE_DB_FILE
+    target = SQLiteBehaviorBackend(db_path)
+    try:
+        existing = (
+            target.count_classifications() + target.count_history()["total_entries"]
+        )
+        if existing and not args.force:
+            print(
+                f"❌ {db_path} already contains {existing} rows; "
+                "re-run with --force to import anyway (history may be duplicated)"
+            )
+            return 1
+
+        counts = migrate_legacy_json(
+            args.data_dir, target, max_entries=args.max_entries, archive=args.archive
+        )
+    finally:
+        target.close()
+
+    print(
+        f"✅ Migrated {counts['classifications']} classifications and "
+        f"{counts['history_entries']} history entries to {db_path}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
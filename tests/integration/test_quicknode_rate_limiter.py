@@ -103,6 +103,20 @@ class TestTokenBucket:
 
         assert tokens_fast > tokens_slow
 
+    @pytest.mark.asyncio
+    async def test_token_bucket_reserve_queues_concurrent_callers(self):
+        """Test reservations space concurrent callers one refill apart"""
+        bucket = TokenBucket(capacity=2, refill_rate=10.0, initial_tokens=2)
+
+        waits = await asyncio.gather(*(bucket.reserve(1) for _ in range(5)))
+        waits = sorted(waits)
+
+        # Burst capacity is served immediately, the rest queue at 1/rate steps
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.02)
+        assert waits[3] == pytest.approx(0.2, abs=0.02)
+        assert waits[4] == pytest.approx(0.3, abs=0.02)
+
 
 class TestAdaptiveRateLimiter:
     """Test adaptive rate limiter"""
@@ -0,0 +1,108 @@
+"""
+Unit tests for utils/alert_dispatcher.py - Coalescing background alert delivery.
+"""
+
+import asyncio
+
+import pytest
+
+from utils.alert_dispatcher import TELEGRAM_MAX_MESSAGE_LENGTH, AlertDispatcher, AlertPriority
+
+
+class RecordingSender:
+    """Async sender that records messages and can be slowed or failed"""
+
+    def __init__(self, delay: float = 0.0, succeed: bool = True) -> None:
+        self.sent = []
+        self.delay = delay
+        self.succeed = succeed
+
+    async def __call__(self, text: str, parse_mode: str) -> bool:
+        await asyncio.sleep(self.delay)
+        self.sent.append(text)
+        return self.succeed
+
+
+class TestAlertDispatcher:
+    """Test non-blocking enqueue, coalescing, priorities and stats."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_returns_without_waiting_for_delivery(self):
+        """Test the caller never waits on a slow sender."""
+        sender = RecordingSender(delay=0.2)
+        dispatcher = AlertDispatcher(sender, min_send_interval=0)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert dispatcher.enqueue("Trade executed", alert_type="trade")
+        assert loop.time() - start < 0.01
+
+        await dispatcher.close()
+        assert sender.sent == ["Trade executed"]
+        assert dispatcher.get_stats()["alerts_delivered"] == 1
+
+    @pytest.mark.asyncio
+    async def test_burst_is_merged_into_one_digest(self):
+        """Test alerts within the window after a delivery arrive as one digest."""
+        sender = RecordingSender()
+        dispatcher = AlertDispatcher(sender, coalesce_window=0.2, min_send_interval=0)
+
+        dispatcher.enqueue("trade 0", alert_type="trade")
+        await asyncio.sleep(0.05)  # First alert goes out immediately
+        for i in range(1, 6):
+            dispatcher.enqueue(f"trade {i}", alert_type="trade")
+        await asyncio.sleep(0.1)
+        assert sender.sent == ["trade 0"]  # The rest wait for the window
+        await asyncio.sleep(0.2)
+
+        assert len(sender.sent) == 2
+        assert "5 trade alerts" in sender.sent[1]
+        assert all(f"trade {i}" in sender.sent[1] for i in range(1, 6))
+        stats = dispatcher.get_stats()
+        assert stats["alerts_delivered"] == 6 and stats["alerts_coalesced"] == 4
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_critical_alerts_skip_the_window_and_jump_the_queue(self):
+        """Test a critical alert is sent before earlier lower-priority alerts."""
+        sender = RecordingSender()
+        dispatcher = AlertDispatcher(sender, coalesce_window=10, min_send_interval=0.05)
+
+        critical = {"alert_type": "circuit_breaker", "priority": AlertPriority.CRITICAL}
+
+        dispatcher.enqueue("breaker", **critical)
+        await asyncio.sleep(0.01)
+        dispatcher.enqueue("low", alert_type="report", priority=AlertPriority.LOW)
+        dispatcher.enqueue("error", alert_type="error", priority=AlertPriority.HIGH)
+        dispatcher.enqueue("breaker 2", **critical)
+        await asyncio.sleep(0.2)
+
+        assert sender.sent == ["breaker", "breaker 2", "error", "low"]
+        await dispatcher.close()
+
+    def test_full_queue_drops_lowest_priority_first(self):
+        """Test overflow evicts low-priority alerts for higher ones and counts drops."""
+        dispatcher = AlertDispatcher(RecordingSender(), max_pending=3)
+
+        for i in range(3):
+            assert dispatcher.enqueue(f"low {i}", alert_type="report", priority=AlertPriority.LOW)
+        assert dispatcher.enqueue("error", alert_type="error", priority=AlertPriority.HIGH)
+        assert not dispatcher.enqueue("low 3", alert_type="report", priority=AlertPriority.LOW)
+
+        stats = dispatcher.get_stats()
+        assert stats["pending"] == 3 and stats["dropped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_sends_are_counted_and_long_digests_are_truncated(self):
+        """Test delivery failures show in stats and digests fit Telegram's limit."""
+        sender = RecordingSender(succeed=False)
+        dispatcher = AlertDispatcher(sender)
+        for i in range(100):
+            dispatcher.enqueue(f"error {i}: " + "x" * 100, alert_type="error")
+
+        await dispatcher.close()
+
+        assert len(sender.sent) == 1
+        assert len(sender.sent[0]) <= TELEGRAM_MAX_MESSAGE_LENGTH
+        assert sender.sent[0].endswith("more")
+        assert dispatcher.get_stats()["alerts_failed"] == 100
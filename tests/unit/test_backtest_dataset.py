@@ -0,0 +1,126 @@
+"""
+Unit tests for core/backtest_dataset.py - Columnar backtest dataset index.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from core.backtest_dataset import CompiledBacktestDataset
+
+START = datetime(2024, 1, 1)
+
+
+def _build_dataset(days: int = 10) -> dict:
+    """Small dataset shaped like HistoricalDataManager output"""
+    hours = [START + timedelta(hours=h) for h in range(days * 24)]
+    return {
+        "market_data": {
+            "price_data": {
+                "market_a": [
+                    {"timestamp": t.isoformat(), "price": 0.5 + 0.001 * i}
+                    for i, t in enumerate(hours)
+                ],
+                "market_b": [
+                    {"timestamp": t.isoformat(), "price": 0.3 + 0.002 * i}
+                    for i, t in enumerate(hours[::6])
+                ],
+            }
+        },
+        "gas_data": {
+            "gas_price_series": [
+                {"timestamp": t.isoformat(), "gas_price_gwei": 30.0 + i}
+                for i, t in enumerate(hours[::3])
+            ]
+        },
+        "regime_data": {
+            "regime_series": [
+                {"timestamp": t.isoformat(), "regime": f"regime_{i % 3}"}
+                for i, t in enumerate(hours[::12])
+            ]
+        },
+        "wallet_data": {
+            "0xaaa": {
+                "summary_stats": {"wallet_type": "market_maker"},
+                "trades": [
+                    {"timestamp": (START + timedelta(hours=h)).isoformat(), "id": h}
+                    for h in (5, 30, 31, 100)
+                ]
+                + [{"id": "no_timestamp"}],
+            },
+            "0xbbb": {
+                "summary_stats": {"wallet_type": "directional_trader"},
+                "trades": [
+                    {"timestamp": (START + timedelta(hours=h)).isoformat(), "id": h}
+                    for h in (29, 6)
+                ],
+            },
+        },
+    }
+
+
+def _reference_prices(dataset: dict, target: datetime) -> list:
+    """Per-day scan used by the engine before compilation"""
+    prices = []
+    for market_prices in dataset["market_data"]["price_data"].values():
+        for point in market_prices:
+            if abs((datetime.fromisoformat(point["timestamp"]) - target).days) <= 1:
+                prices.append(point["price"])
+    return prices
+
+
+def _reference_first(series: list, key: str, target: datetime):
+    for point in series:
+        if abs((datetime.fromisoformat(point["timestamp"]) - target).days) <= 1:
+            return point[key]
+    return None
+
+
+class TestCompiledBacktestDataset:
+    """Test compiled lookups match the original per-day scans."""
+
+    @pytest.mark.parametrize("day_offset", [-3, 0, 1, 4, 9, 12])
+    def test_market_lookups_match_reference_scan(self, day_offset):
+        """Test price, gas and regime windows match the original semantics."""
+        dataset = _build_dataset()
+        compiled = CompiledBacktestDataset(dataset)
+        target = START + timedelta(days=day_offset, hours=7)
+
+        np.testing.assert_allclose(
+            compiled.prices_near(target), _reference_prices(dataset, target)
+        )
+        assert compiled.gas_price_near(target) == _reference_first(
+            dataset["gas_data"]["gas_price_series"], "gas_price_gwei", target
+        )
+        assert compiled.regime_near(target) == _reference_first(
+            dataset["regime_data"]["regime_series"], "regime", target
+        )
+
+    def test_trades_grouped_by_wallet_in_dataset_order(self):
+        """Test same-day trades are grouped per wallet, keeping list order."""
+        compiled = CompiledBacktestDataset(_build_dataset())
+
+        day_one = compiled.trades_on(START + timedelta(days=1, hours=23))
+
+        assert [compiled.wallet_addresses[i] for i, _ in day_one] == [
+            "0xaaa",
+            "0xbbb",
+        ]
+        assert [t["id"] for t in day_one[0][1]] == [30, 31]
+        assert [t["id"] for t in day_one[1][1]] == [29]
+
+        day_zero = compiled.trades_on(START)
+        assert [[t["id"] for t in trades] for _, trades in day_zero] == [[5], [6]]
+
+        assert compiled.trades_on(START + timedelta(days=2)) == []
+
+    def test_empty_dataset(self):
+        """Test compiling a dataset without any series."""
+        compiled = CompiledBacktestDataset({})
+
+        assert len(compiled.prices_near(START)) == 0
+        assert compiled.gas_price_near(START) is None
+        assert compiled.regime_near(START) is None
+        assert compiled.trades_on(START) == []
+        assert compiled.get_stats()["trades"] == 0
@@ -0,0 +1,201 @@
+"""
+Unit tests for core/backtest_runner.py - Seeded serial/process-pool backtests.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from core.backtest_runner import BacktestBatchRunner, request_seed
+from core.backtesting_engine import BacktestingEngine
+from core.parameter_optimizer import ParameterOptimizer
+
+START = datetime(2024, 1, 1)
+END = START + timedelta(days=6)
+
+
+def _build_dataset() -> dict:
+    """Small dataset with daily trades for two wallets"""
+    hours = [START + timedelta(hours=h) for h in range(7 * 24)]
+    trades = [
+        {
+            "timestamp": (START + timedelta(hours=h)).isoformat(),
+            "parsed_trade": {"price": 0.55, "amount": 100, "side": "BUY"},
+        }
+        for h in range(2, 7 * 24, 9)
+    ]
+    return {
+        "market_data": {
+            "price_data": {
+                "market_a": [
+                    {"timestamp": t.isoformat(), "price": 0.5 + 0.0005 * i}
+                    for i, t in enumerate(hours)
+                ]
+            }
+        },
+        "gas_data": {
+            "gas_price_series": [
+                {"timestamp": t.isoformat(), "gas_price_gwei": 40.0} for t in hours
+            ]
+        },
+        "regime_data": {"regime_series": []},
+        "wallet_data": {
+            "0xaaa": {"summary_stats": {"wallet_type": "market_maker"}, "trades": trades},
+            "0xbbb": {
+                "summary_stats": {"wallet_type": "directional_trader"},
+                "trades": trades[::2],
+            },
+        },
+    }
+
+
+class FailingBacktestingEngine(BacktestingEngine):
+    """Engine whose backtest fails for configs marked ``fail``"""
+
+    async def run_backtest(self, strategy_config, *args, **kwargs):
+        if strategy_config.get("fail"):
+            raise ValueError("backtest failed")
+        return await super().run_backtest(strategy_config, *args, **kwargs)
+
+
+class TestBacktestBatchRunner:
+    """Test seeding and serial/parallel equivalence."""
+
+    def test_request_seed_is_stable_and_distinct(self):
+        """Test seeds depend only on request content and base seed."""
+        request = ({"name": "a", "min_quality_score": 50}, START, END, 10000.0)
+        same = ({"min_quality_score": 50, "name": "a"}, START, END, 10000.0)
+        other = ({"name": "a", "min_quality_score": 51}, START, END, 10000.0)
+
+        assert request_seed(request, 42) == request_seed(same, 42)
+        assert request_seed(request, 42) != request_seed(other, 42)
+        assert request_seed(request, 42) != request_seed(request, 7)
+
+    @pytest.mark.asyncio
+    async def test_serial_runs_are_reproducible_and_keep_caller_rng(self):
+        """Test serial results repeat exactly and the caller's RNG is untouched."""
+        dataset = _build_dataset()
+        runner = BacktestBatchRunner(BacktestingEngine(None), dataset)
+        request = ({"name": "s"}, START, END, 10000.0)
+
+        np.random.seed(123)
+        expected_next = np.random.random()
+        np.random.seed(123)
+
+        first, second = await runner.run([request, request])
+        assert np.random.random() == expected_next
+
+        assert first["final_capital"] == second["final_capital"]
+        assert first["trade_log"]
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_serial(self):
+        """Test process-pool results equal the serial path exactly."""
+        dataset = _build_dataset()
+        engine = BacktestingEngine(None)
+        requests = [
+            ({"name": f"s{i}"}, START, END - timedelta(days=i), 10000.0)
+            for i in range(4)
+        ]
+
+        serial = await BacktestBatchRunner(engine, dataset).run(requests)
+        parallel_runner = BacktestBatchRunner(engine, dataset, max_workers=2)
+        try:
+            parallel = await parallel_runner.run(requests)
+        finally:
+            parallel_runner.close()
+
+        assert [r["final_capital"] for r in parallel] == [
+            r["final_capital"] for r in serial
+        ]
+        assert [r["performance_metrics"] for r in parallel] == [
+            r["performance_metrics"] for r in serial
+        ]
+
+
+class TestParameterOptimizerEvaluation:
+    """Test optimizer batches give identical scores in both modes."""
+
+    @pytest.mark.asyncio
+    async def test_grid_search_matches_across_modes(self):
+        """Test grid search scores do not depend on evaluation_workers."""
+        dataset = _build_dataset()
+        param_space = {"min_quality_score": {"min": 30, "max": 80, "type": "int"}}
+
+        paths = []
+        for workers in (1, 2):
+            optimizer = ParameterOptimizer(BacktestingEngine(None))
+            optimizer.optimization_config["evaluation_workers"] = workers
+            optimizer._backtest_runner = BacktestBatchRunner(
+                optimizer.backtesting_engine, dataset, max_workers=workers
+            )
+            try:
+                _, path = await optimizer._grid_search_optimization(
+                    "wallet_quality_scorer", param_space, dataset, START, END, 10000.0
+                )
+            finally:
+                optimizer._backtest_runner.close()
+            paths.append([step["score"] for step in path])
+
+        assert len(paths[0]) == 5
+        assert paths[0] == paths[1]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("workers", [1, 2])
+    async def test_failed_candidate_does_not_sink_batch(self, workers):
+        """Test one failing backtest only marks its own candidate unscorable."""
+        dataset = _build_dataset()
+        optimizer = ParameterOptimizer(FailingBacktestingEngine(None))
+        optimizer._backtest_runner = BacktestBatchRunner(
+            optimizer.backtesting_engine, dataset, max_workers=workers
+        )
+        candidates = [
+            ({"min_quality_score": 40}, START, END),
+            ({"min_quality_score": 50, "fail": True}, START, END),
+            ({"min_quality_score": 60}, START, END),
+        ]
+        try:
+            results = await optimizer._evaluate_parameter_batch(
+                "wallet_quality_scorer", candidates, dataset, 10000.0
+            )
+            (expected,) = await optimizer._evaluate_parameter_batch(
+                "wallet_quality_scorer", candidates[:1], dataset, 10000.0
+            )
+        finally:
+            optimizer._backtest_runner.close()
+
+        assert results[1]["score"] == float("-inf")
+        assert "backtest failed" in results[1]["error"]
+        assert "error" not in results[0] and "error" not in results[2]
+        assert results[0]["score"] == expected["score"]
+        assert results[2]["score"] > float("-inf")
+
+    @pytest.mark.asyncio
+    async def test_optimization_leaves_global_rng_alone(self):
+        """Test seeded candidate generation neither reads nor reseeds np.random."""
+        dataset = _build_dataset()
+        param_space = {"min_quality_score": {"min": 30, "max": 80, "type": "int"}}
+
+        np.random.seed(123)
+        expected_next = np.random.random()
+        np.random.seed(123)
+
+        optimal = []
+        for _ in range(2):
+            optimizer = ParameterOptimizer(BacktestingEngine(None))
+            optimizer.optimization_config.update(
+                {"population_size": 6, "generations": 2, "stability_windows": 2}
+            )
+            result = await optimizer.optimize_strategy_parameters(
+                "wallet_quality_scorer",
+                dataset,
+                START,
+                END,
+                optimization_method="genetic",
+                parameter_space=param_space,
+            )
+            optimal.append(result["optimal_parameters"])
+
+        assert np.random.random() == expected_next
+        assert optimal[0] == optimal[1]
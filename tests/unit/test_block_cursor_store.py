@@ -0,0 +1,84 @@
+"""
+Unit tests for core/block_cursor_store.py - Per-wallet incremental block cursors.
+"""
+
+import json
+
+from core.block_cursor_store import MAX_BLOCKS_PER_QUERY, BlockCursorStore
+
+WALLET = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+OTHER_WALLET = "0x1234567890abcdef1234567890abcdef12345678"
+
+
+class TestBlockCursorStore:
+    """Test block range computation, advancement and persistence."""
+
+    def test_new_wallet_uses_initial_lookback(self, tmp_path):
+        """Test a wallet without a cursor only looks back a small window."""
+        store = BlockCursorStore(
+            tmp_path / "cursors.json", initial_lookback_blocks=150
+        )
+
+        assert store.get_block_range(WALLET, 50_000_000) == (49_999_850, 50_000_000)
+
+    def test_known_wallet_requests_delta_with_reorg_rewind(self, tmp_path):
+        """Test a known wallet only asks for blocks after its cursor minus rewind."""
+        store = BlockCursorStore(tmp_path / "cursors.json", reorg_rewind_blocks=32)
+        store.advance(WALLET, 50_000_000)
+
+        start, end = store.get_block_range(WALLET, 50_000_010)
+
+        assert start == 50_000_001 - 32
+        assert end == 50_000_010
+
+    def test_backfill_is_bounded_after_long_downtime(self, tmp_path):
+        """Test a stale cursor never reaches further back than max_backfill."""
+        store = BlockCursorStore(tmp_path / "cursors.json", max_backfill_blocks=1800)
+        store.advance(WALLET, 1_000)
+
+        start, end = store.get_block_range(WALLET, 50_000_000)
+
+        assert start == 50_000_000 - 1800
+        assert end - start <= MAX_BLOCKS_PER_QUERY
+
+    def test_cursor_never_moves_backwards(self, tmp_path):
+        """Test an overlapping fetch cannot regress the cursor."""
+        store = BlockCursorStore(tmp_path / "cursors.json")
+        store.advance(WALLET, 200)
+        store.advance(WALLET, 150)
+
+        assert store.get_cursor(WALLET) == 200
+
+    def test_cursors_persist_across_restarts(self, tmp_path):
+        """Test cursors saved by one instance are loaded by the next."""
+        cursor_file = tmp_path / "cursors.json"
+        store = BlockCursorStore(cursor_file)
+        store.advance(WALLET, 123_456)
+
+        assert store.save() is True
+        assert store.save() is False  # Nothing changed since last save
+
+        restored = BlockCursorStore(cursor_file)
+        assert restored.get_cursor(WALLET.lower()) == 123_456
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        """Test a corrupt cursor file does not prevent startup."""
+        cursor_file = tmp_path / "cursors.json"
+        cursor_file.write_text("{not json")
+
+        store = BlockCursorStore(cursor_file)
+
+        assert len(store) == 0
+
+    def test_retain_drops_unmonitored_wallets(self, tmp_path):
+        """Test cursors for removed wallets are pruned."""
+        cursor_file = tmp_path / "cursors.json"
+        store = BlockCursorStore(cursor_file)
+        store.advance(WALLET, 10)
+        store.advance(OTHER_WALLET, 20)
+
+        removed = store.retain([WALLET])
+        store.save()
+
+        assert removed == 1
+        assert json.loads(cursor_file.read_text())["cursors"] == {WALLET.lower(): 10}
@@ -0,0 +1,189 @@
+"""
+Unit tests for core/block_source.py - Off-loop block fetching with sender fan-out.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.block_source import FALLBACK_SCAN_BLOCKS, Web3BlockSource
+
+WALLET_A = "0x742d35cc6634c0532925a3b844bc454e4438f44e"
+WALLET_B = "0x1234567890abcdef1234567890abcdef12345678"
+OTHER = "0x9999999999999999999999999999999999999999"
+
+HEAD = 1000
+
+
+class FakeEth:
+    """Synchronous eth namespace that records every get_block call"""
+
+    def __init__(self, delay: float = 0.0, failing_blocks=()):
+        self.delay = delay
+        self.failing_blocks = set(failing_blocks)
+        self.block_calls = []
+        self.threads = set()
+
+    @property
+    def block_number(self):
+        return HEAD
+
+    def get_block(self, number, full_transactions=False):
+        self.block_calls.append(number)
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        if number in self.failing_blocks:
+            raise ValueError(f"block {number} unavailable")
+        senders = [WALLET_A, OTHER] if number % 2 else [WALLET_B.upper().replace("X", "x")]
+        return {
+            "timestamp": 1700000000 + number,
+            "transactions": [
+                {"from": sender, "hash": bytes([number % 256]) * 32, "to": OTHER}
+                for sender in senders
+            ],
+        }
+
+
+class FakeWeb3:
+    def __init__(self, delay: float = 0.0, failing_blocks=()):
+        self.eth = FakeEth(delay, failing_blocks)
+
+    def is_connected(self):
+        return True
+
+
+class TestWeb3BlockSource:
+    """Test each block is fetched once, off the loop, and fanned out."""
+
+    @pytest.mark.asyncio
+    async def test_fans_out_by_sender_fetching_each_block_once(self):
+        """Test one pass over the range serves every wallet."""
+        web3 = FakeWeb3()
+        source = Web3BlockSource(web3)
+
+        by_sender, failed_blocks = await source.get_transactions_by_sender(
+            HEAD - 9, HEAD, [WALLET_A, WALLET_B]
+        )
+
+        assert sorted(web3.eth.block_calls) == list(range(HEAD - 9, HEAD + 1))
+        assert failed_blocks == []
+        assert [tx["blockNumber"] for tx in by_sender[WALLET_A]] == list(
+            range(HEAD - 9, HEAD + 1, 2)
+        )
+        assert len(by_sender[WALLET_B]) == 5
+        assert by_sender[WALLET_A][0]["hash"].startswith("0x")
+        assert by_sender[WALLET_A][0]["timeStamp"] == 1700000000 + HEAD - 9
+
+        # A later call (e.g. per-wallet fallback) reuses the cached blocks
+        await source.get_transactions_by_sender(HEAD - 9, HEAD, [OTHER])
+        assert len(web3.eth.block_calls) == 10
+        assert source.get_stats()["cache_hits"] == 10
+
+    @pytest.mark.asyncio
+    async def test_blocking_calls_run_concurrently_off_the_loop(self):
+        """Test slow RPC calls overlap and the event loop keeps running."""
+        web3 = FakeWeb3(delay=0.05)
+        source = Web3BlockSource(web3, max_concurrent_blocks=10)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        await asyncio.gather(
+            source.get_transactions_by_sender(HEAD - 9, HEAD, [WALLET_A]),
+            source.get_transactions_by_sender(HEAD - 9, HEAD, [WALLET_B]),
+        )
+        elapsed = time.perf_counter() - start
+        ticker_task.cancel()
+
+        assert len(web3.eth.block_calls) == 10  # concurrent callers share fetches
+        assert threading.get_ident() not in web3.eth.threads
+        assert elapsed < 10 * 0.05
+        assert ticks >= 3
+
+
+class TestWalletMonitorBlockFallback:
+    """Test the monitor's Web3 fallback scans blocks once per cycle."""
+
+    @pytest.mark.asyncio
+    async def test_fallback_cycle_cost_is_per_block(self, monkeypatch, tmp_path):
+        """Test blocks are fetched once for all wallets, within each range."""
+        from config.settings import settings
+        from core.wallet_monitor import WalletMonitor
+
+        monkeypatch.chdir(tmp_path)
+        monitor = WalletMonitor(settings, target_wallets=[WALLET_A, WALLET_B])
+        monitor.polygonscan_client = None
+        monitor.web3 = FakeWeb3()
+
+        block_ranges = {WALLET_A: (HEAD - 200, HEAD), WALLET_B: (HEAD - 4, HEAD)}
+        results, latencies = await monitor._fetch_wallets_from_blocks(
+            [WALLET_A, WALLET_B], block_ranges, HEAD
+        )
+
+        assert len(monitor.web3.eth.block_calls) == FALLBACK_SCAN_BLOCKS + 1
+        assert len(results[WALLET_A]) == (FALLBACK_SCAN_BLOCKS + 1) // 2
+        assert {tx["blockNumber"] for tx in results[WALLET_B]} == {HEAD - 4, HEAD - 2, HEAD}
+        assert len(latencies) == 2
+        assert monitor._fetch_completed_through == {WALLET_A: HEAD, WALLET_B: HEAD}
+
+    @pytest.mark.asyncio
+    async def test_failed_blocks_hold_back_cursors(self, monkeypatch, tmp_path):
+        """Test wallets are only marked scanned up to the first failed block."""
+        from config.settings import settings
+        from core.wallet_monitor import WalletMonitor
+
+        monkeypatch.chdir(tmp_path)
+        monitor = WalletMonitor(settings, target_wallets=[WALLET_A, WALLET_B])
+        monitor.polygonscan_client = None
+        monitor.web3 = FakeWeb3(failing_blocks={HEAD - 3, HEAD - 1})
+
+        block_ranges = {WALLET_A: (HEAD - 9, HEAD), WALLET_B: (HEAD - 2, HEAD)}
+        results, _ = await monitor._fetch_wallets_from_blocks(
+            [WALLET_A, WALLET_B], block_ranges, HEAD
+        )
+
+        assert [tx["blockNumber"] for tx in results[WALLET_A]] == [
+            HEAD - 9,
+            HEAD - 7,
+            HEAD - 5,
+        ]
+        assert results[WALLET_B] == []
+        assert monitor._fetch_completed_through == {
+            WALLET_A: HEAD - 4,
+            WALLET_B: HEAD - 4,
+        }
+
+        monitor._advance_block_cursors([WALLET_A, WALLET_B])
+        assert monitor.block_cursors.get_cursor(WALLET_A) == HEAD - 4
+
+    @pytest.mark.asyncio
+    async def test_unknown_head_skips_cycle(self, monkeypatch, tmp_path):
+        """Test no cycle is planned, and no cursor moves, without a real chain head."""
+        from config.settings import settings
+        from core.wallet_monitor import WalletMonitor
+
+        class OfflineWeb3(FakeWeb3):
+            def is_connected(self):
+                return False
+
+        monkeypatch.chdir(tmp_path)
+        monitor = WalletMonitor(settings, target_wallets=[WALLET_A])
+        monitor.polygonscan_client = None
+        monitor.web3 = OfflineWeb3()
+
+        assert await monitor.plan_monitoring_cycle() is None
+        assert await monitor.get_wallet_transactions(WALLET_A) == []
+        assert monitor.block_cursors.get_cursor(WALLET_A) is None
+
+        monitor.web3 = FakeWeb3()
+        current_block, wallets, block_ranges = await monitor.plan_monitoring_cycle()
+        assert current_block == HEAD
+        assert block_ranges[wallets[0]][1] == HEAD
@@ -0,0 +1,106 @@
+"""
+Unit tests for utils/bounded_cache.py - O(1) LRU/TTL cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from utils.bounded_cache import ENTRY_OVERHEAD_BYTES, BoundedCache
+
+
+class TestBoundedCache:
+    """Test recency ordering, lazy expiry and size accounting."""
+
+    def test_accepts_component_options(self):
+        """Test the constructor accepts the options callers pass."""
+        cache = BoundedCache(
+            max_size=10,
+            ttl_seconds=60,
+            component_name="scanner.api_cache",
+            memory_threshold_mb=5.0,
+            cleanup_interval_seconds=30,
+        )
+
+        stats = cache.get_stats()
+
+        assert stats["component_name"] == "scanner.api_cache"
+        assert stats["memory_threshold_mb"] == 5.0
+
+    def test_eviction_is_least_recently_used(self):
+        """Test a recently read key survives eviction over an older untouched one."""
+        cache = BoundedCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.get_stats()["evicted_count"] == 1
+
+    def test_overwrite_does_not_grow_cache(self):
+        """Test overwriting a key replaces it rather than adding a new slot."""
+        cache = BoundedCache(max_size=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("a", 2)
+
+        assert len(cache) == 1
+        assert cache.get("a") == 2
+
+    def test_expired_entries_are_removed_lazily(self):
+        """Test expired entries miss on read and are purged on the next write."""
+        cache = BoundedCache(max_size=10, ttl_seconds=10)
+        with patch("utils.bounded_cache.time.time", return_value=1000.0):
+            cache.set("a", 1)
+            cache.set("b", 2)
+        with patch("utils.bounded_cache.time.time", return_value=1005.0):
+            cache.set("c", 3)
+
+        with patch("utils.bounded_cache.time.time", return_value=1011.0):
+            assert cache.get("a") is None
+            cache.set("d", 4)
+
+            assert "b" not in cache
+            assert cache.get("c") == 3
+            assert len(cache) == 2
+            assert cache.get_stats()["expired_count"] == 2
+
+    def test_size_accounting_tracks_inserts_and_deletes(self):
+        """Test byte accounting grows with values and returns to zero."""
+        cache = BoundedCache(max_size=10, ttl_seconds=60)
+        cache.set("small", "x")
+        small_bytes = cache.get_stats()["size_bytes"]
+        cache.set("large", "x" * 10_000)
+
+        assert small_bytes >= ENTRY_OVERHEAD_BYTES
+        assert cache.get_stats()["size_bytes"] > small_bytes + 10_000
+
+        assert cache.delete("large") is True
+        assert cache.delete("large") is False
+        assert cache.get_stats()["size_bytes"] == small_bytes
+
+        cache.clear()
+        assert cache.get_stats()["size_bytes"] == 0
+
+    def test_memory_threshold_evicts_lru(self):
+        """Test exceeding the memory threshold evicts least recently used items."""
+        cache = BoundedCache(max_size=100, ttl_seconds=60, memory_threshold_mb=0.01)
+        for i in range(5):
+            cache.set(f"key{i}", "x" * 4_000)
+
+        stats = cache.get_stats()
+
+        assert stats["size_bytes"] <= 0.01 * 1024 * 1024
+        assert "key4" in cache
+        assert "key0" not in cache
+
+    def test_hit_rate(self):
+        """Test hit/miss counters."""
+        cache = BoundedCache(max_size=10, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        assert cache.get_stats()["hit_rate"] == pytest.approx(0.5)
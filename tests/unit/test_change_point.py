@@ -0,0 +1,116 @@
+"""
+Unit tests for core/change_point.py - Vectorized change-point candidate detection.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.behavioral_analyzer import BehaviorPatternTracker
+from core.change_point import (
+    cusum_change_points,
+    detect_change_point_candidates,
+    rolling_slopes,
+    rolling_variances,
+    trend_change_points,
+    variance_change_points,
+)
+
+
+def _series(seed: int, n: int) -> np.ndarray:
+    """Random walk with a level shift and a change in volatility halfway"""
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(0, 1, n) * np.where(np.arange(n) < n // 2, 1.0, 3.0)
+    return 500 + np.cumsum(noise) + np.where(np.arange(n) < n // 2, 0.0, 10.0)
+
+
+def _reference_variance_changes(values: np.ndarray) -> list:
+    """The per-metric pandas implementation the detector replaces"""
+    window = max(5, len(values) // 5)
+    rolling_var = pd.Series(values).rolling(window=window).var()
+    return np.where(np.abs(np.diff(rolling_var.values)) > np.std(rolling_var) * 1.5)[0].tolist()
+
+
+def _reference_trend_changes(values: np.ndarray) -> list:
+    """The per-position np.polyfit implementation the detector replaces"""
+    window = max(10, len(values) // 4)
+    changes = []
+    for i in range(window, len(values) - window):
+        before = np.polyfit(range(window), values[i - window : i], 1)[0]
+        after = np.polyfit(range(window), values[i : i + window], 1)[0]
+        if abs(after - before) > np.std(values) * 0.5:
+            changes.append(i)
+    return changes
+
+
+class TestRollingStatistics:
+    """Test prefix-sum rolling slopes and variances against direct fits."""
+
+    def test_rolling_slopes_match_polyfit(self):
+        """Test every window's slope equals np.polyfit's."""
+        values = _series(0, 120)
+        slopes = rolling_slopes(values, 15)
+
+        expected = [np.polyfit(range(15), values[i : i + 15], 1)[0] for i in range(106)]
+        assert slopes.shape == (106,)
+        assert slopes == pytest.approx(expected, abs=1e-9)
+
+    def test_rolling_variances_match_pandas(self):
+        """Test sample variances equal pandas' rolling variance."""
+        values = _series(1, 80)
+        expected = pd.Series(values).rolling(window=12).var().values[11:]
+
+        assert rolling_variances(values, 12) == pytest.approx(expected, abs=1e-9)
+        assert rolling_variances(values[:5], 12).shape == (0,)
+
+
+class TestDetectors:
+    """Test the detectors reproduce the loop-based implementations."""
+
+    @pytest.mark.parametrize("n", [10, 25, 41, 120, 300])
+    def test_detectors_match_reference(self, n):
+        """Test candidate positions are unchanged by vectorization."""
+        for seed in range(5):
+            values = _series(seed, n)
+            mean_step = np.diff(np.cumsum(values - values.mean()))
+            cusum_expected = (np.where(np.abs(mean_step) > mean_step.std() * 2)[0] + 1).tolist()
+
+            assert cusum_change_points(values) == cusum_expected
+            assert variance_change_points(values) == _reference_variance_changes(values)
+            assert trend_change_points(values) == _reference_trend_changes(values)
+
+    def test_batch_matches_individual_series(self):
+        """Test a stacked 2-D batch gives each row's 1-D result."""
+        batch = np.stack([_series(seed, 150) for seed in range(8)])
+
+        results = detect_change_point_candidates(batch)
+
+        assert len(results) == 8
+        for row, found in zip(batch, results):
+            assert found == detect_change_point_candidates(row)
+
+    def test_rejects_higher_dimensional_input(self):
+        """Test only series and 2-D batches are accepted."""
+        with pytest.raises(ValueError, match="3-D"):
+            cusum_change_points(np.zeros((2, 3, 4)))
+
+
+class TestTrackerBatch:
+    """Test BehaviorPatternTracker's batched change-point detection."""
+
+    def test_batch_matches_per_metric_detection(self):
+        """Test mixed-length series keyed by (wallet, metric) match one-at-a-time calls."""
+        tracker = BehaviorPatternTracker()
+        series = {
+            (f"0x{seed:040x}", metric): _series(seed * 10 + i, 60 + 20 * (seed % 3)).tolist()
+            for seed in range(6)
+            for i, metric in enumerate(["win_rate", "avg_return"])
+        }
+        series[("0xshort", "win_rate")] = [0.5] * 5
+
+        results = tracker.detect_change_points_batch(series)
+
+        assert ("0xshort", "win_rate") not in results
+        for key, values in series.items():
+            assert results.get(key, []) == tracker._detect_change_points(values, key)
+        assert results
@@ -0,0 +1,156 @@
+"""
+Unit tests for core/exchange_calldata.py - Selector-indexed fill decoding.
+"""
+
+import time
+from decimal import Decimal
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from core.exchange_calldata import (
+    FILL_SELECTORS,
+    POLYMARKET_EXCHANGE_CONTRACTS,
+    decode_order_fills,
+    fill_for_wallet,
+    is_order_fill,
+)
+
+ORDER_TYPE = (
+    "(uint256,address,address,address,uint256,uint256,uint256,uint256,uint256,"
+    "uint256,uint8,uint8,bytes)"
+)
+SIGNATURES = {
+    "fillOrder": f"fillOrder({ORDER_TYPE},uint256)",
+    "fillOrders": f"fillOrders({ORDER_TYPE}[],uint256[])",
+    "matchOrders": f"matchOrders({ORDER_TYPE},{ORDER_TYPE}[],uint256,uint256[])",
+}
+
+MAKER = "0x742d35cc6634c0532925a3b844bc454e4438f44e"
+TAKER = "0x1234567890abcdef1234567890abcdef12345678"
+OTHER_MAKER = "0xabcdefabcdefabcdefabcdefabcdefabcdefabcd"
+TOKEN_ID = 71321045679252212594626385532706912750332728571942532289631379312455583992563
+
+
+def _order(maker: str, side: int, maker_amount: int, taker_amount: int) -> tuple:
+    return (
+        1,
+        maker,
+        maker,
+        "0x" + "00" * 20,
+        TOKEN_ID,
+        maker_amount,
+        taker_amount,
+        0,
+        0,
+        0,
+        side,
+        0,
+        b"\x11" * 65,
+    )
+
+
+def _calldata(function: str, types: list, args: list) -> str:
+    selector = Web3.keccak(text=SIGNATURES[function])[:4]
+    return "0x" + (selector + encode(types, args)).hex()
+
+
+# Maker buys 100 tokens for 60 USDC; the taker fills 30 USDC of it
+FILL_ORDER_INPUT = _calldata(
+    "fillOrder",
+    [ORDER_TYPE, "uint256"],
+    [_order(MAKER, 0, 60_000_000, 100_000_000), 30_000_000],
+)
+
+
+class TestExchangeCalldata:
+    """Test selector dispatch and field decoding."""
+
+    def test_selector_table_matches_signatures(self):
+        """Test the precomputed selectors are the keccak of each signature."""
+        for selector, (function, _) in FILL_SELECTORS.items():
+            assert Web3.keccak(text=SIGNATURES[function])[:4].hex() == selector
+
+    def test_fill_order_decodes_price_size_and_sides(self):
+        """Test a BUY order yields its real price, size and token id."""
+        (fill,) = decode_order_fills(FILL_ORDER_INPUT)
+
+        assert fill.function == "fillOrder"
+        assert fill.token_id == str(TOKEN_ID)
+        assert fill.price == Decimal("0.6")
+        assert fill.amount == Decimal(30)
+        assert fill.size == Decimal(50)
+        assert fill.side_for(MAKER) == "BUY"
+        assert fill.side_for(TAKER) == "SELL"
+
+    def test_match_orders_picks_the_wallets_order(self):
+        """Test maker fills are decoded and matched to the wallet that made them."""
+        taker_order = _order(TAKER, 1, 200_000_000, 120_000_000)  # sell 200 at 0.6
+        maker_orders = [
+            _order(MAKER, 0, 60_000_000, 100_000_000),
+            _order(OTHER_MAKER, 0, 66_000_000, 100_000_000),
+        ]
+        input_data = _calldata(
+            "matchOrders",
+            [ORDER_TYPE, f"{ORDER_TYPE}[]", "uint256", "uint256[]"],
+            [taker_order, maker_orders, 200_000_000, [60_000_000, 66_000_000]],
+        )
+
+        fills = decode_order_fills(input_data)
+
+        assert [f.maker for f in fills] == [TAKER, MAKER, OTHER_MAKER]
+        assert fills[0].side == "SELL" and fills[0].size == Decimal(200)
+        assert fill_for_wallet(fills, OTHER_MAKER).price == Decimal("0.66")
+        assert fill_for_wallet(fills, OTHER_MAKER).amount == Decimal(66)
+
+    def test_rejects_other_calls_and_malformed_calldata(self):
+        """Test non-fill selectors and truncated fills decode to None."""
+        transfer = "0xa9059cbb" + "00" * 64
+
+        assert not is_order_fill(transfer)
+        assert not is_order_fill("0x")
+        assert decode_order_fills(transfer) is None
+        assert decode_order_fills(FILL_ORDER_INPUT[:300]) is None
+        assert decode_order_fills(FILL_ORDER_INPUT[:-1]) is None
+
+
+class TestBatchProcessorDecoding:
+    """Test the wallet monitor builds trades from decoded fills."""
+
+    @pytest.mark.asyncio
+    async def test_batch_trades_carry_decoded_fields(self, monkeypatch, tmp_path):
+        """Test only fills become trades, with their decoded side and price."""
+        from config.settings import settings
+        from core.wallet_monitor import BatchTransactionProcessor, WalletMonitor
+
+        monkeypatch.chdir(tmp_path)
+        monitor = WalletMonitor(settings, target_wallets=[TAKER])
+        exchange = POLYMARKET_EXCHANGE_CONTRACTS[0]
+        base = {
+            "from": TAKER,
+            "to": exchange,
+            "value": "0",
+            "gasUsed": "150000",
+            "gasPrice": "30000000000",
+            "blockNumber": "100",
+            "timeStamp": str(int(time.time()) - 120),
+        }
+        transactions = [
+            {**base, "hash": "0x" + "aa" * 32, "input": FILL_ORDER_INPUT},
+            {**base, "hash": "0x" + "bb" * 32, "input": "0xa9059cbb" + "00" * 64},
+        ]
+
+        trades = await BatchTransactionProcessor(monitor).process_transaction_batch(
+            transactions, TAKER
+        )
+
+        assert len(trades) == 1
+        trade = trades[0]
+        assert trade["tx_hash"] == "0x" + "aa" * 32
+        assert (trade["side"], trade["price"], trade["amount"]) == (
+            "SELL",
+            Decimal("0.6"),
+            Decimal(30),
+        )
+        assert trade["token_id"] == str(TOKEN_ID)
@@ -0,0 +1,73 @@
+"""
+Unit tests for trading/gas_optimizer.py - Ring-buffer gas price statistics.
+"""
+
+import numpy as np
+import pytest
+
+from trading.gas_optimizer import (
+    LONG_TERM_WINDOW,
+    MEDIUM_TERM_WINDOW,
+    SHORT_TERM_WINDOW,
+    GasPricePredictor,
+)
+
+
+def _prices(count: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 40 + 15 * np.sin(np.arange(count) / 30) + rng.normal(0, 5, count)
+
+
+class TestGasPricePredictor:
+    """Test the running window statistics against NumPy over the raw history."""
+
+    def test_streaming_statistics_match_numpy(self):
+        """Test moving averages, volatility and spikes after the buffer wraps."""
+        predictor = GasPricePredictor(history_size=300)
+        prices = _prices(1234)
+        for i, price in enumerate(prices):
+            predictor.add_gas_price(price, timestamp=float(i))
+
+        prediction = predictor.predict_gas_price()
+
+        assert len(predictor) == 300
+        np.testing.assert_array_equal(predictor.gas_history, prices[-300:])
+        np.testing.assert_array_equal(predictor.timestamp_history, np.arange(934, 1234))
+        assert prediction["short_ma"] == pytest.approx(prices[-SHORT_TERM_WINDOW:].mean())
+        assert prediction["medium_ma"] == pytest.approx(prices[-MEDIUM_TERM_WINDOW:].mean())
+        assert prediction["long_ma"] == pytest.approx(prices[-LONG_TERM_WINDOW:].mean())
+        assert predictor.get_volatility() == pytest.approx(np.std(prices[-SHORT_TERM_WINDOW:]))
+        medium_mean = prices[-MEDIUM_TERM_WINDOW:].mean()
+        assert predictor.detect_gas_spike(medium_mean * 2.01)
+        assert not predictor.detect_gas_spike(medium_mean * 1.99)
+
+    def test_batch_backfill_matches_incremental_updates(self):
+        """Test add_gas_prices leaves the same state as one-by-one updates."""
+        prices = _prices(700, seed=11)
+        incremental = GasPricePredictor(history_size=250)
+        for i, price in enumerate(prices):
+            incremental.add_gas_price(price, timestamp=float(i))
+        batched = GasPricePredictor(history_size=250)
+        batched.add_gas_prices(prices[:100], np.arange(100.0))
+        batched.add_gas_prices(prices[100:], np.arange(100.0, 700.0))
+
+        expected = incremental.predict_gas_price()
+        actual = batched.predict_gas_price()
+
+        np.testing.assert_array_equal(batched.gas_history, incremental.gas_history)
+        np.testing.assert_array_equal(batched.timestamp_history, incremental.timestamp_history)
+        for key in ("short_ma", "medium_ma", "long_ma", "volatility", "trend"):
+            assert actual[key] == pytest.approx(expected[key])
+
+    def test_partial_history_falls_back_to_shorter_windows(self):
+        """Test the medium and long averages reuse shorter ones until they fill."""
+        predictor = GasPricePredictor()
+
+        assert predictor.predict_gas_price()["method"] == "insufficient_data"
+        predictor.add_gas_prices([30.0] * 5 + [60.0] * 15)
+        prediction = predictor.predict_gas_price()
+
+        assert prediction["short_ma"] == pytest.approx(60.0)
+        assert prediction["medium_ma"] == prediction["long_ma"] == prediction["short_ma"]
+        assert prediction["volatility"] == pytest.approx(0.0)
+        assert not predictor.detect_gas_spike(500.0)
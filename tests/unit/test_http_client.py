@@ -0,0 +1,60 @@
+"""
+Unit tests for utils/http_client.py - Shared pooled HTTP session.
+"""
+
+import pytest
+
+from utils.http_client import SharedHTTPClient
+
+
+class TestSharedHTTPClient:
+    """Test shared HTTP client lifecycle and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_until_closed(self):
+        """Test that repeated get_session calls return one pooled session."""
+        client = SharedHTTPClient(connection_limit=20, limit_per_host=5)
+
+        session_a = await client.get_session()
+        session_b = await client.get_session()
+
+        assert session_a is session_b
+        assert client.is_running
+        assert session_a.connector.limit == 20
+        assert session_a.connector.limit_per_host == 5
+
+        await client.close()
+        assert not client.is_running
+        assert session_a.closed
+
+    @pytest.mark.asyncio
+    async def test_session_recreated_after_close(self):
+        """Test that a closed client lazily recreates its session."""
+        client = SharedHTTPClient()
+        first = await client.get_session()
+        await client.close()
+
+        second = await client.get_session()
+
+        assert second is not first
+        assert client.get_stats()["sessions_created"] == 2
+        await client.close()
+
+    def test_reuse_ratio_statistics(self):
+        """Test connection reuse ratio calculation."""
+        client = SharedHTTPClient()
+        client._stats["connections_created"] = 2
+        client._stats["connections_reused"] = 8
+
+        stats = client.get_stats()
+
+        assert stats["connection_reuse_ratio"] == pytest.approx(0.8)
+        assert stats["handshakes_saved"] == 8
+        assert stats["is_running"] is False
+
+    def test_reuse_ratio_without_traffic(self):
+        """Test statistics before any request has been made."""
+        stats = SharedHTTPClient().get_stats()
+
+        assert stats["connection_reuse_ratio"] == 0.0
+        assert stats["requests"] == 0
@@ -0,0 +1,205 @@
+"""
+Unit tests for the async delta rescoring mode of scanners/leaderboard_scanner.py.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from config.scanner_config import ScannerConfig
+from scanners.leaderboard_scanner import LeaderboardScanner
+from scanners.wallet_score_table import WalletScoreTable, wallet_fingerprint
+
+
+def _entry(i: int, trade_count: int = 50) -> Dict[str, Any]:
+    return {
+        "address": f"0x{i + 1:040x}",
+        "created_at": "2023-01-01T00:00:00Z",
+        "trade_count": trade_count,
+        "volume": 1000.0 * (i + 1),
+        "pnl": 100.0 * (i + 1),
+    }
+
+
+def _performance(address: str) -> Dict[str, float]:
+    return {
+        "roi_7d": 5.0,
+        "roi_30d": 40.0,
+        "win_rate": 0.65,
+        "profit_factor": 2.0,
+        "max_drawdown": 0.1,
+        "volatility": 0.05,
+        "sharpe_ratio": 1.5,
+        "monthly_consistency": 0.8,
+        "trade_count": 50,
+        "avg_position_hold_time": 3600,
+    }
+
+
+class FakePerformanceAPI:
+    """Leaderboard API whose per-wallet performance fetch is tracked"""
+
+    def __init__(self, leaderboard: List[Dict[str, Any]], delay: float = 0.0) -> None:
+        self.leaderboard = leaderboard
+        self.delay = delay
+        self.calls: List[str] = []
+        self.failing: set = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_leaderboard(self) -> List[Dict[str, Any]]:
+        return [dict(entry) for entry in self.leaderboard]
+
+    def get_wallet_performance(self, address: str) -> Dict[str, float]:
+        with self._lock:
+            self.calls.append(address)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if address in self.failing:
+                raise ConnectionError("performance endpoint unavailable")
+            return _performance(address)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _scanner(api: FakePerformanceAPI, table_file, **overrides) -> LeaderboardScanner:
+    settings = {
+        "MIN_TRADE_COUNT": 10,
+        "MIN_WALLET_AGE_DAYS": 30,
+        "MAX_WALLETS_TO_MONITOR": 100,
+        "CONFIDENCE_SCORE_THRESHOLD": 0.0,
+        "DELTA_RESCORE_RATE_PER_SECOND": 1000.0,
+    }
+    settings.update(overrides)
+    config = ScannerConfig(**settings)
+    with patch("scanners.wallet_analyzer.BlockchainAPI"), patch(
+        "scanners.wallet_analyzer.PolymarketLeaderboardAPI", return_value=api
+    ):
+        scanner = LeaderboardScanner(config, score_table=WalletScoreTable(table_file))
+    scanner.wallet_analyzer.get_leaderboard_data = api.get_leaderboard
+    return scanner
+
+
+@pytest.fixture(autouse=True)
+def no_alerts():
+    with patch("scanners.leaderboard_scanner.send_error_alert", new=AsyncMock()), patch(
+        "scanners.leaderboard_scanner.send_telegram_alert", new=AsyncMock()
+    ):
+        yield
+
+
+class TestDeltaScan:
+    """Test that only wallets whose data changed are rescored."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_wallets_are_rescored(self, tmp_path):
+        """Test a rescan fetches performance only for wallets that traded."""
+        leaderboard = [_entry(i) for i in range(20)]
+        api = FakePerformanceAPI(leaderboard)
+        scanner = _scanner(api, tmp_path / "scores.json")
+
+        first = await scanner.run_delta_scan()
+        assert len(api.calls) == 20 and len(first) == 20
+
+        api.calls.clear()
+        leaderboard[3]["trade_count"] += 1
+        leaderboard[7]["volume"] += 250.0
+        second = await scanner.run_delta_scan()
+
+        assert sorted(api.calls) == sorted([leaderboard[3]["address"], leaderboard[7]["address"]])
+        assert {w.address for w in second} == {w.address for w in first}
+        stats = scanner.get_scan_status()["delta_scan"]
+        assert stats["wallets_rescored"] == 22 and stats["wallets_reused"] == 18
+
+    @pytest.mark.asyncio
+    async def test_score_table_survives_restart(self, tmp_path):
+        """Test a new scanner on the same table file rescores nothing."""
+        leaderboard = [_entry(i) for i in range(10)] + [_entry(10, trade_count=2)]
+        api = FakePerformanceAPI(leaderboard)
+        table_file = tmp_path / "scores.json"
+
+        first = await _scanner(api, table_file).run_delta_scan()
+        api.calls.clear()
+        restarted = await _scanner(api, table_file).run_delta_scan()
+
+        assert api.calls == []
+        assert [w.address for w in restarted] == [w.address for w in first]
+        assert leaderboard[10]["address"] not in {w.address for w in restarted}
+
+    @pytest.mark.asyncio
+    async def test_rescoring_respects_concurrency_limit(self, tmp_path):
+        """Test no more than DELTA_RESCORE_CONCURRENCY fetches run at once."""
+        api = FakePerformanceAPI([_entry(i) for i in range(12)], delay=0.02)
+        scanner = _scanner(api, tmp_path / "scores.json", DELTA_RESCORE_CONCURRENCY=3)
+
+        await scanner.run_delta_scan()
+
+        assert len(api.calls) == 12
+        assert 1 < api.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_failed_rescore_keeps_previous_score_and_retries(self, tmp_path):
+        """Test a wallet whose fetch fails keeps its last score and is retried next scan."""
+        leaderboard = [_entry(i) for i in range(5)]
+        api = FakePerformanceAPI(leaderboard)
+        scanner = _scanner(api, tmp_path / "scores.json")
+        await scanner.run_delta_scan()
+
+        target = leaderboard[2]["address"]
+        leaderboard[2]["trade_count"] += 5
+        api.failing.add(target)
+        api.calls.clear()
+        results = await scanner.run_delta_scan()
+
+        assert api.calls == [target]
+        assert target in {w.address for w in results}
+        assert scanner.delta_stats["rescore_errors"] == 1
+
+        api.failing.clear()
+        api.calls.clear()
+        await scanner.run_delta_scan()
+        assert api.calls == [target]
+
+    @pytest.mark.asyncio
+    async def test_empty_leaderboard_falls_back_to_safe_defaults(self, tmp_path):
+        """Test the delta scan keeps the safe-default behavior of run_scan."""
+        scanner = _scanner(FakePerformanceAPI([]), tmp_path / "scores.json")
+        defaults = [MagicMock(address="0xdefault", total_score=0.5, risk_score=0.1, metrics={})]
+        scanner.wallet_analyzer._get_safe_default_wallets = MagicMock(return_value=defaults)
+
+        assert await scanner.run_delta_scan() == defaults
+        assert len(scanner.score_table) == 0
+
+
+class TestWalletScoreTable:
+    """Test fingerprinting, freshness and pruning."""
+
+    def test_fingerprint_tracks_trading_fields_only(self):
+        """Test fields that change on a trade alter the fingerprint and others do not."""
+        entry = _entry(0)
+        base = wallet_fingerprint(entry)
+
+        assert wallet_fingerprint({**entry, "username": "renamed"}) == base
+        assert wallet_fingerprint({**entry, "trade_count": 51}) != base
+        assert wallet_fingerprint({"address": entry["address"]}) is None
+
+    def test_stale_scores_and_departed_wallets(self, tmp_path):
+        """Test expired scores miss and retain() drops wallets that left."""
+        table = WalletScoreTable(tmp_path / "scores.json", max_age_seconds=0.05)
+        table.store("0xAAA", "fp", None)
+        table.store("0xbbb", "fp", None)
+
+        assert table.lookup("0xaaa", "fp") == (True, None)
+        assert table.lookup("0xaaa", "other") == (False, None)
+        time.sleep(0.06)
+        assert table.lookup("0xaaa", "fp") == (False, None)
+
+        assert table.retain(["0xaaa"]) == 1
+        assert table.save() and len(WalletScoreTable(tmp_path / "scores.json")) == 1
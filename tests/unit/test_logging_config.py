@@ -0,0 +1,102 @@
+"""
+Unit tests for utils/logging_config.py - Queued JSON file logging.
+"""
+
+import json
+import logging
+import threading
+
+import pytest
+
+from utils.logging_config import BatchRotatingFileHandler, JSONFormatter, QueuedLogHandler
+
+
+@pytest.fixture
+def json_file_handler(tmp_path):
+    handler = BatchRotatingFileHandler(tmp_path / "bot.log", encoding="utf-8")
+    handler.setFormatter(JSONFormatter())
+    return handler
+
+
+def _read_entries(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def _logger(handler, name):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+class TestQueuedLogHandler:
+    """Test records reach the file through the background writer."""
+
+    def test_records_are_written_in_order_with_fields_and_tracebacks(
+        self, tmp_path, json_file_handler
+    ):
+        """Test messages, extras and exceptions survive the queue."""
+        handler = QueuedLogHandler(json_file_handler)
+        logger = _logger(handler, "test.queued.order")
+        items = ["a"]
+
+        logger.info("processed %s", items, extra={"tx_hash": "0xabc"})
+        items.append("b")  # Mutating args after the call must not change the message
+        try:
+            raise ValueError("bad fill")
+        except ValueError:
+            logger.exception("decode failed")
+        for i in range(50):
+            logger.debug("trade %d", i)
+        handler.close()
+
+        entries = _read_entries(tmp_path / "bot.log")
+        assert entries[0]["message"] == "processed ['a']"
+        assert entries[0]["tx_hash"] == "0xabc"
+        assert "ValueError: bad fill" in entries[1]["exception"]
+        assert [e["message"] for e in entries[2:]] == [f"trade {i}" for i in range(50)]
+        assert handler.get_stats()["written"] == 52
+
+    def test_full_queue_drops_and_reports_records(self, tmp_path, json_file_handler):
+        """Test overflow is counted and logged instead of blocking the caller."""
+        release = threading.Event()
+        original = json_file_handler.emit_batch
+
+        def slow_emit_batch(records):
+            release.wait(5)
+            original(records)
+
+        json_file_handler.emit_batch = slow_emit_batch
+        handler = QueuedLogHandler(json_file_handler, max_queue_size=10, write_interval=0)
+        logger = _logger(handler, "test.queued.overflow")
+
+        for i in range(100):
+            logger.info("event %d", i)
+        release.set()
+        handler.close()
+
+        assert handler.dropped >= 80
+        entries = _read_entries(tmp_path / "bot.log")
+        assert len(entries) == 100 - handler.dropped + 1
+        assert entries[-1]["level"] == "WARNING"
+        assert f"{handler.dropped} total" in entries[-1]["message"]
+
+
+def test_batch_writes_roll_over_by_size(tmp_path):
+    """Test batched writes still rotate the file when it reaches maxBytes."""
+    handler = BatchRotatingFileHandler(
+        tmp_path / "bot.log", maxBytes=2000, backupCount=3, encoding="utf-8"
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    records = [
+        logging.LogRecord("test", logging.INFO, __file__, 1, "x" * 99, None, None)
+        for _ in range(50)
+    ]
+
+    handler.emit_batch(records)
+    handler.close()
+
+    files = sorted(tmp_path.glob("bot.log*"))
+    assert len(files) == 3
+    assert all(f.stat().st_size <= 2000 for f in files)
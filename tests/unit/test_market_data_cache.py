@@ -0,0 +1,108 @@
+"""
+Unit tests for core/market_data_cache.py - Async market and price cache.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.market_data_cache import MarketDataCache
+
+CONDITION_A = "0x" + "aa" * 32
+CONDITION_B = "0x" + "bb" * 32
+
+
+class FakeClobClient:
+    """Synchronous client that records calls and the threads they ran on"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.market_calls = []
+        self.midpoint_calls = []
+        self.threads = set()
+
+    def get_market(self, condition_id):
+        self.market_calls.append(condition_id)
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        return {
+            "condition_id": condition_id,
+            "tokens": [
+                {"token_id": f"{condition_id[-4:]}-yes", "outcome": "Yes"},
+                {"token_id": f"{condition_id[-4:]}-no", "outcome": "No"},
+            ],
+        }
+
+    def get_midpoints(self, params):
+        self.midpoint_calls.append([p.token_id for p in params])
+        return {p.token_id: "0.42" for p in params}
+
+
+class TestMarketDataCache:
+    """Test caching, coalescing and batching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_off_loop_fetch(self):
+        """Test one blocking call serves concurrent and repeat requests."""
+        client = FakeClobClient(delay=0.05)
+        cache = MarketDataCache(client)
+
+        markets = await asyncio.gather(*(cache.get_market(CONDITION_A) for _ in range(5)))
+        repeat = await cache.get_market(CONDITION_A)
+
+        assert client.market_calls == [CONDITION_A]
+        assert all(m is markets[0] for m in markets) and repeat is markets[0]
+        assert threading.get_ident() not in client.threads
+        assert cache.get_stats()["coalesced_requests"] == 4
+        assert cache.get_stats()["market_hits"] == 1
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self):
+        """Test cancelling the first or a waiting caller leaves the others served."""
+        client = FakeClobClient(delay=0.05)
+        cache = MarketDataCache(client)
+
+        leader = asyncio.create_task(cache.get_market(CONDITION_A))
+        waiter = asyncio.create_task(cache.get_market(CONDITION_A))
+        other = asyncio.create_task(cache.get_market(CONDITION_A))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        waiter.cancel()
+
+        market = await other
+        assert market["condition_id"] == CONDITION_A
+        assert leader.cancelled() and waiter.cancelled()
+        assert client.market_calls == [CONDITION_A]
+        assert await cache.get_market(CONDITION_A) is market
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_refetch(self):
+        """Test invalidated markets are fetched again."""
+        client = FakeClobClient()
+        cache = MarketDataCache(client)
+
+        await cache.get_market(CONDITION_A)
+        cache.invalidate(CONDITION_A)
+        await cache.get_market(CONDITION_A)
+
+        assert client.market_calls == [CONDITION_A, CONDITION_A]
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_prices_for_many_markets_use_one_batch(self):
+        """Test position prices cost one midpoint request, then hit the cache."""
+        client = FakeClobClient()
+        cache = MarketDataCache(client)
+
+        prices = await cache.get_current_prices([CONDITION_A, CONDITION_B, CONDITION_A])
+        again = await cache.get_current_price(CONDITION_B)
+
+        assert prices == {CONDITION_A: 0.42, CONDITION_B: 0.42}
+        assert again == 0.42
+        assert client.midpoint_calls == [["aaaa-yes", "bbbb-yes"]]
+        assert sorted(client.market_calls) == [CONDITION_A, CONDITION_B]
+        cache.close()
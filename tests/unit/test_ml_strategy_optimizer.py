@@ -0,0 +1,200 @@
+"""
+Unit tests for core/ml_strategy_optimizer.py - Off-loop training and batched inference.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from core.ml_strategy_optimizer import MLStrategyOptimizer
+
+MARKET = {"volatility_index": 0.3, "liquidity_score": 0.7, "trend_strength": 0.1}
+STRATEGIES = {
+    "market_maker": "market_maker_conservative",
+    "directional_trader": "directional_momentum",
+    "arbitrage_trader": "arbitrage_cross_market",
+}
+
+
+def _wallet_data(rng: np.random.Generator) -> Dict[str, Any]:
+    classification = str(rng.choice(list(STRATEGIES)))
+    return {
+        "classification": classification,
+        "confidence_score": float(rng.uniform(0.5, 1.0)),
+        "behavior_metrics": {
+            "trades_24h": int(rng.integers(0, 200)),
+            "trades_7d": int(rng.integers(200, 1000)),
+            "win_rate": float(rng.uniform(0.3, 0.8)),
+            "profit_factor": float(rng.uniform(0.5, 3.0)),
+            "avg_position_size": float(rng.uniform(10, 1000)),
+        },
+    }
+
+
+async def _training_examples(optimizer: MLStrategyOptimizer, count: int) -> List[Dict]:
+    rng = np.random.default_rng(0)
+    examples = []
+    for i in range(count):
+        wallet_data = _wallet_data(rng)
+        features = await optimizer._extract_features(f"0x{i:040x}", wallet_data, MARKET)
+        examples.append(
+            {"features": features, "selected_strategy": STRATEGIES[wallet_data["classification"]]}
+        )
+    return examples
+
+
+async def _trained_optimizer() -> MLStrategyOptimizer:
+    optimizer = MLStrategyOptimizer(use_process_pool=False)
+    optimizer.training_params["min_samples_for_training"] = 300
+    results = await optimizer.train_strategy_predictor(
+        await _training_examples(optimizer, 300), force_retrain=True
+    )
+    assert results["training_successful"], results
+    return optimizer
+
+
+class TestOffLoopTraining:
+    """Test fits run outside the event loop and swap the model in when done."""
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running_during_process_training(self):
+        """Test a ticker task keeps running while the ensemble trains in a process."""
+        optimizer = MLStrategyOptimizer()
+        optimizer.training_params["min_samples_for_training"] = 1000
+        examples = await _training_examples(optimizer, 1000)
+        gaps: List[float] = []
+
+        async def ticker():
+            last = time.monotonic()
+            while True:
+                await asyncio.sleep(0.01)
+                now = time.monotonic()
+                gaps.append(now - last)
+                last = now
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            results = await optimizer.train_strategy_predictor(examples, force_retrain=True)
+        finally:
+            ticker_task.cancel()
+            optimizer.close()
+
+        assert results["training_successful"], results
+        assert results["cross_validation_score"] > 0.9
+        assert optimizer.strategy_predictor._model_version == results["model_version"]
+        assert list(optimizer.label_encoder.classes_) == sorted(STRATEGIES.values())
+        assert len(gaps) > 20 and max(gaps) < 0.5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_training_is_not_started_twice(self):
+        """Test a second request while a fit is running is skipped."""
+        optimizer = MLStrategyOptimizer(use_process_pool=False)
+        optimizer.training_params["min_samples_for_training"] = 300
+        examples = await _training_examples(optimizer, 300)
+        optimizer.training_data = examples
+
+        first, second = await asyncio.gather(
+            optimizer.train_strategy_predictor(force_retrain=True),
+            optimizer.train_strategy_predictor(force_retrain=True),
+        )
+
+        assert first["training_successful"]
+        assert second["reason"] == "Training already in progress"
+        assert optimizer.get_model_health_status()["training_in_progress"] == []
+
+    @pytest.mark.asyncio
+    async def test_performance_predictor_trains_off_loop(self):
+        """Test the performance regressor is fitted and evaluated in the worker."""
+        optimizer = MLStrategyOptimizer(use_process_pool=False)
+        rng = np.random.default_rng(1)
+        data = []
+        for _ in range(150):
+            x = rng.normal(size=3)
+            data.append(
+                {
+                    "features": {"a": x[0], "b": x[1], "c": x[2]},
+                    "performance_score": float(2 * x[0] - x[1]),
+                }
+            )
+
+        results = await optimizer.train_performance_predictor(data)
+
+        assert results["training_successful"], results
+        assert results["r2_score"] > 0.5
+        assert optimizer.performance_predictor is not None
+
+
+class TestBatchedPrediction:
+    """Test predict_optimal_strategies against per-wallet prediction."""
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_predictions_with_one_model_call(self, monkeypatch):
+        """Test one predict_proba call serves every wallet in the batch."""
+        trained_optimizer = await _trained_optimizer()
+        rng = np.random.default_rng(5)
+        wallets = {f"0x{i:040x}": _wallet_data(rng) for i in range(25)}
+        wallets["0xbad"] = {"classification": "market_maker", "behavior_metrics": None}
+        strategies = list(STRATEGIES.values())
+
+        singles = {
+            address: await trained_optimizer.predict_optimal_strategy(
+                address, data, MARKET, strategies
+            )
+            for address, data in wallets.items()
+        }
+
+        predictor = trained_optimizer.strategy_predictor
+        calls = []
+        original = predictor.predict_proba
+        monkeypatch.setattr(
+            predictor, "predict_proba", lambda X: calls.append(len(X)) or original(X)
+        )
+        batch = await trained_optimizer.predict_optimal_strategies(wallets, MARKET, strategies)
+
+        assert calls == [25]
+        assert batch["0xbad"]["fallback_reason"] == "Feature extraction failed"
+        for address, single in singles.items():
+            assert batch[address]["recommended_strategy"] == single["recommended_strategy"]
+            assert batch[address]["confidence_score"] == pytest.approx(single["confidence_score"])
+            assert batch[address]["model_version"] == single["model_version"]
+
+    @pytest.mark.asyncio
+    async def test_untrained_models_fall_back_for_every_wallet(self):
+        """Test the rule-based fallback is used when no model is trained."""
+        optimizer = MLStrategyOptimizer(use_process_pool=False)
+        wallets = {"0xa": {"classification": "market_maker"}, "0xb": {"classification": "x"}}
+
+        batch = await optimizer.predict_optimal_strategies(
+            wallets, MARKET, ["market_maker_conservative", "passive_hold"]
+        )
+
+        assert batch["0xa"]["recommended_strategy"] == "market_maker_conservative"
+        assert batch["0xb"]["recommended_strategy"] == "passive_hold"
+        assert all(p["fallback_reason"] == "Models not trained yet" for p in batch.values())
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_is_shut_down_off_the_event_loop(self):
+        """Test the thread fallback reaps a broken pool without blocking the loop."""
+        loop_thread = threading.get_ident()
+        shutdown_threads: List[int] = []
+
+        class BrokenExecutor:
+            def submit(self, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                shutdown_threads.append(threading.get_ident())
+
+        optimizer = MLStrategyOptimizer()
+        optimizer._training_executor = BrokenExecutor()
+
+        result = await optimizer._run_training_job(dict, {"fitted": True})
+
+        assert result == {"fitted": True}
+        assert optimizer._training_executor is None
+        assert shutdown_threads and shutdown_threads[0] != loop_thread
@@ -0,0 +1,168 @@
+"""
+Unit tests for core/monte_carlo.py - Vectorized Monte Carlo stress testing.
+"""
+
+import copy
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from core.backtest_dataset import CompiledBacktestDataset
+from core.backtesting_engine import BacktestingEngine
+from core.monte_carlo import MonteCarloAccumulator, generate_scenario_shocks
+
+START = datetime(2024, 1, 1)
+END = START + timedelta(days=4)
+
+STRESS_PARAMS = {
+    "volatility_shock_scenarios": 2,
+    "correlation_break_scenarios": 1,
+    "liquidity_crisis_scenarios": 1,
+}
+
+
+def _build_dataset() -> dict:
+    """Small dataset with hourly prices, gas and trades"""
+    hours = [START + timedelta(hours=h) for h in range(5 * 24)]
+    trades = [
+        {
+            "timestamp": (START + timedelta(hours=h)).isoformat(),
+            "parsed_trade": {"price": 0.55, "amount": 100, "side": "BUY"},
+        }
+        for h in range(3, 5 * 24, 7)
+    ]
+    return {
+        "market_data": {
+            "price_data": {
+                "market_a": [
+                    {"timestamp": t.isoformat(), "price": 0.5 + 0.01 * np.sin(i)}
+                    for i, t in enumerate(hours)
+                ]
+            }
+        },
+        "gas_data": {
+            "gas_price_series": [
+                {"timestamp": t.isoformat(), "gas_price_gwei": 40.0} for t in hours
+            ]
+        },
+        "regime_data": {"regime_series": []},
+        "wallet_data": {
+            "0xaaa": {"summary_stats": {"wallet_type": "market_maker"}, "trades": trades},
+        },
+    }
+
+
+def _engine(scenarios: int, workers: int = 1) -> BacktestingEngine:
+    engine = BacktestingEngine(None)
+    engine.simulation_params.update(STRESS_PARAMS)
+    engine.simulation_params["monte_carlo_scenarios"] = scenarios
+    engine.simulation_params["monte_carlo_workers"] = workers
+    engine.simulation_params["monte_carlo_chunk_size"] = 2
+    return engine
+
+
+class TestScenarioShocks:
+    """Test vectorized shock generation and shocked dataset views."""
+
+    def test_shocks_are_seeded_and_typed_in_blocks(self):
+        """Test shocks repeat for a seed and stress blocks come first."""
+        small = generate_scenario_shocks(6, STRESS_PARAMS, seed=7)
+        repeat = generate_scenario_shocks(6, STRESS_PARAMS, seed=7)
+        other = generate_scenario_shocks(6, STRESS_PARAMS, seed=8)
+
+        np.testing.assert_array_equal(
+            small["gas_price_multiplier"], repeat["gas_price_multiplier"]
+        )
+        assert not np.array_equal(
+            small["gas_price_multiplier"], other["gas_price_multiplier"]
+        )
+        assert list(small["scenario_type"]) == [
+            "high_volatility",
+            "high_volatility",
+            "correlation_break",
+            "liquidity_crisis",
+            "normal",
+            "normal",
+        ]
+        assert np.all(small["volatility_multiplier"][:2] >= 2.0)
+        assert small["liquidity_multiplier"][3] <= 0.3
+
+    def test_with_shocks_shares_columns_and_leaves_source_untouched(self):
+        """Test the shocked view only rescales gas and copies nothing else."""
+        compiled = CompiledBacktestDataset(_build_dataset())
+
+        shocked = compiled.with_shocks(
+            gas_multiplier=2.0, volatility_multiplier=3.0, liquidity_multiplier=0.5
+        )
+
+        assert shocked.gas_price_near(START) == 80.0
+        assert compiled.gas_price_near(START) == 40.0
+        assert shocked.trades is compiled.trades
+        assert shocked.price_columns is compiled.price_columns
+        assert (shocked.volatility_multiplier, shocked.liquidity_multiplier) == (3.0, 0.5)
+        assert (compiled.volatility_multiplier, compiled.liquidity_multiplier) == (1.0, 1.0)
+
+
+class TestMonteCarloAccumulator:
+    """Test aggregate statistics over scenario summaries."""
+
+    def test_var_and_cvar_match_reference(self):
+        """Test VaR/CVaR equal the percentile definition used before."""
+        returns = np.random.default_rng(0).normal(0, 0.1, 200)
+        accumulator = MonteCarloAccumulator(len(returns))
+        for scenario_id in np.random.default_rng(1).permutation(len(returns)):
+            accumulator.add(
+                {
+                    "scenario_id": int(scenario_id),
+                    "total_return": returns[scenario_id],
+                    "sharpe_ratio": 0.0,
+                    "max_drawdown": 0.0,
+                }
+            )
+
+        var_95, cvar_95 = accumulator.value_at_risk(0.95)
+
+        assert var_95 == pytest.approx(np.percentile(returns, 5))
+        assert cvar_95 == pytest.approx(np.mean(returns[returns <= var_95]))
+        assert accumulator.extreme_scenarios() == (
+            int(np.argmin(returns)),
+            int(np.argmax(returns)),
+        )
+        assert accumulator.get_statistics()["worst_return"] == pytest.approx(returns.min())
+
+
+class TestMonteCarloStressTest:
+    """Test the stress test end to end."""
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_serial_and_dataset_is_unchanged(self):
+        """Test results do not depend on workers and the dataset is not mutated."""
+        dataset = _build_dataset()
+        original = copy.deepcopy(dataset)
+
+        serial = await _engine(6).run_monte_carlo_stress_test(
+            {"name": "mc"}, dataset, START, END
+        )
+        parallel = await _engine(6, workers=2).run_monte_carlo_stress_test(
+            {"name": "mc"}, dataset, START, END
+        )
+
+        assert "error" not in serial
+        assert dataset == original
+        assert serial["scenario_types"] == {
+            "correlation_break": 1,
+            "high_volatility": 2,
+            "liquidity_crisis": 1,
+            "normal": 2,
+        }
+        assert serial["var_95"] == parallel["var_95"]
+        assert serial["cvar_95"] == parallel["cvar_95"]
+        assert serial["aggregate_statistics"] == parallel["aggregate_statistics"]
+        assert (
+            serial["worst_case_scenario"]["scenario_id"]
+            == parallel["worst_case_scenario"]["scenario_id"]
+        )
+        assert serial["worst_case_scenario"]["total_return"] == pytest.approx(
+            serial["aggregate_statistics"]["worst_return"]
+        )
@@ -0,0 +1,152 @@
+"""
+Unit tests for core/real_time_scorer.py - Online accumulators and full-update scheduling.
+"""
+
+import time
+from collections import deque
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from core.real_time_scorer import RealTimeScoringEngine, _TradeAccumulator
+
+
+def _engine() -> RealTimeScoringEngine:
+    return RealTimeScoringEngine(Mock())
+
+
+def _reference_stability(scores: list) -> dict:
+    """Statistics as the engine computed them from the full score list"""
+    slope, _, _, p_value, _ = stats.linregress(np.arange(len(scores)), scores)
+    return {
+        "volatility": np.std(scores),
+        "score_range": max(scores) - min(scores),
+        "slope": slope,
+        "p_value": p_value,
+        "momentum": (np.mean(scores[-5:]) - np.mean(scores[:-5]))
+        / max(abs(np.mean(scores[:-5])), 0.1),
+    }
+
+
+class TestTradeAccumulator:
+    """Test running PnL moments, win/loss counts, drawdown and EWMA volatility."""
+
+    def test_matches_batch_statistics(self):
+        """Test O(1) updates agree with statistics recomputed from all trades."""
+        returns = np.random.default_rng(7).normal(0.5, 4.0, 500)
+        returns[::17] = 0.0
+        accumulator = _TradeAccumulator()
+        for r in returns:
+            accumulator.add_trade(float(r), 0.94)
+
+        metrics = accumulator.to_metrics()
+        cumulative = np.cumsum(returns)
+        drawdowns = np.maximum.accumulate(np.maximum(cumulative, 0)) - cumulative
+        ewma = returns[0] ** 2
+        for r in returns[1:]:
+            ewma = 0.94 * ewma + 0.06 * r**2
+
+        assert metrics["trade_count"] == 500
+        assert metrics["wins"] == int((returns > 0).sum())
+        assert metrics["losses"] == int((returns < 0).sum())
+        assert metrics["pnl_mean"] == pytest.approx(returns.mean())
+        assert metrics["pnl_std"] == pytest.approx(returns.std(ddof=1))
+        assert metrics["max_drawdown"] == pytest.approx(drawdowns.max())
+        assert metrics["current_drawdown"] == pytest.approx(drawdowns[-1])
+        assert metrics["ewma_volatility"] == pytest.approx(np.sqrt(ewma))
+
+    @pytest.mark.asyncio
+    async def test_incremental_update_uses_batch_win_rate(self):
+        """Test the incremental adjustment counts only trades since the last update."""
+        engine = _engine()
+        wallet = "0xabc"
+        await engine.initialize_wallet_stream(wallet, [{"pnl_pct": -1.0}] * 10)
+        engine.active_wallets[wallet]["current_score"] = 50.0
+
+        for pnl in (2.0, 1.0, -1.0, 3.0, 0.0):  # 3 wins of 5
+            await engine.process_trade_update(wallet, {"pnl_pct": pnl})
+
+        # (0.6 - 0.55) * 10 adjustment, damped by 0.3
+        assert engine.active_wallets[wallet]["current_score"] == pytest.approx(50.15)
+        assert engine.trade_accumulators[wallet].batch_trades == 0
+        assert engine.trade_accumulators[wallet].trade_count == 15
+        assert wallet not in engine._wallets_with_pending
+
+
+class TestScoreWindow:
+    """Test O(1) stability reads against recomputation from the stream."""
+
+    @pytest.mark.asyncio
+    async def test_stability_matches_recomputation_after_evictions(self):
+        """Test running sums stay exact as the bounded stream evicts old scores."""
+        engine = _engine()
+        wallet = "0xabc"
+        await engine.initialize_wallet_stream(wallet)
+        scores = 50 + np.cumsum(np.random.default_rng(3).normal(0.1, 1.5, 400))
+
+        for i, score in enumerate(scores):
+            engine._append_score(wallet, {"timestamp": str(i), "score": float(score)})
+            if i in (25, 49, 50, 399):
+                window = [e["score"] for e in engine.score_streams[wallet]]
+                metrics = await engine._calculate_score_stability(wallet)
+                expected = _reference_stability(window)
+
+                assert metrics["samples_used"] == len(window)
+                assert metrics["volatility"] == pytest.approx(expected["volatility"])
+                assert metrics["score_range"] == pytest.approx(expected["score_range"])
+                assert metrics["momentum"] == pytest.approx(expected["momentum"])
+                slope, p_value = engine.score_windows[wallet].linear_trend()
+                assert slope == pytest.approx(expected["slope"])
+                assert p_value == pytest.approx(expected["p_value"], abs=1e-9)
+
+    @pytest.mark.asyncio
+    async def test_loaded_streams_rebuild_running_sums(self):
+        """Test a stream replaced from saved state is picked up on the next read."""
+        engine = _engine()
+        wallet = "0xabc"
+        await engine.initialize_wallet_stream(wallet)
+        scores = [float(s) for s in range(20, 45)]
+        engine.score_streams[wallet] = deque(
+            ({"score": s} for s in scores), maxlen=engine.scoring_params["trend_analysis_window"]
+        )
+
+        metrics = await engine._calculate_score_stability(wallet)
+
+        assert metrics["samples_used"] == 25
+        assert metrics["volatility"] == pytest.approx(np.std(scores))
+        assert metrics["trend"] == "improving"
+
+
+class TestFullUpdateSchedule:
+    """Test the min-heap of full-update due times."""
+
+    def test_due_wallets_pop_in_order_and_stale_entries_are_skipped(self):
+        """Test only due wallets come off the heap, using their latest schedule."""
+        engine = _engine()
+        engine._schedule_full_update("0xa", 300.0)
+        engine._schedule_full_update("0xb", 100.0)
+        engine._schedule_full_update("0xc", 200.0)
+        engine._schedule_full_update("0xb", 500.0)  # Rescheduled after a full update
+
+        assert engine._pop_due_full_updates(250.0) == ["0xc"]
+        assert engine._pop_due_full_updates(400.0) == ["0xa"]
+        assert engine._pop_due_full_updates(1000.0) == ["0xb"]
+        assert engine._pop_due_full_updates(1000.0) == []
+        assert engine.get_engine_status()["scheduled_full_updates"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_update_schedules_next_one(self):
+        """Test a successful full update puts the wallet back on the schedule."""
+        engine = _engine()
+        engine.quality_scorer.calculate_wallet_quality_score = AsyncMock(
+            return_value={"quality_score": 70.0}
+        )
+        before = time.time()
+        await engine.initialize_wallet_stream("0xabc", [{"pnl_pct": 1.0}] * 30)
+
+        due_at = engine._full_update_due["0xabc"]
+        assert due_at >= before + engine.scoring_params["update_interval_seconds"]
+        assert engine._pop_due_full_updates(due_at - 1) == []
+        assert engine._pop_due_full_updates(due_at) == ["0xabc"]
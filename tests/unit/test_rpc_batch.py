@@ -0,0 +1,181 @@
+"""
+Unit tests for risk_management/rate_limiter.py - JSON-RPC batching and Multicall3.
+"""
+
+from typing import Any, Callable, Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.exceptions import APIError
+from risk_management.rate_limiter import (
+    MULTICALL3_ADDRESS,
+    QuickNodeRPCClient,
+    _abi_word,
+    _decode_aggregate3,
+    _encode_aggregate3,
+)
+
+ENDPOINT = "https://test-rpc.quicknode.com/v1/test"
+
+
+class FakeResponse:
+    """Minimal aiohttp response"""
+
+    def __init__(self, status: int, body: Any) -> None:
+        self.status = status
+        self.body = body
+        self.headers: Dict[str, str] = {}
+
+    async def json(self) -> Any:
+        return self.body
+
+    async def text(self) -> str:
+        return str(self.body)
+
+    async def __aenter__(self) -> "FakeResponse":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+
+class FakeSession:
+    """Session whose POSTs are answered by ``handler(payload) -> (status, body)``"""
+
+    def __init__(self, handler: Callable[[Any], Any]) -> None:
+        self.handler = handler
+        self.payloads: List[Any] = []
+
+    def post(self, url: str, json: Any = None, headers: Any = None) -> FakeResponse:
+        self.payloads.append(json)
+        return FakeResponse(*self.handler(json))
+
+
+def _echo(request: Dict[str, Any]) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request["id"], "result": hex(request["params"][0])}
+
+
+def _client(handler: Callable[[Any], Any]) -> QuickNodeRPCClient:
+    client = QuickNodeRPCClient(primary_endpoint=ENDPOINT)
+    client.session = FakeSession(handler)
+    client._get_session = AsyncMock(return_value=client.session)
+    return client
+
+
+class TestCallBatch:
+    """Test packing, demultiplexing, splitting and retries."""
+
+    @pytest.mark.asyncio
+    async def test_calls_are_packed_and_cost_one_token_per_request(self):
+        """Test 250 calls go out as 3 requests and come back in order."""
+        client = _client(lambda batch: (200, [_echo(r) for r in reversed(batch)]))
+
+        with patch.object(
+            client.rate_limiter, "acquire", wraps=client.rate_limiter.acquire
+        ) as acquire:
+            results = await client.call_batch(
+                [("eth_getBalance", [i]) for i in range(250)], batch_size=100
+            )
+
+        assert results == [hex(i) for i in range(250)]
+        assert [len(p) for p in client.session.payloads] == [100, 100, 50]
+        assert acquire.call_count == 3
+        assert client.get_health_summary()["batch_stats"]["batched_calls"] == 250
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_is_split_in_half(self):
+        """Test a batch the provider refuses as too large is retried as halves."""
+
+        def handler(batch):
+            if len(batch) > 4:
+                return 413, "Payload Too Large"
+            return 200, [_echo(r) for r in batch]
+
+        client = _client(handler)
+        results = await client.call_batch([("eth_getBalance", [i]) for i in range(8)])
+
+        assert results == [hex(i) for i in range(8)]
+        assert [len(p) for p in client.session.payloads] == [8, 4, 4]
+        assert client.batch_stats["batch_splits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_and_transient_failures_are_retried(self):
+        """Test only dropped or transiently failed calls are resent."""
+        attempts = {"count": 0}
+
+        def handler(batch):
+            attempts["count"] += 1
+            if attempts["count"] > 1:
+                return 200, [_echo(r) for r in batch]
+            responses = [_echo(r) for r in batch if r["id"] not in (1, 2, 3)]
+            responses.append({"id": 2, "error": {"code": -32005, "message": "limit exceeded"}})
+            responses.append({"id": 3, "error": {"code": -32000, "message": "execution reverted"}})
+            return 200, responses
+
+        client = _client(handler)
+        results = await client.call_batch(
+            [("eth_call", [i]) for i in range(5)], return_exceptions=True
+        )
+
+        assert client.session.payloads[1] == [
+            {"jsonrpc": "2.0", "method": "eth_call", "params": [i], "id": i} for i in (1, 2)
+        ]
+        assert results[:3] == ["0x0", "0x1", "0x2"] and results[4] == "0x4"
+        assert isinstance(results[3], APIError) and "execution reverted" in str(results[3])
+
+        with pytest.raises(APIError, match="execution reverted"):
+            attempts["count"] = 0
+            await client.call_batch([("eth_call", [i]) for i in range(5)])
+
+
+class TestMulticall:
+    """Test Multicall3 aggregate3 encoding and fan-out."""
+
+    def test_aggregate3_calldata_layout(self):
+        """Test the array offset, element offsets and padded callData."""
+        token = "0x" + "11" * 20
+        calldata = _encode_aggregate3([(token, "0x70a08231" + "00" * 32), (token, "0x18160ddd")])
+        words = [calldata[10 + i : 10 + i + 64] for i in range(0, len(calldata) - 10, 64)]
+
+        assert calldata.startswith("0x82ad56cb")
+        assert [int(w, 16) for w in words[:4]] == [32, 2, 64, 64 + 6 * 32]
+        assert words[4] == "00" * 12 + "11" * 20
+        assert int(words[5], 16) == 1 and int(words[6], 16) == 96 and int(words[7], 16) == 36
+        assert words[9] == "00" * 4 + "00" * 28
+
+    @pytest.mark.asyncio
+    async def test_multicall_fans_out_and_marks_reverts(self):
+        """Test reads are aggregated per chunk and failed reads come back as None."""
+
+        def result_for(count: int) -> str:
+            heads, tails, position = [], [], 32 * count
+            for i in range(count):
+                tail = _abi_word(i % 3 != 2) + _abi_word(64) + _abi_word(32) + _abi_word(i)
+                heads.append(_abi_word(position))
+                tails.append(tail)
+                position += len(tail) // 2
+            return "0x" + _abi_word(32) + _abi_word(count) + "".join(heads) + "".join(tails)
+
+        def handler(batch):
+            responses = []
+            for request in batch:
+                call = request["params"][0]
+                assert call["to"] == MULTICALL3_ADDRESS
+                count = int(call["data"][74:138], 16)
+                responses.append({"id": request["id"], "result": result_for(count)})
+            return 200, responses
+
+        client = _client(handler)
+        reads = [("0x" + "22" * 20, "0x18160ddd")] * 7
+        results = await client.multicall(reads, chunk_size=3)
+
+        assert len(client.session.payloads) == 1 and len(client.session.payloads[0]) == 3
+        assert results[0] == "0x" + _abi_word(0)
+        assert results[2] is None and results[5] is None and results[6] == "0x" + _abi_word(0)
+        assert len(_decode_aggregate3(result_for(4))) == 4
+
+    def test_malformed_result_raises(self):
+        """Test truncated return data is reported as an API error."""
+        with pytest.raises(APIError, match="Malformed Multicall3"):
+            _decode_aggregate3("0x" + _abi_word(32) + _abi_word(2))
@@ -0,0 +1,53 @@
+"""
+Unit tests for utils/single_flight.py - Shared in-flight fetches.
+"""
+
+import asyncio
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test coalescing, cancellation isolation and cleanup."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self):
+        """Test callers for one key await a single fetch, then it is forgotten."""
+        flights: SingleFlight[str, str] = SingleFlight()
+        calls = []
+
+        async def fetch(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key.upper()
+
+        results = await asyncio.gather(*(flights.run("a", fetch) for _ in range(5)))
+
+        assert results == ["A"] * 5
+        assert calls == ["a"]
+        assert "a" not in flights and len(flights) == 0
+
+        assert await flights.run("a", fetch) == "A"
+        assert calls == ["a", "a"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self):
+        """Test the other callers still get the result after one is cancelled."""
+        flights: SingleFlight[int, int] = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch(key):
+            await release.wait()
+            return key * 2
+
+        first = asyncio.create_task(flights.run(21, fetch))
+        second = asyncio.create_task(flights.run(21, fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == 42
+        with pytest.raises(asyncio.CancelledError):
+            await first
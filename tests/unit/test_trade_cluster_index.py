@@ -0,0 +1,143 @@
+"""
+Unit tests for core/trade_cluster_index.py - Cross-wallet cluster detection.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from core.trade_cluster_index import TradeClusterIndex
+
+START = 1_700_000_000.0
+MARKET = "0x" + "ab" * 32
+
+
+def _wallet(i: int) -> str:
+    return f"0x{i + 1:040x}"
+
+
+class FakeOrderBookClient:
+    """CLOB client whose order books name the market a token belongs to"""
+
+    def __init__(self, markets):
+        self.markets = markets
+        self.book_calls = []
+
+    def get_order_book(self, token_id):
+        self.book_calls.append(token_id)
+        return {"market": self.markets.get(token_id), "asset_id": token_id}
+
+
+class TestTradeClusterIndex:
+    """Test detection, deduplication and eviction."""
+
+    def test_cluster_forms_once_across_wallets(self):
+        """Test five wallets on one side within the window form a single cluster."""
+        index = TradeClusterIndex()
+        results = [
+            index.add_trade(_wallet(i), MARKET, "BUY", START + i * 600, 100.0 * (i + 1))
+            for i in range(5)
+        ]
+        index.add_trade(_wallet(9), MARKET, "SELL", START + 100, 50.0)
+        index.add_trade(_wallet(8), "0xother", "BUY", START + 200, 50.0)
+
+        assert results[:4] == [None] * 4
+        cluster = results[4]
+        assert cluster.wallet_count == 5
+        assert cluster.duration_seconds == 2400
+        assert cluster.avg_amount == 300.0
+        assert all(index.clusters_for_wallet(_wallet(i)) == [cluster] for i in range(5))
+        assert index.clusters_for_wallet(_wallet(9)) == []
+
+        # A sixth wallet joins the same event rather than creating a new one
+        assert index.add_trade(_wallet(5), MARKET, "buy", START + 2500, 100.0) is cluster
+        assert cluster.wallet_count == 6
+        assert index.get_stats()["clusters_detected"] == 1
+
+    def test_spread_out_and_repeated_trades_do_not_cluster(self):
+        """Test trades over more than the window, or rescans, never reach the threshold."""
+        index = TradeClusterIndex()
+        for i in range(5):
+            index.add_trade(_wallet(i), MARKET, "BUY", START + i * 1000)
+        for _ in range(3):
+            for i in range(4):
+                index.add_trades(
+                    [{"condition_id": "0xdup", "side": "SELL", "timestamp": START, "tx_hash": i}],
+                    wallet_address=_wallet(i),
+                )
+
+        assert index.get_stats()["clusters_detected"] == 0
+        assert index.get_stats()["duplicate_trades"] == 8
+
+    def test_out_of_order_trades_and_datetimes(self):
+        """Test a late trade in the middle of a burst completes the cluster."""
+        index = TradeClusterIndex()
+        for i in (0, 1, 3, 4):
+            index.add_trade(_wallet(i), MARKET, "BUY", START + i * 60)
+        late = datetime.fromtimestamp(START + 120, tz=timezone.utc)
+
+        cluster = index.add_trade(_wallet(2), MARKET, "BUY", late)
+
+        assert cluster is not None and cluster.start == START and cluster.end == START + 240
+
+    def test_expired_buckets_and_clusters_are_evicted(self):
+        """Test trades and clusters older than the retention period are dropped."""
+        index = TradeClusterIndex(retention_seconds=7200)
+        for i in range(5):
+            index.add_trade(_wallet(i), MARKET, "BUY", START + i)
+        assert index.clusters_for_wallet(_wallet(0))
+
+        index.add_trade(_wallet(7), MARKET, "BUY", START + 3 * 3600)
+
+        assert len(index) == 1
+        assert index.clusters_for_wallet(_wallet(0)) == []
+        assert index.add_trade(_wallet(6), MARKET, "BUY", START) is None
+        assert index.get_stats()["expired_trades"] == 1
+        assert index.evict_expired(now=START + 10 * 3600) == 1
+        assert len(index) == 0
+
+    @pytest.mark.asyncio
+    async def test_monitored_fills_and_scanned_trades_share_clusters(
+        self, monkeypatch, tmp_path
+    ):
+        """Test monitor fills keyed by token land in scanned trades' condition clusters."""
+        from config.settings import settings
+        from core.market_data_cache import MarketDataCache
+        from core.wallet_monitor import WalletMonitor
+
+        monkeypatch.chdir(tmp_path)
+        index = TradeClusterIndex()
+        client = FakeOrderBookClient({"111": MARKET})
+        market_data = MarketDataCache(client)
+        monitor = WalletMonitor(settings, target_wallets=[], market_data=market_data)
+        monitor.cluster_index = index
+
+        # Three on-chain fills of the market's outcome token, one unknown token
+        fills = [
+            {
+                "tx_hash": f"0x{i:064x}",
+                "wallet_address": _wallet(i),
+                "token_id": "111",
+                "side": "BUY",
+                "timestamp": datetime.fromtimestamp(START + i * 60, tz=timezone.utc),
+                "amount": 100.0,
+            }
+            for i in range(3)
+        ]
+        fills.append({**fills[0], "tx_hash": "0x01", "token_id": "999"})
+        await monitor.index_trades_for_clusters(fills)
+
+        # Two scanned wallets trading the same condition complete the cluster,
+        # added the way RedFlagDetector._detect_insider_cluster adds them
+        for i in (3, 4):
+            index.add_trades(
+                [{"condition_id": MARKET, "side": "BUY", "timestamp": START + i * 60}],
+                wallet_address=_wallet(i),
+            )
+
+        (cluster,) = index.clusters_for_wallet(_wallet(0))
+        assert cluster.condition_id == MARKET
+        assert cluster.wallets == {_wallet(i) for i in range(5)}
+        assert sorted(client.book_calls) == ["111", "999"]
+        assert len(index) == 5
+        market_data.close()
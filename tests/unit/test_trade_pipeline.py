@@ -0,0 +1,175 @@
+"""
+Unit tests for core/trade_pipeline.py - Streaming detect -> execute pipeline.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from core.trade_pipeline import CopyTradePipeline
+
+FAST_WALLET = "0x742d35cc6634c0532925a3b844bc454e4438f44e"
+SLOW_WALLET = "0x1234567890abcdef1234567890abcdef12345678"
+
+
+class FakeWalletMonitor:
+    """Yields each wallet's transactions after its own fetch delay"""
+
+    def __init__(self, delays: Dict[str, float], tx_per_wallet: int = 1):
+        self.delays = delays
+        self.tx_per_wallet = tx_per_wallet
+        self.fetched: List[str] = []
+        self.completed_cycles: List[List[str]] = []
+
+    async def plan_monitoring_cycle(self):
+        wallets = list(self.delays)
+        return 100, wallets, {wallet: (90, 100) for wallet in wallets}
+
+    async def iter_wallet_transactions(self, wallets, block_ranges, current_block):
+        for wallet in sorted(wallets, key=self.delays.get):
+            await asyncio.sleep(self.delays[wallet])
+            self.fetched.append(wallet)
+            yield wallet, [
+                {"hash": f"{wallet}-{i}"} for i in range(self.tx_per_wallet)
+            ], self.delays[wallet]
+
+    async def complete_monitoring_cycle(
+        self, wallets, current_block, latencies, fetch_time, cycle_time
+    ):
+        self.completed_cycles.append(list(wallets))
+
+
+class FakeBatchProcessor:
+    """Turns every transaction into a trade"""
+
+    async def process_transaction_batch(self, transactions, wallet_address):
+        return [
+            {"tx_hash": tx["hash"], "wallet_address": wallet_address}
+            for tx in transactions
+        ]
+
+
+class FakeTradeExecutor:
+    """Records executions; optionally blocks until released"""
+
+    def __init__(self, rejected_wallets=(), release: asyncio.Event = None):
+        self.rejected_wallets = set(rejected_wallets)
+        self.release = release
+        self.executed: List[str] = []
+
+    async def screen_trade(self, trade):
+        if trade["wallet_address"] in self.rejected_wallets:
+            return {"status": "rejected", "reason": "risk", "trade_id": trade["tx_hash"]}
+        return None
+
+    async def execute_copy_trade(self, trade):
+        if self.release is not None:
+            await self.release.wait()
+        self.executed.append(trade["tx_hash"])
+        return {"status": "success", "trade_id": trade["tx_hash"]}
+
+
+def _pipeline(monitor, executor, **kwargs) -> CopyTradePipeline:
+    pipeline = CopyTradePipeline(monitor, executor, **kwargs)
+    pipeline.batch_processor = FakeBatchProcessor()
+    return pipeline
+
+
+class TestCopyTradePipeline:
+    """Test trades stream through the stages as wallets are fetched."""
+
+    @pytest.mark.asyncio
+    async def test_trade_executes_before_slower_wallets_are_fetched(self):
+        """Test copy latency depends on one wallet fetch, not the whole cycle."""
+        monitor = FakeWalletMonitor({FAST_WALLET: 0.0, SLOW_WALLET: 0.3})
+        executor = FakeTradeExecutor()
+        pipeline = _pipeline(monitor, executor)
+
+        cycle = asyncio.create_task(pipeline.run_cycle())
+        await asyncio.sleep(0.1)
+
+        assert executor.executed == [f"{FAST_WALLET}-0"]
+        assert monitor.fetched == [FAST_WALLET]
+
+        summary = await cycle
+        await pipeline.drain()
+        await pipeline.stop()
+
+        assert summary["trades_detected"] == 2
+        assert executor.executed == [f"{FAST_WALLET}-0", f"{SLOW_WALLET}-0"]
+        assert monitor.completed_cycles == [[FAST_WALLET, SLOW_WALLET]]
+        assert pipeline.stats["last_copy_latency"] < 0.3
+
+    @pytest.mark.asyncio
+    async def test_risk_gate_drops_rejected_trades(self):
+        """Test rejected trades are reported and never executed."""
+        monitor = FakeWalletMonitor({FAST_WALLET: 0.0, SLOW_WALLET: 0.0})
+        executor = FakeTradeExecutor(rejected_wallets={SLOW_WALLET})
+        results: List[Any] = []
+
+        async def on_result(trade, result):
+            results.append((trade["wallet_address"], result["status"]))
+
+        pipeline = _pipeline(monitor, executor, on_trade_result=on_result)
+        await pipeline.run_cycle()
+        await pipeline.drain()
+        await pipeline.stop()
+
+        assert executor.executed == [f"{FAST_WALLET}-0"]
+        assert sorted(results) == [(SLOW_WALLET, "rejected"), (FAST_WALLET, "success")]
+        assert pipeline.stats["trades_rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bounded_queues_apply_backpressure(self):
+        """Test a stalled executor stops detection from running ahead."""
+        monitor = FakeWalletMonitor({FAST_WALLET: 0.0}, tx_per_wallet=50)
+        release = asyncio.Event()
+        executor = FakeTradeExecutor(release=release)
+        pipeline = _pipeline(monitor, executor, queue_size=2, execution_workers=1)
+
+        cycle = asyncio.create_task(pipeline.run_cycle())
+        await asyncio.sleep(0.05)
+
+        # Executing + two full queues + one blocked put in the gate and detection
+        assert not cycle.done()
+        assert pipeline.stats["trades_detected"] <= 1 + 2 * 2 + 2
+
+        release.set()
+        await cycle
+        await pipeline.drain()
+        await pipeline.stop()
+
+        assert len(executor.executed) == 50
+        assert pipeline.stats["trades_successful"] == 50
+
+    @pytest.mark.asyncio
+    async def test_stop_executes_trades_still_queued(self):
+        """Test stop drains trades whose blocks the cursors have already passed."""
+        monitor = FakeWalletMonitor({FAST_WALLET: 0.0}, tx_per_wallet=5)
+        release = asyncio.Event()
+        executor = FakeTradeExecutor(release=release)
+        pipeline = _pipeline(monitor, executor, execution_workers=1)
+
+        await pipeline.run_cycle()
+        assert monitor.completed_cycles == [[FAST_WALLET]]
+        assert executor.executed == []
+
+        asyncio.get_running_loop().call_later(0.05, release.set)
+        await pipeline.stop()
+
+        assert len(executor.executed) == 5
+        assert not pipeline.running
+
+    @pytest.mark.asyncio
+    async def test_stop_gives_up_after_drain_timeout(self):
+        """Test a stuck executor cannot hold up shutdown past the timeout."""
+        monitor = FakeWalletMonitor({FAST_WALLET: 0.0}, tx_per_wallet=3)
+        executor = FakeTradeExecutor(release=asyncio.Event())
+        pipeline = _pipeline(monitor, executor, execution_workers=1)
+
+        await pipeline.run_cycle()
+        await asyncio.wait_for(pipeline.stop(drain_timeout=0.05), timeout=1.0)
+
+        assert executor.executed == []
+        assert pipeline.get_stats()["execution_queue_depth"] == 2
@@ -0,0 +1,138 @@
+"""
+Unit tests for core/wallet_behavior_store.py - Indexed wallet behavior storage.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.wallet_behavior_backends import (
+    SQLITE_DB_FILE,
+    GzipJSONBehaviorBackend,
+    SQLiteBehaviorBackend,
+)
+from core.wallet_behavior_store import WalletBehaviorStore
+
+WALLET = "0x742d35cc6634c0532925a3b844bc454e4438f44e"
+OTHER_WALLET = "0x1234567890abcdef1234567890abcdef12345678"
+
+
+def _entry(hours_ago: float, classification: str = "directional_trader") -> dict:
+    timestamp = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return {
+        "timestamp": timestamp.isoformat(),
+        "classification": classification,
+        "market_maker_probability": 0.2,
+        "confidence_score": 0.9,
+    }
+
+
+@pytest.fixture(params=["sqlite", "gzip_json"])
+def store(request, tmp_path):
+    """Store running on each backend"""
+    if request.param == "sqlite":
+        backend = SQLiteBehaviorBackend(tmp_path / SQLITE_DB_FILE)
+    else:
+        backend = GzipJSONBehaviorBackend(tmp_path)
+    store = WalletBehaviorStore(data_dir=tmp_path, backend=backend)
+    yield store
+    store.close()
+
+
+class TestWalletBehaviorStore:
+    """Test classification and history storage across backends."""
+
+    def test_classification_round_trip(self, store):
+        """Test classifications are upserted per wallet."""
+        store.store_wallet_classification(WALLET, {"classification": "noise"})
+        store.store_wallet_classification(WALLET, {"classification": "market_maker"})
+        store.store_wallet_classification(OTHER_WALLET, {"classification": "noise"})
+
+        assert store.get_wallet_classification(WALLET)["classification"] == (
+            "market_maker"
+        )
+        assert set(store.get_all_classifications()) == {WALLET, OTHER_WALLET}
+        assert store.get_wallet_classification("0xmissing") is None
+
+    def test_history_days_back_and_limit(self, store):
+        """Test days_back filters by timestamp and results are newest first."""
+        for hours_ago in (100, 30, 2, 1):
+            store.store_behavior_history(WALLET, _entry(hours_ago))
+
+        recent = store.get_wallet_behavior_history(WALLET, days_back=2)
+        limited = store.get_wallet_behavior_history(WALLET, limit=3)
+
+        assert len(recent) == 3
+        assert recent[0]["timestamp"] > recent[-1]["timestamp"]
+        assert len(limited) == 3
+        assert store.get_wallet_behavior_history(OTHER_WALLET) == []
+
+    def test_history_is_capped_per_wallet(self, store):
+        """Test only the newest max_history_per_wallet entries are kept."""
+        store.max_history_per_wallet = 5
+        for i in range(8):
+            store.store_behavior_history(WALLET, _entry(hours_ago=10 - i))
+        store.store_behavior_history(OTHER_WALLET, _entry(hours_ago=1))
+
+        history = store.get_wallet_behavior_history(WALLET)
+
+        assert len(history) == 5
+        assert len(store.get_wallet_behavior_history(OTHER_WALLET)) == 1
+
+    def test_detect_classification_changes(self, store):
+        """Test a classification change within the window is reported."""
+        store.store_behavior_history(WALLET, _entry(3, "directional_trader"))
+        store.store_behavior_history(WALLET, _entry(1, "market_maker"))
+        store.store_behavior_history(OTHER_WALLET, _entry(3, "noise"))
+        store.store_behavior_history(OTHER_WALLET, _entry(1, "noise"))
+
+        changes = store.detect_classification_changes(hours_back=24)
+
+        assert [c["wallet_address"] for c in changes] == [WALLET]
+        assert changes[0]["current_classification"] == "market_maker"
+        assert changes[0]["hours_since_change"] == pytest.approx(1, abs=0.1)
+
+    def test_optimize_trims_history(self, store):
+        """Test optimize_storage trims per-wallet history."""
+        store.optimize_keep_per_wallet = 2
+        for hours_ago in (4, 3, 2, 1):
+            store.store_behavior_history(WALLET, _entry(hours_ago))
+
+        stats = store.optimize_storage()
+
+        assert stats["old_entries_removed"] == 2
+        assert len(store.get_wallet_behavior_history(WALLET)) == 2
+
+    def test_backup_and_restore(self, store):
+        """Test a backup restores data written before it."""
+        store.store_wallet_classification(WALLET, {"classification": "noise"})
+        backup_file = store.create_backup()
+        store.store_wallet_classification(OTHER_WALLET, {"classification": "noise"})
+
+        assert store.restore_from_backup(backup_file) is True
+        assert set(store.get_all_classifications()) == {WALLET}
+
+
+class TestLegacyMigration:
+    """Test automatic migration from gzip JSON files."""
+
+    def test_default_store_migrates_legacy_files(self, tmp_path):
+        """Test a new SQLite store imports existing gzip JSON data once."""
+        legacy = GzipJSONBehaviorBackend(tmp_path)
+        legacy.put_classification(WALLET, {"classification": "market_maker"})
+        legacy.append_history(WALLET, _entry(1), max_entries=200)
+        legacy.append_history(WALLET, _entry(2), max_entries=200)
+
+        store = WalletBehaviorStore(data_dir=tmp_path)
+
+        assert store.backend.name == "sqlite"
+        assert store.get_wallet_classification(WALLET)["classification"] == (
+            "market_maker"
+        )
+        assert len(store.get_wallet_behavior_history(WALLET)) == 2
+        store.close()
+
+        # Reopening must not import the legacy files a second time
+        reopened = WalletBehaviorStore(data_dir=tmp_path)
+        assert len(reopened.get_wallet_behavior_history(WALLET)) == 2
+        reopened.close()
@@ -0,0 +1,104 @@
+"""
+Unit tests for core/wallet_correlation.py - Incremental wallet PnL correlation.
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from core.wallet_correlation import SECONDS_PER_DAY, WalletCorrelationEngine
+from core.wallet_selector import AutomaticWalletSelector
+
+LEADER = "0x" + "11" * 20
+FOLLOWER = "0x" + "22" * 20
+CONTRARIAN = "0x" + "33" * 20
+INDEPENDENT = "0x" + "44" * 20
+START = 1_700_000_000
+
+
+def _trades(days: int = 60) -> list:
+    """Daily trades: a follower tracks the leader, a contrarian opposes it"""
+    rng = np.random.default_rng(3)
+    trades = []
+    for day in range(days):
+        base = rng.normal(0, 100)
+        timestamp = START + day * SECONDS_PER_DAY + 3600
+        for wallet, pnl in (
+            (LEADER, base),
+            (FOLLOWER, 0.8 * base + rng.normal(0, 10)),
+            (CONTRARIAN, -base + rng.normal(0, 10)),
+            (INDEPENDENT, rng.normal(0, 100)),
+        ):
+            trades.append({"wallet_address": wallet, "pnl_usd": pnl, "timestamp": timestamp})
+    return trades
+
+
+class TestWalletCorrelationEngine:
+    """Test incremental updates and queries."""
+
+    def test_correlations_follow_pnl_co_movement(self):
+        """Test co-moving wallets correlate and top-k ranks them first."""
+        engine = WalletCorrelationEngine()
+        for trade in _trades():
+            engine.record_pnl(trade["wallet_address"], trade["pnl_usd"], trade["timestamp"])
+
+        assert engine.correlation(LEADER, FOLLOWER) > 0.9
+        assert engine.correlation(LEADER, CONTRARIAN) < -0.9
+        assert abs(engine.correlation(LEADER, INDEPENDENT)) < 0.5
+        top = engine.top_correlated(LEADER, k=2)
+        assert [wallet for wallet, _ in top][0] == FOLLOWER
+        assert engine.top_correlated(LEADER, k=1, candidates=[CONTRARIAN])[0][0] == CONTRARIAN
+        assert len(engine.pnl_series(LEADER)) == 59  # The last day is still open
+
+    def test_batch_matches_incremental_and_young_wallets_are_ignored(self):
+        """Test record_trades equals per-trade updates; new wallets read as zero."""
+        trades = _trades()
+        incremental = WalletCorrelationEngine(initial_capacity=2)
+        for trade in trades:
+            incremental.record_pnl(trade["wallet_address"], trade["pnl_usd"], trade["timestamp"])
+        batched = WalletCorrelationEngine(initial_capacity=2)
+        assert batched.record_trades(trades) == len(trades)
+
+        wallets = [LEADER, FOLLOWER, CONTRARIAN, INDEPENDENT]
+        np.testing.assert_allclose(
+            batched.correlation_matrix(wallets), incremental.correlation_matrix(wallets)
+        )
+
+        late = "0x" + "55" * 20
+        batched.record_pnl(late, 100.0, START + 60 * SECONDS_PER_DAY)
+        batched.record_pnl(late, 100.0, START + 62 * SECONDS_PER_DAY)
+        matrix = batched.correlation_matrix([LEADER, late, "0x" + "66" * 20])
+        np.testing.assert_array_equal(matrix[1:, :], np.eye(3)[1:, :])
+
+
+class TestSelectorCorrelationFiltering:
+    """Test the wallet selector filters on engine correlations."""
+
+    def test_highly_correlated_lower_ranked_wallet_is_dropped(self):
+        """Test the follower is filtered out behind the leader it copies."""
+        engine = WalletCorrelationEngine()
+        engine.record_trades(_trades())
+        selector = AutomaticWalletSelector(Mock(), correlation_engine=engine)
+        wallets = [{"address": w} for w in (LEADER, FOLLOWER, CONTRARIAN, INDEPENDENT)]
+
+        kept = selector._apply_correlation_filtering(wallets, {"correlation_constraint": 0.7})
+
+        assert [w["address"] for w in kept] == [LEADER, CONTRARIAN, INDEPENDENT]
+
+
+@pytest.mark.parametrize("wallet_count", [2500])
+def test_top_k_over_thousands_of_wallets(wallet_count):
+    """Test top-k queries stay correct with thousands of tracked wallets."""
+    rng = np.random.default_rng(5)
+    engine = WalletCorrelationEngine(min_observations=5)
+    wallets = [f"0x{i:040x}" for i in range(wallet_count)]
+    engine.add_wallets(wallets)
+    for day in range(12):
+        pnl = rng.normal(0, 1, wallet_count)
+        pnl[1] = pnl[0] * 2 + rng.normal(0, 0.01)
+        for i in (0, 1, 2, 3):
+            engine.record_pnl(wallets[i], pnl[i], START + day * SECONDS_PER_DAY)
+
+    assert engine.top_correlated(wallets[0], k=1)[0][0] == wallets[1]
+    assert len(engine.top_correlated(wallets[0], k=50)) == 50
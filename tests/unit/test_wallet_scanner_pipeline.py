@@ -0,0 +1,158 @@
+"""
+Unit tests for the staged pipeline in scanners/high_performance_wallet_scanner_v2.py.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Set
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from config.scanner_config import ScannerConfig
+from core.exceptions import APIError
+from scanners.high_performance_wallet_scanner_v2 import HighPerformanceWalletScanner
+
+MODULE = "scanners.high_performance_wallet_scanner_v2"
+
+
+def _wallet(i: int) -> str:
+    return f"0x{i + 1:040x}"
+
+
+def _full_data() -> Dict:
+    trades = [
+        {"category": "Politics", "amount": "100", "pnl": "10"},
+        {"category": "Politics", "amount": "100", "pnl": "-5"},
+    ] * 50
+    return {
+        "trade_count": 100,
+        "wallet_age_days": 60,
+        "avg_hold_time_seconds": 86400,
+        "win_rate": 0.65,
+        "profit_per_trade": "0.05",
+        "trades": trades,
+    }
+
+
+class FakeAnalyzer:
+    """Analyzer whose wallets in ``survivors`` pass Stage 1"""
+
+    def __init__(self, survivors: Set[str], slow: Optional[Dict[str, float]] = None):
+        self.survivors = survivors
+        self.slow = slow or {}
+        self.summary_calls: List[str] = []
+        self.full_calls: List[str] = []
+        self.finished: Dict[str, float] = {}
+
+    async def get_wallet_summary(self, address: str) -> Dict:
+        self.summary_calls.append(address)
+        await asyncio.sleep(self.slow.get(address, 0.001))
+        if address not in self.survivors:
+            return {"trade_count": 2, "wallet_age_days": 60, "category_volumes": {"Sports": "5"}}
+        return {"trade_count": 100, "wallet_age_days": 60, "category_volumes": {"Politics": "1e4"}}
+
+    async def analyze_wallet(self, address: str) -> Dict:
+        self.full_calls.append(address)
+        await asyncio.sleep(0.001)
+        self.finished[address] = time.monotonic()
+        return _full_data()
+
+
+class FullDataOnlyAnalyzer:
+    """Analyzer without a summary endpoint"""
+
+    def __init__(self) -> None:
+        self.full_calls: List[str] = []
+
+    async def analyze_wallet(self, address: str) -> Dict:
+        self.full_calls.append(address)
+        return _full_data()
+
+
+def _scanner(analyzer) -> HighPerformanceWalletScanner:
+    config = ScannerConfig(MIN_TRADE_COUNT=10, MIN_WALLET_AGE_DAYS=30)
+    with patch(f"{MODULE}.WalletAnalyzer", return_value=analyzer):
+        return HighPerformanceWalletScanner(config)
+
+
+@pytest.fixture(autouse=True)
+def no_alerts():
+    with patch(f"{MODULE}.send_telegram_alert", new=AsyncMock(return_value=True)):
+        yield
+
+
+class TestStagedPipeline:
+    """Test continuous flow, tiered fetching and per-stage statistics."""
+
+    @pytest.mark.asyncio
+    async def test_only_stage1_survivors_fetch_trade_history(self):
+        """Test rejected wallets cost one summary call and survivors one more."""
+        wallets = [_wallet(i) for i in range(100)]
+        survivors = set(wallets[::5])
+        analyzer = FakeAnalyzer(survivors)
+        scanner = _scanner(analyzer)
+
+        results, stats = await scanner.scan_wallet_batch(wallets)
+
+        assert [r.address for r in results] == wallets
+        assert sorted(analyzer.full_calls) == sorted(survivors)
+        assert stats.api_calls == 100 + len(survivors)
+        assert stats.stage1_rejected == 80 and stats.targets_found == 20
+        assert (stats.stage1_processed, stats.stage2_processed, stats.stage3_processed) == (
+            100,
+            20,
+            20,
+        )
+        assert set(stats.stage_throughput) == {"stage1", "stage2", "stage3"}
+        assert all(rate > 0 for rate in stats.stage_throughput.values())
+
+    @pytest.mark.asyncio
+    async def test_slow_wallet_does_not_stall_the_others(self):
+        """Test wallets queued behind a slow one finish before it does."""
+        wallets = [_wallet(i) for i in range(60)]
+        analyzer = FakeAnalyzer(set(wallets), slow={wallets[0]: 0.3})
+        scanner = _scanner(analyzer)
+
+        start = time.monotonic()
+        results, stats = await scanner.scan_wallet_batch(wallets, batch_size=10)
+
+        assert all(r is not None for r in results) and len(results) == 60
+        assert max(t for w, t in analyzer.finished.items() if w != wallets[0]) - start < 0.25
+        assert analyzer.finished[wallets[0]] - start >= 0.3
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_full_data_without_summary_endpoint(self):
+        """Test analyzers without summaries are called once per wallet."""
+        analyzer = FullDataOnlyAnalyzer()
+        scanner = _scanner(analyzer)
+        wallets = [_wallet(i) for i in range(10)]
+
+        results, stats = await scanner.scan_wallet_batch(wallets)
+
+        assert not scanner.tiered_fetch_enabled
+        assert _scanner(FakeAnalyzer(set())).tiered_fetch_enabled
+        assert sorted(analyzer.full_calls) == sorted(wallets)
+        assert stats.api_calls == 10
+        assert all(r.scan_stage_completed == 3 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_wallets_are_counted_and_skipped(self):
+        """Test a wallet whose fetch fails yields no result without stopping the scan."""
+        wallets = [_wallet(i) for i in range(10)]
+        analyzer = FakeAnalyzer(set(wallets))
+        original = analyzer.get_wallet_summary
+
+        async def flaky_summary(address: str) -> Dict:
+            if address == wallets[3]:
+                raise APIError("upstream timeout")
+            return await original(address)
+
+        analyzer.get_wallet_summary = flaky_summary
+        scanner = _scanner(analyzer)
+
+        results, stats = await scanner.scan_wallet_batch(wallets)
+
+        assert len(results) == 9
+        assert wallets[3] not in {r.address for r in results}
+        assert stats.errors == 1
@@ -0,0 +1,150 @@
+"""
+Unit tests for core/wallet_scoring_kernel.py - Vectorized batch wallet scoring.
+"""
+
+import dataclasses
+import threading
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from core.wallet_quality_scorer import WalletQualityScorer
+from core.wallet_scoring_kernel import _first_at_least, pack_trades
+
+CATEGORIES = ["politics", "crypto", "sports", "economics", "science", "culture", "tech"]
+
+
+def _wallet(seed: int, trade_count: int) -> dict:
+    """Random trade history with timestamp ties, flat trades and drawdowns"""
+    rng = np.random.default_rng(seed)
+    start = time.time() - rng.uniform(2, 200) * 86400
+    gaps = rng.choice([0.0, 60.0, 1800.0, 7200.0, 86400.0], size=trade_count)
+    pnls = np.round(rng.normal(rng.uniform(-5, 15), 40, trade_count), 2)
+    pnls[rng.random(trade_count) < 0.05] = 0.0
+    category_count = int(rng.integers(1, len(CATEGORIES)))
+    trades = []
+    for i in range(trade_count):
+        trades.append(
+            {
+                "timestamp": float(start + gaps[: i + 1].sum()),
+                "pnl": str(pnls[i]),
+                "is_profitable": bool(pnls[i] > 0),
+                "category": CATEGORIES[int(rng.integers(0, category_count))],
+                "position_size": float(rng.uniform(10, 1500)),
+            }
+        )
+    rng.shuffle(trades)  # Histories are not required to arrive sorted
+    address = "0x" + f"{seed + 1:040x}"
+    return {"address": address, "trades": trades, "trade_count": trade_count}
+
+
+def _assert_same_score(batch_score, single_score):
+    assert batch_score.wallet_address == single_score.wallet_address
+    assert batch_score.quality_tier == single_score.quality_tier
+    assert batch_score.is_market_maker == single_score.is_market_maker
+    assert [f[0] for f in batch_score.red_flags] == [f[0] for f in single_score.red_flags]
+    for name in ("total_score", "performance_score", "risk_score", "consistency_score"):
+        assert getattr(batch_score, name) == pytest.approx(getattr(single_score, name))
+    for name, expected in dataclasses.asdict(single_score.risk_metrics).items():
+        assert getattr(batch_score.risk_metrics, name) == pytest.approx(expected), name
+    batch_domain = dataclasses.asdict(batch_score.domain_expertise)
+    for name, expected in dataclasses.asdict(single_score.domain_expertise).items():
+        if name == "primary_domain":
+            assert batch_domain[name] == expected
+        else:
+            assert float(batch_domain[name]) == pytest.approx(float(expected)), name
+
+
+class TestBatchScoring:
+    """Test the batch path reproduces score_wallet."""
+
+    @pytest.mark.asyncio
+    async def test_batch_scores_match_single_wallet_scores(self):
+        """Test every metric matches across small, large and market-maker wallets."""
+        wallets = [_wallet(seed, n) for seed, n in enumerate([0, 5, 29, 30, 31, 80, 250, 650])]
+        market_maker = _wallet(99, 620)
+        for i, trade in enumerate(sorted(market_maker["trades"], key=lambda t: t["timestamp"])):
+            trade["timestamp"] = time.time() - 86400 * 30 + i * 600
+            trade["pnl"] = "1.0" if i % 2 else "-1.1"
+            trade["is_profitable"] = bool(i % 2)
+        wallets.append(market_maker)
+        wallets.append({"address": "not-a-wallet", "trades": []})
+
+        batch_scores = await WalletQualityScorer(Mock()).batch_score_wallets(wallets)
+        single = WalletQualityScorer(Mock())
+        single_scores = [await single.score_wallet(w["address"], w) for w in wallets[:-1]]
+
+        assert len(batch_scores) == len(single_scores) == len(wallets) - 1
+        assert batch_scores[-1].is_market_maker
+        for batch_score, single_score in zip(batch_scores, single_scores):
+            _assert_same_score(batch_score, single_score)
+
+    @pytest.mark.asyncio
+    async def test_chunked_batch_runs_kernel_off_the_loop(self, monkeypatch):
+        """Test chunked batches match score_wallet and compute metrics in worker threads."""
+        wallets = [_wallet(seed, n) for seed, n in enumerate([40, 120, 35, 300, 60, 90], 10)]
+        scorer = WalletQualityScorer(Mock())
+        scorer.BATCH_MAX_TRADES = 200  # Several kernel calls for one batch
+        kernel_threads = []
+        compute = scorer._compute_batch_metrics
+
+        def recording_compute(trade_lists):
+            kernel_threads.append(threading.get_ident())
+            return compute(trade_lists)
+
+        monkeypatch.setattr(scorer, "_compute_batch_metrics", recording_compute)
+
+        batch_scores = await scorer.batch_score_wallets(wallets)
+        single = WalletQualityScorer(Mock())
+        single_scores = [await single.score_wallet(w["address"], w) for w in wallets]
+
+        assert len(kernel_threads) > 1
+        assert threading.get_ident() not in kernel_threads
+        assert len(batch_scores) == len(wallets)
+        for batch_score, single_score in zip(batch_scores, single_scores):
+            _assert_same_score(batch_score, single_score)
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_and_fills_the_score_cache(self):
+        """Test cached wallets are returned as-is and new scores are cached."""
+        scorer = WalletQualityScorer(Mock())
+        wallets = [_wallet(seed, 40) for seed in range(3)]
+
+        first = await scorer.batch_score_wallets(wallets)
+        second = await scorer.batch_score_wallets(wallets)
+
+        assert all(a is b for a, b in zip(first, second))
+        assert (await scorer.get_score_summary())["total_scores"] == 3
+
+
+class TestKernelPrimitives:
+    """Test packing and the binary-lifting search."""
+
+    def test_pack_trades_builds_csr_offsets_and_skips_bad_trades(self):
+        """Test offsets follow the input lists and unparsable trades are dropped."""
+        trades = [
+            [{"timestamp": 1.0, "pnl": "2"}, {"timestamp": 2.0, "pnl": None}],
+            [],
+            [{"timestamp": 3.0, "pnl": "-1", "category": "crypto"}],
+        ]
+
+        batch = pack_trades(trades, float)
+
+        assert batch.offsets.tolist() == [0, 1, 1, 2]
+        assert batch.pnls.tolist() == [2.0, -1.0]
+        assert [batch.category_names[c] for c in batch.categories] == ["general", "crypto"]
+
+    def test_first_at_least_matches_a_linear_scan(self):
+        """Test every query finds the first qualifying index at or after its start."""
+        rng = np.random.default_rng(1)
+        values = rng.normal(size=300)
+        starts = rng.integers(0, 301, size=500)
+        thresholds = rng.normal(1.0, 1.0, size=500)
+
+        found = _first_at_least(values, starts, thresholds)
+
+        for start, threshold, result in zip(starts, thresholds, found):
+            hits = np.flatnonzero(values[start:] >= threshold)
+            assert result == (start + hits[0] if len(hits) else len(values))
@@ -0,0 +1,81 @@
+"""
+Unit tests for core/websocket_manager.py - Subscription tracking across reconnects.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+import core.websocket_manager as websocket_manager
+from core.websocket_manager import WebSocketManager
+
+
+class FakeWebSocket:
+    """Connected socket that records sent frames and never receives"""
+
+    def __init__(self):
+        self.sent = []
+        self._closed = asyncio.Event()
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def close(self):
+        self._closed.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self._closed.wait()
+        raise StopAsyncIteration
+
+
+@pytest.fixture
+def sockets(monkeypatch):
+    opened = []
+
+    async def fake_connect(url, **kwargs):
+        opened.append(FakeWebSocket())
+        return opened[-1]
+
+    monkeypatch.setattr(websocket_manager, "connect", fake_connect)
+    return opened
+
+
+class TestWebSocketManagerSubscriptions:
+    """Test server-id tracking and the on_connect hook."""
+
+    @pytest.mark.asyncio
+    async def test_tracks_server_ids_and_clears_on_reconnect(self, sockets):
+        """Test active subscriptions hold server ids and reset per connection."""
+        connects = []
+        manager = WebSocketManager(
+            "wss://example",
+            on_connect=lambda: connects.append(len(sockets)),
+            alert_on_disconnect=False,
+        )
+        try:
+            assert await manager.connect()
+            assert await manager.subscribe({"id": "req_1", "params": ["logs", {}]})
+            assert manager.active_subscriptions == set()
+
+            manager._record_subscription_confirmation({"id": "req_1", "result": "0xs1"})
+            assert manager.active_subscriptions == {"0xs1"}
+
+            assert await manager.unsubscribe("0xs1")
+            assert manager.active_subscriptions == set()
+
+            await manager.subscribe({"id": "req_2", "params": ["logs", {}]})
+            manager._record_subscription_confirmation({"id": "req_2", "result": "0xs2"})
+
+            # Simulate the socket dropping and the reconnect loop succeeding
+            await sockets[0].close()
+            manager.state = websocket_manager.ConnectionState.RECONNECTING
+            assert await manager.connect()
+
+            assert manager.active_subscriptions == set()
+            assert connects == [1, 2]
+        finally:
+            await manager.disconnect()
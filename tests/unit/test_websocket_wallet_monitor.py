@@ -0,0 +1,184 @@
+"""
+Unit tests for core/websocket_wallet_monitor.py - Multiplexed log monitoring.
+"""
+
+import pytest
+from web3 import Web3
+
+from core.websocket_wallet_monitor import (
+    ORDER_FILLED_TOPIC,
+    WebSocketWalletMonitor,
+    address_to_topic,
+)
+
+WALLET_A = "0x742d35cc6634c0532925a3b844bc454e4438f44e"
+WALLET_B = "0x1234567890abcdef1234567890abcdef12345678"
+WALLET_C = "0xabcdefabcdefabcdefabcdefabcdefabcdefabcd"
+OTHER = "0x9999999999999999999999999999999999999999"
+EXCHANGE = "0x4bfb41d5b3570defd03c39a9a4d8de6bd8b8982e"
+
+
+class FakeWebSocketManager:
+    """Records subscribe/unsubscribe calls on a connected socket"""
+
+    def __init__(self):
+        self.subscribed = []
+        self.unsubscribed = []
+
+    def is_connected(self):
+        return True
+
+    async def subscribe(self, params):
+        self.subscribed.append(params)
+        return True
+
+    async def unsubscribe(self, subscription_id):
+        self.unsubscribed.append(subscription_id)
+        return True
+
+
+def _word(value: int) -> str:
+    return f"{value:064x}"
+
+
+def _order_filled(maker: str, taker: str, log_index: int = 1, tx: str = "0xaa") -> dict:
+    # Maker pays 60 USDC for 100 outcome tokens (token id 777)
+    data = "0x" + "".join(_word(v) for v in (0, 777, 60_000_000, 100_000_000, 0))
+    return {
+        "address": EXCHANGE,
+        "topics": [
+            ORDER_FILLED_TOPIC,
+            "0x" + "11" * 32,
+            address_to_topic(maker),
+            address_to_topic(taker),
+        ],
+        "data": data,
+        "transactionHash": tx,
+        "logIndex": hex(log_index),
+        "blockNumber": "0x10",
+    }
+
+
+def _notification(log: dict) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "method": "eth_subscription",
+        "params": {"subscription": "0xsub", "result": log},
+    }
+
+
+@pytest.fixture
+def monitor():
+    trades = []
+    monitor = WebSocketWalletMonitor(
+        [WALLET_A, WALLET_B], "wss://example", None, trades.append
+    )
+    monitor.ws_manager = FakeWebSocketManager()
+    monitor.trades = trades
+    return monitor
+
+
+class TestWebSocketWalletMonitor:
+    """Test multiplexed subscription, routing and dedup."""
+
+    def test_order_filled_topic_matches_event_signature(self):
+        """Test the hard-coded topic is the OrderFilled signature hash."""
+        signature = "OrderFilled(bytes32,address,address,uint256,uint256,uint256,uint256,uint256)"
+        assert "0x" + Web3.keccak(text=signature).hex().removeprefix("0x") == (
+            ORDER_FILLED_TOPIC
+        )
+
+    @pytest.mark.asyncio
+    async def test_single_filter_set_covers_all_wallets(self, monitor):
+        """Test one maker and one taker filter cover every wallet."""
+        await monitor._subscribe_to_wallet_logs()
+
+        filters = [p["params"][1] for p in monitor.ws_manager.subscribed]
+        assert len(filters) == 2
+        assert filters[0]["topics"][2] == [
+            address_to_topic(WALLET_A),
+            address_to_topic(WALLET_B),
+        ]
+        assert filters[1]["topics"][3] == filters[0]["topics"][2]
+
+    @pytest.mark.asyncio
+    async def test_routes_by_role_and_deduplicates(self, monitor):
+        """Test each matching wallet gets its side and repeats are dropped."""
+        log = _order_filled(maker=WALLET_A, taker=WALLET_B)
+
+        await monitor._handle_websocket_message(_notification(log))
+        await monitor._handle_websocket_message(_notification(log))
+        await monitor._handle_websocket_message(
+            _notification(_order_filled(maker=OTHER, taker=OTHER, log_index=2))
+        )
+
+        assert [(t["wallet_address"], t["role"], t["side"]) for t in monitor.trades] == [
+            (WALLET_A, "maker", "BUY"),
+            (WALLET_B, "taker", "SELL"),
+        ]
+        assert monitor.trades[0]["price"] == pytest.approx(0.6)
+        assert monitor.trades[0]["amount"] == pytest.approx(100)
+        assert monitor.trades[0]["token_id"] == "777"
+        assert monitor.metrics["duplicate_events"] == 1
+        assert monitor.metrics["websocket_events_unmatched"] == 1
+
+    @pytest.mark.asyncio
+    async def test_update_target_wallets_resubscribes_in_place(self, monitor):
+        """Test wallet changes swap filters on the live connection."""
+        await monitor._subscribe_to_wallet_logs()
+        for request in monitor.ws_manager.subscribed:
+            await monitor._handle_websocket_message(
+                {"id": request["id"], "result": f"0xsub_{request['id']}"}
+            )
+
+        await monitor.update_target_wallets([WALLET_B, WALLET_C])
+
+        manager = monitor.ws_manager
+        assert len(manager.subscribed) == 4
+        assert manager.subscribed[2]["params"][1]["topics"][2] == [
+            address_to_topic(WALLET_B),
+            address_to_topic(WALLET_C),
+        ]
+        assert sorted(manager.unsubscribed) == [
+            "0xsub_wallet_logs_maker_1",
+            "0xsub_wallet_logs_taker_1",
+        ]
+
+        await monitor._handle_websocket_message(
+            _notification(_order_filled(maker=WALLET_A, taker=WALLET_C))
+        )
+        assert [t["wallet_address"] for t in monitor.trades] == [WALLET_C]
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_superseded_subscription_is_released_later(self, monitor):
+        """Test a filter replaced before confirmation is dropped on confirmation."""
+        await monitor._subscribe_to_wallet_logs()
+        await monitor.update_target_wallets([WALLET_C])
+        assert monitor.ws_manager.unsubscribed == []
+
+        await monitor._handle_websocket_message(
+            {"id": "wallet_logs_maker_1", "result": "0xold"}
+        )
+
+        assert monitor.ws_manager.unsubscribed == ["0xold"]
+        assert "wallet_logs_maker_1" not in monitor.subscription_requests
+
+    @pytest.mark.asyncio
+    async def test_reconnect_resubscribes_without_releasing_dead_filters(self, monitor):
+        """Test the on_connect hook installs fresh filters after a reconnect."""
+        await monitor._subscribe_to_wallet_logs()
+        for request in monitor.ws_manager.subscribed:
+            await monitor._handle_websocket_message(
+                {"id": request["id"], "result": f"0xsub_{request['id']}"}
+            )
+
+        await monitor._handle_websocket_connect()
+
+        manager = monitor.ws_manager
+        assert [r["id"] for r in manager.subscribed[2:]] == [
+            "wallet_logs_maker_2",
+            "wallet_logs_taker_2",
+        ]
+        assert manager.unsubscribed == []
+        assert monitor._active_requests == ["wallet_logs_maker_2", "wallet_logs_taker_2"]
+        assert set(monitor.subscription_requests) == set(monitor._active_requests)
@@ -12,10 +12,9 @@ All gas prices are handled in gwei (1 gwei = 10^9 wei).
 
 import logging
 import time
-from collections import deque
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 from web3 import Web3
@@ -126,6 +125,46 @@ class GasSpikeStrategy(Enum):
     BATCH = "batch"  # Batch with other pending trades
 
 
+class _RollingWindow:
+    """Running mean and Welford variance over the newest ``size`` observations"""
+
+    __slots__ = ("size", "count", "mean", "m2")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, new: float, old: Optional[float]) -> None:
+        """Add ``new``; ``old`` is the value leaving a full window, else None"""
+        if old is None:
+            self.count += 1
+            delta = new - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (new - self.mean)
+        else:
+            old_mean = self.mean
+            self.mean += (new - old) / self.count
+            self.m2 += (new - old) * (new - self.mean + old - old_mean)
+            if self.m2 < 0.0:  # Rounding can push an all-equal window below zero
+                self.m2 = 0.0
+
+    def load(self, values: np.ndarray) -> None:
+        """Recompute exactly from the window's values"""
+        self.count = len(values)
+        self.mean = float(values.mean()) if self.count else 0.0
+        self.m2 = float(((values - self.mean) ** 2).sum()) if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation (matches np.std)"""
+        return float(np.sqrt(self.m2 / self.count)) if self.count else 0.0
+
+
 class GasPricePredictor:
     """
     Predicts gas prices using historical data and time-series analysis.
@@ -136,6 +175,12 @@ class GasPricePredictor:
     - Time-of-day patterns
     - Day-of-week patterns
     - Recent trend analysis
+
+    History is a preallocated float64 ring buffer. Each moving-average
+    window keeps a running mean and Welford variance that are updated as
+    prices enter and leave it, so predictions and spike checks are O(1)
+    and allocate nothing. Window statistics are recomputed exactly once
+    per ``history_size`` updates to stop floating-point drift.
     """
 
     def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE) -> None:
@@ -148,25 +193,54 @@ class GasPricePredictor:
             history_size: Number of historical gas prices to track.
                 Defaults to DEFAULT_HISTORY_SIZE.
         """
-        self.history_size = history_size
-        self.gas_history: deque = deque(maxlen=history_size)
-        self.timestamp_history: deque = deque(maxlen=history_size)
+        self.history_size = max(1, history_size)
+        self._prices = np.zeros(self.history_size, dtype=np.float64)
+        self._timestamps = np.zeros(self.history_size, dtype=np.float64)
+        self._head = 0  # Next slot to write
+        self._count = 0
+        self._updates_since_resync = 0
 
         # Prediction parameters
         self.short_window = SHORT_TERM_WINDOW
         self.medium_window = MEDIUM_TERM_WINDOW
         self.long_window = LONG_TERM_WINDOW
+        self._windows = {
+            size: _RollingWindow(min(size, self.history_size))
+            for size in (self.short_window, self.medium_window, self.long_window)
+        }
 
         logger.info("Gas price predictor initialized")
 
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def gas_history(self) -> np.ndarray:
+        """Gas prices oldest first (a copy, for inspection and plotting)"""
+        return self._chronological(self._prices)
+
+    @property
+    def timestamp_history(self) -> np.ndarray:
+        """Observation timestamps oldest first (a copy)"""
+        return self._chronological(self._timestamps)
+
+    def _chronological(self, buffer: np.ndarray) -> np.ndarray:
+        if self._count < self.history_size:
+            return buffer[: self._count].copy()
+        return np.roll(buffer, -self._head)
+
+    def _recent(self, offset: int) -> float:
+        """Price ``offset`` observations back (1 = latest)"""
+        return float(self._prices[(self._head - offset) % self.history_size])
+
     def add_gas_price(
         self, gas_price_gwei: float, timestamp: Optional[float] = None
     ) -> None:
         """Add gas price observation to history.
 
         Adds a new gas price observation to the historical data used for
-        prediction. The history is maintained as a deque with maximum size
-        to prevent unbounded memory growth.
+        prediction. The oldest observation is overwritten once the ring
+        buffer holds history_size prices.
 
         Args:
             gas_price_gwei: Gas price in gwei (1 gwei = 10^9 wei).
@@ -175,9 +249,62 @@ class GasPricePredictor:
         """
         if timestamp is None:
             timestamp = time.time()
+        price = float(gas_price_gwei)
 
-        self.gas_history.append(gas_price_gwei)
-        self.timestamp_history.append(timestamp)
+        for window in self._windows.values():
+            old = self._recent(window.size) if self._count >= window.size else None
+            window.push(price, old)
+
+        self._prices[self._head] = price
+        self._timestamps[self._head] = timestamp
+        self._head = (self._head + 1) % self.history_size
+        self._count = min(self._count + 1, self.history_size)
+
+        self._updates_since_resync += 1
+        if self._updates_since_resync >= self.history_size:
+            self._resync_windows()
+
+    def add_gas_prices(
+        self,
+        gas_prices_gwei: Sequence[float],
+        timestamps: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Add many gas price observations at once (e.g. a historical backfill).
+
+        Only the newest history_size observations are kept, so the cost is
+        bounded by the buffer size rather than the batch size.
+
+        Args:
+            gas_prices_gwei: Gas prices in gwei, oldest first.
+            timestamps: Unix timestamps matching gas_prices_gwei.
+                Defaults to the current time for every observation.
+        """
+        prices = np.asarray(gas_prices_gwei, dtype=np.float64)
+        if timestamps is None:
+            stamps = np.full(len(prices), time.time())
+        else:
+            stamps = np.asarray(timestamps, dtype=np.float64)
+            if len(stamps) != len(prices):
+                raise ValueError("gas_prices_gwei and timestamps differ in length")
+        if len(prices) == 0:
+            return
+
+        prices = prices[-self.history_size :]
+        stamps = stamps[-self.history_size :]
+        slots = (self._head + np.arange(len(prices))) % self.history_size
+        self._prices[slots] = prices
+        self._timestamps[slots] = stamps
+        self._head = (self._head + len(prices)) % self.history_size
+        self._count = min(self._count + len(prices), self.history_size)
+        self._resync_windows()
+
+    def _resync_windows(self) -> None:
+        """Recompute every window's statistics from the buffer"""
+        for window in self._windows.values():
+            count = min(window.size, self._count)
+            slots = (self._head - count + np.arange(count)) % self.history_size
+            window.load(self._prices[slots])
+        self._updates_since_resync = 0
 
     def predict_gas_price(
         self,
@@ -208,11 +335,10 @@ class GasPricePredictor:
         CONFIDENCE_BOUND_MULTIPLIER_LOWER = 0.9  # 10% below for lower bound
         CONFIDENCE_BOUND_MULTIPLIER_UPPER = 1.1  # 10% above for upper bound
 
-        if len(self.gas_history) < self.short_window:
+        count = self._count
+        if count < self.short_window:
             # Not enough data - return current price
-            current = (
-                self.gas_history[-1] if self.gas_history else DEFAULT_GAS_PRICE_GWEI
-            )
+            current = self._recent(1) if count else DEFAULT_GAS_PRICE_GWEI
             return {
                 "predicted_price_gwei": current,
                 "confidence": 0.0,
@@ -221,39 +347,26 @@ class GasPricePredictor:
                 "upper_bound": current * CONFIDENCE_BOUND_MULTIPLIER_UPPER,
             }
 
-        gas_array = np.array(self.gas_history)
-
-        # Calculate moving averages
-        short_ma = (
-            np.mean(gas_array[-self.short_window :])
-            if len(gas_array) >= self.short_window
-            else gas_array[-1]
-        )
+        # Moving averages from the running window statistics
+        short = self._windows[self.short_window]
+        short_ma = short.mean
         medium_ma = (
-            np.mean(gas_array[-self.medium_window :])
-            if len(gas_array) >= self.medium_window
+            self._windows[self.medium_window].mean
+            if count >= self.medium_window
             else short_ma
         )
         long_ma = (
-            np.mean(gas_array[-self.long_window :])
-            if len(gas_array) >= self.long_window
+            self._windows[self.long_window].mean
+            if count >= self.long_window
             else medium_ma
         )
 
         # Calculate volatility
-        volatility = (
-            np.std(gas_array[-self.short_window :])
-            if len(gas_array) >= self.short_window
-            else 0.0
-        )
+        volatility = short.std
 
         # Trend analysis
-        recent_trend = (
-            (gas_array[-1] - gas_array[-min(10, len(gas_array))])
-            / min(10, len(gas_array))
-            if len(gas_array) > 1
-            else 0.0
-        )
+        trend_span = min(10, count)
+        recent_trend = (self._recent(1) - self._recent(trend_span)) / trend_span
 
         # Time-of-day adjustment (gas tends to be higher during peak hours)
         now = datetime.now(timezone.utc)
@@ -288,7 +401,7 @@ class GasPricePredictor:
         predicted_price *= time_multiplier * day_multiplier
 
         # Confidence calculation (based on data quality and volatility)
-        data_quality = min(1.0, len(self.gas_history) / self.long_window)
+        data_quality = min(1.0, count / self.long_window)
         volatility_factor = max(0.0, 1.0 - (volatility / base_prediction))
         confidence = data_quality * volatility_factor
 
@@ -330,10 +443,10 @@ class GasPricePredictor:
             True if current gas price exceeds threshold_multiplier times
             the recent average, False otherwise.
         """
-        if len(self.gas_history) < self.medium_window:
+        if self._count < self.medium_window:
             return False
 
-        recent_avg = np.mean(list(self.gas_history)[-self.medium_window :])
+        recent_avg = self._windows[self.medium_window].mean
         return current_gas > recent_avg * threshold_multiplier
 
     def get_volatility(self) -> float:
@@ -347,10 +460,10 @@ class GasPricePredictor:
             Volatility as standard deviation of recent gas prices.
             Returns 0.0 if insufficient data available.
         """
-        if len(self.gas_history) < self.short_window:
+        if self._count < self.short_window:
             return 0.0
 
-        return float(np.std(list(self.gas_history)[-self.short_window :]))
+        return self._windows[self.short_window].std
 
 
 class MEVProtection:
@@ -1041,6 +1154,6 @@ class GasOptimizer:
             **self.metrics,
             "mode": self.mode.value,
             "current_gas_price_gwei": self.current_gas_price,
-            "history_size": len(self.predictor.gas_history),
+            "history_size": len(self.predictor),
             "volatility": self.predictor.get_volatility(),
         }
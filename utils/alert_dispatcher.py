@@ -0,0 +1,294 @@
+"""
+Coalescing alert dispatcher.
+
+Alerts are queued without blocking the caller and delivered by a background
+task. Alerts of the same type that arrive within the coalescing window of
+the previous delivery of that type are merged into one digest message, so a
+burst produces a single notification instead of being dropped. The pending
+queue is bounded: when it is full the lowest-priority alert is dropped
+(never one of higher priority than the newcomer), and drops are counted.
+
+Delivery order is by priority, then age. CRITICAL alerts are never held for
+the coalescing window; they only merge with CRITICAL alerts of the same type
+already waiting.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Dispatcher constants
+ALERT_QUEUE_MAX_ALERTS = 500  # Alerts waiting for delivery before drops start
+ALERT_COALESCE_WINDOW_SECONDS = 60.0  # Same-type alerts within this window share a digest
+ALERT_MIN_SEND_INTERVAL_SECONDS = 1.0  # Telegram allows about one message per second per chat
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+DigestKey = Tuple[str, str]  # (alert_type, parse_mode)
+
+
+class AlertPriority(IntEnum):
+    """Delivery priority (lower values are sent first)"""
+
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
+@dataclass
+class _Digest:
+    """Alerts of one type waiting to be delivered together"""
+
+    alert_type: str
+    parse_mode: str
+    priority: AlertPriority
+    messages: List[str] = field(default_factory=list)
+    enqueued_at: List[float] = field(default_factory=list)
+
+
+class AlertDispatcher:
+    """
+    Non-blocking, coalescing delivery queue in front of an async sender.
+
+    Example:
+        dispatcher = AlertDispatcher(send_message)
+        dispatcher.enqueue("Trade executed ...", alert_type="trade")
+        await dispatcher.close()  # Deliver what is left on shutdown
+
+    Args:
+        send: Coroutine function ``send(text, parse_mode) -> bool``
+        max_pending: Maximum alerts waiting for delivery
+        coalesce_window: Seconds after a delivery during which further
+            alerts of the same type are held and merged
+        min_send_interval: Minimum seconds between any two deliveries
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, str], Awaitable[bool]],
+        max_pending: int = ALERT_QUEUE_MAX_ALERTS,
+        coalesce_window: float = ALERT_COALESCE_WINDOW_SECONDS,
+        min_send_interval: float = ALERT_MIN_SEND_INTERVAL_SECONDS,
+    ) -> None:
+        self._send = send
+        self.max_pending = max(1, max_pending)
+        self.coalesce_window = coalesce_window
+        self.min_send_interval = min_send_interval
+
+        self._pending: Dict[DigestKey, _Digest] = {}
+        self._pending_count = 0
+        self._last_delivery: Dict[DigestKey, float] = {}
+        self._last_send = float("-inf")
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self.stats = {
+            "enqueued": 0,
+            "dropped": 0,
+            "messages_sent": 0,
+            "alerts_delivered": 0,
+            "alerts_coalesced": 0,
+            "alerts_failed": 0,
+            "total_delivery_latency": 0.0,
+            "max_delivery_latency": 0.0,
+        }
+
+    def enqueue(
+        self,
+        message: str,
+        alert_type: str = "general",
+        priority: AlertPriority = AlertPriority.NORMAL,
+        parse_mode: str = "Markdown",
+    ) -> bool:
+        """
+        Queue an alert for delivery without waiting for it.
+
+        Args:
+            message: Alert text
+            alert_type: Alerts of the same type are merged into digests
+            priority: Delivery priority
+            parse_mode: Telegram parse mode of the message
+
+        Returns:
+            True if queued, False if dropped because the queue is full
+        """
+        if self._pending_count >= self.max_pending and not self._evict_below(priority):
+            self.stats["dropped"] += 1
+            logger.warning(f"Alert queue full, dropping {alert_type} alert")
+            return False
+
+        key = (alert_type, parse_mode)
+        digest = self._pending.get(key)
+        if digest is None:
+            digest = self._pending[key] = _Digest(alert_type, parse_mode, priority)
+        digest.priority = min(digest.priority, priority)
+        digest.messages.append(message)
+        digest.enqueued_at.append(time.monotonic())
+        self._pending_count += 1
+        self.stats["enqueued"] += 1
+
+        self._ensure_worker()
+        self._wakeup.set()
+        return True
+
+    def _evict_below(self, priority: AlertPriority) -> bool:
+        """Drop the newest alert of the lowest priority, if lower than ``priority``"""
+        victim = max(self._pending.values(), key=lambda d: (d.priority, d.enqueued_at[-1]))
+        if victim.priority <= priority:
+            return False
+        victim.messages.pop()
+        victim.enqueued_at.pop()
+        if not victim.messages:
+            del self._pending[(victim.alert_type, victim.parse_mode)]
+        self._pending_count -= 1
+        self.stats["dropped"] += 1
+        return True
+
+    def _ensure_worker(self) -> None:
+        """Start the delivery task if an event loop is running"""
+        if self._closing:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Delivered once a loop is running (or on flush)
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        self._wakeup = asyncio.Event()  # Bound to the loop the task runs on
+        self._task = loop.create_task(self._run())
+
+    def _due_at(self, key: DigestKey, digest: _Digest) -> float:
+        if digest.priority == AlertPriority.CRITICAL:
+            return digest.enqueued_at[0]
+        last = self._last_delivery.get(key, float("-inf"))
+        return max(digest.enqueued_at[0], last + self.coalesce_window)
+
+    def _pop_next(self, now: Optional[float] = None) -> Optional[_Digest]:
+        """Remove and return the most urgent digest that is due (any, if now is None)"""
+        candidates = [
+            (digest.priority, digest.enqueued_at[0], key)
+            for key, digest in self._pending.items()
+            if now is None or self._due_at(key, digest) <= now
+        ]
+        if not candidates:
+            return None
+        key = min(candidates)[2]
+        digest = self._pending.pop(key)
+        self._pending_count -= len(digest.messages)
+        return digest
+
+    async def _run(self) -> None:
+        """Deliver digests as they come due, pacing sends"""
+        while not self._closing:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            now = time.monotonic()
+            send_at = self._last_send + self.min_send_interval
+            if now >= send_at:
+                digest = self._pop_next(now)
+                if digest is not None:
+                    await self._deliver(digest)
+                    continue
+                wait_until = min(self._due_at(k, d) for k, d in self._pending.items())
+            else:
+                wait_until = send_at
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, wait_until - now))
+            except asyncio.TimeoutError:
+                pass
+
+    def format_digest(self, alert_type: str, messages: List[str]) -> str:
+        """Merge alerts into one message that fits Telegram's length limit"""
+        if len(messages) == 1:
+            return messages[0][:TELEGRAM_MAX_MESSAGE_LENGTH]
+
+        header = f"📬 **{len(messages)} {alert_type} alerts**"
+        parts = [header]
+        length = len(header)
+        for shown, message in enumerate(messages):
+            remaining = len(messages) - shown
+            footer = f"\n\n…and {remaining} more"
+            if length + 2 + len(message) + len(footer) > TELEGRAM_MAX_MESSAGE_LENGTH:
+                parts.append(footer.strip())
+                break
+            parts.append(message)
+            length += 2 + len(message)
+        return "\n\n".join(parts)
+
+    async def _deliver(self, digest: _Digest) -> bool:
+        now = time.monotonic()
+        key = (digest.alert_type, digest.parse_mode)
+        self._last_send = now
+        self._last_delivery[key] = now
+        count = len(digest.messages)
+
+        try:
+            text = self.format_digest(digest.alert_type, digest.messages)
+            sent = bool(await self._send(text, digest.parse_mode))
+        except Exception as e:
+            logger.error(f"Error delivering {digest.alert_type} alert: {str(e)[:100]}")
+            sent = False
+
+        if not sent:
+            self.stats["alerts_failed"] += count
+            return False
+
+        latencies = [now - t for t in digest.enqueued_at]
+        self.stats["messages_sent"] += 1
+        self.stats["alerts_delivered"] += count
+        self.stats["alerts_coalesced"] += count - 1
+        self.stats["total_delivery_latency"] += sum(latencies)
+        self.stats["max_delivery_latency"] = max(
+            self.stats["max_delivery_latency"], max(latencies)
+        )
+        return True
+
+    async def flush(self, timeout: float = 10.0) -> None:
+        """Deliver everything pending now, ignoring windows and pacing"""
+
+        async def drain() -> None:
+            while True:
+                digest = self._pop_next()
+                if digest is None:
+                    return
+                await self._deliver(digest)
+
+        try:
+            await asyncio.wait_for(drain(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Alert flush timed out with {self._pending_count} alerts pending")
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Stop the delivery task (after any send in progress) and deliver what is left"""
+        self._closing = True
+        self._wakeup.set()
+        if self._task is not None and not self._task.done():
+            try:
+                await asyncio.wait_for(self._task, timeout=timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                pass
+        self._task = None
+        await self.flush(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Delivery counters, queue depth and latency"""
+        delivered = self.stats["alerts_delivered"]
+        return {
+            **self.stats,
+            "pending": self._pending_count,
+            "pending_types": len(self._pending),
+            "avg_delivery_latency": (
+                self.stats["total_delivery_latency"] / delivered if delivered else 0.0
+            ),
+        }
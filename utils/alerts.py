@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 import aiohttp
 
 from config.settings import settings
+from utils.alert_dispatcher import AlertDispatcher, AlertPriority
 
 # Import staging settings if available
 try:
@@ -45,7 +46,12 @@ class TelegramAlertManager:
             self.alert_prefix = ""
 
         self.last_alert_time = 0
-        self.alert_cooldown = 60  # 1 minute cooldown between alerts
+        self.alert_cooldown = 60  # Same-type alerts within 1 minute are merged
+
+        # Background delivery so callers never wait on the Telegram API
+        self.dispatcher = AlertDispatcher(
+            self._deliver, coalesce_window=self.alert_cooldown
+        )
 
         if self.enabled:
             try:
@@ -78,29 +84,52 @@ class TelegramAlertManager:
             logger.info("ℹ️ Telegram alerts disabled or not configured")
 
     async def send_alert(
-        self, message: str, parse_mode: str = "Markdown", force: bool = False
+        self,
+        message: str,
+        parse_mode: str = "Markdown",
+        force: bool = False,
+        alert_type: str = "general",
+        priority: AlertPriority = AlertPriority.NORMAL,
     ) -> bool:
-        """Send alert via Telegram with cooldown protection"""
+        """
+        Queue an alert for background delivery via Telegram.
+
+        Returns as soon as the alert is queued. Same-type alerts sent within
+        ``alert_cooldown`` of each other are delivered as one digest.
+        ``force`` sends immediately and waits for the Telegram API instead.
+
+        Returns:
+            True if the alert was queued (or, with force, delivered)
+        """
         if not self.enabled and not force:
             return False
+        if force:
+            return await self._deliver(message, parse_mode)
+        return self.enqueue(message, alert_type, priority, parse_mode)
+
+    def enqueue(
+        self,
+        message: str,
+        alert_type: str = "general",
+        priority: AlertPriority = AlertPriority.NORMAL,
+        parse_mode: str = "Markdown",
+    ) -> bool:
+        """Queue an alert without awaiting anything (usable from sync code)"""
+        if not self.enabled:
+            return False
+        return self.dispatcher.enqueue(message, alert_type, priority, parse_mode)
 
+    async def _deliver(self, message: str, parse_mode: str = "Markdown") -> bool:
+        """Send one message to Telegram"""
         # Add staging prefix if in staging mode
         if self.staging_mode and self.alert_prefix:
             message = f"{self.alert_prefix}{message}"
 
-        # Cooldown protection
-        now = time.time()
-        if now - self.last_alert_time < self.alert_cooldown and not force:
-            logger.debug(
-                f"Skipping Telegram alert due to cooldown ({self.alert_cooldown}s)"
-            )
-            return False
-
         try:
             await self.bot.send_message(
                 chat_id=self.chat_id, text=message, parse_mode=parse_mode
             )
-            self.last_alert_time = now
+            self.last_alert_time = time.time()
             env_indicator = "[STAGING] " if self.staging_mode else ""
             logger.info(f"✅ {env_indicator}Telegram alert sent successfully")
             return True
@@ -124,6 +153,14 @@ class TelegramAlertManager:
             )
             return False
 
+    async def close(self) -> None:
+        """Deliver queued alerts and stop the background dispatcher"""
+        await self.dispatcher.close()
+
+    def get_delivery_stats(self) -> Dict[str, Any]:
+        """Alert queue and delivery statistics"""
+        return self.dispatcher.get_stats()
+
     async def send_error_alert(
         self, error: str, context: Optional[Dict[str, Any]] = None
     ):
@@ -143,7 +180,9 @@ class TelegramAlertManager:
             )
             error_message += f"\n\n**Context:**\n{context_str}"
 
-        await self.send_alert(error_message)
+        await self.send_alert(
+            error_message, alert_type="error", priority=AlertPriority.HIGH
+        )
 
     async def send_trade_alert(self, trade_details: Dict[str, Any]) -> None:
         """Send trade execution alert"""
@@ -160,7 +199,7 @@ class TelegramAlertManager:
             f"Wallet: `{trade_details.get('wallet_address', 'Unknown')[-6:]}`"
         )
 
-        await self.send_alert(message)
+        await self.send_alert(message, alert_type="trade")
 
     async def send_performance_report(self, metrics: Dict[str, Any]) -> None:
         """Send daily performance report"""
@@ -191,9 +230,32 @@ staging_alert_manager = (
 
 # Convenience functions
 async def send_telegram_alert(
-    message: str, parse_mode: str = "Markdown", force: bool = False
+    message: str,
+    parse_mode: str = "Markdown",
+    force: bool = False,
+    alert_type: str = "general",
+    priority: AlertPriority = AlertPriority.NORMAL,
+) -> bool:
+    return await alert_manager.send_alert(
+        message, parse_mode, force, alert_type=alert_type, priority=priority
+    )
+
+
+def enqueue_alert(
+    message: str,
+    alert_type: str = "general",
+    priority: AlertPriority = AlertPriority.NORMAL,
+    parse_mode: str = "Markdown",
 ) -> bool:
-    return await alert_manager.send_alert(message, parse_mode, force)
+    """Queue a Telegram alert from sync or async code without waiting"""
+    return alert_manager.enqueue(message, alert_type, priority, parse_mode)
+
+
+async def close_alerts() -> None:
+    """Deliver queued alerts and stop the dispatchers (call on shutdown)"""
+    await alert_manager.close()
+    if staging_alert_manager:
+        await staging_alert_manager.close()
 
 
 async def send_error_alert(
@@ -1,50 +1,136 @@
 """
 BoundedCache - Memory-safe cache with TTL and size limits
 Production-ready implementation for high-performance wallet scanning
+
+All hot-path operations are amortized O(1):
+- Recency is tracked with an OrderedDict (move_to_end / popitem) for true LRU
+- Every entry in a cache shares one TTL, so expiry order equals write order.
+  A second OrderedDict keyed in write order acts as a single-slot timing
+  wheel: expired entries are always at its front and are popped lazily.
+- Entry sizes are measured once on insert and summed incrementally
 """
 
-import time
+import sys
 import threading
-from typing import Any, Dict, Optional, Callable, TypeVar
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
 
 T = TypeVar("T")
 
+# Size accounting constants
+ENTRY_OVERHEAD_BYTES = 160  # Two ordered-dict slots plus the entry record
+MAX_SIZE_DEPTH = 2  # How deep containers are walked when measuring a value
+
+
+def estimate_size(obj: Any, depth: int = 0) -> int:
+    """
+    Estimate the memory footprint of an object in bytes.
+
+    Containers are walked up to MAX_SIZE_DEPTH levels deep; deeper objects
+    are counted by their shallow size only.
+
+    Args:
+        obj: Object to measure
+        depth: Current recursion depth
+
+    Returns:
+        Estimated size in bytes
+    """
+    size = sys.getsizeof(obj)
+    if depth >= MAX_SIZE_DEPTH:
+        return size
+
+    if isinstance(obj, dict):
+        size += sum(
+            estimate_size(k, depth + 1) + estimate_size(v, depth + 1)
+            for k, v in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, depth + 1) for item in obj)
+    return size
+
+
+class _CacheEntry:
+    """Value plus bookkeeping for a single cache slot"""
+
+    __slots__ = ("value", "expires_at", "size_bytes")
+
+    def __init__(self, value: Any, expires_at: float, size_bytes: int) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.size_bytes = size_bytes
+
 
 class BoundedCache:
     """
     Thread-safe bounded cache with TTL and size limits
 
     Features:
-    - Automatic cleanup of expired items
-    - Size limits with LRU eviction
-    - Memory usage tracking
+    - Lazy expiry of stale items (no full scans on insert)
+    - Size limits with true LRU eviction
+    - Byte-level memory accounting with optional memory threshold
     - Thread-safe operations
     - TTL-based expiration
-    - Performance metrics
+    - Performance metrics tagged with a component name
 
     Example:
-        cache = BoundedCache(max_size=1000, ttl_seconds=3600)
+        cache = BoundedCache(
+            max_size=1000,
+            ttl_seconds=3600,
+            component_name="scanner.api_cache",
+        )
         cache.set("key1", "value1")
         value = cache.get("key1")
     """
 
-    def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: int = 3600,
+        component_name: Optional[str] = None,
+        memory_threshold_mb: Optional[float] = None,
+        cleanup_interval_seconds: int = 60,
+    ):
         """
         Initialize bounded cache
 
         Args:
             max_size: Maximum number of items to store (default: 1000)
             ttl_seconds: Time-to-live in seconds (default: 3600 = 1 hour)
+            component_name: Name reported in stats for memory monitoring
+            memory_threshold_mb: Optional byte budget; LRU items are evicted
+                while the cache exceeds it
+            cleanup_interval_seconds: Minimum interval between expiry sweeps
+                triggered from reads (writes always sweep)
         """
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, tuple] = {}  # {key: (value, timestamp)}
+        self.component_name = component_name or "bounded_cache"
+        self.memory_threshold_mb = memory_threshold_mb
+        self.cleanup_interval_seconds = cleanup_interval_seconds
+
+        self._memory_threshold_bytes: Optional[int] = (
+            int(memory_threshold_mb * 1024 * 1024)
+            if memory_threshold_mb is not None
+            else None
+        )
+
+        # Recency order: least recently used first
+        self._cache: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        # Write (= expiry) order: soonest to expire first
+        self._expiry_order: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._total_bytes = 0
+
         self._lock = threading.RLock()
         self._hit_count = 0
         self._miss_count = 0
         self._cleanup_count = 0
+        self._expired_count = 0
+        self._evicted_count = 0
+        self._last_sweep = time.time()
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """
         Get item from cache
 
@@ -55,21 +141,27 @@ class BoundedCache:
             Cached value or None if not found/expired
         """
         with self._lock:
-            if key not in self._cache:
+            now = time.time()
+            if now - self._last_sweep >= self.cleanup_interval_seconds:
+                self._remove_expired(now)
+
+            entry = self._cache.get(key)
+            if entry is None:
                 self._miss_count += 1
                 return None
 
-            value, timestamp = self._cache[key]
-            if self._is_expired(timestamp):
-                del self._cache[key]
+            if entry.expires_at <= now:
+                self._discard(key)
+                self._expired_count += 1
                 self._cleanup_count += 1
                 self._miss_count += 1
                 return None
 
+            self._cache.move_to_end(key)
             self._hit_count += 1
-            return value
+            return entry.value
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Hashable, value: Any) -> None:
         """
         Set item in cache
 
@@ -77,42 +169,87 @@ class BoundedCache:
             key: Cache key
             value: Value to store
         """
+        size_bytes = (
+            estimate_size(key) + estimate_size(value) + ENTRY_OVERHEAD_BYTES
+        )
+
         with self._lock:
-            # Clean up expired items first
-            self._remove_expired()
+            now = time.time()
+            # Pop whatever has expired at the front of the expiry queue
+            self._remove_expired(now)
+
+            if key in self._cache:
+                self._discard(key)
 
             # Enforce size limit using LRU (least recently used)
             while len(self._cache) >= self.max_size:
-                # Remove oldest item (first inserted)
-                oldest_key = next(iter(self._cache))
-                del self._cache[oldest_key]
-                self._cleanup_count += 1
+                self._evict_lru()
+
+            self._cache[key] = _CacheEntry(value, now + self.ttl_seconds, size_bytes)
+            self._expiry_order[key] = None
+            self._total_bytes += size_bytes
 
-            # Add new item
-            self._cache[key] = (value, time.time())
+            # Enforce memory budget, always keeping the newest item
+            if self._memory_threshold_bytes is not None:
+                while (
+                    self._total_bytes > self._memory_threshold_bytes
+                    and len(self._cache) > 1
+                ):
+                    self._evict_lru()
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Remove an item from the cache
+
+        Args:
+            key: Cache key
 
-    def _is_expired(self, timestamp: float) -> bool:
+        Returns:
+            True if the key was present
+        """
+        with self._lock:
+            if key not in self._cache:
+                return False
+            self._discard(key)
+            return True
+
+    def _discard(self, key: Hashable) -> None:
+        """Remove a key from both orderings and release its size"""
+        entry = self._cache.pop(key)
+        self._expiry_order.pop(key, None)
+        self._total_bytes -= entry.size_bytes
+
+    def _evict_lru(self) -> None:
+        """Evict the least recently used item"""
+        key, entry = self._cache.popitem(last=False)
+        self._expiry_order.pop(key, None)
+        self._total_bytes -= entry.size_bytes
+        self._evicted_count += 1
+        self._cleanup_count += 1
+
+    def _is_expired(self, expires_at: float) -> bool:
         """Check if item is expired"""
-        return time.time() - timestamp > self.ttl_seconds
-
-    def _remove_expired(self) -> None:
-        """Remove all expired items"""
-        current_time = time.time()
-        expired_keys = [
-            k
-            for k, (_, ts) in self._cache.items()
-            if current_time - ts > self.ttl_seconds
-        ]
-
-        for key in expired_keys:
-            del self._cache[key]
+        return time.time() >= expires_at
+
+    def _remove_expired(self, now: Optional[float] = None) -> None:
+        """Remove expired items from the front of the expiry queue"""
+        now = time.time() if now is None else now
+        while self._expiry_order:
+            key = next(iter(self._expiry_order))
+            if self._cache[key].expires_at > now:
+                break
+            self._discard(key)
+            self._expired_count += 1
             self._cleanup_count += 1
+        self._last_sweep = now
 
     def clear(self) -> None:
         """Clear all items from cache"""
         with self._lock:
-            self._cache.clear()
             self._cleanup_count += len(self._cache)
+            self._cache.clear()
+            self._expiry_order.clear()
+            self._total_bytes = 0
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -125,10 +262,8 @@ class BoundedCache:
             total_requests = self._hit_count + self._miss_count
             hit_rate = self._hit_count / total_requests if total_requests > 0 else 0
 
-            # Estimate memory usage (very rough approximation)
-            estimated_memory_mb = len(self._cache) * 0.001  # 1KB per item approx
-
             return {
+                "component_name": self.component_name,
                 "size": len(self._cache),
                 "max_size": self.max_size,
                 "ttl_seconds": self.ttl_seconds,
@@ -136,16 +271,22 @@ class BoundedCache:
                 "miss_count": self._miss_count,
                 "hit_rate": hit_rate,
                 "cleanup_count": self._cleanup_count,
-                "estimated_memory_mb": estimated_memory_mb,
+                "expired_count": self._expired_count,
+                "evicted_count": self._evicted_count,
+                "size_bytes": self._total_bytes,
+                "estimated_memory_mb": self._total_bytes / (1024 * 1024),
+                "memory_threshold_mb": self.memory_threshold_mb,
             }
 
     def __len__(self) -> int:
         """Get current cache size"""
         return len(self._cache)
 
-    def __contains__(self, key: str) -> bool:
-        """Check if key exists in cache"""
-        return key in self._cache
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a live (non-expired) key exists without touching recency"""
+        with self._lock:
+            entry = self._cache.get(key)
+            return entry is not None and not self._is_expired(entry.expires_at)
 
 
 class AsyncBoundedCache(BoundedCache):
@@ -209,6 +350,12 @@ def cached_function(ttl_seconds: int = 300, max_size: int = 100):
 
 
 # Global cache instances for common use cases
-WALLET_DATA_CACHE = BoundedCache(max_size=5000, ttl_seconds=1800)  # 30 minutes
-MARKET_DATA_CACHE = BoundedCache(max_size=1000, ttl_seconds=300)  # 5 minutes
-API_RESPONSE_CACHE = BoundedCache(max_size=2000, ttl_seconds=60)  # 1 minute
+WALLET_DATA_CACHE = BoundedCache(
+    max_size=5000, ttl_seconds=1800, component_name="global.wallet_data"
+)  # 30 minutes
+MARKET_DATA_CACHE = BoundedCache(
+    max_size=1000, ttl_seconds=300, component_name="global.market_data"
+)  # 5 minutes
+API_RESPONSE_CACHE = BoundedCache(
+    max_size=2000, ttl_seconds=60, component_name="global.api_response"
+)  # 1 minute
@@ -0,0 +1,210 @@
+"""Shared, long-lived HTTP client for blockchain data APIs.
+
+Every Polygonscan / RPC call used to build its own ``aiohttp.ClientSession``
+(and often its own ``TCPConnector``), paying DNS, TCP and TLS setup on each
+request. This module keeps one pooled session per process so connections are
+kept alive and reused across wallet monitoring, the rate-limited Polygonscan
+client and the scanner's blockchain API.
+
+Features:
+- Keep-alive connection pooling with global and per-host connection limits
+- DNS caching
+- Explicit startup/shutdown hooks (wired into ``PolymarketCopyBot``)
+- Connection-reuse counters collected through aiohttp tracing
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Connection pool constants
+DEFAULT_CONNECTION_LIMIT = 100  # Total open connections across all hosts
+DEFAULT_LIMIT_PER_HOST = 10  # Open connections per host
+DEFAULT_KEEPALIVE_TIMEOUT_SECONDS = 30.0  # Idle time before a connection is closed
+DEFAULT_DNS_CACHE_TTL_SECONDS = 300  # DNS cache lifetime
+
+# Timeout constants (match the previous per-request settings)
+DEFAULT_TIMEOUT_TOTAL_SECONDS = 15
+DEFAULT_TIMEOUT_CONNECT_SECONDS = 5
+
+
+class SharedHTTPClient:
+    """
+    Process-wide pooled aiohttp session.
+
+    The underlying session is created lazily on first use (it must be created
+    inside a running event loop) or eagerly via start(). Callers obtain the
+    session with get_session() and use it as usual; they must never close it.
+
+    Example:
+        client = get_http_client()
+        session = await client.get_session()
+        async with session.get(url, params=params) as response:
+            data = await response.json()
+    """
+
+    def __init__(
+        self,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT_SECONDS,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL_SECONDS,
+        timeout_total: float = DEFAULT_TIMEOUT_TOTAL_SECONDS,
+        timeout_connect: float = DEFAULT_TIMEOUT_CONNECT_SECONDS,
+    ) -> None:
+        """
+        Initialize the shared HTTP client.
+
+        Args:
+            connection_limit: Maximum number of open connections
+            limit_per_host: Maximum number of open connections per host
+            keepalive_timeout: Seconds an idle connection is kept alive
+            dns_cache_ttl: Seconds resolved DNS entries are cached
+            timeout_total: Default total request timeout in seconds
+            timeout_connect: Default connection timeout in seconds
+        """
+        self.connection_limit = connection_limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout_total = timeout_total
+        self.timeout_connect = timeout_connect
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+        self._started_at: Optional[float] = None
+
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "request_errors": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+            "sessions_created": 0,
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """Whether an open session currently exists"""
+        return self._session is not None and not self._session.closed
+
+    async def start(self) -> None:
+        """Create the pooled session (startup hook)"""
+        await self.get_session()
+
+    async def close(self) -> None:
+        """Close the pooled session and release all connections (shutdown hook)"""
+        async with self._lock:
+            if self._session is not None and not self._session.closed:
+                await self._session.close()
+                logger.info(
+                    "🔌 Shared HTTP client closed (%d requests, %d connections reused)",
+                    self._stats["requests"],
+                    self._stats["connections_reused"],
+                )
+            self._session = None
+            self._started_at = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled session, creating it if needed.
+
+        Returns:
+            Shared aiohttp ClientSession instance
+        """
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                self._session = self._create_session()
+                self._started_at = time.time()
+                self._stats["sessions_created"] += 1
+                logger.info(
+                    "🔌 Shared HTTP client started (limit=%d, per_host=%d, keepalive=%.0fs)",
+                    self.connection_limit,
+                    self.limit_per_host,
+                    self.keepalive_timeout,
+                )
+            return self._session
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Build the pooled session with connection limits and tracing"""
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            enable_cleanup_closed=True,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=self.timeout_total, connect=self.timeout_connect
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            trace_configs=[self._build_trace_config()],
+        )
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """Attach counters to aiohttp connection lifecycle signals"""
+        trace_config = aiohttp.TraceConfig()
+
+        def counter(name: str) -> Any:
+            async def increment(*_args: Any) -> None:
+                self._stats[name] += 1
+
+            return increment
+
+        trace_config.on_request_start.append(counter("requests"))
+        trace_config.on_request_exception.append(counter("request_errors"))
+        trace_config.on_connection_create_end.append(counter("connections_created"))
+        trace_config.on_connection_reuseconn.append(counter("connections_reused"))
+        trace_config.on_dns_cache_hit.append(counter("dns_cache_hits"))
+        trace_config.on_dns_cache_miss.append(counter("dns_cache_misses"))
+        return trace_config
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            Dictionary with request and connection-reuse counters. The
+            handshakes_saved figure equals connections_reused: each reuse is a
+            TCP/TLS setup that did not happen.
+        """
+        stats: Dict[str, Any] = dict(self._stats)
+        acquired = stats["connections_created"] + stats["connections_reused"]
+        stats["connection_reuse_ratio"] = (
+            stats["connections_reused"] / acquired if acquired > 0 else 0.0
+        )
+        stats["handshakes_saved"] = stats["connections_reused"]
+        stats["is_running"] = self.is_running
+        stats["uptime_seconds"] = (
+            time.time() - self._started_at if self._started_at else 0.0
+        )
+        return stats
+
+
+# Global shared client instance
+_http_client: Optional[SharedHTTPClient] = None
+
+
+def get_http_client() -> SharedHTTPClient:
+    """Get the process-wide shared HTTP client"""
+    global _http_client
+    if _http_client is None:
+        _http_client = SharedHTTPClient()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the process-wide shared HTTP client if it was created"""
+    if _http_client is not None:
+        await _http_client.close()
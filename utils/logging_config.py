@@ -1,11 +1,14 @@
 """Logging configuration for Polymarket copy bot."""
 
+import copy
 import json
 import logging
+import queue
 import sys
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 try:
     from logging.handlers import RotatingFileHandler
@@ -16,6 +19,72 @@ except ImportError:
     RotatingFileHandler = None
     _rotating_handler_available = False
 
+_RotatingFileBase = RotatingFileHandler if _rotating_handler_available else logging.FileHandler
+
+try:
+    import orjson
+
+    _orjson_available = True
+except ImportError:
+    # Fall back to the standard library serializer
+    orjson = None
+    _orjson_available = False
+
+# Whether _dumps uses orjson; see set_orjson_enabled
+_orjson_enabled = _orjson_available
+
+# Queued logging defaults
+QUEUED_LOG_MAX_RECORDS = 10_000  # Records waiting for the writer before new ones are dropped
+QUEUED_LOG_BATCH_SIZE = 512  # Records formatted and written per file flush
+QUEUED_LOG_WRITE_INTERVAL = 0.05  # Seconds the writer waits for a partial batch to fill
+
+# Extra record attributes copied into JSON log entries
+JSON_CUSTOM_FIELDS = (
+    "wallet",
+    "wallet_address",
+    "trade_id",
+    "market_id",
+    "condition_id",
+    "tx_hash",
+    "order_id",
+    "amount",
+    "price",
+    "side",
+    "status",
+    "balance",
+    "gas_price",
+    "block_number",
+    "latency_ms",
+)
+
+
+def orjson_available() -> bool:
+    """Whether orjson is installed for JSON log serialization"""
+    return _orjson_available
+
+
+def set_orjson_enabled(enabled: bool) -> bool:
+    """
+    Choose between orjson and the standard library for JSON log entries.
+
+    Args:
+        enabled: Use orjson (ignored when it is not installed)
+
+    Returns:
+        Whether orjson was enabled before the call
+    """
+    global _orjson_enabled
+    previous = _orjson_enabled
+    _orjson_enabled = enabled and _orjson_available
+    return previous
+
+
+def _dumps(entry: Dict[str, Any]) -> str:
+    """Serialize a log entry, with orjson when it is installed and enabled"""
+    if _orjson_enabled:
+        return orjson.dumps(entry, default=str).decode("utf-8")
+    return json.dumps(entry, default=str)
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
@@ -31,7 +100,7 @@ class JSONFormatter(logging.Formatter):
             JSON formatted log entry
         """
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -40,30 +109,14 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add exception info if present
+        # Add exception info if present (pre-rendered when the record was queued)
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_entry["exception"] = record.exc_text
 
         # Add custom fields from record
-        custom_fields = [
-            "wallet",
-            "wallet_address",
-            "trade_id",
-            "market_id",
-            "condition_id",
-            "tx_hash",
-            "order_id",
-            "amount",
-            "price",
-            "side",
-            "status",
-            "balance",
-            "gas_price",
-            "block_number",
-            "latency_ms",
-        ]
-
-        for field in custom_fields:
+        for field in JSON_CUSTOM_FIELDS:
             if hasattr(record, field):
                 value = getattr(record, field)
                 # Convert non-serializable types
@@ -72,7 +125,7 @@ class JSONFormatter(logging.Formatter):
                 else:
                     log_entry[field] = value
 
-        return json.dumps(log_entry, default=str)
+        return _dumps(log_entry)
 
 
 class HumanFormatter(logging.Formatter):
@@ -94,11 +147,182 @@ class HumanFormatter(logging.Formatter):
         return super().format(record)
 
 
+class BatchRotatingFileHandler(_RotatingFileBase):
+    """Rotating file handler that can write many records with one flush."""
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        Format and write records, rolling over by size, then flush once.
+
+        Args:
+            records: Log records in arrival order
+        """
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            max_bytes = getattr(self, "maxBytes", 0)
+            position = self.stream.tell() if max_bytes else 0
+            for record in records:
+                if record.levelno < self.level or not self.filter(record):
+                    continue
+                try:
+                    message = self.format(record) + self.terminator
+                    if max_bytes and position and position + len(message) >= max_bytes:
+                        self.doRollover()
+                        position = 0
+                    self.stream.write(message)
+                    position += len(message)
+                except Exception:
+                    self.handleError(record)
+            self.flush()
+        finally:
+            self.release()
+
+
+class QueuedLogHandler(logging.Handler):
+    """
+    Hand log records to a background writer thread.
+
+    The calling thread only renders the message and any traceback into the
+    record and puts it on a bounded queue; JSON serialization and file I/O
+    happen on the writer thread, which drains up to ``batch_size`` records
+    at a time and writes them with a single flush. After a partial batch the
+    writer sleeps for ``write_interval`` so it wakes a few times per second
+    rather than once per record, keeping it off the GIL while the event loop
+    is busy. When the queue is full new records are dropped and counted, and
+    the writer logs how many were lost, so a burst of logging can never stall
+    the event loop.
+
+    Args:
+        target: Handler that formats and writes records (batched when it
+            provides ``emit_batch``)
+        max_queue_size: Records allowed to wait for the writer
+        batch_size: Maximum records written per flush
+        write_interval: Seconds to let a partial batch accumulate
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        max_queue_size: int = QUEUED_LOG_MAX_RECORDS,
+        batch_size: int = QUEUED_LOG_BATCH_SIZE,
+        write_interval: float = QUEUED_LOG_WRITE_INTERVAL,
+    ) -> None:
+        super().__init__(level=target.level)
+        self.target = target
+        self.batch_size = max(1, batch_size)
+        self.write_interval = write_interval
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, max_queue_size))
+        self._exception_formatter = logging.Formatter()
+        self.dropped = 0
+        self._reported_dropped = 0
+        self.written = 0
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="queued-log-writer", daemon=True)
+        self._thread.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Freeze a record so it no longer references caller state"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue a record without blocking; count it as dropped if the queue is full"""
+        try:
+            self._queue.put_nowait(self.prepare(record))
+        except queue.Full:
+            self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue in batches until stopped"""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [r for r in batch if r is not self._STOP]
+            try:
+                self._write(records)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if len(records) < len(batch):
+                return
+            if len(batch) < self.batch_size and self.write_interval > 0:
+                self._stopping.wait(self.write_interval)
+
+    def _write(self, records: List[logging.LogRecord]) -> None:
+        dropped = self.dropped
+        if dropped > self._reported_dropped:
+            records.append(
+                logging.LogRecord(
+                    __name__,
+                    logging.WARNING,
+                    __file__,
+                    0,
+                    f"Queued logging dropped {dropped - self._reported_dropped} records "
+                    f"(queue full, {dropped} total)",
+                    None,
+                    None,
+                )
+            )
+            self._reported_dropped = dropped
+        if not records:
+            return
+
+        try:
+            if hasattr(self.target, "emit_batch"):
+                self.target.emit_batch(records)
+            else:
+                for record in records:
+                    self.target.handle(record)
+            self.written += len(records)
+        except Exception:
+            self.handleError(records[-1])
+
+    def flush(self) -> None:
+        """Block until every queued record has been written"""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write the remaining records, stop the writer and close the target"""
+        if self._thread.is_alive():
+            self._stopping.set()
+            self._queue.put(self._STOP)
+            self._thread.join(timeout=5.0)
+        self.target.close()
+        super().close()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Queue depth and written/dropped record counts"""
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+        }
+
+
 def setup_logging(
     level: str = "INFO",
     log_dir: str = "logs",
     console_level: Optional[str] = None,
     json_logging: bool = True,
+    queued: bool = False,
+    queue_size: int = QUEUED_LOG_MAX_RECORDS,
 ) -> None:
     """
     Configure logging for the application.
@@ -108,14 +332,21 @@ def setup_logging(
         log_dir: Directory for log files
         console_level: Console logging level (defaults to same as level)
         json_logging: Whether to enable JSON file logging
+        queued: Write the JSON log file from a background thread instead
+            of the calling thread (records are dropped, and counted, if
+            more than ``queue_size`` are waiting)
+        queue_size: Maximum records waiting for the background writer
     """
     # Create log directory
     log_path = Path(log_dir)
     log_path.mkdir(exist_ok=True, parents=True)
 
-    # Clear existing handlers
+    # Remove existing handlers (closing stops any queued writer thread)
     root = logging.getLogger()
-    root.handlers.clear()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        if isinstance(handler, QueuedLogHandler):
+            handler.close()
     root.setLevel(getattr(logging, level.upper(), logging.INFO))
 
     # Console handler - human readable
@@ -127,7 +358,7 @@ def setup_logging(
 
     # File handler - JSON format for structured logging
     if json_logging and _rotating_handler_available:
-        file_handler = RotatingFileHandler(
+        file_handler = BatchRotatingFileHandler(
             log_path / "bot.log",
             maxBytes=10_000_000,  # 10MB per file
             backupCount=5,  # Keep 5 backup files
@@ -135,6 +366,8 @@ def setup_logging(
         )
         file_handler.setLevel(logging.DEBUG)  # Log everything to file
         file_handler.setFormatter(JSONFormatter())
+        if queued:
+            file_handler = QueuedLogHandler(file_handler, max_queue_size=queue_size)
         root.addHandler(file_handler)
 
     # Reduce noise from third-party libraries
@@ -174,6 +407,7 @@ def setup_logging(
             "level": level,
             "log_dir": str(log_dir),
             "json_logging": json_logging,
+            "queued": queued,
             "console_level": console_level,
         },
     )
@@ -6,9 +6,8 @@ from asyncio import Lock, Semaphore
 from time import time
 from typing import Any, Dict, List, Optional
 
-import aiohttp
-
 from core.exceptions import APIError, PolygonscanError, RateLimitError
+from utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -126,9 +125,76 @@ class RateLimitedPolygonscanClient:
             "sort": "desc",
         }
 
-        timeout = aiohttp.ClientTimeout(total=15, connect=5)
+        session = await get_http_client().get_session()
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status == 429:
+                raise RateLimitError("Polygonscan rate limit exceeded")
+            elif response.status != 200:
+                raise PolygonscanError(
+                    f"Polygonscan API error: HTTP {response.status}"
+                )
+
+            data = await response.json()
+
+            # Check for API-level errors
+            if data.get("status") == "0":
+                error_msg = data.get("message", "Unknown error")
+                if "rate limit" in error_msg.lower():
+                    raise RateLimitError(
+                        f"Polygonscan API rate limited: {error_msg}"
+                    )
+                else:
+                    raise PolygonscanError(f"Polygonscan API error: {error_msg}")
+
+            # Handle both v1 and v2 API response formats
+            if (
+                data.get("status") == "1" and data.get("message") == "OK"
+            ) or data.get("status") == "success":
+                transactions = data.get("result", [])
+
+                # Handle different response structures
+                if (
+                    isinstance(transactions, dict)
+                    and "transactions" in transactions
+                ):
+                    transactions = transactions["transactions"]
+
+                if not isinstance(transactions, list):
+                    raise PolygonscanError(
+                        f"Unexpected response format: {type(transactions)}"
+                    )
+
+                # Limit transactions for performance
+                if len(transactions) > max_transactions:
+                    transactions = transactions[:max_transactions]
+
+                return transactions
+            else:
+                raise PolygonscanError(f"Unexpected API response: {data}")
+
+    async def get_block_number(self) -> int:
+        """
+        Latest Polygon block number via the Polygonscan proxy module.
+
+        Returns:
+            Current chain head block number
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        Raises:
+            PolygonscanError: If the API returns an error
+            RateLimitError: If rate limit is exceeded
+        """
+        async with self._semaphore:
+            await self._wait_for_rate_limit()
+
+            url = "https://api.polygonscan.com/v2/api"
+            headers = {
+                "User-Agent": "Polymarket-Copy-Bot/1.0",
+                "Accept": "application/json",
+                "X-API-Key": self.api_key,
+            }
+            params = {"module": "proxy", "action": "eth_blockNumber"}
+
+            session = await get_http_client().get_session()
             async with session.get(url, params=params, headers=headers) as response:
                 if response.status == 429:
                     raise RateLimitError("Polygonscan rate limit exceeded")
@@ -136,44 +202,13 @@ class RateLimitedPolygonscanClient:
                     raise PolygonscanError(
                         f"Polygonscan API error: HTTP {response.status}"
                     )
-
                 data = await response.json()
 
-                # Check for API-level errors
-                if data.get("status") == "0":
-                    error_msg = data.get("message", "Unknown error")
-                    if "rate limit" in error_msg.lower():
-                        raise RateLimitError(
-                            f"Polygonscan API rate limited: {error_msg}"
-                        )
-                    else:
-                        raise PolygonscanError(f"Polygonscan API error: {error_msg}")
-
-                # Handle both v1 and v2 API response formats
-                if (
-                    data.get("status") == "1" and data.get("message") == "OK"
-                ) or data.get("status") == "success":
-                    transactions = data.get("result", [])
-
-                    # Handle different response structures
-                    if (
-                        isinstance(transactions, dict)
-                        and "transactions" in transactions
-                    ):
-                        transactions = transactions["transactions"]
-
-                    if not isinstance(transactions, list):
-                        raise PolygonscanError(
-                            f"Unexpected response format: {type(transactions)}"
-                        )
-
-                    # Limit transactions for performance
-                    if len(transactions) > max_transactions:
-                        transactions = transactions[:max_transactions]
-
-                    return transactions
-                else:
-                    raise PolygonscanError(f"Unexpected API response: {data}")
+            result = data.get("result") if isinstance(data, dict) else None
+            try:
+                return int(result, 16)
+            except (TypeError, ValueError):
+                raise PolygonscanError(f"Unexpected block number response: {data}")
 
     async def get_transactions_batch(
         self,
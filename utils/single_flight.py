@@ -0,0 +1,45 @@
+"""
+SingleFlight - Share one in-flight fetch among concurrent callers
+
+Callers asking for a key that is already being fetched await the running
+task instead of starting their own. The task is shielded, so cancelling one
+caller does not cancel the fetch the others are waiting on, and it is
+forgotten as soon as it finishes so a later call starts a fresh fetch.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """In-flight fetch tasks keyed by what they fetch"""
+
+    def __init__(self) -> None:
+        self._tasks: Dict[K, "asyncio.Task[V]"] = {}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    async def run(self, key: K, fetch: Callable[[K], Awaitable[V]]) -> V:
+        """
+        Await ``fetch(key)``, joining the fetch already running for ``key``.
+
+        Args:
+            key: What is being fetched
+            fetch: Coroutine function started when no fetch for ``key`` runs
+
+        Returns:
+            Result of the shared fetch
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch(key))
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)